@@ -21,6 +21,7 @@ import fastmcp
 from fastmcp.cli import run as run_module
 from fastmcp.cli.auth import auth_app
 from fastmcp.cli.client import call_command, discover_command, list_command
+from fastmcp.cli.diagnose import diagnose_app
 from fastmcp.cli.generate import generate_cli_command
 from fastmcp.cli.install import install_app
 from fastmcp.cli.tasks import tasks_app
@@ -962,6 +963,9 @@ app.command(install_app)
 # Add tasks subcommand group
 app.command(tasks_app)
 
+# Add diagnose subcommand group
+app.command(diagnose_app)
+
 # Add client query commands
 app.command(list_command, name="list")
 app.command(call_command, name="call")
@@ -0,0 +1,127 @@
+"""FastMCP diagnose CLI for inspecting the local installation."""
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Annotated
+
+import cyclopts
+from rich.console import Console
+from rich.table import Table
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger("cli.diagnose")
+console = Console()
+
+diagnose_app = cyclopts.App(
+    name="diagnose",
+    help="Diagnose FastMCP performance and environment issues",
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Import cost of a single module, as reported by `python -X importtime`."""
+
+    module: str
+    # Time spent executing the module itself, in microseconds
+    self_us: int
+    # Time including the module's own imports, in microseconds
+    cumulative_us: int
+    # Nesting level in the import tree (0 for top-level imports)
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse the stderr of `python -X importtime` into per-module timings.
+
+    Lines that are not importtime records (warnings, the header) are ignored.
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        try:
+            timing = ImportTiming(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        except ValueError:
+            # Header line ("self [us] | cumulative | imported package")
+            continue
+        timings.append(timing)
+    return timings
+
+
+def measure_import(module: str = "fastmcp") -> list[ImportTiming]:
+    """Import a module in a fresh interpreter and return its import timings.
+
+    Raises:
+        RuntimeError: If the module fails to import
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(
+            f"Failed to import {module}: {error[-1] if error else 'unknown error'}"
+        )
+    return parse_importtime(result.stderr)
+
+
+@diagnose_app.command(name="import")
+def import_command(
+    module: Annotated[
+        str,
+        cyclopts.Parameter(help="Module to import"),
+    ] = "fastmcp",
+    *,
+    top: Annotated[
+        int,
+        cyclopts.Parameter(help="Number of modules to show"),
+    ] = 25,
+) -> None:
+    """Report how long importing FastMCP takes, broken down by module.
+
+    Imports the module in a fresh interpreter with `python -X importtime` and
+    lists the modules with the highest cumulative import time.
+
+    Example:
+        fastmcp diagnose import
+        fastmcp diagnose import fastmcp.server.auth --top 10
+    """
+    try:
+        timings = measure_import(module)
+    except RuntimeError as e:
+        console.print(f"[bold red]✗[/bold red] {e}")
+        sys.exit(1)
+
+    total = next((t for t in timings if t.module == module), None)
+    table = Table(title=f"Import time for {module}")
+    table.add_column("Module", style="cyan")
+    table.add_column("Cumulative (ms)", justify="right")
+    table.add_column("Self (ms)", justify="right")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        table.add_row(
+            timing.module,
+            f"{timing.cumulative_us / 1000:.1f}",
+            f"{timing.self_us / 1000:.1f}",
+        )
+    console.print(table)
+
+    if total is not None:
+        console.print(
+            f"\n[bold]Total:[/bold] {total.cumulative_us / 1000:.1f} ms "
+            f"across {len(timings)} modules"
+        )
@@ -5,6 +5,7 @@ from .transports import (
     FastMCPTransport,
     NodeStdioTransport,
     NpxStdioTransport,
+    PooledStdioTransport,
     PythonStdioTransport,
     SSETransport,
     StdioTransport,
@@ -21,6 +22,7 @@ __all__ = [
     "NodeStdioTransport",
     "NpxStdioTransport",
     "OAuth",
+    "PooledStdioTransport",
     "PythonStdioTransport",
     "SSETransport",
     "StdioTransport",
@@ -47,6 +47,7 @@ from fastmcp.client.tasks import (
     PromptTask,
     ResourceTask,
     TaskNotificationHandler,
+    TaskWatcher,
     ToolTask,
 )
 from fastmcp.mcp_config import MCPConfig
@@ -325,6 +326,9 @@ class Client(
             str, weakref.ref[ToolTask | PromptTask | ResourceTask]
         ] = {}
 
+        # Shared status polling for Task.wait()
+        self._task_watcher = TaskWatcher(self)
+
     def _reset_session_state(self, full: bool = False) -> None:
         """Reset session state after disconnect or cancellation.
 
@@ -731,6 +735,7 @@ class Client(
                 # Convert notification params to GetTaskResult (they share the same fields via Task)
                 status = GetTaskResult.model_validate(notification.params.model_dump())
                 task._handle_status_notification(status)
+                self._task_watcher.status_notified(task_id)
 
     async def close(self):
         await self._disconnect(force=True)
@@ -95,7 +95,8 @@ class ClientTaskManagementMixin:
 
         Args:
             cursor: Optional pagination cursor
-            limit: Maximum number of tasks to return (default 50)
+            limit: Maximum number of locally tracked tasks to query when
+                falling back (default 50). Server pages are sized by the server.
 
         Returns:
             dict: Response with structure:
@@ -106,15 +107,7 @@ class ClientTaskManagementMixin:
             RuntimeError: If client not connected
             McpError: If the request results in a TimeoutError | JSONRPCError
         """
-        # Send protocol request
-        params = PaginatedRequestParams(cursor=cursor, limit=limit)  # type: ignore[call-arg]  # Optional field in MCP SDK
-        request = ListTasksRequest(params=params)
-        server_response = await self._await_with_session_monitoring(
-            self.session.send_request(
-                request=request,  # type: ignore[invalid-argument-type]
-                result_type=mcp.types.ListTasksResult,
-            )
-        )
+        server_response = await self._list_tasks_page(cursor, limit)
 
         # If server returned tasks, use those
         if server_response.tasks:
@@ -132,6 +125,19 @@ class ClientTaskManagementMixin:
 
         return {"tasks": tasks, "nextCursor": None}
 
+    async def _list_tasks_page(
+        self: Client, cursor: str | None = None, limit: int | None = None
+    ) -> mcp.types.ListTasksResult:
+        """Send a single 'tasks/list' request, without client-side fallback."""
+        params = PaginatedRequestParams(cursor=cursor, limit=limit)  # type: ignore[call-arg]  # Optional field in MCP SDK
+        request = ListTasksRequest(params=params)
+        return await self._await_with_session_monitoring(
+            self.session.send_request(
+                request=request,  # type: ignore[invalid-argument-type]
+                result_type=mcp.types.ListTasksResult,
+            )
+        )
+
     async def cancel_task(self: Client, task_id: str) -> mcp.types.CancelTaskResult:
         """Cancel a task, transitioning it to cancelled state.
 
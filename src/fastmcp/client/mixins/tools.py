@@ -7,7 +7,7 @@ import weakref
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 import mcp.types
-from pydantic import RootModel
+from pydantic import RootModel, TypeAdapter
 
 if TYPE_CHECKING:
     import datetime
@@ -21,7 +21,7 @@ from fastmcp.telemetry import inject_trace_context
 from fastmcp.utilities.json_schema_type import json_schema_to_type
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.timeout import normalize_timeout_to_timedelta
-from fastmcp.utilities.types import get_cached_typeadapter
+from fastmcp.utilities.types import get_cached_typeadapter, identity_cache
 
 logger = get_logger(__name__)
 
@@ -29,6 +29,16 @@ logger = get_logger(__name__)
 ToolTaskResponseUnion = RootModel[mcp.types.CreateTaskResult | mcp.types.CallToolResult]
 
 
+@identity_cache(maxsize=1024)
+def _output_type_adapter(output_schema: dict[str, Any]) -> TypeAdapter[Any]:
+    """TypeAdapter for a tool output schema, built once per schema object.
+
+    The session keeps the same schema dicts until tools are re-listed, so this
+    skips hashing the schema to find its generated type on every call.
+    """
+    return get_cached_typeadapter(json_schema_to_type(output_schema))
+
+
 class ClientToolsMixin:
     """Mixin providing tool-related methods for Client."""
 
@@ -386,8 +396,7 @@ async def _parse_call_tool_result(
                         structured_content = result.structuredContent.get("result")
                     else:
                         structured_content = result.structuredContent
-                    output_type = json_schema_to_type(output_schema)
-                    type_adapter = get_cached_typeadapter(output_type)
+                    type_adapter = _output_type_adapter(output_schema)
                     data = type_adapter.validate_python(structured_content)
                 else:
                     data = result.structuredContent
@@ -5,16 +5,20 @@ from __future__ import annotations
 import abc
 import asyncio
 import inspect
+import random
 import time
 import weakref
 from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import mcp.types
 from mcp.types import GetTaskResult, TaskStatusNotification
 
 from fastmcp.client.messages import Message, MessageHandler
+from fastmcp.utilities.async_utils import gather
 from fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -43,6 +47,171 @@ class TaskNotificationHandler(MessageHandler):
 
 TaskResultT = TypeVar("TaskResultT")
 
+# Poll interval used until the server suggests one via pollInterval
+DEFAULT_POLL_INTERVAL = 0.5
+# Unchanged polls back off exponentially up to this interval (seconds)
+MAX_POLL_INTERVAL = 30.0
+POLL_BACKOFF = 1.5
+POLL_JITTER = 0.1
+
+
+@dataclass
+class _WatchEntry:
+    task: Task[Any]
+    waiters: int
+    interval: float
+    next_poll: float
+
+
+class TaskWatcher:
+    """Polls the status of every task a Client is waiting on from one loop.
+
+    Each Client has one watcher. `Task.wait()` registers with it instead of
+    polling on its own, so waiting on many tasks costs one loop rather than
+    one per task. Polls follow the server's suggested pollInterval and back
+    off exponentially (with jitter) while a task's status is unchanged;
+    notifications/tasks/status updates reset the backoff, so servers that
+    push status changes are polled rarely.
+
+    When several tasks are due at once, their statuses are fetched with
+    tasks/list. Servers that track tasks client-side return an empty list,
+    after which the watcher sends one tasks/get per task.
+    """
+
+    def __init__(self, client: Client):
+        self._client_ref: weakref.ref[Client] = weakref.ref(client)
+        self._entries: dict[str, _WatchEntry] = {}
+        self._wakeup: asyncio.Event | None = None
+        self._runner: asyncio.Task[None] | None = None
+        self._bulk_supported = True
+
+    def watch(self, task: Task[Any]) -> None:
+        """Start polling `task` on behalf of one waiter."""
+        entry = self._entries.get(task.task_id)
+        if entry is not None:
+            entry.waiters += 1
+            return
+        interval = _suggested_interval(task._status_cache)
+        self._entries[task.task_id] = _WatchEntry(
+            task=task,
+            waiters=1,
+            interval=interval,
+            next_poll=time.monotonic() + _jittered(interval),
+        )
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.create_task(self._run())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+    def unwatch(self, task: Task[Any]) -> None:
+        """Stop polling `task` for one waiter."""
+        entry = self._entries.get(task.task_id)
+        if entry is None:
+            return
+        entry.waiters -= 1
+        if entry.waiters <= 0:
+            del self._entries[task.task_id]
+
+    def status_notified(self, task_id: str) -> None:
+        """Push back the next poll of a task whose status the server just sent."""
+        entry = self._entries.get(task_id)
+        if entry is not None:
+            entry.interval = _suggested_interval(entry.task._status_cache)
+            entry.next_poll = time.monotonic() + _jittered(entry.interval)
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while self._entries and self._client_ref() is not None:
+            now = time.monotonic()
+            # Fold polls due within their jitter band into this batch
+            due = [
+                e
+                for e in self._entries.values()
+                if e.next_poll <= now + e.interval * POLL_JITTER
+            ]
+            if not due:
+                next_poll = min(e.next_poll for e in self._entries.values())
+                self._wakeup.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), next_poll - now)
+                continue
+            await self._poll(due)
+
+    async def _poll(self, due: list[_WatchEntry]) -> None:
+        client = self._client_ref()
+        if client is None:
+            return
+
+        statuses: dict[str, GetTaskResult | BaseException] = {}
+        if self._bulk_supported and len(due) > 1:
+            try:
+                statuses.update(
+                    await self._list_statuses(client, {e.task.task_id for e in due})
+                )
+            except Exception as e:
+                logger.debug(f"tasks/list poll failed, falling back to tasks/get: {e}")
+                self._bulk_supported = False
+
+        missing = [e.task.task_id for e in due if e.task.task_id not in statuses]
+        results = await gather(
+            *(client.get_task_status(task_id) for task_id in missing),
+            return_exceptions=True,
+        )
+        statuses.update(zip(missing, results, strict=True))
+
+        now = time.monotonic()
+        for entry in due:
+            status = statuses[entry.task.task_id]
+            if isinstance(status, BaseException):
+                entry.task._set_watch_error(status)
+            else:
+                previous = entry.task._status_cache
+                entry.task._set_status(status)
+                if previous is None or previous.status != status.status:
+                    entry.interval = _suggested_interval(status)
+                else:
+                    entry.interval = min(
+                        entry.interval * POLL_BACKOFF,
+                        max(MAX_POLL_INTERVAL, _suggested_interval(status)),
+                    )
+            entry.next_poll = now + _jittered(entry.interval)
+
+    async def _list_statuses(
+        self, client: Client, task_ids: set[str]
+    ) -> dict[str, GetTaskResult]:
+        """Fetch statuses for `task_ids` from tasks/list pages.
+
+        Stops once every task is found, or after as many pages as there are
+        tasks, beyond which individual tasks/get requests are cheaper.
+        """
+        found: dict[str, GetTaskResult] = {}
+        cursor: str | None = None
+        for _ in range(len(task_ids)):
+            page = await client._list_tasks_page(cursor)
+            if not page.tasks and cursor is None:
+                # Server tracks tasks client-side; use tasks/get from now on
+                self._bulk_supported = False
+                break
+            for task in page.tasks:
+                if task.taskId in task_ids:
+                    found[task.taskId] = GetTaskResult.model_validate(task.model_dump())
+            cursor = page.nextCursor
+            if cursor is None or len(found) == len(task_ids):
+                break
+        return found
+
+
+def _suggested_interval(status: GetTaskResult | None) -> float:
+    """The server's suggested poll interval in seconds, or the default."""
+    if status is not None and status.pollInterval:
+        return status.pollInterval / 1000
+    return DEFAULT_POLL_INTERVAL
+
+
+def _jittered(interval: float) -> float:
+    return interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
 
 class Task(abc.ABC, Generic[TaskResultT]):
     """
@@ -83,6 +252,8 @@ class Task(abc.ABC, Generic[TaskResultT]):
             Callable[[GetTaskResult], None | Awaitable[None]]
         ] = []
         self._cached_result: TaskResultT | None = None
+        # Poll failure reported by the client's TaskWatcher to wait()
+        self._watch_error: BaseException | None = None
 
     def _check_client_connected(self) -> None:
         """Validate that client context is still active.
@@ -142,6 +313,18 @@ class Task(abc.ABC, Generic[TaskResultT]):
             except Exception as e:
                 logger.warning(f"Task callback error: {e}", exc_info=True)
 
+    def _set_status(self, status: GetTaskResult) -> None:
+        """Store a polled status and wake any wait() calls (internal)."""
+        self._status_cache = status
+        if self._status_event is not None:
+            self._status_event.set()
+
+    def _set_watch_error(self, error: BaseException) -> None:
+        """Hand a poll failure to the next wait() iteration (internal)."""
+        self._watch_error = error
+        if self._status_event is not None:
+            self._status_event.set()
+
     def on_status_change(
         self,
         callback: Callable[[GetTaskResult], None | Awaitable[None]],
@@ -214,6 +397,8 @@ class Task(abc.ABC, Generic[TaskResultT]):
         Uses event-based waiting when notifications are available (fast),
         with fallback to polling (reliable). Optimally wakes up immediately
         on status changes when server sends notifications/tasks/status.
+        Polling is shared by all tasks on the client (see TaskWatcher) and
+        follows the server's suggested pollInterval.
 
         Args:
             state: Desired state ('submitted', 'working', 'completed', 'failed').
@@ -236,38 +421,39 @@ class Task(abc.ABC, Generic[TaskResultT]):
         if self._status_event is None:
             self._status_event = asyncio.Event()
 
-        start = time.time()
+        deadline = time.monotonic() + timeout
         terminal_states = {"completed", "failed", "cancelled"}
-        poll_interval = 0.5  # Fallback polling interval (500ms)
-
-        while True:
-            # Check cached status first (updated by notifications)
-            if self._status_cache:
-                current = self._status_cache.status
-                if state is None:
-                    if current in terminal_states:
+
+        watcher = self._client._task_watcher
+        watcher.watch(self)
+        try:
+            while True:
+                if self._watch_error is not None:
+                    error, self._watch_error = self._watch_error, None
+                    raise error
+
+                # Check cached status (updated by notifications and polls)
+                if self._status_cache:
+                    current = self._status_cache.status
+                    if state is None:
+                        if current in terminal_states:
+                            return self._status_cache
+                    elif current == state:
                         return self._status_cache
-                elif current == state:
-                    return self._status_cache
-
-            # Check timeout
-            elapsed = time.time() - start
-            if elapsed >= timeout:
-                raise TimeoutError(
-                    f"Task {self._task_id} did not reach {state or 'terminal state'} within {timeout}s"
-                )
 
-            remaining = timeout - elapsed
+                # Check timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Task {self._task_id} did not reach {state or 'terminal state'} within {timeout}s"
+                    )
 
-            # Wait for notification event OR poll timeout
-            try:
-                await asyncio.wait_for(
-                    self._status_event.wait(), timeout=min(poll_interval, remaining)
-                )
-                self._status_event.clear()
-            except asyncio.TimeoutError:
-                # Fallback: poll server (notification didn't arrive in time)
-                self._status_cache = await self._client.get_task_status(self._task_id)
+                # Wait for a notification or poll result
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._status_event.wait(), remaining)
+                    self._status_event.clear()
+        finally:
+            watcher.unwatch(self)
 
     async def cancel(self) -> None:
         """Cancel this task, transitioning it to cancelled state.
@@ -15,6 +15,7 @@ from fastmcp.client.transports.stdio import (
     FastMCPStdioTransport,
     NodeStdioTransport,
     NpxStdioTransport,
+    PooledStdioTransport,
     PythonStdioTransport,
     StdioTransport,
     UvStdioTransport,
@@ -28,6 +29,7 @@ __all__ = [
     "FastMCPTransport",
     "NodeStdioTransport",
     "NpxStdioTransport",
+    "PooledStdioTransport",
     "PythonStdioTransport",
     "SSETransport",
     "StdioTransport",
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
+import asyncio
 import contextlib
 import datetime
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mcp import ClientSession
 from typing_extensions import Unpack
@@ -16,7 +19,15 @@ from fastmcp.mcp_config import (
     TransformingRemoteMCPServer,
     TransformingStdioMCPServer,
 )
-from fastmcp.server.server import FastMCP, create_proxy
+from fastmcp.server.server import FastMCP
+from fastmcp.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    from fastmcp.server.providers.proxy import _ProxyBackend
+
+logger = get_logger(__name__)
+
+DEFAULT_STARTUP_TIMEOUT = 30.0
 
 
 class MCPConfigTransport(ClientTransport):
@@ -66,12 +77,36 @@ class MCPConfigTransport(ClientTransport):
         ```
     """
 
-    def __init__(self, config: MCPConfig | dict, name_as_prefix: bool = True):
+    def __init__(
+        self,
+        config: MCPConfig | dict,
+        name_as_prefix: bool = True,
+        startup_timeout: float | None = DEFAULT_STARTUP_TIMEOUT,
+    ):
+        """
+        Initialize an MCPConfig transport.
+
+        Args:
+            config: The MCPConfig, or a dict matching its schema
+            name_as_prefix: Whether to namespace each server's components with
+                its name when there are several servers
+            startup_timeout: Seconds to wait for each server to connect when
+                the composite starts. Servers that take longer keep starting
+                in the background and are left out of listings until they
+                connect; calling one of their components waits for them. A
+                server's own `startup_timeout` setting takes precedence. None
+                waits for every server.
+        """
         if isinstance(config, dict):
             config = MCPConfig.from_dict(config)
         self.config = config
         self.name_as_prefix = name_as_prefix
+        self.startup_timeout = startup_timeout
         self._transports: list[ClientTransport] = []
+        self._backends: dict[str, _ProxyBackend] = {}
+        self._composite: FastMCP[Any] | None = None
+        # Backends that already used up their startup timeout
+        self._timed_out: set[str] = set()
 
         if not self.config.mcpServers:
             raise ValueError("No MCP servers defined in the config")
@@ -81,6 +116,15 @@ class MCPConfigTransport(ClientTransport):
             self.transport = next(iter(self.config.mcpServers.values())).to_transport()
             self._transports.append(self.transport)
 
+    @property
+    def connect_times(self) -> dict[str, float]:
+        """Seconds each connected server took to connect, by server name."""
+        return {
+            name: backend.connect_time
+            for name, backend in self._backends.items()
+            if backend.connect_time is not None
+        }
+
     @contextlib.asynccontextmanager
     async def connect_session(
         self, **session_kwargs: Unpack[SessionKwargs]
@@ -91,30 +135,56 @@ class MCPConfigTransport(ClientTransport):
                 yield session
             return
 
-        # Multiple servers - create composite with mounted proxies
-        # Close any previous transports from prior connections to avoid leaking
-        for t in self._transports:
-            await t.close()
-        self._transports = []
-        timeout = session_kwargs.get("read_timeout_seconds")
-        composite = FastMCP[Any](name="MCPRouter")
+        # Multiple servers - build the composite once and reuse it across
+        # connections, along with the backend transports it proxies to
+        if self._composite is None:
+            self._composite = self._create_composite(
+                session_kwargs.get("read_timeout_seconds")
+            )
+        await self._start_backends()
+
+        async with FastMCPTransport(mcp=self._composite).connect_session(
+            **session_kwargs
+        ) as session:
+            yield session
 
+    def _create_composite(self, timeout: datetime.timedelta | None) -> FastMCP[Any]:
+        composite = FastMCP[Any](name="MCPRouter")
         try:
             for name, server_config in self.config.mcpServers.items():
                 transport, proxy = self._create_proxy(name, server_config, timeout)
                 self._transports.append(transport)
                 composite.mount(proxy, namespace=name if self.name_as_prefix else None)
         except Exception:
-            # Clean up any transports created before the failure
-            for t in self._transports:
-                await t.close()
             self._transports = []
+            self._backends = {}
             raise
-
-        async with FastMCPTransport(mcp=composite).connect_session(
-            **session_kwargs
-        ) as session:
-            yield session
+        return composite
+
+    async def _start_backends(self) -> None:
+        """Connect all backends in parallel, each up to its startup timeout.
+
+        Backends still connecting after their timeout are left to finish in
+        the background, and later connections don't wait for them again.
+        """
+        waits = [
+            self._wait_for_backend(backend)
+            for name, backend in self._backends.items()
+            if not backend.ready
+            and not (backend.connecting and name in self._timed_out)
+        ]
+        if waits:
+            await asyncio.gather(*waits)
+
+    async def _wait_for_backend(self, backend: _ProxyBackend) -> None:
+        task = backend.start()
+        await asyncio.wait([task], timeout=backend.startup_timeout)
+        if not task.done():
+            self._timed_out.add(backend.name)
+            logger.info(
+                f"MCP server {backend.name!r} did not connect within "
+                f"{backend.startup_timeout}s; continuing to connect in the background"
+            )
 
     def _create_proxy(
         self,
@@ -124,7 +194,10 @@ class MCPConfigTransport(ClientTransport):
     ) -> tuple[ClientTransport, FastMCP[Any]]:
         """Create underlying transport and proxy server for a single backend."""
         # Import here to avoid circular dependency
-        from fastmcp.server.providers.proxy import ProxyClient
+        from fastmcp.server.providers.proxy import (
+            _BackendProxyProvider,
+            _ProxyBackend,
+        )
 
         tool_transforms = None
         include_tags = None
@@ -144,11 +217,15 @@ class MCPConfigTransport(ClientTransport):
         else:
             transport = config.to_transport()
 
-        client = ProxyClient(transport=transport, timeout=timeout)
+        startup_timeout = config.startup_timeout
+        if startup_timeout is None:
+            startup_timeout = self.startup_timeout
+        backend = _ProxyBackend(name, transport, timeout, startup_timeout)
+        self._backends[name] = backend
+
         # Create proxy without include_tags/exclude_tags - we'll add them after tool transforms
-        proxy = create_proxy(
-            client,
-            name=f"Proxy-{name}",
+        proxy = FastMCP[Any](
+            name=f"Proxy-{name}", providers=[_BackendProxyProvider(backend)]
         )
         # Add tool transforms FIRST - they may add/modify tags
         if tool_transforms:
@@ -163,8 +240,16 @@ class MCPConfigTransport(ClientTransport):
         return transport, proxy
 
     async def close(self):
+        for backend in self._backends.values():
+            await backend.stop()
         for transport in self._transports:
             await transport.close()
+        # The next multi-server connection builds a fresh composite
+        if len(self.config.mcpServers) > 1:
+            self._transports = []
+            self._backends = {}
+            self._composite = None
+            self._timed_out = set()
 
     def __repr__(self) -> str:
         return f"<MCPConfigTransport(config='{self.config}')>"
@@ -3,13 +3,17 @@ import contextlib
 import os
 import shutil
 import sys
+import time
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TextIO, cast
 
 import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.shared.message import SessionMessage
 from typing_extensions import Unpack
 
 from fastmcp.client.transports.base import ClientTransport, SessionKwargs
@@ -64,6 +68,10 @@ class StdioTransport(ClientTransport):
         self.log_file = log_file
 
         self._session: ClientSession | None = None
+        # Receives the server's stdout; closed for sending once it exits
+        self._read_stream: (
+            MemoryObjectReceiveStream[SessionMessage | Exception] | None
+        ) = None
         self._connect_task: asyncio.Task | None = None
         self._ready_event = anyio.Event()
         self._stop_event = anyio.Event()
@@ -88,6 +96,9 @@ class StdioTransport(ClientTransport):
             return
 
         session_future: asyncio.Future[ClientSession] = asyncio.Future()
+        read_stream_future: asyncio.Future[
+            MemoryObjectReceiveStream[SessionMessage | Exception]
+        ] = asyncio.Future()
 
         # start the connection task
         self._connect_task = asyncio.create_task(
@@ -102,6 +113,7 @@ class StdioTransport(ClientTransport):
                 ready_event=self._ready_event,
                 stop_event=self._stop_event,
                 session_future=session_future,
+                read_stream_future=read_stream_future,
             )
         )
 
@@ -115,6 +127,7 @@ class StdioTransport(ClientTransport):
                 raise exception
 
         self._session = await session_future
+        self._read_stream = await read_stream_future
         return self._session
 
     async def disconnect(self):
@@ -129,6 +142,7 @@ class StdioTransport(ClientTransport):
 
         # reset variables and events for potential future reconnects
         self._connect_task = None
+        self._read_stream = None
         self._stop_event = anyio.Event()
         self._ready_event = anyio.Event()
 
@@ -156,6 +170,10 @@ async def _stdio_transport_connect_task(
     ready_event: anyio.Event,
     stop_event: anyio.Event,
     session_future: asyncio.Future[ClientSession],
+    read_stream_future: asyncio.Future[
+        MemoryObjectReceiveStream[SessionMessage | Exception]
+    ]
+    | None = None,
 ):
     """A standalone connection task for a stdio transport. It is not a part of the StdioTransport class
     to ensure that the connection task does not hold a reference to the Transport object."""
@@ -182,6 +200,8 @@ async def _stdio_transport_connect_task(
                     stdio_client(server_params, errlog=log_file_handle)
                 )
                 read_stream, write_stream = transport
+                if read_stream_future is not None:
+                    read_stream_future.set_result(read_stream)
                 session_future.set_result(
                     await stack.enter_async_context(
                         ClientSession(read_stream, write_stream, **session_kwargs)
@@ -202,6 +222,274 @@ async def _stdio_transport_connect_task(
         raise
 
 
+@dataclass(eq=False)
+class _StdioWorker:
+    """One subprocess in a PooledStdioTransport."""
+
+    index: int
+    transport: StdioTransport
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Sessions currently leased to clients
+    outstanding: int = 0
+    # Consecutive failed starts or crashes, used for restart backoff
+    failures: int = 0
+    # Monotonic time before which the worker should not be restarted
+    retry_at: float = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self.transport._connect_task is not None and not self.crashed
+
+    @property
+    def crashed(self) -> bool:
+        task = self.transport._connect_task
+        if task is None:
+            return False
+        if task.done():
+            return True
+        # When the subprocess exits, the stdout reader closes the sending end
+        # of the read stream while the connect task keeps waiting
+        read_stream = self.transport._read_stream
+        return (
+            read_stream is not None and read_stream.statistics().open_send_streams == 0
+        )
+
+
+class PooledStdioTransport(ClientTransport):
+    """
+    Transport that spreads sessions across several identical stdio subprocesses.
+
+    Each connection is leased to the running worker with the fewest
+    outstanding sessions. Idle running workers are preferred over spawning
+    new ones, so workers start only when the pool is busy (or all at once with
+    `prespawn=True`). Workers that exit are restarted on their next lease,
+    with exponential backoff between failed restarts.
+
+    Because consecutive sessions may reach different processes, the server
+    must not keep state between requests. Pooling more than one worker
+    therefore requires `stateless=True` as an explicit acknowledgement.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        args: list[str],
+        env: dict[str, str] | None = None,
+        cwd: str | None = None,
+        *,
+        workers: int,
+        stateless: bool = False,
+        prespawn: bool = False,
+        keep_alive: bool | None = None,
+        log_file: Path | TextIO | None = None,
+        restart_backoff: float = 0.5,
+        max_restart_backoff: float = 30.0,
+    ):
+        """
+        Initialize a pooled Stdio transport.
+
+        Args:
+            command: The command to run (e.g., "python", "node", "uvx")
+            args: The arguments to pass to the command
+            env: Environment variables to set for each subprocess
+            cwd: Current working directory for each subprocess
+            workers: Maximum number of subprocesses to run
+            stateless: Confirms that the server keeps no state between
+                requests (sessions, subscriptions, in-memory data), so any
+                worker can serve any session. Required when workers > 1.
+            prespawn: Start every worker on the first connection (or on
+                `start()`) instead of only when the pool is busy.
+            keep_alive: Whether to keep each worker alive once none of its
+                sessions are leased. Defaults to True.
+            log_file: Optional path or file-like object where subprocess stderr
+                will be written. Defaults to sys.stderr.
+            restart_backoff: Seconds to wait before restarting a worker that
+                failed again right after a restart. Doubles with each
+                consecutive failure.
+            max_restart_backoff: Upper bound on the restart delay in seconds.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if workers > 1 and not stateless:
+            raise ValueError(
+                "Pooling stdio workers sends sessions for one server to "
+                "different processes, so state kept by the server is not "
+                "shared between them. Pass stateless=True to confirm the "
+                "server keeps no state between requests."
+            )
+        self.command = command
+        self.args = args
+        self.env = env
+        self.cwd = cwd
+        self.stateless = stateless
+        self.prespawn = prespawn
+        self.keep_alive = True if keep_alive is None else keep_alive
+        self.log_file = log_file
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+
+        self._workers = [
+            _StdioWorker(
+                index=i,
+                transport=StdioTransport(
+                    command=command,
+                    args=args,
+                    env=env,
+                    cwd=cwd,
+                    keep_alive=True,
+                    log_file=log_file,
+                ),
+            )
+            for i in range(workers)
+        ]
+        self._prespawn_tasks: set[asyncio.Task[None]] = set()
+        self._prespawned = False
+
+    @property
+    def workers(self) -> int:
+        """Maximum number of subprocesses in the pool."""
+        return len(self._workers)
+
+    @property
+    def outstanding(self) -> list[int]:
+        """Number of sessions currently leased to each worker."""
+        return [worker.outstanding for worker in self._workers]
+
+    @contextlib.asynccontextmanager
+    async def connect_session(
+        self, **session_kwargs: Unpack[SessionKwargs]
+    ) -> AsyncIterator[ClientSession]:
+        kwargs = SessionKwargs(**session_kwargs)
+        if self.prespawn and not self._prespawned:
+            self._spawn_all(kwargs)
+
+        worker = await self._lease()
+        try:
+            session = await self._ensure_started(worker, kwargs)
+            yield session
+        finally:
+            worker.outstanding -= 1
+            if not self.keep_alive:
+                async with worker.lock:
+                    if worker.outstanding == 0:
+                        await self._stop(worker)
+
+    async def start(self, **session_kwargs: Unpack[SessionKwargs]) -> None:
+        """Start every worker now, for a warm pool before the first request.
+
+        Workers share the session callbacks of whichever connection starts
+        them, so pass the same callbacks the client uses.
+        """
+        kwargs = SessionKwargs(**session_kwargs)
+        self._prespawned = True
+        await asyncio.gather(
+            *(self._ensure_started(worker, kwargs) for worker in self._workers)
+        )
+
+    def _spawn_all(self, session_kwargs: SessionKwargs) -> None:
+        self._prespawned = True
+        for worker in self._workers:
+            task = asyncio.create_task(self._prespawn_worker(worker, session_kwargs))
+            self._prespawn_tasks.add(task)
+            task.add_done_callback(self._prespawn_tasks.discard)
+
+    async def _prespawn_worker(
+        self, worker: _StdioWorker, session_kwargs: SessionKwargs
+    ) -> None:
+        try:
+            await self._ensure_started(worker, session_kwargs)
+        except Exception as e:
+            # The failure is recorded for backoff; leasing retries the start
+            logger.debug(f"Failed to prespawn stdio worker {worker.index}: {e}")
+
+    async def _lease(self) -> _StdioWorker:
+        """Pick the worker with the fewest outstanding sessions and lease it.
+
+        Running workers win ties over stopped ones, and workers waiting out a
+        restart backoff are only used once every worker is backing off.
+        """
+        while True:
+            now = time.monotonic()
+            available = [w for w in self._workers if w.retry_at <= now]
+            if available:
+                worker = min(
+                    available, key=lambda w: (w.outstanding, not w.running, w.index)
+                )
+                worker.outstanding += 1
+                return worker
+            await asyncio.sleep(min(w.retry_at for w in self._workers) - now)
+
+    async def _ensure_started(
+        self, worker: _StdioWorker, session_kwargs: SessionKwargs
+    ) -> ClientSession:
+        async with worker.lock:
+            if worker.crashed:
+                await self._reap(worker)
+            if not worker.running:
+                try:
+                    await worker.transport.connect(**session_kwargs)
+                except Exception:
+                    await self._reap(worker)
+                    raise
+                if worker.failures:
+                    logger.debug(f"Restarted stdio worker {worker.index}")
+                worker.failures = 0
+                worker.retry_at = 0.0
+            return cast(ClientSession, worker.transport._session)
+
+    async def _reap(self, worker: _StdioWorker) -> None:
+        """Clean up a worker whose subprocess exited or failed to start.
+
+        The first restart is immediate; each consecutive failure after that
+        doubles the delay before the worker is leased again.
+        """
+        worker.failures += 1
+        backoff = 0.0
+        if worker.failures > 1:
+            backoff = min(
+                self.restart_backoff * 2 ** (worker.failures - 2),
+                self.max_restart_backoff,
+            )
+        worker.retry_at = time.monotonic() + backoff
+        logger.warning(
+            f"Stdio worker {worker.index} exited; restarting in {backoff:.1f}s"
+        )
+        await self._stop(worker)
+
+    async def _stop(self, worker: _StdioWorker) -> None:
+        transport = worker.transport
+        if transport._connect_task is None:
+            return
+        try:
+            await transport.disconnect()
+        except Exception as e:
+            logger.debug(f"Stdio worker {worker.index} exited with: {e}")
+        finally:
+            transport._connect_task = None
+            transport._session = None
+            transport._read_stream = None
+            transport._stop_event = anyio.Event()
+            transport._ready_event = anyio.Event()
+
+    async def disconnect(self):
+        for task in list(self._prespawn_tasks):
+            task.cancel()
+        await asyncio.gather(*self._prespawn_tasks, return_exceptions=True)
+        self._prespawned = False
+        for worker in self._workers:
+            async with worker.lock:
+                await self._stop(worker)
+
+    async def close(self):
+        await self.disconnect()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}(command='{self.command}', "
+            f"args={self.args}, workers={self.workers})>"
+        )
+
+
 class PythonStdioTransport(StdioTransport):
     """Transport for running Python scripts."""
 
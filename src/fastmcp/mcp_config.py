@@ -46,6 +46,7 @@ from fastmcp.utilities.types import FastMCPBaseModel
 if TYPE_CHECKING:
     from fastmcp.client.transports import (
         ClientTransport,
+        PooledStdioTransport,
         SSETransport,
         StdioTransport,
         StreamableHttpTransport,
@@ -172,9 +173,14 @@ class StdioMCPServer(BaseModel):
     # Execution context
     cwd: str | None = None  # Working directory for command execution
     timeout: int | None = None  # Maximum response time in milliseconds
+    startup_timeout: float | None = (
+        None  # Seconds to wait at startup before connecting lazily
+    )
     keep_alive: bool | None = (
         None  # Whether to keep the subprocess alive between connections
     )
+    workers: int | None = None  # Run a pool of this many identical subprocesses
+    stateless: bool = False  # Confirms the server can be pooled across processes
 
     # Metadata
     description: str | None = None  # Human-readable server description
@@ -185,9 +191,19 @@ class StdioMCPServer(BaseModel):
 
     model_config = ConfigDict(extra="allow")  # Preserve unknown fields
 
-    def to_transport(self) -> StdioTransport:
-        from fastmcp.client.transports import StdioTransport
-
+    def to_transport(self) -> StdioTransport | PooledStdioTransport:
+        from fastmcp.client.transports import PooledStdioTransport, StdioTransport
+
+        if self.workers is not None:
+            return PooledStdioTransport(
+                command=self.command,
+                args=self.args,
+                env=self.env,
+                cwd=self.cwd,
+                workers=self.workers,
+                stateless=self.stateless,
+                keep_alive=self.keep_alive,
+            )
         return StdioTransport(
             command=self.command,
             args=self.args,
@@ -225,6 +241,9 @@ class RemoteMCPServer(BaseModel):
     # Timeout configuration
     sse_read_timeout: datetime.timedelta | int | float | None = None
     timeout: int | None = None  # Maximum response time in milliseconds
+    startup_timeout: float | None = (
+        None  # Seconds to wait at startup before connecting lazily
+    )
 
     # Metadata
     description: str | None = None  # Human-readable server description
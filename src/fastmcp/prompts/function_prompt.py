@@ -26,6 +26,7 @@ from fastmcp.decorators import resolve_task_config
 from fastmcp.exceptions import PromptError
 from fastmcp.prompts.prompt import Prompt, PromptArgument, PromptResult
 from fastmcp.server.auth.authorization import AuthCheck
+from fastmcp.server.coalescing import validate_coalesce
 from fastmcp.server.dependencies import (
     transform_context_annotations,
     without_injected_parameters,
@@ -68,6 +69,7 @@ class PromptMeta:
     meta: dict[str, Any] | None = None
     task: bool | TaskConfig | None = None
     auth: AuthCheck | list[AuthCheck] | None = None
+    coalesce: bool = False
     enabled: bool = True
 
 
@@ -92,6 +94,7 @@ class FunctionPrompt(Prompt):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionPrompt:
         """Create a Prompt from a function.
 
@@ -108,7 +111,7 @@ class FunctionPrompt(Prompt):
         - PromptResult: used directly
         """
         # Check mutual exclusion
-        individual_params_provided = any(
+        individual_params_provided = coalesce or any(
             x is not None
             for x in [name, version, title, description, icons, tags, meta, task, auth]
         )
@@ -131,6 +134,7 @@ class FunctionPrompt(Prompt):
                 meta=meta,
                 task=task,
                 auth=auth,
+                coalesce=coalesce,
             )
 
         func_name = (
@@ -169,6 +173,8 @@ class FunctionPrompt(Prompt):
 
         # Transform Context type annotations to Depends() for unified DI
         fn = transform_context_annotations(fn)
+        if metadata.coalesce:
+            validate_coalesce(fn, func_name)
 
         # Wrap fn to handle dependency resolution internally
         wrapped_fn = without_injected_parameters(fn)
@@ -232,6 +238,7 @@ class FunctionPrompt(Prompt):
             meta=metadata.meta,
             task_config=task_config,
             auth=metadata.auth,
+            coalesce=metadata.coalesce,
         )
 
     def _convert_string_arguments(self, kwargs: dict[str, Any]) -> dict[str, Any]:
@@ -378,6 +385,7 @@ def prompt(
     meta: dict[str, Any] | None = None,
     task: bool | TaskConfig | None = None,
     auth: AuthCheck | list[AuthCheck] | None = None,
+    coalesce: bool = False,
 ) -> Callable[[F], F]: ...
 @overload
 def prompt(
@@ -392,6 +400,7 @@ def prompt(
     meta: dict[str, Any] | None = None,
     task: bool | TaskConfig | None = None,
     auth: AuthCheck | list[AuthCheck] | None = None,
+    coalesce: bool = False,
 ) -> Callable[[F], F]: ...
 
 
@@ -407,6 +416,7 @@ def prompt(
     meta: dict[str, Any] | None = None,
     task: bool | TaskConfig | None = None,
     auth: AuthCheck | list[AuthCheck] | None = None,
+    coalesce: bool = False,
 ) -> Any:
     """Standalone decorator to mark a function as an MCP prompt.
 
@@ -433,6 +443,7 @@ def prompt(
             meta=meta,
             task=resolve_task_config(task),
             auth=auth,
+            coalesce=coalesce,
         )
         return FunctionPrompt.from_function(fn, metadata=prompt_meta)
 
@@ -447,6 +458,7 @@ def prompt(
             meta=meta,
             task=task,
             auth=auth,
+            coalesce=coalesce,
         )
         target = fn.__func__ if hasattr(fn, "__func__") else fn
         target.__fastmcp__ = metadata
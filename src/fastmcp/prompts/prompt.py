@@ -198,6 +198,11 @@ class Prompt(FastMCPComponent):
     auth: SkipJsonSchema[AuthCheck | list[AuthCheck] | None] = Field(
         default=None, description="Authorization checks for this prompt", exclude=True
     )
+    coalesce: bool = Field(
+        default=False,
+        description="Whether concurrent identical renders share one execution",
+        exclude=True,
+    )
 
     def to_mcp_prompt(
         self,
@@ -238,6 +243,7 @@ class Prompt(FastMCPComponent):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionPrompt:
         """Create a Prompt from a function.
 
@@ -259,6 +265,7 @@ class Prompt(FastMCPComponent):
             meta=meta,
             task=task,
             auth=auth,
+            coalesce=coalesce,
         )
 
     async def render(
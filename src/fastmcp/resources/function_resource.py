@@ -17,6 +17,7 @@ from fastmcp.decorators import resolve_task_config
 from fastmcp.resources.resource import Resource, ResourceResult
 from fastmcp.server.apps import resolve_ui_mime_type
 from fastmcp.server.auth.authorization import AuthCheck
+from fastmcp.server.coalescing import validate_coalesce
 from fastmcp.server.dependencies import (
     transform_context_annotations,
     without_injected_parameters,
@@ -58,6 +59,7 @@ class ResourceMeta:
     meta: dict[str, Any] | None = None
     task: bool | TaskConfig | None = None
     auth: AuthCheck | list[AuthCheck] | None = None
+    coalesce: bool = False
     enabled: bool = True
 
 
@@ -95,6 +97,7 @@ class FunctionResource(Resource):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionResource:
         """Create a FunctionResource from a function.
 
@@ -124,6 +127,7 @@ class FunctionResource(Resource):
                     auth,
                 ]
             )
+            or coalesce
             or uri is not None
         )
 
@@ -150,6 +154,7 @@ class FunctionResource(Resource):
                 meta=meta,
                 task=task,
                 auth=auth,
+                coalesce=coalesce,
             )
 
         uri_obj = AnyUrl(metadata.uri)
@@ -178,6 +183,8 @@ class FunctionResource(Resource):
 
         # Transform Context type annotations to Depends() for unified DI
         fn = transform_context_annotations(fn)
+        if metadata.coalesce:
+            validate_coalesce(fn, func_name)
 
         # Wrap fn to handle dependency resolution internally
         wrapped_fn = without_injected_parameters(fn)
@@ -199,6 +206,7 @@ class FunctionResource(Resource):
             meta=metadata.meta,
             task_config=task_config,
             auth=metadata.auth,
+            coalesce=metadata.coalesce,
         )
 
     async def read(
@@ -247,6 +255,7 @@ def resource(
     meta: dict[str, Any] | None = None,
     task: bool | TaskConfig | None = None,
     auth: AuthCheck | list[AuthCheck] | None = None,
+    coalesce: bool = False,
 ) -> Callable[[F], F]:
     """Standalone decorator to mark a function as an MCP resource.
 
@@ -285,6 +294,7 @@ def resource(
             meta=meta,
             task=resolved,
             auth=auth,
+            coalesce=coalesce,
         )
 
         if has_uri_params or has_func_params:
@@ -303,6 +313,7 @@ def resource(
                 meta=meta,
                 task=resolved,
                 auth=auth,
+                coalesce=coalesce,
             )
         else:
             return FunctionResource.from_function(fn, metadata=resource_meta)
@@ -321,6 +332,7 @@ def resource(
             meta=meta,
             task=task,
             auth=auth,
+            coalesce=coalesce,
         )
         target = fn.__func__ if hasattr(fn, "__func__") else fn
         target.__fastmcp__ = metadata
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import base64
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, overload
 
 import mcp.types
@@ -22,6 +22,7 @@ from pydantic import (
     AnyUrl,
     ConfigDict,
     Field,
+    PrivateAttr,
     UrlConstraints,
     field_validator,
     model_validator,
@@ -60,6 +61,10 @@ class ResourceContent(pydantic.BaseModel):
     mime_type: str | None = None
     meta: dict[str, Any] | None = None
 
+    # Base64 encoding of binary content, computed on first conversion so
+    # content that is cached and served repeatedly is only encoded once
+    _blob: str | None = PrivateAttr(default=None)
+
     def __init__(
         self,
         content: Any,
@@ -89,6 +94,19 @@ class ResourceContent(pydantic.BaseModel):
 
         super().__init__(content=normalized_content, mime_type=mime_type, meta=meta)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "content":
+            self._blob = None
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copy = super().model_copy(update=update, deep=deep)
+        if update and "content" in update:
+            copy._blob = None
+        return copy
+
     def to_mcp_resource_contents(
         self, uri: AnyUrl | str
     ) -> mcp.types.TextResourceContents | mcp.types.BlobResourceContents:
@@ -108,9 +126,12 @@ class ResourceContent(pydantic.BaseModel):
                 _meta=self.meta,  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
             )
         else:
+            blob = self._blob
+            if blob is None:
+                blob = self._blob = base64.b64encode(self.content).decode()
             return mcp.types.BlobResourceContents(
                 uri=AnyUrl(uri) if isinstance(uri, str) else uri,
-                blob=base64.b64encode(self.content).decode(),
+                blob=blob,
                 mimeType=self.mime_type or "application/octet-stream",
                 _meta=self.meta,  # type: ignore[call-arg]  # _meta is Pydantic alias for meta field
             )
@@ -230,6 +251,13 @@ class Resource(FastMCPComponent):
         SkipJsonSchema[AuthCheck | list[AuthCheck] | None],
         Field(description="Authorization checks for this resource", exclude=True),
     ] = None
+    coalesce: Annotated[
+        bool,
+        Field(
+            description="Whether concurrent identical reads share one execution",
+            exclude=True,
+        ),
+    ] = False
 
     @classmethod
     def from_function(
@@ -248,6 +276,7 @@ class Resource(FastMCPComponent):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionResource:
         from fastmcp.resources.function_resource import (
             FunctionResource,
@@ -267,6 +296,7 @@ class Resource(FastMCPComponent):
             meta=meta,
             task=task,
             auth=auth,
+            coalesce=coalesce,
         )
 
     @field_validator("mime_type", mode="before")
@@ -393,9 +423,8 @@ class Resource(FastMCPComponent):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(uri={self.uri!r}, name={self.name!r}, description={self.description!r}, tags={self.tags})"
 
-    @property
-    def key(self) -> str:
-        """The globally unique lookup key for this resource."""
+    def _compute_key(self) -> str:
+        """Build the lookup key for this resource."""
         base_key = self.make_key(str(self.uri))
         return f"{base_key}@{self.version or ''}"
 
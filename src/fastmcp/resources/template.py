@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import re
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, ClassVar, overload
+from collections.abc import Callable, Collection
+from typing import TYPE_CHECKING, Any, ClassVar, get_type_hints, overload
 from urllib.parse import parse_qs, unquote
 
 import mcp.types
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 from mcp.types import ResourceTemplate as SDKResourceTemplate
 from pydantic import (
     Field,
+    TypeAdapter,
+    ValidationError,
     field_validator,
     validate_call,
 )
@@ -25,11 +28,13 @@ from pydantic import (
 from fastmcp.resources.resource import Resource, ResourceResult
 from fastmcp.server.apps import resolve_ui_mime_type
 from fastmcp.server.auth.authorization import AuthCheck
+from fastmcp.server.coalescing import validate_coalesce
 from fastmcp.server.dependencies import (
     transform_context_annotations,
     without_injected_parameters,
 )
 from fastmcp.server.tasks.config import TaskConfig, TaskMeta
+from fastmcp.utilities.async_utils import call_sync_fn_in_threadpool
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.types import get_cached_typeadapter
@@ -100,6 +105,72 @@ def match_uri_template(uri: str, uri_template: str) -> dict[str, str] | None:
     return params
 
 
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes")
+
+
+def _string_coercer(annotation: Any) -> Callable[[str], Any] | None:
+    """Return a function converting a string parameter to `annotation`.
+
+    Returns None when the string should be passed through unchanged. Values
+    that fail to convert are also passed through, so the function's own
+    validation reports the error.
+    """
+    if annotation is inspect.Parameter.empty or annotation is str:
+        return None
+    if isinstance(annotation, str):
+        # Unresolved forward reference
+        return None
+    if annotation is int or annotation is float:
+        return annotation
+    if annotation is bool:
+        return _parse_bool
+
+    try:
+        adapter = get_cached_typeadapter(annotation)
+    except TypeError:
+        # Unhashable annotation metadata
+        adapter = TypeAdapter(annotation)
+
+    def coerce(value: str) -> Any:
+        try:
+            return adapter.validate_strings(value)
+        except ValidationError:
+            pass
+        try:
+            # Lists, dicts and models passed as JSON
+            return adapter.validate_json(value)
+        except ValidationError:
+            return value
+
+    return coerce
+
+
+def _build_coercion_plan(
+    fn: Callable[..., Any], parameters: Collection[str] | None = None
+) -> dict[str, Callable[[str], Any]]:
+    """Map each parameter of `fn` that needs converting from a string to its
+    converter.
+
+    Args:
+        fn: The function whose parameters are converted
+        parameters: If given, only these parameters are considered (e.g. to
+            skip injected dependencies)
+    """
+    try:
+        hints = get_type_hints(fn, include_extras=True)
+    except Exception:
+        hints = {}
+    plan = {}
+    for name, param in inspect.signature(fn).parameters.items():
+        if parameters is not None and name not in parameters:
+            continue
+        coerce = _string_coercer(hints.get(name, param.annotation))
+        if coerce is not None:
+            plan[name] = coerce
+    return plan
+
+
 class ResourceTemplate(FastMCPComponent):
     """A template for dynamically creating resources."""
 
@@ -122,6 +193,11 @@ class ResourceTemplate(FastMCPComponent):
         description="Authorization checks for this resource template",
         exclude=True,
     )
+    coalesce: bool = Field(
+        default=False,
+        description="Whether concurrent identical reads share one execution",
+        exclude=True,
+    )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(uri_template={self.uri_template!r}, name={self.name!r}, description={self.description!r}, tags={self.tags})"
@@ -141,6 +217,7 @@ class ResourceTemplate(FastMCPComponent):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionResourceTemplate:
         return FunctionResourceTemplate.from_function(
             fn=fn,
@@ -156,6 +233,7 @@ class ResourceTemplate(FastMCPComponent):
             meta=meta,
             task=task,
             auth=auth,
+            coalesce=coalesce,
         )
 
     @field_validator("mime_type", mode="before")
@@ -283,9 +361,8 @@ class ResourceTemplate(FastMCPComponent):
             parameters={},  # Remote templates don't have local parameters
         )
 
-    @property
-    def key(self) -> str:
-        """The globally unique lookup key for this template."""
+    def _compute_key(self) -> str:
+        """Build the lookup key for this template."""
         base_key = self.make_key(self.uri_template)
         return f"{base_key}@{self.version or ''}"
 
@@ -390,35 +467,35 @@ class FunctionResourceTemplate(ResourceTemplate):
             auth=self.auth,
         )
 
+    @property
+    def _coercion_plan(self) -> dict[str, Callable[[str], Any]]:
+        """Converters for string parameters, built once and cached like `key`."""
+        derived = self._derived_values()
+        plan = derived.get("coercion_plan")
+        if plan is None:
+            plan = derived["coercion_plan"] = _build_coercion_plan(self.fn)
+        return plan
+
     async def read(self, arguments: dict[str, Any]) -> str | bytes | ResourceResult:
         """Read the resource content."""
         # Type coercion for query parameters (which arrive as strings)
         kwargs = arguments.copy()
-        sig = inspect.signature(self.fn)
-        for param_name, param_value in list(kwargs.items()):
-            if param_name in sig.parameters and isinstance(param_value, str):
-                param = sig.parameters[param_name]
-                annotation = param.annotation
-
-                if annotation is inspect.Parameter.empty or annotation is str:
-                    continue
-
-                try:
-                    if annotation is int:
-                        kwargs[param_name] = int(param_value)
-                    elif annotation is float:
-                        kwargs[param_name] = float(param_value)
-                    elif annotation is bool:
-                        kwargs[param_name] = param_value.lower() in ("true", "1", "yes")
-                except (ValueError, AttributeError):
-                    pass
+        plan = self._coercion_plan
+        for param_name, param_value in arguments.items():
+            coerce = plan.get(param_name)
+            if coerce is not None and isinstance(param_value, str):
+                with contextlib.suppress(ValueError, AttributeError):
+                    kwargs[param_name] = coerce(param_value)
 
         # self.fn is wrapped by without_injected_parameters which handles
         # dependency resolution internally, so we call it directly
-        result = self.fn(**kwargs)
+        if inspect.iscoroutinefunction(self.fn):
+            return await self.fn(**kwargs)
+
+        # Sync function: run in threadpool to avoid blocking
+        result = await call_sync_fn_in_threadpool(self.fn, **kwargs)
         if inspect.isawaitable(result):
             result = await result
-
         return result
 
     def register_with_docket(self, docket: Docket) -> None:
@@ -472,6 +549,7 @@ class FunctionResourceTemplate(ResourceTemplate):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionResourceTemplate:
         """Create a template from a function."""
 
@@ -560,6 +638,11 @@ class FunctionResourceTemplate(ResourceTemplate):
 
         # Transform Context type annotations to Depends() for unified DI
         fn = transform_context_annotations(fn)
+        if coalesce:
+            validate_coalesce(fn, func_name)
+        # Resolve annotations against the function's own module, which the
+        # wrapper below cannot do
+        coercion_plan = _build_coercion_plan(fn, func_params)
 
         wrapper_fn = without_injected_parameters(fn)
         type_adapter = get_cached_typeadapter(wrapper_fn)
@@ -572,7 +655,7 @@ class FunctionResourceTemplate(ResourceTemplate):
         # Apply ui:// MIME default, then fall back to text/plain
         resolved_mime = resolve_ui_mime_type(uri_template, mime_type)
 
-        return cls(
+        template = cls(
             uri_template=uri_template,
             name=func_name,
             version=str(version) if version is not None else None,
@@ -587,4 +670,7 @@ class FunctionResourceTemplate(ResourceTemplate):
             meta=meta,
             task_config=task_config,
             auth=auth,
+            coalesce=coalesce,
         )
+        template._derived_values()["coercion_plan"] = coercion_plan
+        return template
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import io
 import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 import httpx
 import pydantic.json
-from anyio import Path as AsyncPath
+from anyio.lowlevel import RunVar
 from pydantic import Field, ValidationInfo
 from typing_extensions import override
 
 from fastmcp.exceptions import ResourceError
 from fastmcp.resources.resource import Resource, ResourceContent, ResourceResult
+from fastmcp.utilities.async_utils import call_sync_fn_in_threadpool
 from fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -46,6 +54,9 @@ class FileResource(Resource):
     """A resource that reads from a file.
 
     Set is_binary=True to read file as binary data instead of text.
+
+    Content of files up to `max_cache_size` bytes is kept between reads and
+    reused until the file's inode, modification time, or size changes.
     """
 
     path: Path = Field(description="Path to the file")
@@ -57,10 +68,14 @@ class FileResource(Resource):
         default="text/plain",
         description="MIME type of the resource content",
     )
-
-    @property
-    def _async_path(self) -> AsyncPath:
-        return AsyncPath(self.path)
+    max_size: int | None = Field(
+        default=None,
+        description="Maximum file size in bytes; reading a larger file fails",
+    )
+    max_cache_size: int = Field(
+        default=10 * 1024 * 1024,
+        description="Largest file size in bytes whose content is cached between reads",
+    )
 
     @pydantic.field_validator("path")
     @classmethod
@@ -79,40 +94,251 @@ class FileResource(Resource):
         mime_type = info.data.get("mime_type", "text/plain")
         return not mime_type.startswith("text/")
 
+    def _read_content(self) -> ResourceContent:
+        """Read the file, reusing cached content if the file is unchanged."""
+        derived = self._derived_values()
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            cached = derived.get("file_content")
+            if cached is not None and cached[0] == file_key:
+                # Callers may mutate what they get back, so hand out a copy
+                return cached[1].model_copy()
+
+            if self.max_size is not None and stat.st_size > self.max_size:
+                raise ResourceError(
+                    f"File {self.path} is {stat.st_size} bytes, which exceeds "
+                    f"the limit of {self.max_size} bytes"
+                )
+            if self.is_binary:
+                content: str | bytes = f.read()
+            else:
+                content = io.TextIOWrapper(f).read()
+
+        resource_content = ResourceContent(content=content, mime_type=self.mime_type)
+        if stat.st_size <= self.max_cache_size:
+            if isinstance(content, bytes):
+                # Encode once here, off the event loop; copies handed out on
+                # later reads share the encoded blob
+                resource_content.to_mcp_resource_contents(self.uri)
+            derived["file_content"] = (file_key, resource_content)
+            return resource_content.model_copy()
+        return resource_content
+
     @override
     async def read(self) -> ResourceResult:
         """Read the file content."""
         try:
-            if self.is_binary:
-                content: str | bytes = await self._async_path.read_bytes()
-            else:
-                content = await self._async_path.read_text()
-            return ResourceResult(
-                contents=[ResourceContent(content=content, mime_type=self.mime_type)]
-            )
+            content = await call_sync_fn_in_threadpool(self._read_content)
+        except ResourceError:
+            raise
         except Exception as e:
             raise ResourceError(f"Error reading file {self.path}") from e
+        return ResourceResult(contents=[content])
+
+
+@dataclass
+class _HttpClientState:
+    client: httpx.AsyncClient | None = None
+    # Open `_http_client_lifespan` scopes on this event loop
+    users: int = 0
+
+
+_http_client_state: RunVar[_HttpClientState] = RunVar("_http_client_state")
+
+
+def _get_http_client_state() -> _HttpClientState:
+    try:
+        return _http_client_state.get()
+    except LookupError:
+        state = _HttpClientState()
+        _http_client_state.set(state)
+        return state
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the HTTP client shared by HttpResource reads on this event loop."""
+    state = _get_http_client_state()
+    if state.client is None:
+        state.client = httpx.AsyncClient()
+    return state.client
+
+
+@asynccontextmanager
+async def _http_client_lifespan() -> AsyncIterator[None]:
+    """Close the shared HTTP client when the last scope on this loop exits.
+
+    Servers enter this in their lifespan, so the client's connections are
+    released on shutdown; a later read opens a new client.
+    """
+    state = _get_http_client_state()
+    state.users += 1
+    try:
+        yield
+    finally:
+        state.users -= 1
+        if state.users == 0 and state.client is not None:
+            client, state.client = state.client, None
+            await client.aclose()
+
+
+@dataclass
+class _CachedResponse:
+    text: str
+    etag: str | None
+    last_modified: str | None
+    # Monotonic time until which the body may be served without revalidation
+    fresh_until: float | None
+
+    def is_fresh(self) -> bool:
+        return self.fresh_until is not None and time.monotonic() < self.fresh_until
+
+
+class _HttpCache:
+    """A bounded, least-recently-used cache of HTTP response bodies by URL.
+
+    Follows the response's caching headers: `no-store` responses are not
+    kept, `max-age` sets how long a body is served without contacting the
+    server, and `ETag`/`Last-Modified` are used to revalidate stale bodies
+    with a conditional request. `Vary` is not supported.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, _CachedResponse] = OrderedDict()
+
+    def get(self, url: str) -> _CachedResponse | None:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def store(self, url: str, response: httpx.Response, text: str) -> None:
+        directives = _parse_cache_control(response.headers.get("cache-control"))
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        fresh_until = _fresh_until(directives)
+        if "no-store" in directives or (
+            fresh_until is None and etag is None and last_modified is None
+        ):
+            self._entries.pop(url, None)
+            return
+        self._entries[url] = _CachedResponse(
+            text=text,
+            etag=etag,
+            last_modified=last_modified,
+            fresh_until=fresh_until,
+        )
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def revalidated(self, url: str, response: httpx.Response) -> None:
+        """Refresh an entry's lifetime after a 304 Not Modified response."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            directives = _parse_cache_control(response.headers.get("cache-control"))
+            entry.fresh_until = _fresh_until(directives)
+            entry.etag = response.headers.get("etag", entry.etag)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _parse_cache_control(header: str | None) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in (header or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _fresh_until(directives: dict[str, str | None]) -> float | None:
+    if "no-cache" in directives:
+        return None
+    try:
+        max_age = int(directives.get("max-age") or "")
+    except ValueError:
+        return None
+    return time.monotonic() + max_age
+
+
+_http_cache = _HttpCache()
 
 
 class HttpResource(Resource):
-    """A resource that reads from an HTTP endpoint."""
+    """A resource that reads from an HTTP endpoint.
+
+    Reads share a pooled client per event loop. Response bodies are cached
+    according to their `Cache-Control`, `ETag` and `Last-Modified` headers:
+    fresh bodies are served without a request, and stale ones are
+    revalidated with a conditional GET.
+    """
 
     url: str = Field(description="URL to fetch content from")
     mime_type: str = Field(
         default="application/json", description="MIME type of the resource content"
     )
+    timeout: float | None = Field(
+        default=30.0, description="Request timeout in seconds"
+    )
+    max_size: int | None = Field(
+        default=None,
+        description="Maximum response body size in bytes; larger responses fail",
+    )
+
+    async def _fetch(self) -> str:
+        cached = _http_cache.get(self.url)
+        if cached is not None and cached.is_fresh():
+            return cached.text
+
+        headers = {}
+        if cached is not None:
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        client = _get_http_client()
+        async with client.stream(
+            "GET", self.url, headers=headers, timeout=self.timeout
+        ) as response:
+            if response.status_code == 304 and cached is not None:
+                _http_cache.revalidated(self.url, response)
+                return cached.text
+            _ = response.raise_for_status()
+
+            content_length = response.headers.get("content-length")
+            if (
+                self.max_size is not None
+                and content_length is not None
+                and content_length.isdigit()
+                and int(content_length) > self.max_size
+            ):
+                raise self._too_large()
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if self.max_size is not None and len(body) > self.max_size:
+                    raise self._too_large()
+
+        text = body.decode(response.encoding or "utf-8", errors="replace")
+        _http_cache.store(self.url, response, text)
+        return text
+
+    def _too_large(self) -> ResourceError:
+        return ResourceError(
+            f"Response from {self.url} exceeds the limit of {self.max_size} bytes"
+        )
 
     @override
     async def read(self) -> ResourceResult:
         """Read the HTTP content."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.url)
-            _ = response.raise_for_status()
-            return ResourceResult(
-                contents=[
-                    ResourceContent(content=response.text, mime_type=self.mime_type)
-                ]
-            )
+        text = await self._fetch()
+        return ResourceResult(
+            contents=[ResourceContent(content=text, mime_type=self.mime_type)]
+        )
 
 
 class DirectoryResource(Resource):
@@ -129,10 +355,6 @@ class DirectoryResource(Resource):
         default="application/json", description="MIME type of the resource content"
     )
 
-    @property
-    def _async_path(self) -> AsyncPath:
-        return AsyncPath(self.path)
-
     @pydantic.field_validator("path")
     @classmethod
     def validate_absolute_path(cls, path: Path) -> Path:
@@ -141,21 +363,52 @@ class DirectoryResource(Resource):
             raise ValueError("Path must be absolute")
         return path
 
-    async def list_files(self) -> list[Path]:
-        """List files in the directory."""
-        if not await self._async_path.exists():
+    def _listing_state(self) -> tuple[int, ...] | None:
+        """Return the modification times the listing depends on.
+
+        A directory's mtime changes when entries are added, removed, or
+        renamed in it, so the listing can be reused while these are unchanged.
+        Returns None when the listing can't be validated this way (patterns
+        that reach into subdirectories without `recursive`).
+        """
+        if self.recursive:
+            return tuple(
+                os.stat(directory).st_mtime_ns for directory, _, _ in os.walk(self.path)
+            )
+        if "/" in (self.pattern or ""):
+            return None
+        return (os.stat(self.path).st_mtime_ns,)
+
+    def _list_files(self) -> list[Path]:
+        if not self.path.exists():
             raise FileNotFoundError(f"Directory not found: {self.path}")
-        if not await self._async_path.is_dir():
+        if not self.path.is_dir():
             raise NotADirectoryError(f"Not a directory: {self.path}")
 
-        pattern = self.pattern or "*"
+        derived = self._derived_values()
+        state = self._listing_state()
+        cached = derived.get("listing")
+        if state is not None and cached is not None and cached[0] == state:
+            return list(cached[1])
 
-        glob_fn = self._async_path.rglob if self.recursive else self._async_path.glob
+        pattern = self.pattern or "*"
+        glob_fn = self.path.rglob if self.recursive else self.path.glob
         try:
-            return [Path(p) async for p in glob_fn(pattern) if await p.is_file()]
+            files = [p for p in glob_fn(pattern) if p.is_file()]
         except Exception as e:
             raise ResourceError(f"Error listing directory {self.path}") from e
 
+        if state is not None:
+            derived["listing"] = (state, files)
+        return list(files)
+
+    async def list_files(self) -> list[Path]:
+        """List files in the directory.
+
+        Listings are cached and reused until a directory they cover changes.
+        """
+        return await call_sync_fn_in_threadpool(self._list_files)
+
     @override
     async def read(self) -> ResourceResult:
         """Read the directory listing."""
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from .auth import (
     OAuthProvider,
     TokenVerifier,
@@ -12,10 +14,15 @@ from .authorization import (
     restrict_tag,
     run_auth_checks,
 )
-from .providers.debug import DebugTokenVerifier
-from .providers.jwt import JWTVerifier, StaticTokenVerifier
-from .oauth_proxy import OAuthProxy
-from .oidc_proxy import OIDCProxy
+
+if TYPE_CHECKING:
+    from .providers.debug import DebugTokenVerifier as DebugTokenVerifier
+    from .providers.jwt import (
+        JWTVerifier as JWTVerifier,
+        StaticTokenVerifier as StaticTokenVerifier,
+    )
+    from .oauth_proxy import OAuthProxy as OAuthProxy
+    from .oidc_proxy import OIDCProxy as OIDCProxy
 
 
 __all__ = [
@@ -35,3 +42,24 @@ __all__ = [
     "restrict_tag",
     "run_auth_checks",
 ]
+
+# Provider implementations pull in JWT, key-value storage and HTTP client
+# dependencies, so they are imported on first access rather than with
+# `fastmcp` itself.
+_LAZY_EXPORTS = {
+    "DebugTokenVerifier": ".providers.debug",
+    "JWTVerifier": ".providers.jwt",
+    "StaticTokenVerifier": ".providers.jwt",
+    "OAuthProxy": ".oauth_proxy",
+    "OIDCProxy": ".oidc_proxy",
+}
+
+
+def __getattr__(name: str):
+    """Lazy import for auth providers to keep `import fastmcp` fast."""
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
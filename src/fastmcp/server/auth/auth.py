@@ -47,6 +47,7 @@ from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
     from fastmcp.server.auth.cimd import CIMDClientManager
+    from fastmcp.server.metrics import ServerMetrics
 
 logger = get_logger(__name__)
 
@@ -315,17 +316,21 @@ class AuthProvider(TokenVerifierProtocol):
             if isinstance(route, Route) and route.path.startswith("/.well-known/")
         ]
 
-    def get_middleware(self) -> list:
+    def get_middleware(self, metrics: ServerMetrics | None = None) -> list:
         """Get HTTP application-level middleware for this auth provider.
 
+        Args:
+            metrics: If provided, token verification time is recorded here.
+
         Returns:
             List of Starlette Middleware instances to apply to the HTTP app
         """
+        verifier = self if metrics is None else metrics.timed_token_verifier(self)
         # TODO(ty): remove type ignores when ty supports Starlette Middleware typing
         return [
             Middleware(
                 AuthenticationMiddleware,  # type: ignore[arg-type]
-                backend=BearerAuthBackend(self),
+                backend=BearerAuthBackend(verifier),
             ),
             Middleware(AuthContextMiddleware),  # type: ignore[arg-type]
         ]
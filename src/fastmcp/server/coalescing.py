@@ -0,0 +1,100 @@
+"""Request coalescing for components that opt in with `coalesce=True`.
+
+When many sessions read the same resource or render the same prompt at the
+same moment (dashboards, manifests read by every agent at startup), the
+concurrent requests share one execution of the component. Unlike response
+caching, nothing is kept once that execution finishes: the next request
+after it runs the component again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from fastmcp.server.dependencies import get_access_token, get_dependency_parameters
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight(Generic[T]):
+    task: asyncio.Future[T]
+    waiters: int = 0
+
+
+class RequestCoalescer:
+    """Shares one in-flight execution between concurrent calls with equal keys.
+
+    The execution runs in its own task, so a caller that is cancelled does
+    not cancel it for the others; it is cancelled only when every caller
+    waiting on it has gone.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn`, or wait for the execution already running under `key`."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(
+                lambda task, key=key, flight=flight: self._finish(key, flight, task)
+            )
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _finish(
+        self, key: Hashable, flight: _Flight[Any], task: asyncio.Future[Any]
+    ) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled
+            task.exception()
+
+
+def coalescing_key(*parts: Hashable) -> tuple[Hashable, ...]:
+    """Build a coalescing key that also identifies the caller's credentials.
+
+    Requests made with different access tokens never share an execution.
+    """
+    token = get_access_token()
+    fingerprint = (
+        hashlib.sha256(token.token.encode()).hexdigest() if token is not None else None
+    )
+    return (*parts, fingerprint)
+
+
+def validate_coalesce(fn: Callable[..., Any], name: str) -> None:
+    """Reject `coalesce=True` for a function that receives injected values.
+
+    A shared execution runs under the first caller's request, so a `Context`
+    or other injected dependency would hand one session's state to every
+    request that joins it. Call after `transform_context_annotations()`, so
+    that `Context` parameters are reported as dependencies.
+
+    Raises:
+        ValueError: If the function takes any injected parameter.
+    """
+    injected = get_dependency_parameters(fn)
+    if injected:
+        raise ValueError(
+            f"coalesce=True is not supported for {name!r} because it receives "
+            f"injected parameters ({', '.join(injected)}), which belong to a "
+            "single request"
+        )
@@ -34,7 +34,12 @@ from fastmcp.server.elicitation import (
     parse_elicit_response_type,
 )
 from fastmcp.server.low_level import MiddlewareServerSession
-from fastmcp.server.sampling import SampleStep, SamplingResult, SamplingTool
+from fastmcp.server.sampling import (
+    SampleStep,
+    SamplingResult,
+    SamplingTool,
+    SamplingToolset,
+)
 from fastmcp.server.sampling.run import (
     sample_impl,
     sample_step_impl,
@@ -804,7 +809,9 @@ class Context:
         temperature: float | None = None,
         max_tokens: int | None = None,
         model_preferences: ModelPreferences | str | list[str] | None = None,
-        tools: Sequence[SamplingTool | Callable[..., Any]] | None = None,
+        tools: SamplingToolset
+        | Sequence[SamplingTool | Callable[..., Any]]
+        | None = None,
         tool_choice: ToolChoiceOption | str | None = None,
         execute_tools: bool = True,
         mask_error_details: bool | None = None,
@@ -824,7 +831,8 @@ class Context:
             temperature: Optional sampling temperature.
             max_tokens: Maximum tokens to generate. Defaults to 512.
             model_preferences: Optional model preferences.
-            tools: Optional list of tools the LLM can use.
+            tools: Optional list of tools the LLM can use, or a SamplingToolset
+                to reuse converted tools across calls.
             tool_choice: Tool choice mode ("auto", "required", or "none").
             execute_tools: If True (default), execute tool calls and append results
                 to history. If False, return immediately with tool_calls available
@@ -883,7 +891,9 @@ class Context:
         temperature: float | None = None,
         max_tokens: int | None = None,
         model_preferences: ModelPreferences | str | list[str] | None = None,
-        tools: Sequence[SamplingTool | Callable[..., Any]] | None = None,
+        tools: SamplingToolset
+        | Sequence[SamplingTool | Callable[..., Any]]
+        | None = None,
         result_type: type[ResultT],
         mask_error_details: bool | None = None,
         tool_concurrency: int | None = None,
@@ -899,7 +909,9 @@ class Context:
         temperature: float | None = None,
         max_tokens: int | None = None,
         model_preferences: ModelPreferences | str | list[str] | None = None,
-        tools: Sequence[SamplingTool | Callable[..., Any]] | None = None,
+        tools: SamplingToolset
+        | Sequence[SamplingTool | Callable[..., Any]]
+        | None = None,
         result_type: None = None,
         mask_error_details: bool | None = None,
         tool_concurrency: int | None = None,
@@ -914,7 +926,9 @@ class Context:
         temperature: float | None = None,
         max_tokens: int | None = None,
         model_preferences: ModelPreferences | str | list[str] | None = None,
-        tools: Sequence[SamplingTool | Callable[..., Any]] | None = None,
+        tools: SamplingToolset
+        | Sequence[SamplingTool | Callable[..., Any]]
+        | None = None,
         result_type: type[ResultT] | None = None,
         mask_error_details: bool | None = None,
         tool_concurrency: int | None = None,
@@ -941,7 +955,8 @@ class Context:
             max_tokens: Maximum tokens to generate. Defaults to 512.
             model_preferences: Optional model preferences.
             tools: Optional list of tools the LLM can use. Accepts plain
-                functions or SamplingTools.
+                functions or SamplingTools, or a SamplingToolset to reuse
+                converted tools across calls.
             result_type: Optional type for structured output. When specified,
                 a synthetic `final_response` tool is created and the LLM's
                 response is validated against this type.
@@ -756,12 +756,12 @@ async def _restore_task_access_token(
     if docket is None:
         return None
 
-    token_key = docket.key(f"fastmcp:task:{session_id}:{task_id}:access_token")
+    from fastmcp.server.tasks.metadata import load_task_metadata
+
     try:
-        async with docket.redis() as redis:
-            token_data = await redis.get(token_key)
-        if token_data is not None:
-            restored = AccessToken.model_validate_json(token_data)
+        metadata = await load_task_metadata(docket, session_id, task_id)
+        if metadata is not None and metadata.access_token is not None:
+            restored = AccessToken.model_validate_json(metadata.access_token)
             return _task_access_token.set(restored)
     except Exception:
         _logger.warning(
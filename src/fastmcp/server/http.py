@@ -177,8 +177,12 @@ def create_sse_app(
 
     # Set up auth if enabled
     if auth:
-        # Get auth middleware from the provider
-        auth_middleware = auth.get_middleware()
+        # Get auth middleware from the provider, timing token verification
+        # when metrics are enabled
+        if server.metrics is not None:
+            auth_middleware = auth.get_middleware(metrics=server.metrics)
+        else:
+            auth_middleware = auth.get_middleware()
 
         # Get auth provider's own routes (OAuth endpoints, metadata, etc)
         auth_routes = auth.get_routes(mcp_path=sse_path)
@@ -311,8 +315,12 @@ def create_streamable_http_app(
 
     # Add StreamableHTTP routes with or without auth
     if auth:
-        # Get auth middleware from the provider
-        auth_middleware = auth.get_middleware()
+        # Get auth middleware from the provider, timing token verification
+        # when metrics are enabled
+        if server.metrics is not None:
+            auth_middleware = auth.get_middleware(metrics=server.metrics)
+        else:
+            auth_middleware = auth.get_middleware()
 
         # Get auth provider's own routes (OAuth endpoints, metadata, etc)
         auth_routes = auth.get_routes(mcp_path=streamable_http_path)
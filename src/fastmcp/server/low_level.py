@@ -6,6 +6,7 @@ from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING, Any
 
 import anyio
+import jsonschema
 import mcp.types
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcp import McpError
@@ -25,6 +26,7 @@ from mcp.shared.session import RequestResponder
 from pydantic import AnyUrl
 
 from fastmcp.server.apps import UI_EXTENSION_ID
+from fastmcp.utilities.json_schema import validate_json_schema
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -255,6 +257,52 @@ class LowLevelServer(_Server[LifespanResultT, RequestT]):
                         raise_exceptions,
                     )
 
+    def call_tool(
+        self, *, validate_input: bool = True
+    ) -> Callable[
+        [Callable[..., Awaitable[Any]]],
+        Callable[..., Awaitable[Any]],
+    ]:
+        """
+        Decorator for registering a call_tool handler with cached input validators.
+
+        The MCP SDK validates tool input with `jsonschema.validate()`, which
+        re-checks the schema against its metaschema and builds a new validator
+        on every call. Here the SDK handler is registered with its own input
+        validation turned off and the handler is wrapped to validate against a
+        validator compiled once per tool schema. Everything else, including
+        result conversion and output validation, is left to the SDK.
+        """
+        register = super().call_tool(validate_input=False)
+
+        def decorator(
+            func: Callable[..., Awaitable[Any]],
+        ) -> Callable[..., Awaitable[Any]]:
+            if not validate_input:
+                return register(func)
+
+            async def validated(tool_name: str, arguments: dict[str, Any]) -> Any:
+                tool = await self._get_cached_tool_definition(tool_name)
+                if tool:
+                    try:
+                        validate_json_schema(arguments, tool.inputSchema)
+                    except jsonschema.ValidationError as e:
+                        return mcp.types.CallToolResult(
+                            content=[
+                                mcp.types.TextContent(
+                                    type="text",
+                                    text=f"Input validation error: {e.message}",
+                                )
+                            ],
+                            isError=True,
+                        )
+                return await func(tool_name, arguments)
+
+            register(validated)
+            return func
+
+        return decorator
+
     def read_resource(
         self,
     ) -> Callable[
@@ -0,0 +1,605 @@
+"""Metrics for FastMCP servers.
+
+Servers created with `metrics=True` (or a `ServerMetrics` instance) record
+request latency, errors, payload sizes, provider fan-out time, and auth
+verification time for every method and component. Metrics are recorded
+independently of OpenTelemetry, so they are available even when no tracing
+SDK is configured.
+
+Counters and histograms are sharded per thread: each thread only ever writes
+to its own shard, so recording takes no locks. Shards are summed when metrics
+are collected, for example when the optional `/metrics` route is scraped.
+
+Example:
+    ```python
+    from fastmcp import FastMCP
+    from fastmcp.server.metrics import ServerMetrics
+
+    mcp = FastMCP("my-server", metrics=ServerMetrics(route="/metrics"))
+    ```
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar, runtime_checkable
+
+import anyio
+
+from fastmcp.exceptions import NotFoundError
+from fastmcp.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    from mcp.server.auth.provider import AccessToken, TokenVerifier
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Latency buckets in seconds, from sub-millisecond lookups to slow tool calls
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Payload size buckets in bytes, from 64B to 16MB
+DEFAULT_SIZE_BUCKETS: tuple[float, ...] = tuple(float(4**i) for i in range(3, 13))
+
+MetricType = Literal["counter", "gauge", "histogram"]
+
+
+@dataclass(frozen=True)
+class Sample:
+    """A single value of a metric family."""
+
+    name: str
+    labels: dict[str, str]
+    value: float
+
+
+@dataclass(frozen=True)
+class MetricFamily:
+    """All samples of one metric, as passed to exporters.
+
+    Counter samples are named `<name>_total`. Histogram samples are named
+    `<name>_bucket` (with a cumulative `le` label), `<name>_sum` and
+    `<name>_count`.
+    """
+
+    name: str
+    type: MetricType
+    documentation: str
+    samples: list[Sample] = field(default_factory=list)
+
+
+@runtime_checkable
+class MetricsCollector(Protocol):
+    """An object that reports its own metrics when they are collected.
+
+    Middleware implementing this protocol (such as `ResponseCachingMiddleware`)
+    is collected automatically by servers with metrics enabled.
+    """
+
+    def collect_metrics(self) -> Iterable[MetricFamily]: ...
+
+
+class MetricsExporter:
+    """Base class for pushing metrics to an external system.
+
+    Exporters added to `ServerMetrics` are called periodically while the
+    server is running, and once more when it shuts down.
+    """
+
+    async def export(self, families: Sequence[MetricFamily]) -> None:
+        """Export a snapshot of all metrics.
+
+        Args:
+            families: The collected metric families.
+        """
+        raise NotImplementedError
+
+
+class _Metric:
+    """Base for metrics whose values are sharded per thread."""
+
+    type: MetricType
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: list[dict[tuple[str, ...], list[float]]] = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+    def _shard(self) -> dict[tuple[str, ...], list[float]]:
+        """Return this thread's shard, creating it on first use."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: dict[tuple[str, ...], list[float]] = {}
+            self._local.shard = shard
+            # list.append is atomic, so registering a shard needs no lock
+            self._shards.append(shard)
+            return shard
+
+    def _merged(self) -> dict[tuple[str, ...], list[float]]:
+        """Sum the values of all shards, per label set."""
+        merged: dict[tuple[str, ...], list[float]] = {}
+        for shard in list(self._shards):
+            for labels, values in list(shard.items()):
+                total = merged.get(labels)
+                if total is None:
+                    merged[labels] = list(values)
+                else:
+                    for i, value in enumerate(values):
+                        total[i] += value
+        return merged
+
+    def _labels(self, values: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, values, strict=True))
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, per label set."""
+
+    type: MetricType = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increment the counter for the given label values."""
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            shard[labels] = [amount]
+        else:
+            series[0] += amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current total for the given label values."""
+        series = self._merged().get(labels)
+        return series[0] if series is not None else 0.0
+
+    def collect(self) -> MetricFamily:
+        return MetricFamily(
+            name=self.name,
+            type=self.type,
+            documentation=self.documentation,
+            samples=[
+                Sample(f"{self.name}_total", self._labels(labels), values[0])
+                for labels, values in sorted(self._merged().items())
+            ],
+        )
+
+
+class Histogram(_Metric):
+    """A distribution of observed values in fixed buckets, per label set."""
+
+    type: MetricType = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets)
+        if not bounds or bounds[-1] != math.inf:
+            bounds.append(math.inf)
+        self.buckets: tuple[float, ...] = tuple(bounds)
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record a value for the given label values."""
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            # One count per bucket, followed by the running sum
+            series = shard[labels] = [0.0] * (len(self.buckets) + 1)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observations for the given label values."""
+        series = self._merged().get(labels)
+        return int(sum(series[:-1])) if series is not None else 0
+
+    def collect(self) -> MetricFamily:
+        samples: list[Sample] = []
+        for labels, values in sorted(self._merged().items()):
+            base = self._labels(labels)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values[:-1], strict=True):
+                cumulative += count
+                samples.append(
+                    Sample(
+                        f"{self.name}_bucket",
+                        {**base, "le": _format_value(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append(Sample(f"{self.name}_count", base, cumulative))
+            samples.append(Sample(f"{self.name}_sum", base, values[-1]))
+        return MetricFamily(
+            name=self.name,
+            type=self.type,
+            documentation=self.documentation,
+            samples=samples,
+        )
+
+
+class MetricsRegistry:
+    """A set of metrics and collectors that are collected together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(
+        self, collector: Callable[[], Iterable[MetricFamily]]
+    ) -> None:
+        """Register a function that reports metric families when collected."""
+        self._collectors.append(collector)
+
+    def _register(self, metric: Any) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name!r} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def collect(self) -> list[MetricFamily]:
+        """Collect all registered metrics and collectors."""
+        families = [metric.collect() for metric in self._metrics.values()]
+        for collector in self._collectors:
+            try:
+                families.extend(collector())
+            except Exception:
+                logger.exception(f"Error collecting metrics from {collector!r}")
+        return families
+
+
+class ServerMetrics:
+    """Standard metrics for a FastMCP server.
+
+    Pass an instance to `FastMCP(metrics=...)`, or `metrics=True` for the
+    defaults. Every tool call, resource read and prompt render records its
+    latency, outcome and payload size, labeled by server, method, component
+    type and component.
+
+    Args:
+        route: If set, serve the metrics in OpenMetrics text format at this
+            HTTP path (for example "/metrics").
+        exporters: Exporters to push metrics to while the server runs.
+        export_interval: Seconds between exports.
+        registry: Registry to create the metrics in. Defaults to a new one.
+    """
+
+    def __init__(
+        self,
+        *,
+        route: str | None = None,
+        exporters: Sequence[MetricsExporter] | None = None,
+        export_interval: float = 60.0,
+        registry: MetricsRegistry | None = None,
+    ) -> None:
+        self.route = route
+        self.exporters: list[MetricsExporter] = list(exporters or [])
+        self.export_interval = export_interval
+        self.registry = registry or MetricsRegistry()
+
+        component_labels = ("server", "method", "component_type", "component")
+        self.requests = self.registry.counter(
+            "fastmcp_requests",
+            "Requests handled, by component and outcome.",
+            (*component_labels, "outcome"),
+        )
+        self.request_duration = self.registry.histogram(
+            "fastmcp_request_duration_seconds",
+            "Time spent handling requests, including errors.",
+            component_labels,
+        )
+        self.payload_bytes = self.registry.histogram(
+            "fastmcp_response_payload_bytes",
+            "Approximate size of the content returned by successful requests.",
+            component_labels,
+            buckets=DEFAULT_SIZE_BUCKETS,
+        )
+        self.provider_duration = self.registry.histogram(
+            "fastmcp_provider_duration_seconds",
+            "Time each provider takes to answer a fan-out lookup or listing.",
+            ("provider", "operation"),
+        )
+        self.provider_errors = self.registry.counter(
+            "fastmcp_provider_errors",
+            "Provider lookups and listings that raised.",
+            ("provider", "operation"),
+        )
+        self.auth_duration = self.registry.histogram(
+            "fastmcp_auth_duration_seconds",
+            "Time spent verifying tokens and running component auth checks.",
+            ("stage", "outcome"),
+        )
+
+    def __repr__(self) -> str:
+        return f"ServerMetrics(route={self.route!r})"
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        """Add an exporter to push metrics to while the server runs."""
+        self.exporters.append(exporter)
+
+    def collect(self) -> list[MetricFamily]:
+        """Collect all metrics."""
+        return self.registry.collect()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def observe(
+        self,
+        server: str,
+        method: str,
+        component_type: str,
+        component: str,
+    ) -> Iterator[RequestObservation]:
+        """Time a request and record its outcome and payload size.
+
+        Requests for unknown components are labeled with an empty component,
+        so that arbitrary names sent by clients don't create new series.
+        """
+        observation = RequestObservation(component)
+        start = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            yield observation
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            component = observation.component
+            if isinstance(error, NotFoundError):
+                component = ""
+            labels = (server, method, component_type, component)
+            self.request_duration.observe(duration, *labels)
+            self.requests.inc(*labels, "error" if error is not None else "success")
+            if error is None:
+                size = payload_size(observation.result)
+                if size is not None:
+                    self.payload_bytes.observe(size, *labels)
+
+    def observe_provider(
+        self, provider: str, operation: str, duration: float, error: bool = False
+    ) -> None:
+        """Record how long one provider took to answer a fan-out call."""
+        self.provider_duration.observe(duration, provider, operation)
+        if error:
+            self.provider_errors.inc(provider, operation)
+
+    def observe_auth(self, stage: str, duration: float, outcome: str) -> None:
+        """Record the time spent on one auth step."""
+        self.auth_duration.observe(duration, stage, outcome)
+
+    def timed_token_verifier(self, verifier: TokenVerifier) -> TokenVerifier:
+        """Wrap a token verifier so that verification time is recorded."""
+        return _TimedTokenVerifier(verifier, self)
+
+    # -------------------------------------------------------------------------
+    # Serving and exporting
+    # -------------------------------------------------------------------------
+
+    async def handle_metrics_request(self, request: Request) -> Response:
+        """Serve all metrics in OpenMetrics text format."""
+        from starlette.responses import Response
+
+        return Response(
+            generate_openmetrics(self.collect()),
+            media_type=OPENMETRICS_CONTENT_TYPE,
+        )
+
+    async def export(self) -> None:
+        """Push the current metrics to every exporter."""
+        if not self.exporters:
+            return
+        families = self.collect()
+        for exporter in self.exporters:
+            try:
+                await exporter.export(families)
+            except Exception:
+                logger.exception(f"Error exporting metrics with {exporter!r}")
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[None]:
+        """Export periodically while the server runs, and once at shutdown."""
+        if not self.exporters:
+            yield
+            return
+
+        async def export_loop() -> None:
+            while True:
+                await anyio.sleep(self.export_interval)
+                await self.export()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(export_loop)
+            try:
+                yield
+            finally:
+                tg.cancel_scope.cancel()
+                # Shielded so the final export runs even during cancellation
+                with anyio.CancelScope(shield=True):
+                    await self.export()
+
+
+class RequestObservation:
+    """The component a request resolved to, and its result.
+
+    Yielded by `ServerMetrics.observe`. Callers may replace `component` with
+    a lower-cardinality label (such as a resource template's URI template),
+    and pass results through `record` so their size can be measured.
+    """
+
+    __slots__ = ("component", "result")
+
+    def __init__(self, component: str) -> None:
+        self.component = component
+        self.result: Any = None
+
+    def record(self, result: T) -> T:
+        """Remember the request's result and return it unchanged."""
+        self.result = result
+        return result
+
+
+class _TimedTokenVerifier:
+    """Token verifier that records how long verification takes."""
+
+    def __init__(self, verifier: TokenVerifier, metrics: ServerMetrics) -> None:
+        self._verifier = verifier
+        self._metrics = metrics
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            access_token = await self._verifier.verify_token(token)
+            outcome = "success" if access_token is not None else "denied"
+            return access_token
+        finally:
+            self._metrics.observe_auth(
+                "verify_token", time.perf_counter() - start, outcome
+            )
+
+
+def payload_size(result: Any) -> int | None:
+    """Approximate the size of a result's content, without re-encoding it.
+
+    Text is counted in characters and binary data in bytes. Returns None for
+    results without content (such as task results).
+    """
+    if result is None:
+        return None
+
+    from fastmcp.prompts.prompt import PromptResult
+    from fastmcp.resources.resource import ResourceResult
+    from fastmcp.tools.tool import ToolResult
+
+    if isinstance(result, ToolResult):
+        return sum(_content_block_size(block) for block in result.content)
+    if isinstance(result, ResourceResult):
+        return sum(len(item.content) for item in result.contents)
+    if isinstance(result, PromptResult):
+        return sum(_content_block_size(m.content) for m in result.messages)
+    return None
+
+
+def _content_block_size(block: Any) -> int:
+    for attr in ("text", "data", "blob"):
+        value = getattr(block, attr, None)
+        if isinstance(value, str | bytes):
+            return len(value)
+    resource = getattr(block, "resource", None)
+    return _content_block_size(resource) if resource is not None else 0
+
+
+# -----------------------------------------------------------------------------
+# OpenMetrics text format
+# -----------------------------------------------------------------------------
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def generate_openmetrics(families: Iterable[MetricFamily]) -> str:
+    """Render metric families in the OpenMetrics text format."""
+    lines: list[str] = []
+    for family in families:
+        if family.documentation:
+            lines.append(f"# HELP {family.name} {_escape(family.documentation)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for sample in family.samples:
+            if sample.labels:
+                labels = ",".join(
+                    f'{key}="{_escape(value)}"' for key, value in sample.labels.items()
+                )
+                lines.append(f"{sample.name}{{{labels}}} {_format_value(sample.value)}")
+            else:
+                lines.append(f"{sample.name} {_format_value(sample.value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "DEFAULT_SIZE_BUCKETS",
+    "OPENMETRICS_CONTENT_TYPE",
+    "Counter",
+    "Histogram",
+    "MetricFamily",
+    "MetricsCollector",
+    "MetricsExporter",
+    "MetricsRegistry",
+    "RequestObservation",
+    "Sample",
+    "ServerMetrics",
+    "generate_openmetrics",
+    "payload_size",
+]
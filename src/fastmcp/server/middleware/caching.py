@@ -19,6 +19,7 @@ from typing_extensions import NotRequired, Self, override
 
 from fastmcp.prompts.prompt import Message, Prompt, PromptResult
 from fastmcp.resources.resource import Resource, ResourceContent, ResourceResult
+from fastmcp.server.metrics import MetricFamily, Sample
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.tools.tool import Tool, ToolResult
 from fastmcp.utilities.logging import get_logger
@@ -507,6 +508,30 @@ class ResponseCachingMiddleware(Middleware):
             call_tool=self._stats.statistics.collections.get("tools/call"),
         )
 
+    def collect_metrics(self) -> list[MetricFamily]:
+        """Report cache lookups per method as a metric family.
+
+        Servers with metrics enabled collect this automatically.
+        """
+        samples: list[Sample] = []
+        for method, stats in sorted(self._stats.statistics.collections.items()):
+            for result, value in (("hit", stats.get.hit), ("miss", stats.get.miss)):
+                samples.append(
+                    Sample(
+                        "fastmcp_cache_lookups_total",
+                        {"method": method, "result": result},
+                        float(value),
+                    )
+                )
+        return [
+            MetricFamily(
+                name="fastmcp_cache_lookups",
+                type="counter",
+                documentation="Response cache lookups, by method and result.",
+                samples=samples,
+            )
+        ]
+
 
 def _get_arguments_str(arguments: dict[str, Any] | None) -> str:
     """Get a string representation of the arguments."""
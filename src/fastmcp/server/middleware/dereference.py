@@ -9,6 +9,7 @@ from typing_extensions import override
 from fastmcp.resources.template import ResourceTemplate
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.tools.tool import Tool
+from fastmcp.utilities.components import CopyCache
 from fastmcp.utilities.json_schema import dereference_refs
 
 
@@ -20,6 +21,12 @@ class DereferenceRefsMiddleware(Middleware):
     self-contained. Enabled by default via ``FastMCP(dereference_schemas=True)``.
     """
 
+    stable_listings = True
+
+    def __init__(self) -> None:
+        # Dereferenced copies are reused so listed components keep their identity
+        self._copies = CopyCache()
+
     @override
     async def on_list_tools(
         self,
@@ -27,7 +34,7 @@ class DereferenceRefsMiddleware(Middleware):
         call_next: CallNext[mt.ListToolsRequest, Sequence[Tool]],
     ) -> Sequence[Tool]:
         tools = await call_next(context)
-        return [_dereference_tool(tool) for tool in tools]
+        return [self._copies.get(tool, _dereference_tool) for tool in tools]
 
     @override
     async def on_list_resource_templates(
@@ -38,7 +45,7 @@ class DereferenceRefsMiddleware(Middleware):
         ],
     ) -> Sequence[ResourceTemplate]:
         templates = await call_next(context)
-        return [_dereference_resource_template(t) for t in templates]
+        return [self._copies.get(t, _dereference_resource_template) for t in templates]
 
 
 def _dereference_tool(tool: Tool) -> Tool:
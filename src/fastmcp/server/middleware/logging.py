@@ -2,12 +2,16 @@
 
 import json
 import logging
+import queue
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from logging import Logger
 from typing import Any
 
 import pydantic_core
+from pydantic import BaseModel
 
 from .middleware import CallNext, Middleware, MiddlewareContext
 
@@ -17,6 +21,145 @@ def default_serializer(data: Any) -> str:
     return pydantic_core.to_json(data, fallback=str).decode()
 
 
+def _iter_json(data: Any) -> Iterator[str]:
+    """Yield the default serializer's output for `data` in chunks.
+
+    Containers and plain Pydantic models are walked one member at a time so a
+    consumer can stop early; everything else is encoded whole.
+    """
+    if isinstance(data, dict):
+        yield "{"
+        for i, (key, value) in enumerate(data.items()):
+            if i:
+                yield ","
+            yield json.dumps(str(key), ensure_ascii=False)
+            yield ":"
+            yield from _iter_json(value)
+        yield "}"
+    elif isinstance(data, list | tuple | set | frozenset):
+        yield "["
+        for i, value in enumerate(data):
+            if i:
+                yield ","
+            yield from _iter_json(value)
+        yield "]"
+    elif isinstance(data, BaseModel) and _is_plain_model(type(data)):
+        yield "{"
+        first = True
+        for name, field in type(data).model_fields.items():
+            if field.exclude:
+                continue
+            if not first:
+                yield ","
+            first = False
+            yield json.dumps(
+                field.serialization_alias or field.alias or name, ensure_ascii=False
+            )
+            yield ":"
+            yield from _iter_json(getattr(data, name))
+        for key, value in (data.__pydantic_extra__ or {}).items():
+            if not first:
+                yield ","
+            first = False
+            yield json.dumps(key, ensure_ascii=False)
+            yield ":"
+            yield from _iter_json(value)
+        yield "}"
+    else:
+        yield default_serializer(data)
+
+
+def _is_plain_model(model: type[BaseModel]) -> bool:
+    """Whether a model serializes as its fields, with no custom serializers."""
+    decorators = model.__pydantic_decorators__
+    return not (
+        decorators.model_serializers
+        or decorators.field_serializers
+        or model.model_computed_fields
+    )
+
+
+def truncated_serializer(data: Any, max_length: int) -> str:
+    """Serialize `data` like the default serializer, stopping at `max_length`.
+
+    Only as much of the payload as fits in `max_length` characters is encoded,
+    so large payloads cost no more to log than small ones. Truncated output
+    ends with "...".
+    """
+    chunks: list[str] = []
+    length = 0
+    for chunk in _iter_json(data):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > max_length:
+            return "".join(chunks)[:max_length] + "..."
+    return "".join(chunks)
+
+
+@dataclass
+class _LogEvent:
+    """A log line waiting to be formatted on the background worker."""
+
+    message: dict[str, str | int | float]
+    log_level: int
+
+
+class _LogPipeline:
+    """Bounded queue of log events drained by a daemon thread.
+
+    Enqueueing never blocks: when the queue is full the event is dropped and
+    counted, and the worker reports the number of dropped events with its
+    next log line.
+    """
+
+    def __init__(self, middleware: "BaseLoggingMiddleware", max_queue_size: int):
+        self._middleware = middleware
+        self._queue: queue.Queue[_LogEvent] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.dropped: int = 0
+        self._reported_dropped: int = 0
+
+    def put(self, event: _LogEvent) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been logged."""
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: self._queue.unfinished_tasks == 0, timeout
+            )
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="fastmcp-logging", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                dropped = self.dropped
+                if dropped > self._reported_dropped:
+                    self._middleware.logger.warning(
+                        f"Logging queue full; dropped {dropped - self._reported_dropped} log events"
+                    )
+                    self._reported_dropped = dropped
+                self._middleware._log_message(event.message, event.log_level)
+            except Exception:
+                self._middleware.logger.exception("Failed to emit log event")
+            finally:
+                self._queue.task_done()
+
+
 class BaseLoggingMiddleware(Middleware):
     """Base class for logging middleware."""
 
@@ -29,22 +172,19 @@ class BaseLoggingMiddleware(Middleware):
     methods: list[str] | None
     structured_logging: bool
     payload_serializer: Callable[[Any], str] | None
+    _pipeline: "_LogPipeline | None" = None
 
-    def _serialize_payload(self, context: MiddlewareContext[Any]) -> str:
-        payload: str
-
-        if not self.payload_serializer:
-            payload = default_serializer(context.message)
-        else:
+    def _serialize_payload(
+        self, payload: Any, message: dict[str, str | int | float]
+    ) -> str:
+        if self.payload_serializer:
             try:
-                payload = self.payload_serializer(context.message)
+                return self.payload_serializer(payload)
             except Exception as e:
                 self.logger.warning(
-                    f"Failed to serialize payload due to {e}: {context.type} {context.method} {context.source}."
+                    f"Failed to serialize payload due to {e}: {message['event']} {message['method']} {message['source']}."
                 )
-                payload = default_serializer(context.message)
-
-        return payload
+        return default_serializer(payload)
 
     def _format_message(self, message: dict[str, str | int | float]) -> str:
         """Format a message for logging."""
@@ -53,38 +193,62 @@ class BaseLoggingMiddleware(Middleware):
         else:
             return " ".join([f"{k}={v}" for k, v in message.items()])
 
-    def _create_before_message(
+    def _create_start_message(
         self, context: MiddlewareContext[Any]
     ) -> dict[str, str | int | float]:
-        message = {
+        return {
             "event": context.type + "_start",
             "method": context.method or "unknown",
             "source": context.source,
         }
 
-        if (
+    def _create_before_message(
+        self, context: MiddlewareContext[Any]
+    ) -> dict[str, str | int | float]:
+        message = self._create_start_message(context)
+
+        if self._logs_payload:
+            message |= self._create_payload_fields(context.message, message)
+
+        return message
+
+    @property
+    def _logs_payload(self) -> bool:
+        return (
             self.include_payloads
             or self.include_payload_length
             or self.estimate_payload_tokens
-        ):
-            payload = self._serialize_payload(context)
+        )
 
-            if self.include_payload_length or self.estimate_payload_tokens:
-                payload_length = len(payload)
+    def _create_payload_fields(
+        self, payload: Any, message: dict[str, str | int | float]
+    ) -> dict[str, str | int | float]:
+        fields: dict[str, str | int | float] = {}
+        needs_length = self.include_payload_length or self.estimate_payload_tokens
+
+        if self.max_payload_length and not needs_length and not self.payload_serializer:
+            # Only the truncated payload is logged, so don't encode the rest.
+            # A length or token estimate needs the full encoding below.
+            serialized = truncated_serializer(payload, self.max_payload_length)
+        else:
+            serialized = self._serialize_payload(payload, message)
+
+            if needs_length:
+                payload_length = len(serialized)
                 payload_tokens = payload_length // 4
                 if self.estimate_payload_tokens:
-                    message["payload_tokens"] = payload_tokens
+                    fields["payload_tokens"] = payload_tokens
                 if self.include_payload_length:
-                    message["payload_length"] = payload_length
+                    fields["payload_length"] = payload_length
 
-            if self.max_payload_length and len(payload) > self.max_payload_length:
-                payload = payload[: self.max_payload_length] + "..."
+            if self.max_payload_length and len(serialized) > self.max_payload_length:
+                serialized = serialized[: self.max_payload_length] + "..."
 
-            if self.include_payloads:
-                message["payload"] = payload
-                message["payload_type"] = type(context.message).__name__
+        if self.include_payloads:
+            fields["payload"] = serialized
+            fields["payload_type"] = type(payload).__name__
 
-        return message
+        return fields
 
     def _create_error_message(
         self,
@@ -121,6 +285,43 @@ class BaseLoggingMiddleware(Middleware):
     ):
         self.logger.log(log_level or self.log_level, self._format_message(message))
 
+    def _log_event(
+        self,
+        message: dict[str, str | int | float],
+        log_level: int | None = None,
+        *,
+        payload: Any = None,
+        has_payload: bool = False,
+    ) -> None:
+        """Log a message now, or hand it to the background worker.
+
+        The payload, if any, is serialized here, before the request can change
+        it; the background worker only formats and writes the line.
+        """
+        log_level = log_level or self.log_level
+        if not self.logger.isEnabledFor(log_level):
+            return
+        if has_payload:
+            message |= self._create_payload_fields(payload, message)
+        if self._pipeline is not None:
+            self._pipeline.put(_LogEvent(message, log_level))
+            return
+        self._log_message(message, log_level)
+
+    @property
+    def dropped_log_events(self) -> int:
+        """Number of log events dropped because the background queue was full."""
+        return self._pipeline.dropped if self._pipeline is not None else 0
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for queued log events to be written when logging in the background.
+
+        Returns False if the timeout expired first.
+        """
+        if self._pipeline is None:
+            return True
+        return self._pipeline.flush(timeout)
+
     async def on_message(
         self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
     ) -> Any:
@@ -129,17 +330,21 @@ class BaseLoggingMiddleware(Middleware):
         if self.methods and context.method not in self.methods:
             return await call_next(context)
 
-        self._log_message(self._create_before_message(context))
+        self._log_event(
+            self._create_start_message(context),
+            payload=context.message,
+            has_payload=self._logs_payload,
+        )
 
         start_time = time.perf_counter()
         try:
             result = await call_next(context)
 
-            self._log_message(self._create_after_message(context, start_time))
+            self._log_event(self._create_after_message(context, start_time))
 
             return result
         except Exception as e:
-            self._log_message(
+            self._log_event(
                 self._create_error_message(context, start_time, e), logging.ERROR
             )
             raise
@@ -175,6 +380,8 @@ class LoggingMiddleware(BaseLoggingMiddleware):
         max_payload_length: int = 1000,
         methods: list[str] | None = None,
         payload_serializer: Callable[[Any], str] | None = None,
+        background: bool = False,
+        max_queue_size: int = 10_000,
     ):
         """Initialize logging middleware.
 
@@ -182,12 +389,19 @@ class LoggingMiddleware(BaseLoggingMiddleware):
             logger: Logger instance to use. If None, creates a logger named 'fastmcp.requests'
             log_level: Log level for messages (default: INFO)
             include_payloads: Whether to include message payloads in logs
-            include_payload_length: Whether to include response size in logs
-            estimate_payload_tokens: Whether to estimate response tokens
+            include_payload_length: Whether to include response size in logs.
+                Measuring it encodes the full payload on the request path.
+            estimate_payload_tokens: Whether to estimate response tokens. Like
+                `include_payload_length`, this encodes the full payload.
             max_payload_length: Maximum length of payload to log (prevents huge logs)
             methods: List of methods to log. If None, logs all methods.
             payload_serializer: Callable that converts objects to a JSON string for the
                 payload. If not provided, uses FastMCP's default tool serializer.
+            background: Whether to format and write log lines on a background
+                thread instead of the request path. Events that arrive while the
+                queue is full are dropped and counted in `dropped_log_events`.
+            max_queue_size: Maximum number of events waiting to be written when
+                logging in the background.
         """
         self.logger: Logger = logger or logging.getLogger("fastmcp.middleware.logging")
         self.log_level = log_level
@@ -198,6 +412,8 @@ class LoggingMiddleware(BaseLoggingMiddleware):
         self.methods: list[str] | None = methods
         self.payload_serializer: Callable[[Any], str] | None = payload_serializer
         self.structured_logging: bool = False
+        if background:
+            self._pipeline = _LogPipeline(self, max_queue_size)
 
 
 class StructuredLoggingMiddleware(BaseLoggingMiddleware):
@@ -226,6 +442,8 @@ class StructuredLoggingMiddleware(BaseLoggingMiddleware):
         estimate_payload_tokens: bool = False,
         methods: list[str] | None = None,
         payload_serializer: Callable[[Any], str] | None = None,
+        background: bool = False,
+        max_queue_size: int = 10_000,
     ):
         """Initialize structured logging middleware.
 
@@ -233,11 +451,19 @@ class StructuredLoggingMiddleware(BaseLoggingMiddleware):
             logger: Logger instance to use. If None, creates a logger named 'fastmcp.structured'
             log_level: Log level for messages (default: INFO)
             include_payloads: Whether to include message payloads in logs
-            include_payload_length: Whether to include payload size in logs
-            estimate_payload_tokens: Whether to estimate token count using length // 4
+            include_payload_length: Whether to include payload size in logs.
+                Measuring it encodes the full payload on the request path.
+            estimate_payload_tokens: Whether to estimate token count using
+                length // 4. Like `include_payload_length`, this encodes the
+                full payload.
             methods: List of methods to log. If None, logs all methods.
             payload_serializer: Callable that converts objects to a JSON string for the
                 payload. If not provided, uses FastMCP's default tool serializer.
+            background: Whether to format and write log lines on a background
+                thread instead of the request path. Events that arrive while the
+                queue is full are dropped and counted in `dropped_log_events`.
+            max_queue_size: Maximum number of events waiting to be written when
+                logging in the background.
         """
         self.logger: Logger = logger or logging.getLogger(
             "fastmcp.middleware.structured_logging"
@@ -250,6 +476,8 @@ class StructuredLoggingMiddleware(BaseLoggingMiddleware):
         self.payload_serializer: Callable[[Any], str] | None = payload_serializer
         self.max_payload_length: int | None = None
         self.structured_logging: bool = True
+        if background:
+            self._pipeline = _LogPipeline(self, max_queue_size)
 
 
 def _get_duration_ms(start_time: float, /) -> float:
@@ -8,6 +8,7 @@ from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     Literal,
     Protocol,
@@ -79,6 +80,12 @@ def make_middleware_wrapper(
 class Middleware:
     """Base class for FastMCP middleware with dispatching hooks."""
 
+    # Set to True when the list hooks return the same result for the same
+    # input components, session and access token. A parent server then caches
+    # the catalog of a mounted server using this middleware instead of
+    # running the hooks on every list request.
+    stable_listings: ClassVar[bool] = False
+
     async def __call__(
         self,
         context: MiddlewareContext[T],
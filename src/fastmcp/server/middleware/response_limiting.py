@@ -1,28 +1,120 @@
-"""Response limiting middleware for controlling tool response sizes."""
+"""Response limiting middleware for controlling tool, resource and prompt response sizes."""
 
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import Iterable
+from typing import Any, Literal
 
 import mcp.types as mt
-import pydantic_core
 from mcp.types import TextContent
+from pydantic import BaseModel
 
+from fastmcp.prompts.prompt import Message, PromptResult
+from fastmcp.resources.resource import ResourceContent, ResourceResult
 from fastmcp.tools.tool import ToolResult
 
+from .logging import default_serializer, truncated_serializer
 from .middleware import CallNext, Middleware, MiddlewareContext
 
-__all__ = ["ResponseLimitingMiddleware"]
+__all__ = ["ResponseLimitingMiddleware", "estimate_size"]
 
 logger = logging.getLogger(__name__)
 
+# Account for JSON wrapper overhead: {"content":[{"type":"text","text":"..."}]}
+_WRAPPER_OVERHEAD = 50
+
+
+def _text_size(text: str) -> int:
+    # ASCII strings encode to one byte per character; str.isascii() is O(1)
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _string_size(text: str, budget: int | None) -> int:
+    """Size of `text` as a JSON string, quotes included."""
+    size = _text_size(text) + 2
+    # Escapes at most sextuple a character (\u0000), so they can only matter
+    # for the budget once the raw size passes a sixth of it
+    if budget is not None and budget < 6 * size and size <= budget:
+        return _text_size(json.dumps(text, ensure_ascii=False))
+    return size
+
+
+def estimate_size(value: Any, budget: int | None = None) -> int:
+    """Estimate the size in bytes of `value` once encoded as JSON.
+
+    Strings and bytes are measured without encoding them to JSON, and the walk
+    stops as soon as the running total exceeds `budget`, so checking a large
+    response against a limit costs roughly as much as the limit, not the
+    response. Escape sequences are counted exactly for strings large enough
+    to decide whether `budget` is exceeded, and ignored otherwise.
+
+    Args:
+        value: A result object, content block, or JSON-compatible value
+        budget: Stop once the size is known to exceed this many bytes
+
+    Returns:
+        The estimated size, or some value greater than `budget` if exceeded
+    """
+    if isinstance(value, str):
+        return _string_size(value, budget)
+    if isinstance(value, bytes):
+        # Base64-encoded on the wire
+        return 4 * ((len(value) + 2) // 3) + 2
+    if value is None or isinstance(value, bool | int | float):
+        return len(repr(value))
+
+    if isinstance(value, BaseModel):
+        items: Iterable[tuple[Any, Any]] = value.__dict__.items()
+        if value.__pydantic_extra__:
+            items = [*items, *value.__pydantic_extra__.items()]
+    elif isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list | tuple | set | frozenset):
+        items = ((None, item) for item in value)
+    else:
+        return len(default_serializer(value))
+
+    size = 2
+    for key, item in items:
+        if key is not None:
+            remaining = None if budget is None else budget - size
+            size += _string_size(str(key), remaining) + 2
+        remaining = None if budget is None else budget - size
+        size += estimate_size(item, remaining) + 1
+        if budget is not None and size > budget:
+            break
+    return size
+
+
+def _truncate_text(text: str, max_bytes: int) -> str:
+    """Cut text to at most max_bytes of UTF-8, preserving character boundaries."""
+    if text.isascii():
+        return text[:max_bytes]
+    # No character is shorter than one byte, so only a prefix needs encoding
+    return text[:max_bytes].encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+
+
+def _opt_in(names: list[str] | Literal["all"] | None) -> set[str] | None:
+    if names == "all":
+        return None
+    return set(names or ())
+
 
 class ResponseLimitingMiddleware(Middleware):
-    """Middleware that limits the response size of tool calls.
+    """Middleware that limits the response size of tool calls, resource reads
+    and prompts.
+
+    Intercepts responses and enforces size limits. If a tool response exceeds
+    the limit, it extracts text content, truncates it, and returns a single
+    TextContent block. Resource reads and prompts are only limited when listed
+    in `resources` / `prompts` (or set to "all"): their contents and messages
+    are kept up to the limit, with the text item that crosses it truncated and
+    later items dropped.
 
-    Intercepts tool call responses and enforces size limits. If a response
-    exceeds the limit, it extracts text content, truncates it, and returns
-    a single TextContent block.
+    Sizes are estimated by walking the result and stop at the limit, so the
+    check never encodes the full response.
 
     Example:
         ```python
@@ -36,11 +128,12 @@ class ResponseLimitingMiddleware(Middleware):
         # Limit all tool responses to 500KB
         mcp.add_middleware(ResponseLimitingMiddleware(max_size=500_000))
 
-        # Limit only specific tools
+        # Limit only specific tools, and every resource read
         mcp.add_middleware(
             ResponseLimitingMiddleware(
                 max_size=100_000,
                 tools=["search", "fetch_data"],
+                resources="all",
             )
         )
         ```
@@ -52,6 +145,8 @@ class ResponseLimitingMiddleware(Middleware):
         max_size: int = 1_000_000,
         truncation_suffix: str = "\n\n[Response truncated due to size limit]",
         tools: list[str] | None = None,
+        resources: list[str] | Literal["all"] | None = None,
+        prompts: list[str] | Literal["all"] | None = None,
     ) -> None:
         """Initialize response limiting middleware.
 
@@ -60,35 +155,65 @@ class ResponseLimitingMiddleware(Middleware):
             truncation_suffix: Suffix to append when truncating responses.
                 Defaults to "\\n\\n[Response truncated due to size limit]".
             tools: List of tool names to apply limiting to. If None, applies to all.
+            resources: List of resource URIs to apply limiting to, or "all".
+                If None, no resource reads are limited.
+            prompts: List of prompt names to apply limiting to, or "all".
+                If None, no prompts are limited.
         """
         if max_size <= 0:
             raise ValueError(f"max_size must be positive, got {max_size}")
         self.max_size = max_size
         self.truncation_suffix = truncation_suffix
         self.tools = set(tools) if tools is not None else None
+        # None means every resource or prompt, as with `tools`
+        self.resources = _opt_in(resources)
+        self.prompts = _opt_in(prompts)
+
+    @property
+    def _target_size(self) -> int:
+        """Bytes available for content once the suffix and wrapper fit."""
+        suffix_bytes = _text_size(self.truncation_suffix)
+        return self.max_size - suffix_bytes - _WRAPPER_OVERHEAD
+
+    def _exceeds_limit(self, result: Any) -> bool:
+        return estimate_size(result, self.max_size) > self.max_size
 
     def _truncate_to_result(self, text: str) -> ToolResult:
         """Truncate text to fit within max_size and wrap in ToolResult."""
-        suffix_bytes = len(self.truncation_suffix.encode("utf-8"))
-        # Account for JSON wrapper overhead: {"content":[{"type":"text","text":"..."}]}
-        overhead = 50
-        target_size = self.max_size - suffix_bytes - overhead
+        return self._truncate_texts_to_result([text])
+
+    def _truncate_texts_to_result(self, texts: Iterable[str]) -> ToolResult:
+        """Join texts with blank lines up to max_size and wrap in ToolResult.
 
+        Texts are consumed one at a time and only until the budget is used, so
+        the joined text is never built in full.
+        """
+        target_size = self._target_size
         if target_size <= 0:
             # Edge case: max_size too small for even the suffix
-            truncated = self.truncation_suffix
-        else:
-            # Truncate to target size, preserving UTF-8 boundaries
-            encoded = text.encode("utf-8")
-            if len(encoded) <= target_size:
-                truncated = text + self.truncation_suffix
-            else:
-                truncated = (
-                    encoded[:target_size].decode("utf-8", errors="ignore")
-                    + self.truncation_suffix
-                )
+            return ToolResult(
+                content=[TextContent(type="text", text=self.truncation_suffix)]
+            )
 
-        return ToolResult(content=[TextContent(type="text", text=truncated)])
+        parts: list[str] = []
+        remaining = target_size
+        for i, text in enumerate(texts):
+            if i:
+                if remaining < 2:
+                    break
+                parts.append("\n\n")
+                remaining -= 2
+            part = _truncate_text(text, remaining)
+            parts.append(part)
+            remaining -= _text_size(part)
+            if len(part) < len(text):
+                break
+
+        return ToolResult(
+            content=[
+                TextContent(type="text", text="".join(parts) + self.truncation_suffix)
+            ]
+        )
 
     async def on_call_tool(
         self,
@@ -102,24 +227,115 @@ class ResponseLimitingMiddleware(Middleware):
         if self.tools is not None and context.message.name not in self.tools:
             return result
 
-        # Measure serialized size
-        serialized = pydantic_core.to_json(result, fallback=str)
-        if len(serialized) <= self.max_size:
+        if not self._exceeds_limit(result):
             return result
 
         # Over limit: extract text, truncate, return single TextContent
         logger.warning(
-            "Tool %r response exceeds size limit: %d bytes > %d bytes, truncating",
+            "Tool %r response exceeds size limit of %d bytes, truncating",
             context.message.name,
-            len(serialized),
             self.max_size,
         )
 
         texts = [b.text for b in result.content if isinstance(b, TextContent)]
-        text = (
-            "\n\n".join(texts)
-            if texts
-            else serialized.decode("utf-8", errors="replace")
+        if texts:
+            return self._truncate_texts_to_result(texts)
+        # No text to keep: fall back to the start of the serialized result
+        serialized = truncated_serializer(result, max(self._target_size, 0))
+        return self._truncate_texts_to_result([serialized.removesuffix("...")])
+
+    async def on_read_resource(
+        self,
+        context: MiddlewareContext[mt.ReadResourceRequestParams],
+        call_next: CallNext[mt.ReadResourceRequestParams, ResourceResult],
+    ) -> ResourceResult:
+        """Intercept resource reads and limit response size."""
+        result = await call_next(context)
+
+        uri = str(context.message.uri)
+        if self.resources is not None and uri not in self.resources:
+            return result
+
+        if not self._exceeds_limit(result):
+            return result
+
+        logger.warning(
+            "Resource %r response exceeds size limit of %d bytes, truncating",
+            uri,
+            self.max_size,
+        )
+
+        contents: list[ResourceContent] = []
+        remaining = self._target_size
+        for item in result.contents:
+            size = estimate_size(item.content, remaining)
+            if size <= remaining:
+                contents.append(item)
+                remaining -= size
+                continue
+            if isinstance(item.content, str) and remaining > 0:
+                contents.append(
+                    ResourceContent(
+                        _truncate_text(item.content, remaining)
+                        + self.truncation_suffix,
+                        mime_type=item.mime_type,
+                        meta=item.meta,
+                    )
+                )
+            else:
+                # Binary content can't be cut meaningfully, so it is dropped
+                if isinstance(item.content, bytes):
+                    logger.warning(
+                        "Resource %r: dropping %d bytes of %s content that "
+                        "exceed the size limit",
+                        uri,
+                        len(item.content),
+                        item.mime_type or "binary",
+                    )
+                contents.append(ResourceContent(self.truncation_suffix.strip()))
+            break
+
+        return ResourceResult(contents, meta=result.meta)
+
+    async def on_get_prompt(
+        self,
+        context: MiddlewareContext[mt.GetPromptRequestParams],
+        call_next: CallNext[mt.GetPromptRequestParams, PromptResult],
+    ) -> PromptResult:
+        """Intercept prompt rendering and limit response size."""
+        result = await call_next(context)
+
+        if self.prompts is not None and context.message.name not in self.prompts:
+            return result
+
+        if not self._exceeds_limit(result):
+            return result
+
+        logger.warning(
+            "Prompt %r response exceeds size limit of %d bytes, truncating",
+            context.message.name,
+            self.max_size,
         )
 
-        return self._truncate_to_result(text)
+        messages: list[Message] = []
+        remaining = self._target_size
+        for message in result.messages:
+            size = estimate_size(message.content, remaining)
+            if size <= remaining:
+                messages.append(message)
+                remaining -= size
+                continue
+            if isinstance(message.content, TextContent):
+                text = _truncate_text(message.content.text, max(remaining, 0))
+            else:
+                # Embedded resources can't be cut meaningfully, so they are dropped
+                logger.warning(
+                    "Prompt %r: dropping %s content that exceeds the size limit",
+                    context.message.name,
+                    message.content.type,
+                )
+                text = ""
+            messages.append(Message(text + self.truncation_suffix, role=message.role))
+            break
+
+        return PromptResult(messages, description=result.description, meta=result.meta)
@@ -9,6 +9,7 @@ from contextlib import AsyncExitStack, asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any
 
 import fastmcp
+from fastmcp.resources.types import _http_client_lifespan
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -142,9 +143,12 @@ class LifespanMixin:
             self._lifespan_result_set = True
 
             async with AsyncExitStack[bool | None]() as stack:
+                await stack.enter_async_context(_http_client_lifespan())
                 # Start lifespans for all providers
                 for provider in self.providers:
                     await stack.enter_async_context(provider.lifespan())
+                if self._metrics is not None:
+                    await stack.enter_async_context(self._metrics.lifespan())
 
                 self._started.set()
                 try:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Sequence
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import mcp.types
@@ -10,6 +12,7 @@ from mcp.shared.exceptions import McpError
 from mcp.types import ContentBlock
 from pydantic import AnyUrl
 
+import fastmcp
 from fastmcp.exceptions import DisabledError, NotFoundError
 from fastmcp.server.tasks.config import TaskMeta
 from fastmcp.utilities.logging import get_logger
@@ -70,6 +73,82 @@ def _dedupe_with_versions(
     return result
 
 
+@dataclass
+class _Catalog:
+    components: list[Any]
+    # The list middleware last served for this catalog, and its wire format
+    served: list[Any] | None = None
+    wire: list[Any] | None = None
+
+
+class CatalogCache:
+    """Recently built component catalogs and their wire format.
+
+    A catalog is the list of components the server returns for a list
+    request, after transforms, visibility, and auth. Catalogs are keyed by
+    `FastMCP._catalog_key()`: the component type, the providers' catalog
+    generation, the session's visibility rules, and the access token. Adding
+    or removing components or transforms changes the generation, so a stale
+    catalog is never served; when providers can't report a generation (for
+    example proxies), the key is None and nothing is cached.
+
+    The wire format of a catalog is reused while middleware keeps serving
+    the same components for it.
+
+    Components are treated as immutable: mutating one in place after it has
+    been listed is not detected.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, _Catalog] = OrderedDict()
+
+    def get(self, key: Hashable | None) -> list[Any] | None:
+        """Return the components of a cached catalog, or None."""
+        if key is None:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return list(entry.components)
+
+    def put(self, key: Hashable | None, components: Sequence[Any]) -> None:
+        """Cache the components of a catalog built for `key`."""
+        if key is None:
+            return
+        self._entries[key] = _Catalog(list(components))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_build(
+        self,
+        key: Hashable | None,
+        components: Sequence[C],
+        build: Callable[[list[C]], list[PaginateT]],
+    ) -> list[PaginateT]:
+        """Return the wire-format list for the catalog, building it on a miss."""
+        components = list(components)
+        entry = self._entries.get(key) if key is not None else None
+        if entry is None:
+            return build(components)
+        served = entry.served
+        if (
+            served is not None
+            and entry.wire is not None
+            and len(served) == len(components)
+            and all(a is b for a, b in zip(served, components, strict=True))
+        ):
+            return entry.wire
+        items = build(components)
+        entry.served, entry.wire = components, items
+        return items
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 def _apply_pagination(
     items: Sequence[PaginateT],
     cursor: str | None,
@@ -152,8 +231,17 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_tools")
 
-        tools = _dedupe_with_versions(list(await server.list_tools()), lambda t: t.name)
-        sdk_tools = [tool.to_mcp_tool(name=tool.name) for tool in tools]
+        async with fastmcp.server.context.Context(fastmcp=server):
+            key = await server._catalog_key("tool")
+            tools = await server.list_tools()
+        sdk_tools = server._catalog_cache.get_or_build(
+            key,
+            tools,
+            lambda tools: [
+                tool.to_mcp_tool(name=tool.name)
+                for tool in _dedupe_with_versions(tools, lambda t: t.name)
+            ],
+        )
 
         # SDK may pass None for internal cache refresh despite type hint
         cursor = (
@@ -172,12 +260,17 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_resources")
 
-        resources = _dedupe_with_versions(
-            list(await server.list_resources()), lambda r: str(r.uri)
+        async with fastmcp.server.context.Context(fastmcp=server):
+            key = await server._catalog_key("resource")
+            resources = await server.list_resources()
+        sdk_resources = server._catalog_cache.get_or_build(
+            key,
+            resources,
+            lambda resources: [
+                resource.to_mcp_resource(uri=str(resource.uri))
+                for resource in _dedupe_with_versions(resources, lambda r: str(r.uri))
+            ],
         )
-        sdk_resources = [
-            resource.to_mcp_resource(uri=str(resource.uri)) for resource in resources
-        ]
 
         cursor = request.params.cursor if request.params else None
         page, next_cursor = _apply_pagination(
@@ -195,13 +288,19 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_resource_templates")
 
-        templates = _dedupe_with_versions(
-            list(await server.list_resource_templates()), lambda t: t.uri_template
+        async with fastmcp.server.context.Context(fastmcp=server):
+            key = await server._catalog_key("template")
+            templates = await server.list_resource_templates()
+        sdk_templates = server._catalog_cache.get_or_build(
+            key,
+            templates,
+            lambda templates: [
+                template.to_mcp_template(uriTemplate=template.uri_template)
+                for template in _dedupe_with_versions(
+                    templates, lambda t: t.uri_template
+                )
+            ],
         )
-        sdk_templates = [
-            template.to_mcp_template(uriTemplate=template.uri_template)
-            for template in templates
-        ]
         cursor = request.params.cursor if request.params else None
         page, next_cursor = _apply_pagination(
             sdk_templates, cursor, server._list_page_size
@@ -220,10 +319,17 @@ class MCPOperationsMixin:
         server = cast("FastMCP", self)
         logger.debug(f"[{server.name}] Handler called: list_prompts")
 
-        prompts = _dedupe_with_versions(
-            list(await server.list_prompts()), lambda p: p.name
+        async with fastmcp.server.context.Context(fastmcp=server):
+            key = await server._catalog_key("prompt")
+            prompts = await server.list_prompts()
+        sdk_prompts = server._catalog_cache.get_or_build(
+            key,
+            prompts,
+            lambda prompts: [
+                prompt.to_mcp_prompt(name=prompt.name)
+                for prompt in _dedupe_with_versions(prompts, lambda p: p.name)
+            ],
         )
-        sdk_prompts = [prompt.to_mcp_prompt(name=prompt.name) for prompt in prompts]
         cursor = request.params.cursor if request.params else None
         page, next_cursor = _apply_pagination(
             sdk_prompts, cursor, server._list_page_size
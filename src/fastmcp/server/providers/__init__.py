@@ -32,16 +32,16 @@ from fastmcp.server.providers.base import Provider
 from fastmcp.server.providers.fastmcp_provider import FastMCPProvider
 from fastmcp.server.providers.filesystem import FileSystemProvider
 from fastmcp.server.providers.local_provider import LocalProvider
-from fastmcp.server.providers.skills import (
-    ClaudeSkillsProvider,
-    SkillProvider,
-    SkillsDirectoryProvider,
-    SkillsProvider,
-)
 
 if TYPE_CHECKING:
     from fastmcp.server.providers.openapi import OpenAPIProvider as OpenAPIProvider
     from fastmcp.server.providers.proxy import ProxyProvider as ProxyProvider
+    from fastmcp.server.providers.skills import (
+        ClaudeSkillsProvider as ClaudeSkillsProvider,
+        SkillProvider as SkillProvider,
+        SkillsDirectoryProvider as SkillsDirectoryProvider,
+        SkillsProvider as SkillsProvider,
+    )
 
 __all__ = [
     "AggregateProvider",
@@ -58,8 +58,17 @@ __all__ = [
 ]
 
 
+_SKILLS_EXPORTS = {
+    "ClaudeSkillsProvider",
+    "SkillProvider",
+    "SkillsDirectoryProvider",
+    "SkillsProvider",
+}
+
+
 def __getattr__(name: str):
-    """Lazy import for providers to avoid circular imports."""
+    """Lazy import for providers to avoid circular imports and keep
+    `import fastmcp` from loading optional providers."""
     if name == "ProxyProvider":
         from fastmcp.server.providers.proxy import ProxyProvider
 
@@ -68,4 +77,8 @@ def __getattr__(name: str):
         from fastmcp.server.providers.openapi import OpenAPIProvider
 
         return OpenAPIProvider
+    if name in _SKILLS_EXPORTS:
+        from fastmcp.server.providers import skills
+
+        return getattr(skills, name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
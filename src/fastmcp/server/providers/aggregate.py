@@ -21,12 +21,14 @@ Example:
 from __future__ import annotations
 
 import logging
-from collections.abc import AsyncIterator, Sequence
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Sequence
 from contextlib import AsyncExitStack, asynccontextmanager
 from typing import TYPE_CHECKING, TypeVar
 
 from fastmcp.exceptions import NotFoundError
 from fastmcp.server.providers.base import Provider
+from fastmcp.server.providers.transform_pipeline import TRANSFORM_METHODS
 from fastmcp.server.transforms import Namespace
 from fastmcp.utilities.async_utils import gather
 from fastmcp.utilities.components import FastMCPComponent
@@ -36,11 +38,14 @@ if TYPE_CHECKING:
     from fastmcp.prompts.prompt import Prompt
     from fastmcp.resources.resource import Resource
     from fastmcp.resources.template import ResourceTemplate
+    from fastmcp.server.metrics import ServerMetrics
+    from fastmcp.server.transforms import ComponentKind
     from fastmcp.tools.tool import Tool
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class AggregateProvider(Provider):
@@ -74,6 +79,9 @@ class AggregateProvider(Provider):
         """
         super().__init__()
         self.providers: list[Provider] = list(providers or [])
+        # Set by FastMCP when metrics are enabled, to time each provider
+        self._metrics: ServerMetrics | None = None
+        self._provider_labels: dict[Provider, str] = {}
 
     def add_provider(self, provider: Provider, *, namespace: str = "") -> None:
         """Add a provider with optional namespace.
@@ -146,25 +154,81 @@ class AggregateProvider(Provider):
     def __repr__(self) -> str:
         return f"AggregateProvider(providers={self.providers!r})"
 
+    async def _gather_providers(
+        self, operation: str, call: Callable[[Provider], Awaitable[T]]
+    ) -> list[T | BaseException]:
+        """Call every provider concurrently, returning results or exceptions.
+
+        When metrics are enabled, each provider's call is timed separately.
+        """
+        metrics = self._metrics
+        if metrics is None:
+            return await gather(
+                *[call(p) for p in self.providers], return_exceptions=True
+            )
+        return await gather(
+            *[self._timed(metrics, p, operation, call(p)) for p in self.providers],
+            return_exceptions=True,
+        )
+
+    async def _timed(
+        self,
+        metrics: ServerMetrics,
+        provider: Provider,
+        operation: str,
+        awaitable: Awaitable[T],
+    ) -> T:
+        label = self._provider_labels.get(provider)
+        if label is None:
+            label = self._provider_labels[provider] = repr(provider)
+        start = time.perf_counter()
+        try:
+            result = await awaitable
+        except NotFoundError:
+            metrics.observe_provider(label, operation, time.perf_counter() - start)
+            raise
+        except BaseException:
+            metrics.observe_provider(
+                label, operation, time.perf_counter() - start, error=True
+            )
+            raise
+        metrics.observe_provider(label, operation, time.perf_counter() - start)
+        return result
+
+    def _source_generation(self, kind: ComponentKind) -> Hashable | None:
+        """Combine the catalog generations of every provider.
+
+        Providers that override their public list method for `kind` bypass
+        their own pipeline, so their generation can't be trusted.
+        """
+        list_method = TRANSFORM_METHODS[kind][0]
+        generations = []
+        for provider in self.providers:
+            if getattr(type(provider), list_method) is not getattr(
+                Provider, list_method
+            ):
+                return None
+            generation = provider._catalog_generation(kind)
+            if generation is None:
+                return None
+            generations.append(generation)
+        return tuple(generations)
+
     # -------------------------------------------------------------------------
     # Tools
     # -------------------------------------------------------------------------
 
     async def _list_tools(self) -> Sequence[Tool]:
         """List all tools from all providers."""
-        results = await gather(
-            *[p.list_tools() for p in self.providers],
-            return_exceptions=True,
-        )
+        results = await self._gather_providers("list_tools", lambda p: p.list_tools())
         return self._collect_list_results(results, "list_tools")
 
     async def _get_tool(
         self, name: str, version: VersionSpec | None = None
     ) -> Tool | None:
         """Get tool by name from providers."""
-        results = await gather(
-            *[p.get_tool(name, version) for p in self.providers],
-            return_exceptions=True,
+        results = await self._gather_providers(
+            "get_tool", lambda p: p.get_tool(name, version)
         )
         return self._get_highest_version_result(results, f"get_tool({name!r})")  # type: ignore[return-value]
 
@@ -174,9 +238,8 @@ class AggregateProvider(Provider):
 
     async def _list_resources(self) -> Sequence[Resource]:
         """List all resources from all providers."""
-        results = await gather(
-            *[p.list_resources() for p in self.providers],
-            return_exceptions=True,
+        results = await self._gather_providers(
+            "list_resources", lambda p: p.list_resources()
         )
         return self._collect_list_results(results, "list_resources")
 
@@ -184,9 +247,8 @@ class AggregateProvider(Provider):
         self, uri: str, version: VersionSpec | None = None
     ) -> Resource | None:
         """Get resource by URI from providers."""
-        results = await gather(
-            *[p.get_resource(uri, version) for p in self.providers],
-            return_exceptions=True,
+        results = await self._gather_providers(
+            "get_resource", lambda p: p.get_resource(uri, version)
         )
         return self._get_highest_version_result(results, f"get_resource({uri!r})")  # type: ignore[return-value]
 
@@ -196,9 +258,8 @@ class AggregateProvider(Provider):
 
     async def _list_resource_templates(self) -> Sequence[ResourceTemplate]:
         """List all resource templates from all providers."""
-        results = await gather(
-            *[p.list_resource_templates() for p in self.providers],
-            return_exceptions=True,
+        results = await self._gather_providers(
+            "list_resource_templates", lambda p: p.list_resource_templates()
         )
         return self._collect_list_results(results, "list_resource_templates")
 
@@ -206,9 +267,8 @@ class AggregateProvider(Provider):
         self, uri: str, version: VersionSpec | None = None
     ) -> ResourceTemplate | None:
         """Get resource template by URI from providers."""
-        results = await gather(
-            *[p.get_resource_template(uri, version) for p in self.providers],
-            return_exceptions=True,
+        results = await self._gather_providers(
+            "get_resource_template", lambda p: p.get_resource_template(uri, version)
         )
         return self._get_highest_version_result(
             results, f"get_resource_template({uri!r})"
@@ -220,9 +280,8 @@ class AggregateProvider(Provider):
 
     async def _list_prompts(self) -> Sequence[Prompt]:
         """List all prompts from all providers."""
-        results = await gather(
-            *[p.list_prompts() for p in self.providers],
-            return_exceptions=True,
+        results = await self._gather_providers(
+            "list_prompts", lambda p: p.list_prompts()
         )
         return self._collect_list_results(results, "list_prompts")
 
@@ -230,9 +289,8 @@ class AggregateProvider(Provider):
         self, name: str, version: VersionSpec | None = None
     ) -> Prompt | None:
         """Get prompt by name from providers."""
-        results = await gather(
-            *[p.get_prompt(name, version) for p in self.providers],
-            return_exceptions=True,
+        results = await self._gather_providers(
+            "get_prompt", lambda p: p.get_prompt(name, version)
         )
         return self._get_highest_version_result(results, f"get_prompt({name!r})")  # type: ignore[return-value]
 
@@ -242,10 +300,7 @@ class AggregateProvider(Provider):
 
     async def get_tasks(self) -> Sequence[FastMCPComponent]:
         """Get all task-eligible components from all providers."""
-        results = await gather(
-            *[p.get_tasks() for p in self.providers],
-            return_exceptions=True,
-        )
+        results = await self._gather_providers("get_tasks", lambda p: p.get_tasks())
         return self._collect_list_results(results, "get_tasks")
 
     # -------------------------------------------------------------------------
@@ -28,9 +28,8 @@ Example:
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Hashable, Sequence
 from contextlib import asynccontextmanager
-from functools import partial
 from typing import TYPE_CHECKING, Literal, cast
 
 from typing_extensions import Self
@@ -38,6 +37,7 @@ from typing_extensions import Self
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import ResourceTemplate
+from fastmcp.server.providers.transform_pipeline import TransformPipeline
 from fastmcp.server.transforms.visibility import Visibility
 from fastmcp.tools.tool import Tool
 from fastmcp.utilities.async_utils import gather
@@ -45,7 +45,7 @@ from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.versions import VersionSpec, version_sort_key
 
 if TYPE_CHECKING:
-    from fastmcp.server.transforms import Transform
+    from fastmcp.server.transforms import ComponentKind, Transform
 
 
 class Provider:
@@ -68,6 +68,8 @@ class Provider:
 
     def __init__(self) -> None:
         self._transforms: list[Transform] = []
+        # Compiled transforms per component type, rebuilt when they change
+        self._pipelines: dict[ComponentKind, TransformPipeline] = {}
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -133,6 +135,61 @@ class Provider:
     # Internal transform chain building
     # -------------------------------------------------------------------------
 
+    def _transform_stack(
+        self, kind: ComponentKind
+    ) -> tuple[Provider, Sequence[Transform]]:
+        """Return the provider that sources components and the transforms on top.
+
+        Transforms are innermost first. Wrapping providers override this to
+        fold their inner provider's transforms into their own pipeline.
+        """
+        return self, self.transforms
+
+    def _transform_pipeline(self, kind: ComponentKind) -> TransformPipeline:
+        """Return the compiled transforms for a component type.
+
+        The pipeline is cached and rebuilt whenever the transforms change
+        (for example after add_transform(), enable(), or disable()).
+        """
+        source, transforms = self._transform_stack(kind)
+        pipeline = self._pipelines.get(kind)
+        if (
+            pipeline is None
+            or pipeline.source is not source
+            or pipeline.transforms != tuple(transforms)
+        ):
+            pipeline = self._pipelines[kind] = TransformPipeline(
+                source, transforms, kind
+            )
+        return pipeline
+
+    def _catalog_generation(self, kind: ComponentKind) -> Hashable | None:
+        """Return a token that changes whenever this provider's listing can.
+
+        The server reuses a catalog it already built while the token is
+        unchanged, instead of listing providers and running transforms again.
+        The token combines the transform pipeline's generation with the
+        source provider's (see `_source_generation`). Returns None when the
+        listing may change without notice: either the source can't tell, or
+        a transform that isn't compiled to steps may depend on request state.
+        """
+        pipeline = self._transform_pipeline(kind)
+        if not pipeline.fused:
+            return None
+        source = pipeline.source._source_generation(kind)
+        if source is None:
+            return None
+        return (pipeline.generation, source)
+
+    def _source_generation(self, kind: ComponentKind) -> Hashable | None:
+        """Return a token that changes whenever `_list_*` for `kind` can.
+
+        Override in providers whose components only change through their own
+        methods. The default, None, means components may change at any time,
+        which is right for providers that query an external source.
+        """
+        return None
+
     async def list_tools(self) -> Sequence[Tool]:
         """List tools with all transforms applied.
 
@@ -144,10 +201,7 @@ class Provider:
         Returns:
             Transformed sequence of tools (including disabled ones).
         """
-        tools = await self._list_tools()
-        for transform in self.transforms:
-            tools = await transform.list_tools(tools)
-        return tools
+        return await self._transform_pipeline("tool").list()
 
     async def get_tool(
         self, name: str, version: VersionSpec | None = None
@@ -165,25 +219,14 @@ class Provider:
         Returns:
             The tool if found (may be marked disabled), None if not found.
         """
-
-        async def base(n: str, version: VersionSpec | None = None) -> Tool | None:
-            return await self._get_tool(n, version)
-
-        chain = base
-        for transform in self.transforms:
-            chain = partial(transform.get_tool, call_next=chain)
-
-        return await chain(name, version=version)
+        return await self._transform_pipeline("tool").get(name, version)
 
     async def list_resources(self) -> Sequence[Resource]:
         """List resources with all transforms applied.
 
         Components may be marked as disabled but are NOT filtered here.
         """
-        resources = await self._list_resources()
-        for transform in self.transforms:
-            resources = await transform.list_resources(resources)
-        return resources
+        return await self._transform_pipeline("resource").list()
 
     async def get_resource(
         self, uri: str, version: VersionSpec | None = None
@@ -200,25 +243,14 @@ class Provider:
         Returns:
             The resource if found (may be marked disabled), None if not found.
         """
-
-        async def base(u: str, version: VersionSpec | None = None) -> Resource | None:
-            return await self._get_resource(u, version)
-
-        chain = base
-        for transform in self.transforms:
-            chain = partial(transform.get_resource, call_next=chain)
-
-        return await chain(uri, version=version)
+        return await self._transform_pipeline("resource").get(uri, version)
 
     async def list_resource_templates(self) -> Sequence[ResourceTemplate]:
         """List resource templates with all transforms applied.
 
         Components may be marked as disabled but are NOT filtered here.
         """
-        templates = await self._list_resource_templates()
-        for transform in self.transforms:
-            templates = await transform.list_resource_templates(templates)
-        return templates
+        return await self._transform_pipeline("template").list()
 
     async def get_resource_template(
         self, uri: str, version: VersionSpec | None = None
@@ -235,27 +267,14 @@ class Provider:
         Returns:
             The template if found (may be marked disabled), None if not found.
         """
-
-        async def base(
-            u: str, version: VersionSpec | None = None
-        ) -> ResourceTemplate | None:
-            return await self._get_resource_template(u, version)
-
-        chain = base
-        for transform in self.transforms:
-            chain = partial(transform.get_resource_template, call_next=chain)
-
-        return await chain(uri, version=version)
+        return await self._transform_pipeline("template").get(uri, version)
 
     async def list_prompts(self) -> Sequence[Prompt]:
         """List prompts with all transforms applied.
 
         Components may be marked as disabled but are NOT filtered here.
         """
-        prompts = await self._list_prompts()
-        for transform in self.transforms:
-            prompts = await transform.list_prompts(prompts)
-        return prompts
+        return await self._transform_pipeline("prompt").list()
 
     async def get_prompt(
         self, name: str, version: VersionSpec | None = None
@@ -272,15 +291,7 @@ class Provider:
         Returns:
             The prompt if found (may be marked disabled), None if not found.
         """
-
-        async def base(n: str, version: VersionSpec | None = None) -> Prompt | None:
-            return await self._get_prompt(n, version)
-
-        chain = base
-        for transform in self.transforms:
-            chain = partial(transform.get_prompt, call_next=chain)
-
-        return await chain(name, version=version)
+        return await self._transform_pipeline("prompt").get(name, version)
 
     # -------------------------------------------------------------------------
     # Private list/get methods (override these to provide components)
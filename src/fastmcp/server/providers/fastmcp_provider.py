@@ -11,8 +11,9 @@ executed.
 from __future__ import annotations
 
 import re
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Hashable, Sequence
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import TYPE_CHECKING, Any, overload
 
 import mcp.types
@@ -21,11 +22,12 @@ from mcp.types import AnyUrl
 from fastmcp.prompts.prompt import Prompt, PromptResult
 from fastmcp.resources.resource import Resource, ResourceResult
 from fastmcp.resources.template import ResourceTemplate
+from fastmcp.server.middleware.middleware import Middleware
 from fastmcp.server.providers.base import Provider
 from fastmcp.server.tasks.config import TaskMeta
 from fastmcp.server.telemetry import delegate_span
 from fastmcp.tools.tool import Tool, ToolResult
-from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.components import CopyCache, FastMCPComponent
 from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
@@ -33,6 +35,7 @@ if TYPE_CHECKING:
     from docket.execution import Execution
 
     from fastmcp.server.server import FastMCP
+    from fastmcp.server.transforms import ComponentKind
 
 
 def _expand_uri_template(template: str, params: dict[str, Any]) -> str:
@@ -469,6 +472,31 @@ class FastMCPProviderResourceTemplate(ResourceTemplate):
 # -----------------------------------------------------------------------------
 
 
+_LIST_HOOKS: dict[ComponentKind, str] = {
+    "tool": "on_list_tools",
+    "resource": "on_list_resources",
+    "template": "on_list_resource_templates",
+    "prompt": "on_list_prompts",
+}
+
+
+def _may_change_listing(middleware: Middleware, kind: ComponentKind) -> bool:
+    """Whether middleware may return different components for the same catalog.
+
+    That's the case for any middleware that hooks `kind` listing requests,
+    unless it declares `stable_listings`.
+    """
+    if not isinstance(middleware, Middleware):
+        return True
+    if middleware.stable_listings:
+        return False
+    hooks = ("__call__", "_dispatch_handler", "on_message", "on_request")
+    return any(
+        getattr(type(middleware), hook) is not getattr(Middleware, hook)
+        for hook in (*hooks, _LIST_HOOKS[kind])
+    )
+
+
 class FastMCPProvider(Provider):
     """Provider that wraps a FastMCP server.
 
@@ -515,6 +543,22 @@ class FastMCPProvider(Provider):
         """
         super().__init__()
         self.server = server
+        # Wrappers are reused while the mounted server returns the same component
+        self._wrapped = CopyCache()
+
+    def _source_generation(self, kind: ComponentKind) -> Hashable | None:
+        """Follow the mounted server's catalog generation and middleware.
+
+        Returns None when any of the mounted server's middleware may change
+        its listing between requests (see `_may_change_listing`).
+        """
+        generation = self.server._catalog_generation(kind)
+        if generation is None:
+            return None
+        middleware = self.server.middleware
+        if any(_may_change_listing(mw, kind) for mw in middleware):
+            return None
+        return (generation, tuple(map(id, middleware)))
 
     # -------------------------------------------------------------------------
     # Tool methods
@@ -528,7 +572,10 @@ class FastMCPProvider(Provider):
         the nested server's middleware.
         """
         raw_tools = await self.server.list_tools()
-        return [FastMCPProviderTool.wrap(self.server, t) for t in raw_tools]
+        return [
+            self._wrapped.get(t, partial(FastMCPProviderTool.wrap, self.server))
+            for t in raw_tools
+        ]
 
     async def _get_tool(
         self, name: str, version: VersionSpec | None = None
@@ -542,7 +589,9 @@ class FastMCPProvider(Provider):
         raw_tool = await self.server.get_tool(name, version)
         if raw_tool is None:
             return None
-        return FastMCPProviderTool.wrap(self.server, raw_tool)
+        return self._wrapped.get(
+            raw_tool, partial(FastMCPProviderTool.wrap, self.server)
+        )
 
     # -------------------------------------------------------------------------
     # Resource methods
@@ -556,7 +605,10 @@ class FastMCPProvider(Provider):
         to the nested server's middleware.
         """
         raw_resources = await self.server.list_resources()
-        return [FastMCPProviderResource.wrap(self.server, r) for r in raw_resources]
+        return [
+            self._wrapped.get(r, partial(FastMCPProviderResource.wrap, self.server))
+            for r in raw_resources
+        ]
 
     async def _get_resource(
         self, uri: str, version: VersionSpec | None = None
@@ -570,7 +622,9 @@ class FastMCPProvider(Provider):
         raw_resource = await self.server.get_resource(uri, version)
         if raw_resource is None:
             return None
-        return FastMCPProviderResource.wrap(self.server, raw_resource)
+        return self._wrapped.get(
+            raw_resource, partial(FastMCPProviderResource.wrap, self.server)
+        )
 
     # -------------------------------------------------------------------------
     # Resource template methods
@@ -585,7 +639,10 @@ class FastMCPProvider(Provider):
         """
         raw_templates = await self.server.list_resource_templates()
         return [
-            FastMCPProviderResourceTemplate.wrap(self.server, t) for t in raw_templates
+            self._wrapped.get(
+                t, partial(FastMCPProviderResourceTemplate.wrap, self.server)
+            )
+            for t in raw_templates
         ]
 
     async def _get_resource_template(
@@ -600,7 +657,9 @@ class FastMCPProvider(Provider):
         raw_template = await self.server.get_resource_template(uri, version)
         if raw_template is None:
             return None
-        return FastMCPProviderResourceTemplate.wrap(self.server, raw_template)
+        return self._wrapped.get(
+            raw_template, partial(FastMCPProviderResourceTemplate.wrap, self.server)
+        )
 
     # -------------------------------------------------------------------------
     # Prompt methods
@@ -614,7 +673,10 @@ class FastMCPProvider(Provider):
         wrapped server's middleware.
         """
         raw_prompts = await self.server.list_prompts()
-        return [FastMCPProviderPrompt.wrap(self.server, p) for p in raw_prompts]
+        return [
+            self._wrapped.get(p, partial(FastMCPProviderPrompt.wrap, self.server))
+            for p in raw_prompts
+        ]
 
     async def _get_prompt(
         self, name: str, version: VersionSpec | None = None
@@ -628,7 +690,9 @@ class FastMCPProvider(Provider):
         raw_prompt = await self.server.get_prompt(name, version)
         if raw_prompt is None:
             return None
-        return FastMCPProviderPrompt.wrap(self.server, raw_prompt)
+        return self._wrapped.get(
+            raw_prompt, partial(FastMCPProviderPrompt.wrap, self.server)
+        )
 
     # -------------------------------------------------------------------------
     # Task registration
@@ -28,14 +28,30 @@ Example:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Sequence
+import hashlib
+import time
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Sequence
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
+import anyio
+import mcp.types
+
+import fastmcp
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.resources.resource import Resource
-from fastmcp.resources.template import ResourceTemplate
-from fastmcp.server.providers.filesystem_discovery import discover_and_import
+from fastmcp.resources.template import ResourceTemplate, match_uri_template
+from fastmcp.server.providers.filesystem_discovery import (
+    ComponentRecord,
+    DiscoveryCache,
+    FileFingerprint,
+    discover_files,
+    extract_components,
+    fingerprint_file,
+    import_module_from_file,
+)
 from fastmcp.server.providers.local_provider import LocalProvider
+from fastmcp.server.transforms import ComponentKind
 from fastmcp.tools.tool import Tool
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.logging import get_logger
@@ -44,6 +60,42 @@ from fastmcp.utilities.versions import VersionSpec
 logger = get_logger(__name__)
 
 
+def _component_kind(component: FastMCPComponent) -> ComponentKind | None:
+    if isinstance(component, Tool):
+        return "tool"
+    if isinstance(component, ResourceTemplate):
+        return "template"
+    if isinstance(component, Resource):
+        return "resource"
+    if isinstance(component, Prompt):
+        return "prompt"
+    return None
+
+
+def _record_kinds(records: Iterable[ComponentRecord]) -> set[ComponentKind]:
+    return {record.kind for record in records}
+
+
+def _component_record(component: FastMCPComponent) -> ComponentRecord | None:
+    kind = _component_kind(component)
+    if kind is None:
+        return None
+    if isinstance(component, ResourceTemplate):
+        name = component.uri_template
+    elif isinstance(component, Resource):
+        name = str(component.uri)
+    else:
+        name = component.name
+    return ComponentRecord(
+        kind=kind, name=name, task=component.task_config.supports_tasks()
+    )
+
+
+def _default_cache_path(root: Path) -> Path:
+    key = hashlib.sha256(str(root).encode()).hexdigest()[:16]
+    return fastmcp.settings.home / "discovery-cache" / f"{key}.json"
+
+
 class FileSystemProvider(LocalProvider):
     """Provider that discovers components from the filesystem.
 
@@ -54,10 +106,31 @@ class FileSystemProvider(LocalProvider):
     - @resource from fastmcp.resources
     - @prompt from fastmcp.prompts
 
+    In reload mode, each file is fingerprinted by (mtime, size, content hash)
+    and only files whose contents changed are re-imported. Components from
+    unchanged files are left in place.
+
+    In lazy mode, the components each file produced are recorded in an
+    on-disk cache keyed by the file's content hash. On the next start,
+    files whose hash matches the cache are not imported until one of their
+    components is listed or requested.
+
     Args:
         root: Root directory to scan. Defaults to current directory.
-        reload: If True, re-scan files on every request (dev mode).
+        reload: If True, check for changed files on every request (dev mode).
             Defaults to False (scan once at init, cache results).
+        watch: If True, watch the directory for changes with watchfiles
+            instead of scanning on every request. Implies reload. The watcher
+            runs for the lifetime of the server; until it starts, requests
+            fall back to scanning.
+        reload_interval: Minimum seconds between scans in reload mode.
+            Requests within the interval reuse the current components.
+            Defaults to 0 (scan on every request).
+        lazy: If True, defer importing files that are unchanged since the
+            discovery cache was written. Files with no cache entry are
+            imported at init as usual.
+        cache_path: Where lazy mode stores its discovery cache. Defaults to
+            a file under `settings.home` derived from the root path.
 
     Example:
         ```python
@@ -77,7 +150,7 @@ class FileSystemProvider(LocalProvider):
         # Path relative to this file
         mcp = FastMCP("MyServer", providers=[FileSystemProvider(Path(__file__).parent / "mcp")])
 
-        # Dev mode - re-scan on every request
+        # Dev mode - re-import changed files on every request
         mcp = FastMCP("MyServer", providers=[FileSystemProvider(Path(__file__).parent / "mcp", reload=True)])
         ```
     """
@@ -86,47 +159,125 @@ class FileSystemProvider(LocalProvider):
         self,
         root: str | Path = ".",
         reload: bool = False,
+        watch: bool = False,
+        reload_interval: float = 0.0,
+        lazy: bool = False,
+        cache_path: str | Path | None = None,
     ) -> None:
         super().__init__(on_duplicate="replace")
         self._root = Path(root).resolve()
-        self._reload = reload
+        self._reload = reload or watch
+        self._watch = watch
+        self._reload_interval = reload_interval
         self._loaded = False
-        # Track files we've warned about: path -> mtime when warned
-        # Re-warn if file changes (mtime differs)
-        self._warned_files: dict[Path, float] = {}
+        # Per-file state: content fingerprint and the components it registered
+        self._file_fingerprints: dict[Path, FileFingerprint] = {}
+        self._file_components: dict[Path, dict[str, FastMCPComponent]] = {}
+        # Monotonic start time of the most recent scan
+        self._last_scan_started = 0.0
         # Lock for serializing reload operations (created lazily)
         self._reload_lock: asyncio.Lock | None = None
+        # Watcher state: paths reported as changed since the last refresh
+        self._watch_task: asyncio.Task[None] | None = None
+        self._pending_paths: set[Path] = set()
+        self._needs_full_scan = False
+        # Lazy mode: files whose import is deferred, and the components the
+        # cache says they produce
+        self._cache: DiscoveryCache | None = None
+        if lazy:
+            self._cache = DiscoveryCache(
+                Path(cache_path) if cache_path else _default_cache_path(self._root)
+            )
+            self._cache.load()
+        self._deferred_files: dict[Path, list[ComponentRecord]] = {}
+        # Seconds spent importing each file and extracting its components
+        self._import_times: dict[Path, float] = {}
 
         # Always load once at init to catch errors early
         self._load_components()
 
+    @property
+    def import_times(self) -> dict[Path, float]:
+        """Seconds spent importing each file, for files imported so far."""
+        return dict(self._import_times)
+
     def _load_components(self) -> None:
         """Discover and register all components from the filesystem."""
-        # Clear existing components if reloading
-        if self._loaded:
-            self._components.clear()
+        start = time.perf_counter()
+        self._refresh()
+        elapsed = time.perf_counter() - start
+        logger.debug(
+            f"FileSystemProvider loaded {len(self._components)} components from "
+            f"{self._root} in {elapsed * 1000:.1f}ms "
+            f"({len(self._import_times)} files imported, "
+            f"{len(self._deferred_files)} deferred)"
+        )
 
-        result = discover_and_import(self._root)
+    def _refresh(self, paths: Iterable[Path] | None = None) -> set[ComponentKind]:
+        """Re-import changed files and return the kinds of components affected.
 
-        # Log warnings for failed files (only once per file version)
-        for file_path, error in result.failed_files.items():
-            try:
-                current_mtime = file_path.stat().st_mtime
-            except OSError:
-                current_mtime = 0.0
-
-            # Warn if we haven't warned about this file, or if it changed
-            last_warned_mtime = self._warned_files.get(file_path)
-            if last_warned_mtime is None or last_warned_mtime != current_mtime:
-                logger.warning(f"Failed to import {file_path}: {error}")
-                self._warned_files[file_path] = current_mtime
-
-        # Clear warnings for files that now import successfully
-        successful_files = {fp for fp, _ in result.components}
-        for fp in successful_files:
-            self._warned_files.pop(fp, None)
-
-        for file_path, component in result.components:
+        Args:
+            paths: Files to check. If None, the whole root is scanned and files
+                that no longer exist are unregistered.
+        """
+        self._last_scan_started = time.monotonic()
+        if paths is None:
+            candidates = set(discover_files(self._root)) | set(self._file_fingerprints)
+        else:
+            candidates = set(paths)
+
+        affected: set[ComponentKind] = set()
+        for file_path in sorted(candidates):
+            affected |= self._refresh_file(file_path)
+
+        self._loaded = True
+        if self._cache is not None:
+            self._cache.save()
+        return affected
+
+    def _refresh_file(self, file_path: Path) -> set[ComponentKind]:
+        """Re-import a single file if its contents changed since the last scan."""
+        previous = self._file_fingerprints.get(file_path)
+        try:
+            fingerprint = fingerprint_file(file_path, previous)
+        except OSError:
+            # File was removed (or is unreadable); drop what it registered
+            self._file_fingerprints.pop(file_path, None)
+            if self._cache is not None:
+                self._cache.discard(file_path)
+            deferred = self._deferred_files.pop(file_path, [])
+            return self._unregister_file(file_path) | _record_kinds(deferred)
+
+        if fingerprint is previous:
+            return set()
+        self._file_fingerprints[file_path] = fingerprint
+        if previous is not None and previous.digest == fingerprint.digest:
+            # Touched but not modified
+            return set()
+
+        affected = self._unregister_file(file_path)
+        affected |= _record_kinds(self._deferred_files.pop(file_path, []))
+        if previous is None and self._cache is not None:
+            records = self._cache.get(file_path, fingerprint.digest)
+            if records is not None:
+                self._deferred_files[file_path] = records
+                return affected | _record_kinds(records)
+        return affected | self._import_file(file_path)
+
+    def _import_file(self, file_path: Path) -> set[ComponentKind]:
+        """Import a file and register its components."""
+        start = time.perf_counter()
+        try:
+            module = import_module_from_file(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to import {file_path}: {e}")
+            if self._cache is not None:
+                self._cache.discard(file_path)
+            return set()
+
+        affected: set[ComponentKind] = set()
+        registered: dict[str, FastMCPComponent] = {}
+        for component in extract_components(module):
             try:
                 self._register_component(component)
             except Exception:
@@ -135,12 +286,64 @@ class FileSystemProvider(LocalProvider):
                     getattr(component, "name", repr(component)),
                     file_path,
                 )
-
-        self._loaded = True
+                continue
+            registered[component.key] = component
+            if kind := _component_kind(component):
+                affected.add(kind)
+        self._file_components[file_path] = registered
+
+        elapsed = time.perf_counter() - start
+        self._import_times[file_path] = elapsed
         logger.debug(
-            f"FileSystemProvider loaded {len(self._components)} components from {self._root}"
+            f"Imported {file_path} in {elapsed * 1000:.1f}ms "
+            f"({len(registered)} components)"
         )
 
+        fingerprint = self._file_fingerprints.get(file_path)
+        if self._cache is not None and fingerprint is not None:
+            records = [
+                record
+                for component in registered.values()
+                if (record := _component_record(component)) is not None
+            ]
+            self._cache.set(file_path, fingerprint.digest, records)
+        return affected
+
+    async def _load_deferred(
+        self, predicate: Callable[[ComponentRecord], bool]
+    ) -> None:
+        """Import deferred files that produce a component matching `predicate`."""
+        paths = [
+            path
+            for path, records in self._deferred_files.items()
+            if any(predicate(record) for record in records)
+        ]
+        if not paths:
+            return
+
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+        async with self._reload_lock:
+            await asyncio.to_thread(self._import_deferred, paths)
+
+    def _import_deferred(self, paths: Iterable[Path]) -> None:
+        for path in paths:
+            # Skip files imported (or removed) while waiting for the lock
+            if self._deferred_files.pop(path, None) is not None:
+                self._import_file(path)
+        if self._cache is not None:
+            self._cache.save()
+
+    def _unregister_file(self, file_path: Path) -> set[ComponentKind]:
+        """Remove the components a file registered, unless since replaced."""
+        affected: set[ComponentKind] = set()
+        for key, component in self._file_components.pop(file_path, {}).items():
+            if self._components.get(key) is component:
+                self._remove_component(key)
+                if kind := _component_kind(component):
+                    affected.add(kind)
+        return affected
+
     def _register_component(self, component: FastMCPComponent) -> None:
         """Register a single component based on its type."""
         if isinstance(component, Tool):
@@ -155,10 +358,12 @@ class FileSystemProvider(LocalProvider):
             logger.debug("Ignoring unknown component type: %r", type(component))
 
     async def _ensure_loaded(self) -> None:
-        """Ensure components are loaded, reloading if in reload mode.
+        """Ensure components are loaded, refreshing changed files in reload mode.
 
         Uses a lock to serialize concurrent reload operations and runs
-        filesystem I/O off the event loop using asyncio.to_thread.
+        filesystem I/O off the event loop using asyncio.to_thread. Requests
+        that arrive while a scan is running reuse its result instead of
+        starting another one.
         """
         if not self._reload and self._loaded:
             return
@@ -167,16 +372,120 @@ class FileSystemProvider(LocalProvider):
         if self._reload_lock is None:
             self._reload_lock = asyncio.Lock()
 
+        requested_at = time.monotonic()
+        # The lock is only held across a scan, so if it's held now a scan is
+        # running and its result is fresh enough for this request
+        joined_scan = self._reload_lock.locked()
         async with self._reload_lock:
-            # Double-check after acquiring lock
-            if self._reload or not self._loaded:
+            if not self._loaded:
                 await asyncio.to_thread(self._load_components)
+                return
+            if joined_scan or self._last_scan_started >= requested_at:
+                return
+            if requested_at - self._last_scan_started < self._reload_interval:
+                return
+
+            if self._watch_task is not None and not self._needs_full_scan:
+                if not self._pending_paths:
+                    return
+                paths, self._pending_paths = self._pending_paths, set()
+                affected = await asyncio.to_thread(self._refresh, paths)
+            else:
+                self._needs_full_scan = False
+                self._pending_paths.clear()
+                affected = await asyncio.to_thread(self._refresh)
+
+        if affected:
+            await self._notify_list_changed(affected)
+
+    async def _notify_list_changed(self, kinds: set[ComponentKind]) -> None:
+        """Tell the requesting session that the component set changed."""
+        from fastmcp.server.dependencies import get_context
+
+        try:
+            context = get_context()
+        except RuntimeError:
+            return
 
-    # Override provider methods to support reload mode
+        notifications: list[mcp.types.ServerNotificationType] = []
+        if "tool" in kinds:
+            notifications.append(mcp.types.ToolListChangedNotification())
+        if "resource" in kinds or "template" in kinds:
+            notifications.append(mcp.types.ResourceListChangedNotification())
+        if "prompt" in kinds:
+            notifications.append(mcp.types.PromptListChangedNotification())
+
+        for notification in notifications:
+            try:
+                await context.send_notification(notification)
+            except Exception as e:
+                logger.debug(f"Could not send {type(notification).__name__}: {e}")
+
+    # -------------------------------------------------------------------------
+    # File watching
+    # -------------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[None]:
+        """Run the file watcher for the server's lifetime when watch=True."""
+        if not self._watch or self._watch_task is not None:
+            yield
+            return
+
+        stop_event = asyncio.Event()
+        # Changes made before the watcher started are picked up by a full scan
+        self._needs_full_scan = True
+        watch_task = asyncio.create_task(self._watch_files(stop_event))
+        self._watch_task = watch_task
+        try:
+            yield
+        finally:
+            # awatch exits on its own once stop_event is set; shield the wait
+            # so shutdown cancellation doesn't propagate into the watcher thread
+            stop_event.set()
+            with anyio.CancelScope(shield=True), suppress(asyncio.CancelledError):
+                await watch_task
+            self._watch_task = None
+
+    async def _watch_files(self, stop_event: asyncio.Event) -> None:
+        """Record changed Python files until stopped."""
+        from watchfiles import PythonFilter, awatch
+
+        try:
+            async for changes in awatch(
+                self._root,
+                watch_filter=PythonFilter(),
+                stop_event=stop_event,
+                rust_timeout=500,
+            ):
+                for _, changed in changes:
+                    path = Path(changed)
+                    if path.name == "__init__.py" or "__pycache__" in path.parts:
+                        continue
+                    self._pending_paths.add(path)
+        except Exception:
+            if stop_event.is_set():
+                return
+            # Fall back to scanning on every request
+            logger.exception(f"File watcher for {self._root} stopped")
+            self._watch_task = None
+
+    # Override provider methods to support reload and lazy modes
+
+    def _source_generation(self, kind: ComponentKind) -> Hashable | None:
+        """Listings change only through refreshes, except in reload mode.
+
+        Reload mode checks files when components are listed, so a listing
+        can't be reused without running that check.
+        """
+        if self._reload or not self._loaded:
+            return None
+        return self._generation
 
     async def _list_tools(self) -> Sequence[Tool]:
         """Return all tools, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.kind == "tool")
         return await super()._list_tools()
 
     async def _get_tool(
@@ -184,11 +493,13 @@ class FileSystemProvider(LocalProvider):
     ) -> Tool | None:
         """Get a tool by name, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.kind == "tool" and r.name == name)
         return await super()._get_tool(name, version)
 
     async def _list_resources(self) -> Sequence[Resource]:
         """Return all resources, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.kind == "resource")
         return await super()._list_resources()
 
     async def _get_resource(
@@ -196,11 +507,13 @@ class FileSystemProvider(LocalProvider):
     ) -> Resource | None:
         """Get a resource by URI, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.kind == "resource" and r.name == uri)
         return await super()._get_resource(uri, version)
 
     async def _list_resource_templates(self) -> Sequence[ResourceTemplate]:
         """Return all resource templates, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.kind == "template")
         return await super()._list_resource_templates()
 
     async def _get_resource_template(
@@ -208,11 +521,17 @@ class FileSystemProvider(LocalProvider):
     ) -> ResourceTemplate | None:
         """Get a resource template, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(
+            lambda r: (
+                r.kind == "template" and match_uri_template(uri, r.name) is not None
+            )
+        )
         return await super()._get_resource_template(uri, version)
 
     async def _list_prompts(self) -> Sequence[Prompt]:
         """Return all prompts, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.kind == "prompt")
         return await super()._list_prompts()
 
     async def _get_prompt(
@@ -220,7 +539,17 @@ class FileSystemProvider(LocalProvider):
     ) -> Prompt | None:
         """Get a prompt by name, reloading if in reload mode."""
         await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.kind == "prompt" and r.name == name)
         return await super()._get_prompt(name, version)
 
+    async def get_tasks(self) -> Sequence[FastMCPComponent]:
+        """Return task-eligible components, importing deferred files that have any."""
+        await self._ensure_loaded()
+        await self._load_deferred(lambda r: r.task)
+        return await super().get_tasks()
+
     def __repr__(self) -> str:
-        return f"FileSystemProvider(root={self._root!r}, reload={self._reload})"
+        return (
+            f"FileSystemProvider(root={self._root!r}, reload={self._reload}, "
+            f"watch={self._watch}, lazy={self._cache is not None})"
+        )
@@ -4,16 +4,21 @@ This module provides functions to:
 1. Discover Python files in a directory tree
 2. Import modules (as packages if __init__.py exists, else directly)
 3. Extract decorated components (Tool, Resource, Prompt objects) from imported modules
+4. Cache which components each file produced, keyed by content hash
 """
 
 from __future__ import annotations
 
+import hashlib
 import importlib.util
+import json
+import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from types import ModuleType
 
+from fastmcp.server.transforms import ComponentKind
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.logging import get_logger
 
@@ -29,6 +34,125 @@ class DiscoveryResult:
     failed_files: dict[Path, str] = field(default_factory=dict)  # path -> error message
 
 
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identity of a file's contents, used to skip unchanged files on reload."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+def fingerprint_file(
+    file_path: Path, previous: FileFingerprint | None = None
+) -> FileFingerprint:
+    """Compute a fingerprint for a file.
+
+    The content hash is only recomputed when the file's mtime or size differs
+    from `previous`, so unchanged files cost a single stat call.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    stat = file_path.stat()
+    if (
+        previous is not None
+        and previous.mtime_ns == stat.st_mtime_ns
+        and previous.size == stat.st_size
+    ):
+        return previous
+    digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+    return FileFingerprint(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest)
+
+
+@dataclass(frozen=True)
+class ComponentRecord:
+    """A component a file produced when it was last imported."""
+
+    kind: ComponentKind
+    # Tool or prompt name, resource URI, or resource URI template
+    name: str
+    # Whether the component supports background task execution
+    task: bool = False
+
+
+class DiscoveryCache:
+    """On-disk record of the components each discovered file produced.
+
+    Entries are keyed by file path and only returned when the file's content
+    digest matches, so an edited file is never served from the cache.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, tuple[str, list[ComponentRecord]]] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load entries from disk. A missing or unreadable cache is treated as empty."""
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != self.VERSION:
+                return
+            self._entries = {
+                file: (
+                    entry["digest"],
+                    [ComponentRecord(**record) for record in entry["components"]],
+                )
+                for file, entry in data["files"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable discovery cache {self.path}: {e}")
+            self._entries = {}
+
+    def get(self, file_path: Path, digest: str) -> list[ComponentRecord] | None:
+        """Return the cached records for a file if its digest matches."""
+        entry = self._entries.get(str(file_path))
+        if entry is None or entry[0] != digest:
+            return None
+        return entry[1]
+
+    def set(self, file_path: Path, digest: str, records: list[ComponentRecord]) -> None:
+        """Record the components a file produced."""
+        entry = (digest, records)
+        if self._entries.get(str(file_path)) != entry:
+            self._entries[str(file_path)] = entry
+            self._dirty = True
+
+    def discard(self, file_path: Path) -> None:
+        """Forget a file (removed, or failed to import)."""
+        if self._entries.pop(str(file_path), None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write entries to disk if they changed since the last load or save."""
+        if not self._dirty:
+            return
+        data = {
+            "version": self.VERSION,
+            "files": {
+                file: {
+                    "digest": digest,
+                    "components": [asdict(record) for record in records],
+                }
+                for file, (digest, records) in self._entries.items()
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write discovery cache {self.path}: {e}")
+            return
+        self._dirty = False
+
+
 def discover_files(root: Path) -> list[Path]:
     """Recursively discover all Python files under a directory.
 
@@ -234,6 +358,8 @@ def extract_components(module: ModuleType) -> list[FastMCPComponent]:
                     task=resolved_task,
                     exclude_args=meta.exclude_args,
                     serializer=meta.serializer,
+                    structured_only=meta.structured_only,
+                    executor=meta.executor,
                     auth=meta.auth,
                 )
                 components.append(tool)
@@ -0,0 +1,58 @@
+"""Signature checks for decorated functions whose components are deferred."""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from fastmcp.server.coalescing import validate_coalesce
+from fastmcp.server.dependencies import transform_context_annotations
+
+
+def check_deferred_function(
+    fn: Callable[..., Any],
+    kind: str,
+    name: str | None,
+    exclude_args: list[str] | None = None,
+    coalesce: bool = False,
+) -> None:
+    """Run the cheap checks that building the component would run.
+
+    Lazy registration defers schema generation, but a function that can never
+    become a component should still fail when it is decorated rather than the
+    first time it is listed.
+
+    Args:
+        fn: The decorated function.
+        kind: "tool" or "prompt", used in error messages.
+        name: The explicit component name, if any.
+        exclude_args: Tool arguments to exclude from the schema.
+        coalesce: Whether the component coalesces concurrent requests.
+
+    Raises:
+        ValueError: If the function can't be turned into a component.
+    """
+    fn_name = name or getattr(fn, "__name__", None) or type(fn).__name__
+    if fn_name == "<lambda>":
+        raise ValueError("You must provide a name for lambda functions")
+
+    sig = inspect.signature(fn)
+    for param in sig.parameters.values():
+        if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            raise ValueError(f"Functions with *args are not supported as {kind}s")
+        if param.kind == inspect.Parameter.VAR_KEYWORD:
+            raise ValueError(f"Functions with **kwargs are not supported as {kind}s")
+
+    for arg_name in exclude_args or []:
+        if arg_name not in sig.parameters:
+            raise ValueError(
+                f"Parameter '{arg_name}' in exclude_args does not exist in function."
+            )
+        if sig.parameters[arg_name].default == inspect.Parameter.empty:
+            raise ValueError(
+                f"Parameter '{arg_name}' in exclude_args must have a default value."
+            )
+
+    if coalesce:
+        validate_coalesce(transform_context_annotations(fn), fn_name)
@@ -18,12 +18,51 @@ import fastmcp
 from fastmcp.prompts.function_prompt import FunctionPrompt
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.server.auth.authorization import AuthCheck
+from fastmcp.server.providers.local_provider.decorators._validation import (
+    check_deferred_function,
+)
 from fastmcp.server.tasks.config import TaskConfig
 
 if TYPE_CHECKING:
     from fastmcp.server.providers.local_provider import LocalProvider
 
 
+def _prompt_from_function(fn: Callable[..., Any]) -> tuple[Prompt, bool]:
+    """Build a Prompt from an @prompt-decorated function.
+
+    Returns:
+        The prompt, and whether it should be enabled.
+    """
+    enabled = True
+    prompt = fn
+    from fastmcp.decorators import get_fastmcp_meta
+    from fastmcp.prompts.function_prompt import PromptMeta
+
+    meta = get_fastmcp_meta(prompt)
+    if meta is not None and isinstance(meta, PromptMeta):
+        resolved_task = meta.task if meta.task is not None else False
+        enabled = meta.enabled
+        prompt = Prompt.from_function(
+            prompt,
+            name=meta.name,
+            version=meta.version,
+            title=meta.title,
+            description=meta.description,
+            icons=meta.icons,
+            tags=meta.tags,
+            meta=meta.meta,
+            task=resolved_task,
+            auth=meta.auth,
+            coalesce=meta.coalesce,
+        )
+    else:
+        raise TypeError(
+            f"Expected Prompt or @prompt-decorated function, got {type(prompt).__name__}. "
+            "Use @prompt decorator or pass a Prompt instance."
+        )
+    return prompt, enabled
+
+
 class PromptDecoratorMixin:
     """Mixin class providing prompt decorator functionality for LocalProvider.
 
@@ -39,30 +78,7 @@ class PromptDecoratorMixin:
         """
         enabled = True
         if not isinstance(prompt, Prompt):
-            from fastmcp.decorators import get_fastmcp_meta
-            from fastmcp.prompts.function_prompt import PromptMeta
-
-            meta = get_fastmcp_meta(prompt)
-            if meta is not None and isinstance(meta, PromptMeta):
-                resolved_task = meta.task if meta.task is not None else False
-                enabled = meta.enabled
-                prompt = Prompt.from_function(
-                    prompt,
-                    name=meta.name,
-                    version=meta.version,
-                    title=meta.title,
-                    description=meta.description,
-                    icons=meta.icons,
-                    tags=meta.tags,
-                    meta=meta.meta,
-                    task=resolved_task,
-                    auth=meta.auth,
-                )
-            else:
-                raise TypeError(
-                    f"Expected Prompt or @prompt-decorated function, got {type(prompt).__name__}. "
-                    "Use @prompt decorator or pass a Prompt instance."
-                )
+            prompt, enabled = _prompt_from_function(prompt)
         self._add_component(prompt)
         if not enabled:
             self.disable(keys={prompt.key})
@@ -83,6 +99,7 @@ class PromptDecoratorMixin:
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionPrompt: ...
 
     @overload
@@ -100,6 +117,7 @@ class PromptDecoratorMixin:
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> Callable[[AnyFunction], FunctionPrompt]: ...
 
     def prompt(
@@ -116,6 +134,7 @@ class PromptDecoratorMixin:
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> (
         Callable[[AnyFunction], FunctionPrompt]
         | FunctionPrompt
@@ -141,6 +160,8 @@ class PromptDecoratorMixin:
             meta: Optional meta information about the prompt
             task: Optional task configuration for background execution
             auth: Optional authorization checks for the prompt
+            coalesce: If True, concurrent identical renders share one execution
+                (not allowed for functions that take injected parameters)
 
         Returns:
             The registered FunctionPrompt or a decorator function.
@@ -201,6 +222,7 @@ class PromptDecoratorMixin:
                     meta=meta,
                     task=resolved_task,
                     auth=auth,
+                    coalesce=coalesce,
                 )
                 self._add_component(prompt_obj)
                 if not enabled:
@@ -219,11 +241,25 @@ class PromptDecoratorMixin:
                     meta=meta,
                     task=task,
                     auth=auth,
+                    coalesce=coalesce,
                     enabled=enabled,
                 )
                 target = fn.__func__ if hasattr(fn, "__func__") else fn
                 target.__fastmcp__ = metadata  # type: ignore[attr-defined]
-                self.add_prompt(fn)
+                if self._lazy:
+                    check_deferred_function(
+                        fn, "prompt", prompt_name, coalesce=coalesce
+                    )
+                    self._defer_component(
+                        Prompt,
+                        prompt_name or getattr(fn, "__name__", type(fn).__name__),
+                        version,
+                        lambda: _prompt_from_function(fn)[0],
+                        task=task,
+                        enabled=enabled,
+                    )
+                else:
+                    self.add_prompt(fn)
                 return fn
 
         if inspect.isroutine(name_or_fn):
@@ -253,4 +289,5 @@ class PromptDecoratorMixin:
             enabled=enabled,
             task=task,
             auth=auth,
+            coalesce=coalesce,
         )
@@ -69,6 +69,7 @@ class ResourceDecoratorMixin:
                         meta=meta.meta,
                         task=resolved_task,
                         auth=meta.auth,
+                        coalesce=meta.coalesce,
                     )
                 else:
                     resource = Resource.from_function(
@@ -85,6 +86,7 @@ class ResourceDecoratorMixin:
                         meta=meta.meta,
                         task=resolved_task,
                         auth=meta.auth,
+                        coalesce=meta.coalesce,
                     )
             else:
                 raise TypeError(
@@ -118,6 +120,7 @@ class ResourceDecoratorMixin:
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> Callable[[AnyFunction], Resource | ResourceTemplate | AnyFunction]:
         """Decorator to register a function as a resource.
 
@@ -137,6 +140,8 @@ class ResourceDecoratorMixin:
             meta: Optional meta information about the resource
             task: Optional task configuration for background execution
             auth: Optional authorization checks for the resource
+            coalesce: If True, concurrent identical reads share one execution
+                (not allowed for functions that take injected parameters)
 
         Returns:
             A decorator function.
@@ -201,6 +206,7 @@ class ResourceDecoratorMixin:
                     meta=meta,
                     task=resolved_task,
                     auth=auth,
+                    coalesce=coalesce,
                 )
                 obj = create_resource(fn)
                 # In legacy mode, standalone_resource always returns a component
@@ -230,6 +236,7 @@ class ResourceDecoratorMixin:
                     meta=meta,
                     task=task,
                     auth=auth,
+                    coalesce=coalesce,
                     enabled=enabled,
                 )
                 target = fn.__func__ if hasattr(fn, "__func__") else fn
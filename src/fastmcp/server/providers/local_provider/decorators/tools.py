@@ -17,8 +17,11 @@ from mcp.types import AnyFunction, ToolAnnotations
 
 import fastmcp
 from fastmcp.server.auth.authorization import AuthCheck
+from fastmcp.server.providers.local_provider.decorators._validation import (
+    check_deferred_function,
+)
 from fastmcp.server.tasks.config import TaskConfig
-from fastmcp.tools.function_tool import FunctionTool
+from fastmcp.tools.function_tool import FunctionTool, ToolExecutor
 from fastmcp.tools.tool import Tool
 from fastmcp.utilities.types import NotSet, NotSetT
 
@@ -29,6 +32,57 @@ if TYPE_CHECKING:
 DuplicateBehavior = Literal["error", "warn", "replace", "ignore"]
 
 
+def _tool_from_function(fn: Callable[..., Any]) -> tuple[Tool, bool]:
+    """Build a Tool from a function, using its @tool metadata if present.
+
+    Returns:
+        The tool, and whether it should be enabled.
+    """
+    enabled = True
+    tool = fn
+    from fastmcp.decorators import get_fastmcp_meta
+    from fastmcp.tools.function_tool import ToolMeta
+
+    fmeta = get_fastmcp_meta(tool)
+    if fmeta is not None and isinstance(fmeta, ToolMeta):
+        resolved_task = fmeta.task if fmeta.task is not None else False
+        enabled = fmeta.enabled
+
+        # Merge ToolMeta.app into the meta dict
+        tool_meta = fmeta.meta
+        if fmeta.app is not None:
+            from fastmcp.server.apps import app_config_to_meta_dict
+
+            tool_meta = dict(tool_meta) if tool_meta else {}
+            if fmeta.app is True:
+                tool_meta["ui"] = True
+            else:
+                tool_meta["ui"] = app_config_to_meta_dict(fmeta.app)
+
+        tool = Tool.from_function(
+            tool,
+            name=fmeta.name,
+            version=fmeta.version,
+            title=fmeta.title,
+            description=fmeta.description,
+            icons=fmeta.icons,
+            tags=fmeta.tags,
+            output_schema=fmeta.output_schema,
+            annotations=fmeta.annotations,
+            meta=tool_meta,
+            task=resolved_task,
+            exclude_args=fmeta.exclude_args,
+            serializer=fmeta.serializer,
+            timeout=fmeta.timeout,
+            structured_only=fmeta.structured_only,
+            executor=fmeta.executor,
+            auth=fmeta.auth,
+        )
+    else:
+        tool = Tool.from_function(tool)
+    return tool, enabled
+
+
 class ToolDecoratorMixin:
     """Mixin class providing tool decorator functionality for LocalProvider.
 
@@ -44,44 +98,7 @@ class ToolDecoratorMixin:
         """
         enabled = True
         if not isinstance(tool, Tool):
-            from fastmcp.decorators import get_fastmcp_meta
-            from fastmcp.tools.function_tool import ToolMeta
-
-            fmeta = get_fastmcp_meta(tool)
-            if fmeta is not None and isinstance(fmeta, ToolMeta):
-                resolved_task = fmeta.task if fmeta.task is not None else False
-                enabled = fmeta.enabled
-
-                # Merge ToolMeta.app into the meta dict
-                tool_meta = fmeta.meta
-                if fmeta.app is not None:
-                    from fastmcp.server.apps import app_config_to_meta_dict
-
-                    tool_meta = dict(tool_meta) if tool_meta else {}
-                    if fmeta.app is True:
-                        tool_meta["ui"] = True
-                    else:
-                        tool_meta["ui"] = app_config_to_meta_dict(fmeta.app)
-
-                tool = Tool.from_function(
-                    tool,
-                    name=fmeta.name,
-                    version=fmeta.version,
-                    title=fmeta.title,
-                    description=fmeta.description,
-                    icons=fmeta.icons,
-                    tags=fmeta.tags,
-                    output_schema=fmeta.output_schema,
-                    annotations=fmeta.annotations,
-                    meta=tool_meta,
-                    task=resolved_task,
-                    exclude_args=fmeta.exclude_args,
-                    serializer=fmeta.serializer,
-                    timeout=fmeta.timeout,
-                    auth=fmeta.auth,
-                )
-            else:
-                tool = Tool.from_function(tool)
+            tool, enabled = _tool_from_function(tool)
         self._add_component(tool)
         if not enabled:
             self.disable(keys={tool.key})
@@ -106,6 +123,8 @@ class ToolDecoratorMixin:
         task: bool | TaskConfig | None = None,
         serializer: ToolResultSerializerType | None = None,  # Deprecated
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> FunctionTool: ...
 
@@ -128,6 +147,8 @@ class ToolDecoratorMixin:
         task: bool | TaskConfig | None = None,
         serializer: ToolResultSerializerType | None = None,  # Deprecated
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> Callable[[AnyFunction], FunctionTool]: ...
 
@@ -153,6 +174,8 @@ class ToolDecoratorMixin:
         task: bool | TaskConfig | None = None,
         serializer: ToolResultSerializerType | None = None,  # Deprecated
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> (
         Callable[[AnyFunction], FunctionTool]
@@ -182,6 +205,10 @@ class ToolDecoratorMixin:
             enabled: Whether the tool is enabled (default True). If False, adds to blocklist.
             task: Optional task configuration for background execution
             serializer: Deprecated. Return ToolResult from your tools for full control over serialization.
+            timeout: Optional execution timeout in seconds
+            structured_only: If True, omit the JSON text block when the result has
+                structured content
+            executor: Where sync functions run: "thread" (default) or "process"
 
         Returns:
             The registered FunctionTool or a decorator function.
@@ -257,6 +284,8 @@ class ToolDecoratorMixin:
                     serializer=serializer,
                     task=resolved_task,
                     timeout=timeout,
+                    structured_only=structured_only,
+                    executor=executor,
                     auth=auth,
                 )
                 self._add_component(tool_obj)
@@ -280,12 +309,25 @@ class ToolDecoratorMixin:
                     exclude_args=exclude_args,
                     serializer=serializer,
                     timeout=timeout,
+                    structured_only=structured_only,
+                    executor=executor,
                     auth=auth,
                     enabled=enabled,
                 )
                 target = fn.__func__ if hasattr(fn, "__func__") else fn
                 target.__fastmcp__ = metadata  # type: ignore[attr-defined]
-                tool_obj = self.add_tool(fn)
+                if self._lazy:
+                    check_deferred_function(fn, "tool", tool_name, exclude_args)
+                    self._defer_component(
+                        Tool,
+                        tool_name or getattr(fn, "__name__", type(fn).__name__),
+                        version,
+                        lambda: _tool_from_function(fn)[0],
+                        task=task,
+                        enabled=enabled,
+                    )
+                else:
+                    self.add_tool(fn)
                 return fn
 
         if inspect.isroutine(name_or_fn):
@@ -324,5 +366,7 @@ class ToolDecoratorMixin:
             task=task,
             serializer=serializer,
             timeout=timeout,
+            structured_only=structured_only,
+            executor=executor,
             auth=auth,
         )
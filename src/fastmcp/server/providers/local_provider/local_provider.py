@@ -24,9 +24,12 @@ server2 = FastMCP("Server2", providers=[provider])
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import itertools
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass
 from typing import Literal, TypeVar
 
+import fastmcp
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import ResourceTemplate
@@ -36,6 +39,9 @@ from fastmcp.server.providers.local_provider.decorators import (
     ResourceDecoratorMixin,
     ToolDecoratorMixin,
 )
+from fastmcp.server.providers.transform_pipeline import TRANSFORM_METHODS
+from fastmcp.server.tasks.config import TaskConfig
+from fastmcp.server.transforms import ComponentKind
 from fastmcp.tools.tool import Tool
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.logging import get_logger
@@ -47,6 +53,23 @@ DuplicateBehavior = Literal["error", "warn", "replace", "ignore"]
 
 _C = TypeVar("_C", bound=FastMCPComponent)
 
+# (component type, name or URI) - see LocalProvider._get_component_identity
+_Identity = tuple[type, str]
+
+# Generations are unique across providers, so two providers never share one
+_generations = itertools.count(1)
+
+
+@dataclass
+class _DeferredComponent:
+    """A decorated function whose component is built on first use."""
+
+    identity: _Identity
+    version: str | None
+    # Whether the component will support background task execution
+    supports_tasks: bool
+    build: Callable[[], FastMCPComponent]
+
 
 class LocalProvider(
     Provider,
@@ -91,6 +114,7 @@ class LocalProvider(
     def __init__(
         self,
         on_duplicate: DuplicateBehavior = "error",
+        lazy: bool | None = None,
     ) -> None:
         """Initialize a LocalProvider with empty storage.
 
@@ -100,11 +124,25 @@ class LocalProvider(
                 - "warn": Log warning and replace
                 - "replace": Silently replace
                 - "ignore": Keep existing, return it
+            lazy: If True, tools and prompts registered with decorators are
+                built (and their schemas generated) the first time they are
+                listed or requested. Only applies when
+                decorators return functions (the default `decorator_mode`).
+                Defaults to `settings.lazy_components`.
         """
         super().__init__()
         self._on_duplicate = on_duplicate
+        self._lazy: bool = (
+            lazy if lazy is not None else fastmcp.settings.lazy_components
+        )
         # Unified component storage - keyed by prefixed key (e.g., "tool:name", "resource:uri")
         self._components: dict[str, FastMCPComponent] = {}
+        # Decorated functions not yet built into components, keyed the same way
+        self._deferred: dict[str, _DeferredComponent] = {}
+        # Keys and versions of stored and deferred components, by identity
+        self._identity_index: dict[_Identity, dict[str, str | None]] = {}
+        # Advanced whenever components are added or removed
+        self._generation = next(_generations)
 
     # =========================================================================
     # Storage methods
@@ -131,7 +169,7 @@ class LocalProvider(
             base_key = key.rsplit("@", 1)[0] if "@" in key else key
             return (type(component), base_key)
 
-    def _check_version_mixing(self, component: _C) -> None:
+    def _check_version_mixing(self, identity: _Identity, version: str | None) -> None:
         """Check that versioned and unversioned components aren't mixed.
 
         LocalProvider enforces a simple rule: for any given name/URI, all
@@ -140,40 +178,75 @@ class LocalProvider(
         be filtered out by version filters.
 
         Args:
-            component: The component being added.
+            identity: The identity of the component being added.
+            version: The version of the component being added.
 
         Raises:
             ValueError: If adding would mix versioned and unversioned components.
         """
-        comp_type, logical_name = self._get_component_identity(component)
-        is_versioned = component.version is not None
+        comp_type, logical_name = identity
+        existing_versions = self._identity_index.get(identity)
+        if not existing_versions:
+            return
+
+        type_name = comp_type.__name__.lower()
+        if version is not None:
+            if None in existing_versions.values():
+                raise ValueError(
+                    f"Cannot add versioned {type_name} {logical_name!r} "
+                    f"(version={version!r}): an unversioned "
+                    f"{type_name} with this name already exists. "
+                    f"Either version all components or none."
+                )
+        else:
+            existing = next(
+                (v for v in existing_versions.values() if v is not None), None
+            )
+            if existing is not None:
+                raise ValueError(
+                    f"Cannot add unversioned {type_name} {logical_name!r}: "
+                    f"versioned {type_name}s with this name already exist "
+                    f"(e.g., version={existing!r}). "
+                    f"Either version all components or none."
+                )
 
-        # Check all existing components of the same type and logical name
-        for existing in self._components.values():
-            if not isinstance(existing, comp_type):
-                continue
+    def _has_component(self, key: str) -> bool:
+        """Check whether a component is stored or deferred under a key."""
+        return key in self._components or key in self._deferred
 
-            _, existing_name = self._get_component_identity(existing)
-            if existing_name != logical_name:
-                continue
+    def _resolve_duplicate(self, key: str) -> bool:
+        """Apply the on_duplicate policy for a key about to be added.
 
-            existing_versioned = existing.version is not None
-            if is_versioned != existing_versioned:
-                type_name = comp_type.__name__.lower()
-                if is_versioned:
-                    raise ValueError(
-                        f"Cannot add versioned {type_name} {logical_name!r} "
-                        f"(version={component.version!r}): an unversioned "
-                        f"{type_name} with this name already exists. "
-                        f"Either version all components or none."
-                    )
-                else:
-                    raise ValueError(
-                        f"Cannot add unversioned {type_name} {logical_name!r}: "
-                        f"versioned {type_name}s with this name already exist "
-                        f"(e.g., version={existing.version!r}). "
-                        f"Either version all components or none."
-                    )
+        Returns:
+            True if the existing component should be kept (on_duplicate="ignore").
+        """
+        if not self._has_component(key):
+            return False
+        if self._on_duplicate == "error":
+            raise ValueError(f"Component already exists: {key}")
+        elif self._on_duplicate == "warn":
+            logger.warning(f"Component already exists: {key}")
+        elif self._on_duplicate == "ignore":
+            return True
+        # "replace" and "warn" fall through to add
+        deferred = self._deferred.pop(key, None)
+        if deferred is not None:
+            self._unindex(key, deferred.identity)
+        return False
+
+    def _store_component(self, component: FastMCPComponent) -> None:
+        key = component.key
+        self._components[key] = component
+        self._generation = next(_generations)
+        identity = self._get_component_identity(component)
+        self._identity_index.setdefault(identity, {})[key] = component.version
+
+    def _unindex(self, key: str, identity: _Identity) -> None:
+        versions = self._identity_index.get(identity)
+        if versions is not None:
+            versions.pop(key, None)
+            if not versions:
+                del self._identity_index[identity]
 
     def _add_component(self, component: _C) -> _C:
         """Add a component to unified storage.
@@ -184,22 +257,93 @@ class LocalProvider(
         Returns:
             The component that was added (or existing if on_duplicate="ignore").
         """
-        existing = self._components.get(component.key)
-        if existing:
-            if self._on_duplicate == "error":
-                raise ValueError(f"Component already exists: {component.key}")
-            elif self._on_duplicate == "warn":
-                logger.warning(f"Component already exists: {component.key}")
-            elif self._on_duplicate == "ignore":
-                return existing  # type: ignore[return-value]
-            # "replace" and "warn" fall through to add
+        if self._resolve_duplicate(component.key):
+            self._materialize([component.key])
+            return self._components[component.key]  # type: ignore[return-value]
 
         # Check for versioned/unversioned mixing before adding
-        self._check_version_mixing(component)
+        self._check_version_mixing(
+            self._get_component_identity(component), component.version
+        )
 
-        self._components[component.key] = component
+        self._store_component(component)
         return component
 
+    def _defer_component(
+        self,
+        component_type: type[FastMCPComponent],
+        identifier: str,
+        version: str | int | None,
+        build: Callable[[], FastMCPComponent],
+        *,
+        task: bool | TaskConfig | None = None,
+        enabled: bool = True,
+    ) -> None:
+        """Register a component to be built the first time it is needed.
+
+        Duplicate and version checks run now, against the key the component
+        will have once built.
+
+        Args:
+            component_type: Tool or Prompt.
+            identifier: The component's name (or URI template).
+            version: The component's version, if any.
+            build: Builds the component.
+            task: The component's task configuration, so task-enabled
+                components can be built at startup for Docket registration.
+            enabled: If False, the component is disabled.
+        """
+        version = str(version) if version is not None else None
+        key = f"{component_type.make_key(identifier)}@{version or ''}"
+        if self._resolve_duplicate(key):
+            return
+        identity = (component_type, identifier)
+        self._check_version_mixing(identity, version)
+        self._generation = next(_generations)
+        self._deferred[key] = _DeferredComponent(
+            identity=identity,
+            version=version,
+            supports_tasks=(
+                task.supports_tasks() if isinstance(task, TaskConfig) else bool(task)
+            ),
+            build=build,
+        )
+        self._identity_index.setdefault(identity, {})[key] = version
+        if not enabled:
+            self.disable(keys={key})
+
+    def _materialize(self, keys: Iterable[str]) -> None:
+        """Build any deferred components among the given keys.
+
+        Each component is built on its own. One that fails to build is
+        logged and dropped, so it can't break listing the others.
+        """
+        for key in list(keys):
+            deferred = self._deferred.pop(key, None)
+            if deferred is None:
+                continue
+            self._unindex(key, deferred.identity)
+            try:
+                component = deferred.build()
+            except Exception:
+                logger.exception(f"Failed to build deferred component {key!r}")
+                continue
+            self._store_component(component)
+
+    def _materialize_type(self, component_type: type[FastMCPComponent]) -> None:
+        """Build all deferred components of a type."""
+        if self._deferred:
+            self._materialize(
+                key
+                for key, deferred in self._deferred.items()
+                if deferred.identity[0] is component_type
+            )
+
+    def _materialize_identity(self, identity: _Identity) -> None:
+        """Build the deferred components with a name or URI."""
+        if self._deferred:
+            self._materialize(self._identity_index.get(identity, {}))
+
     def _remove_component(self, key: str) -> None:
         """Remove a component from unified storage.
 
@@ -209,11 +353,19 @@ class LocalProvider(
         Raises:
             KeyError: If the component is not found.
         """
+        deferred = self._deferred.pop(key, None)
+        if deferred is not None:
+            self._unindex(key, deferred.identity)
+            self._generation = next(_generations)
+            return
+
         component = self._components.get(key)
         if component is None:
             raise KeyError(f"Component {key!r} not found")
 
         del self._components[key]
+        self._generation = next(_generations)
+        self._unindex(key, self._get_component_identity(component))
 
     def _get_component(self, key: str) -> FastMCPComponent | None:
         """Get a component by its prefixed key.
@@ -224,6 +376,8 @@ class LocalProvider(
         Returns:
             The component, or None if not found.
         """
+        if key in self._deferred:
+            self._materialize([key])
         return self._components.get(key)
 
     def remove_tool(self, name: str, version: str | None = None) -> None:
@@ -238,11 +392,7 @@ class LocalProvider(
         """
         if version is None:
             # Remove all versions
-            keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, Tool) and c.name == name
-            ]
+            keys_to_remove = list(self._identity_index.get((Tool, name), {}))
             if not keys_to_remove:
                 raise KeyError(f"Tool {name!r} not found")
             for key in keys_to_remove:
@@ -250,7 +400,7 @@ class LocalProvider(
         else:
             # Remove specific version - key format is "tool:name@version"
             key = f"{Tool.make_key(name)}@{version}"
-            if key not in self._components:
+            if not self._has_component(key):
                 raise KeyError(f"Tool {name!r} version {version!r} not found")
             self._remove_component(key)
 
@@ -266,11 +416,7 @@ class LocalProvider(
         """
         if version is None:
             # Remove all versions
-            keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, Resource) and str(c.uri) == uri
-            ]
+            keys_to_remove = list(self._identity_index.get((Resource, uri), {}))
             if not keys_to_remove:
                 raise KeyError(f"Resource {uri!r} not found")
             for key in keys_to_remove:
@@ -278,7 +424,7 @@ class LocalProvider(
         else:
             # Remove specific version
             key = f"{Resource.make_key(uri)}@{version}"
-            if key not in self._components:
+            if not self._has_component(key):
                 raise KeyError(f"Resource {uri!r} version {version!r} not found")
             self._remove_component(key)
 
@@ -294,11 +440,9 @@ class LocalProvider(
         """
         if version is None:
             # Remove all versions
-            keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, ResourceTemplate) and c.uri_template == uri_template
-            ]
+            keys_to_remove = list(
+                self._identity_index.get((ResourceTemplate, uri_template), {})
+            )
             if not keys_to_remove:
                 raise KeyError(f"Template {uri_template!r} not found")
             for key in keys_to_remove:
@@ -306,7 +450,7 @@ class LocalProvider(
         else:
             # Remove specific version
             key = f"{ResourceTemplate.make_key(uri_template)}@{version}"
-            if key not in self._components:
+            if not self._has_component(key):
                 raise KeyError(
                     f"Template {uri_template!r} version {version!r} not found"
                 )
@@ -324,11 +468,7 @@ class LocalProvider(
         """
         if version is None:
             # Remove all versions
-            keys_to_remove = [
-                k
-                for k, c in self._components.items()
-                if isinstance(c, Prompt) and c.name == name
-            ]
+            keys_to_remove = list(self._identity_index.get((Prompt, name), {}))
             if not keys_to_remove:
                 raise KeyError(f"Prompt {name!r} not found")
             for key in keys_to_remove:
@@ -336,7 +476,7 @@ class LocalProvider(
         else:
             # Remove specific version
             key = f"{Prompt.make_key(name)}@{version}"
-            if key not in self._components:
+            if not self._has_component(key):
                 raise KeyError(f"Prompt {name!r} version {version!r} not found")
             self._remove_component(key)
 
@@ -344,8 +484,20 @@ class LocalProvider(
     # Provider interface implementation
     # =========================================================================
 
+    def _source_generation(self, kind: ComponentKind) -> Hashable | None:
+        """Components only change through this provider's own methods.
+
+        Subclasses that override a `_list_*` method may source components
+        elsewhere, so they report no generation unless they override this too.
+        """
+        list_method = f"_{TRANSFORM_METHODS[kind][0]}"
+        if getattr(type(self), list_method) is not getattr(LocalProvider, list_method):
+            return None
+        return self._generation
+
     async def _list_tools(self) -> Sequence[Tool]:
         """Return all tools."""
+        self._materialize_type(Tool)
         return [v for v in self._components.values() if isinstance(v, Tool)]
 
     async def _get_tool(
@@ -357,10 +509,9 @@ class LocalProvider(
             name: The tool name.
             version: Optional version filter. If None, returns highest version.
         """
+        self._materialize_identity((Tool, name))
         matching = [
-            v
-            for v in self._components.values()
-            if isinstance(v, Tool) and v.name == name
+            self._components[key] for key in self._identity_index.get((Tool, name), {})
         ]
         if version:
             matching = [t for t in matching if version.matches(t.version)]
@@ -382,9 +533,8 @@ class LocalProvider(
             version: Optional version filter. If None, returns highest version.
         """
         matching = [
-            v
-            for v in self._components.values()
-            if isinstance(v, Resource) and str(v.uri) == uri
+            self._components[key]
+            for key in self._identity_index.get((Resource, uri), {})
         ]
         if version:
             matching = [r for r in matching if version.matches(r.version)]
@@ -394,6 +544,7 @@ class LocalProvider(
 
     async def _list_resource_templates(self) -> Sequence[ResourceTemplate]:
         """Return all resource templates."""
+        self._materialize_type(ResourceTemplate)
         return [v for v in self._components.values() if isinstance(v, ResourceTemplate)]
 
     async def _get_resource_template(
@@ -405,6 +556,7 @@ class LocalProvider(
             uri: The URI to match against templates.
             version: Optional version filter. If None, returns highest version.
         """
+        self._materialize_type(ResourceTemplate)
         # Find all templates that match the URI
         matching = [
             component
@@ -420,6 +572,7 @@ class LocalProvider(
 
     async def _list_prompts(self) -> Sequence[Prompt]:
         """Return all prompts."""
+        self._materialize_type(Prompt)
         return [v for v in self._components.values() if isinstance(v, Prompt)]
 
     async def _get_prompt(
@@ -431,10 +584,10 @@ class LocalProvider(
             name: The prompt name.
             version: Optional version filter. If None, returns highest version.
         """
+        self._materialize_identity((Prompt, name))
         matching = [
-            v
-            for v in self._components.values()
-            if isinstance(v, Prompt) and v.name == name
+            self._components[key]
+            for key in self._identity_index.get((Prompt, name), {})
         ]
         if version:
             matching = [p for p in matching if version.matches(p.version)]
@@ -453,6 +606,9 @@ class LocalProvider(
         This includes both FunctionTool/Resource/Prompt instances created via
         decorators and custom Tool/Resource/Prompt subclasses.
         """
+        self._materialize(
+            key for key, deferred in self._deferred.items() if deferred.supports_tasks
+        )
         return [c for c in self._components.values() if c.task_config.supports_tasks()]
 
     # =========================================================================
@@ -7,8 +7,13 @@ classes that forward execution to remote servers.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import contextlib
+import datetime
 import inspect
+import time
+import weakref
 from collections.abc import Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import quote
@@ -39,7 +44,7 @@ from fastmcp.prompts import Message, Prompt, PromptResult
 from fastmcp.prompts.prompt import PromptArgument
 from fastmcp.resources import Resource, ResourceTemplate
 from fastmcp.resources.resource import ResourceContent, ResourceResult
-from fastmcp.server.context import Context
+from fastmcp.server.context import Context, _current_context
 from fastmcp.server.dependencies import get_context
 from fastmcp.server.providers.base import Provider
 from fastmcp.server.server import FastMCP
@@ -47,6 +52,7 @@ from fastmcp.server.tasks.config import TaskConfig
 from fastmcp.tools.tool import Tool, ToolResult
 from fastmcp.utilities.components import FastMCPComponent, get_fastmcp_metadata
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -612,6 +618,207 @@ class ProxyProvider(Provider):
     # because client cleanup is handled per-request
 
 
+# -----------------------------------------------------------------------------
+# Lazily Connected Backends
+# -----------------------------------------------------------------------------
+
+
+def _retrieve_exception(task: asyncio.Task[None]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+class _ProxyBackend:
+    """Connection state for one backend of a multi-server MCPConfigTransport.
+
+    The first connection to a backend runs in its own task, so it can keep
+    going in the background after the startup timeout has passed. Because
+    that connection is made outside any request, the session's forwarding
+    handlers run under the context of the latest request that used the
+    backend instead of the context the session was opened in.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        transport: ClientTransport,
+        timeout: datetime.timedelta | None,
+        startup_timeout: float | None,
+        retry_backoff: float = 0.5,
+        max_retry_backoff: float = 30.0,
+    ):
+        self.name = name
+        self.startup_timeout = startup_timeout
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.connect_time: float | None = None
+        # Consecutive failed connection attempts, used for retry backoff
+        self.failures = 0
+        # Monotonic time before which a failed attempt is not retried
+        self.retry_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+        # Weak references to the latest request's Context and RequestContext.
+        # The session's handlers hold only this list, not the backend, so a
+        # dropped transport can still be garbage collected.
+        self._context_ref: list[Any] = [None, None]
+        self.client = ProxyClient(
+            transport,
+            timeout=timeout,
+            roots=_make_context_handler(default_proxy_roots_handler, self._context_ref),
+            sampling_handler=_make_context_handler(
+                default_proxy_sampling_handler, self._context_ref
+            ),
+            elicitation_handler=_make_context_handler(
+                default_proxy_elicitation_handler, self._context_ref
+            ),
+            log_handler=_make_context_handler(
+                default_proxy_log_handler, self._context_ref
+            ),
+            progress_handler=_make_context_handler(
+                default_proxy_progress_handler, self._context_ref
+            ),
+        )
+
+    def new_client(self) -> Client:
+        """Client factory for the backend's proxy components."""
+        context = _current_context.get()
+        if context is not None:
+            request_context = request_ctx.get(None)
+            self._context_ref[:] = [
+                weakref.ref(context),
+                weakref.ref(request_context) if request_context is not None else None,
+            ]
+        return self.client.new()
+
+    @property
+    def ready(self) -> bool:
+        return (
+            self._task is not None
+            and self._task.done()
+            and not self._task.cancelled()
+            and self._task.exception() is None
+        )
+
+    @property
+    def connecting(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task[None]:
+        """Start connecting, unless a connection attempt is running or done.
+
+        A failed attempt is retried on a later call. The first retry is
+        immediate; each consecutive failure after that doubles the delay
+        before the next one, and calls made before then get the failed task.
+        """
+        task = self._task
+        if task is None or (
+            task.done() and not self.ready and time.monotonic() >= self.retry_at
+        ):
+            task = self._task = asyncio.create_task(self._connect())
+            # Listings start connections without awaiting them
+            task.add_done_callback(_retrieve_exception)
+        return task
+
+    async def wait(self) -> None:
+        """Wait for the backend to connect, starting it if needed."""
+        await asyncio.shield(self.start())
+
+    async def _connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            async with self.client.new():
+                pass
+        except Exception as e:
+            self.failures += 1
+            backoff = 0.0
+            if self.failures > 1:
+                backoff = min(
+                    self.retry_backoff * 2 ** (self.failures - 2),
+                    self.max_retry_backoff,
+                )
+            self.retry_at = time.monotonic() + backoff
+            logger.warning(
+                f"Failed to connect to MCP server {self.name!r}: {e}; "
+                f"retrying in {backoff:.1f}s"
+            )
+            raise
+        self.failures = 0
+        self.retry_at = 0.0
+        self.connect_time = time.perf_counter() - start
+        logger.debug(
+            f"Connected to MCP server {self.name!r} in {self.connect_time:.3f}s"
+        )
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(BaseException):
+                await self._task
+        self._task = None
+
+
+class _BackendProxyProvider(ProxyProvider):
+    """ProxyProvider that leaves a backend out of listings until it connects.
+
+    Listing a backend that is still starting returns nothing, so a slow
+    server doesn't hold up the catalog of the others. Looking up a specific
+    component waits for the backend to connect. Listings retry a backend
+    whose connection failed, subject to its retry backoff.
+    """
+
+    def __init__(self, backend: _ProxyBackend):
+        super().__init__(backend.new_client)
+        self._backend = backend
+
+    async def _list_tools(self) -> Sequence[Tool]:
+        if not self._backend.ready:
+            self._backend.start()
+            return []
+        return await super()._list_tools()
+
+    async def _get_tool(
+        self, name: str, version: VersionSpec | None = None
+    ) -> Tool | None:
+        await self._backend.wait()
+        return await super()._get_tool(name, version)
+
+    async def _list_resources(self) -> Sequence[Resource]:
+        if not self._backend.ready:
+            self._backend.start()
+            return []
+        return await super()._list_resources()
+
+    async def _get_resource(
+        self, uri: str, version: VersionSpec | None = None
+    ) -> Resource | None:
+        await self._backend.wait()
+        return await super()._get_resource(uri, version)
+
+    async def _list_resource_templates(self) -> Sequence[ResourceTemplate]:
+        if not self._backend.ready:
+            self._backend.start()
+            return []
+        return await super()._list_resource_templates()
+
+    async def _get_resource_template(
+        self, uri: str, version: VersionSpec | None = None
+    ) -> ResourceTemplate | None:
+        await self._backend.wait()
+        return await super()._get_resource_template(uri, version)
+
+    async def _list_prompts(self) -> Sequence[Prompt]:
+        if not self._backend.ready:
+            self._backend.start()
+            return []
+        return await super()._list_prompts()
+
+    async def _get_prompt(
+        self, name: str, version: VersionSpec | None = None
+    ) -> Prompt | None:
+        await self._backend.wait()
+        return await super()._get_prompt(name, version)
+
+
 # -----------------------------------------------------------------------------
 # Factory Functions
 # -----------------------------------------------------------------------------
@@ -826,6 +1033,33 @@ def _make_restoring_handler(handler: Callable, rc_ref: list[Any]) -> Callable:
     return wrapper
 
 
+def _make_context_handler(handler: Callable, context_ref: list[Any]) -> Callable:
+    """Wrap a proxy handler to run under a stashed request's context.
+
+    Used for backend sessions opened outside any request, whose receive loop
+    has no FastMCP context. ``context_ref`` holds weak references to the
+    latest request's Context and RequestContext.
+    """
+
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        context = context_ref[0]() if context_ref[0] is not None else None
+        if _current_context.get() is not None or context is None:
+            return await handler(*args, **kwargs)
+        request_context = context_ref[1]() if context_ref[1] is not None else None
+        context_token = _current_context.set(context)
+        request_token = (
+            request_ctx.set(request_context) if request_context is not None else None
+        )
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            if request_token is not None:
+                request_ctx.reset(request_token)
+            _current_context.reset(context_token)
+
+    return wrapper
+
+
 class ProxyClient(Client[ClientTransportT]):
     """A proxy client that forwards advanced interactions between a remote MCP server and the proxy's connected clients.
 
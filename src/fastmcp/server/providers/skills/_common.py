@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class SkillFileInfo:
@@ -18,17 +28,46 @@ class SkillFileInfo:
     hash: str  # sha256 hash
 
 
-@dataclass
+@dataclass(init=False)
 class SkillInfo:
-    """Parsed information about a skill."""
+    """Parsed information about a skill.
+
+    The frontmatter is parsed when the skill is discovered; the file listing
+    and hashes are computed by `index` the first time `files` is accessed,
+    unless `files` is passed in.
+    """
 
     name: str  # Directory name (canonical identifier)
     description: str  # From frontmatter or first line
     path: Path  # Absolute path to skill directory
     main_file: str  # Name of main file (e.g., "SKILL.md")
-    files: list[SkillFileInfo] = field(default_factory=list)
+    index: SkillFileIndex = field(repr=False, compare=False)
     frontmatter: dict[str, Any] = field(default_factory=dict)
 
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        path: Path,
+        main_file: str,
+        files: list[SkillFileInfo] | None = None,
+        frontmatter: dict[str, Any] | None = None,
+        index: SkillFileIndex | None = None,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.path = path
+        self.main_file = main_file
+        self.frontmatter = frontmatter if frontmatter is not None else {}
+        if index is None:
+            index = SkillFileIndex(path, files=files)
+        self.index = index
+
+    @property
+    def files(self) -> list[SkillFileInfo]:
+        """All files in the skill, sorted by path."""
+        return self.index.files()
+
 
 def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from markdown content.
@@ -83,19 +122,155 @@ def compute_file_hash(path: Path) -> str:
     return f"sha256:{sha256.hexdigest()}"
 
 
-def scan_skill_files(skill_dir: Path) -> list[SkillFileInfo]:
-    """Scan a skill directory for all files."""
+def scan_skill_files(
+    skill_dir: Path, cache: SkillIndexCache | None = None
+) -> list[SkillFileInfo]:
+    """Scan a skill directory for all files.
+
+    Args:
+        skill_dir: The skill directory
+        cache: Hashes from earlier scans. Files whose size and mtime match
+            their cached entry are not read again.
+    """
     files = []
     # Sort for deterministic ordering across platforms
     for file_path in sorted(skill_dir.rglob("*")):
-        if file_path.is_file():
-            rel_path = file_path.relative_to(skill_dir)
-            files.append(
-                SkillFileInfo(
-                    # Use POSIX paths for cross-platform URI consistency
-                    path=rel_path.as_posix(),
-                    size=file_path.stat().st_size,
-                    hash=compute_file_hash(file_path),
-                )
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        if not file_path.is_file():
+            continue
+        digest = cache.get(file_path, stat) if cache is not None else None
+        if digest is None:
+            digest = compute_file_hash(file_path)
+            if cache is not None:
+                cache.set(file_path, stat, digest)
+        files.append(
+            SkillFileInfo(
+                # Use POSIX paths for cross-platform URI consistency
+                path=file_path.relative_to(skill_dir).as_posix(),
+                size=stat.st_size,
+                hash=digest,
             )
+        )
     return files
+
+
+class SkillIndexCache:
+    """Hashes of skill files, keyed by absolute path, size, and mtime.
+
+    Kept in memory so re-indexing a skill only hashes files that changed.
+    When given a path, entries are also persisted as JSON so restarts skip
+    hashing unchanged files.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: dict[str, tuple[int, int, str]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != self.VERSION:
+                return
+            self._entries = {
+                file: (size, mtime_ns, digest)
+                for file, (size, mtime_ns, digest) in data["files"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable skill index cache {self.path}: {e}")
+            self._entries = {}
+
+    def get(self, file_path: Path, stat: os.stat_result) -> str | None:
+        """Return the cached hash of a file if its size and mtime match."""
+        entry = self._entries.get(str(file_path))
+        if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns):
+            return None
+        return entry[2]
+
+    def set(self, file_path: Path, stat: os.stat_result, digest: str) -> None:
+        """Record the hash of a file."""
+        with self._lock:
+            self._entries[str(file_path)] = (stat.st_size, stat.st_mtime_ns, digest)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write entries to disk if a path is set and they changed."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            data = json.dumps({"version": self.VERSION, "files": self._entries})
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(data)
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write skill index cache {self.path}: {e}")
+
+
+class SkillFileIndex:
+    """Lazily computed listing of a skill's files.
+
+    The directory is scanned the first time the files are needed and again
+    after `invalidate()`. Rescans reuse the hashes in `cache`, so only files
+    that changed are read.
+    """
+
+    def __init__(
+        self,
+        skill_dir: Path,
+        cache: SkillIndexCache | None = None,
+        files: list[SkillFileInfo] | None = None,
+    ) -> None:
+        self.skill_dir = skill_dir
+        self.cache = cache if cache is not None else SkillIndexCache()
+        # A listing passed in is used until the first invalidation
+        self._files = files
+        self._by_path = {f.path: f for f in files or []}
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the directory has been scanned since the last invalidation."""
+        return self._files is not None
+
+    def files(self) -> list[SkillFileInfo]:
+        """Return the skill's files, scanning the directory if needed."""
+        files = self._files
+        if files is None:
+            with self._lock:
+                files = self._files
+                if files is None:
+                    files = scan_skill_files(self.skill_dir, self.cache)
+                    self.cache.save()
+                    self._by_path = {f.path: f for f in files}
+                    self._files = files
+        return files
+
+    def get(self, path: str) -> SkillFileInfo | None:
+        """Look up a file by its POSIX path relative to the skill directory."""
+        self.files()
+        return self._by_path.get(path)
+
+    def invalidate(self) -> None:
+        """Rescan the directory the next time the files are needed."""
+        self._files = None
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # SkillInfo is a field of the skill resources; pass the index through
+        return core_schema.is_instance_schema(cls)
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Literal
 
+import anyio
+
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import ResourceTemplate
 from fastmcp.server.providers.aggregate import AggregateProvider
+from fastmcp.server.providers.skills._common import SkillIndexCache
 from fastmcp.server.providers.skills.skill_provider import SkillProvider
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.versions import VersionSpec
@@ -24,10 +29,22 @@ class SkillsDirectoryProvider(AggregateProvider):
     Can scan multiple root directories - if a skill name appears in multiple roots,
     the first one found wins.
 
+    Discovery only parses each skill's main file; a skill's other files are
+    listed and hashed the first time they are needed. In reload mode, skills
+    whose main file is unchanged keep their provider, and rescanning their
+    files only rehashes files whose size or mtime changed.
+
     Args:
         roots: Root directory(ies) containing skill folders. Can be a single path
             or a sequence of paths.
         reload: If True, re-discover skills on each request. Defaults to False.
+        watch: If True, watch the roots for changes with watchfiles instead
+            of re-discovering on every request. Implies reload. The watcher
+            runs for the lifetime of the server; until it starts, requests
+            fall back to re-discovering.
+        cache_path: JSON file in which to persist file hashes for all
+            skills, so a restart only rehashes files whose size or mtime
+            changed. Defaults to None (hashes are kept in memory only).
         main_file_name: Name of the main skill file. Defaults to "SKILL.md".
         supporting_files: How supporting files are exposed in child SkillProviders:
             - "template": Accessed via ResourceTemplate, hidden from list_resources().
@@ -58,6 +75,8 @@ class SkillsDirectoryProvider(AggregateProvider):
         reload: bool = False,
         main_file_name: str = "SKILL.md",
         supporting_files: Literal["template", "resources"] = "template",
+        watch: bool = False,
+        cache_path: str | Path | None = None,
     ) -> None:
         super().__init__()
         # Normalize to sequence: single path becomes list
@@ -65,19 +84,35 @@ class SkillsDirectoryProvider(AggregateProvider):
             roots = [roots]
 
         self._roots = [Path(r).resolve() for r in roots]
-        self._reload = reload
+        self._reload = reload or watch
+        self._watch = watch
         self._main_file_name = main_file_name
         self._supporting_files = supporting_files
         self._discovered = False
+        # Shared by every skill so hashes survive re-creating a skill's provider
+        self._index_cache = SkillIndexCache(Path(cache_path) if cache_path else None)
+        # Loaded skills by directory, with the (mtime_ns, size) of the main
+        # file they were parsed from
+        self._skills: dict[Path, tuple[tuple[int, int], SkillProvider]] = {}
+        # Watcher state: skill directories changed since the last discovery
+        self._watch_task: asyncio.Task[None] | None = None
+        self._changed_dirs: set[Path] = set()
+        self._needs_full_scan = False
 
         # Discover skills at init
         self._discover_skills()
 
-    def _discover_skills(self) -> None:
-        """Scan root directories and create SkillProvider per valid skill folder."""
-        # Clear existing providers if reloading
-        self.providers.clear()
+    def _discover_skills(self, changed: set[Path] | None = None) -> None:
+        """Scan root directories and create SkillProvider per valid skill folder.
 
+        Args:
+            changed: Skill directories whose files may have changed. Skills
+                loaded earlier whose main file is unchanged keep their
+                provider; their file listing is rescanned if they are in
+                `changed`, or if `changed` is None.
+        """
+        providers: list[SkillProvider] = []
+        skills: dict[Path, tuple[tuple[int, int], SkillProvider]] = {}
         seen_skill_names: set[str] = set()
 
         for root in self._roots:
@@ -90,7 +125,9 @@ class SkillsDirectoryProvider(AggregateProvider):
                     continue
 
                 main_file = skill_dir / self._main_file_name
-                if not main_file.exists():
+                try:
+                    stat = main_file.stat()
+                except OSError:
                     continue
 
                 skill_name = skill_dir.name
@@ -102,17 +139,30 @@ class SkillsDirectoryProvider(AggregateProvider):
                     )
                     continue
 
-                try:
-                    provider = SkillProvider(
-                        skill_path=skill_dir,
-                        main_file_name=self._main_file_name,
-                        supporting_files=self._supporting_files,
-                    )
-                    self.providers.append(provider)
-                    seen_skill_names.add(skill_name)
-                except (FileNotFoundError, PermissionError, OSError):
-                    logger.exception(f"Failed to load skill: {skill_dir.name}")
+                signature = (stat.st_mtime_ns, stat.st_size)
+                previous = self._skills.get(skill_dir)
+                if previous is not None and previous[0] == signature:
+                    provider = previous[1]
+                    if changed is None or skill_dir in changed:
+                        provider.skill_info.index.invalidate()
+                else:
+                    try:
+                        provider = SkillProvider(
+                            skill_path=skill_dir,
+                            main_file_name=self._main_file_name,
+                            supporting_files=self._supporting_files,
+                        )
+                    except (FileNotFoundError, PermissionError, OSError):
+                        logger.exception(f"Failed to load skill: {skill_dir.name}")
+                        continue
+                    provider.skill_info.index.cache = self._index_cache
+
+                providers.append(provider)
+                skills[skill_dir] = (signature, provider)
+                seen_skill_names.add(skill_name)
 
+        self.providers[:] = providers
+        self._skills = skills
         self._discovered = True
         logger.debug(
             f"SkillsDirectoryProvider loaded {len(self.providers)} skills "
@@ -121,9 +171,77 @@ class SkillsDirectoryProvider(AggregateProvider):
 
     async def _ensure_discovered(self) -> None:
         """Ensure skills are discovered, rediscovering if reload is enabled."""
-        if self._reload or not self._discovered:
+        if not self._discovered:
+            self._discover_skills()
+        elif self._watch_task is not None and not self._needs_full_scan:
+            if self._changed_dirs:
+                changed, self._changed_dirs = self._changed_dirs, set()
+                self._discover_skills(changed)
+        elif self._reload:
+            self._needs_full_scan = False
+            self._changed_dirs.clear()
             self._discover_skills()
 
+    # -------------------------------------------------------------------------
+    # File watching
+    # -------------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[None]:
+        """Run the skills watcher for the server's lifetime when watch=True."""
+        if not self._watch or self._watch_task is not None:
+            async with super().lifespan():
+                yield
+            return
+
+        stop_event = asyncio.Event()
+        # Changes made before the watcher started are picked up by a full scan
+        self._needs_full_scan = True
+        watch_task = asyncio.create_task(self._watch_roots(stop_event))
+        self._watch_task = watch_task
+        try:
+            async with super().lifespan():
+                yield
+        finally:
+            # awatch exits on its own once stop_event is set; shield the wait
+            # so shutdown cancellation doesn't propagate into the watcher thread
+            stop_event.set()
+            with anyio.CancelScope(shield=True), suppress(asyncio.CancelledError):
+                await watch_task
+            self._watch_task = None
+
+    async def _watch_roots(self, stop_event: asyncio.Event) -> None:
+        """Record the skill directories that changed until stopped."""
+        from watchfiles import awatch
+
+        roots = [root for root in self._roots if root.exists()]
+        if not roots:
+            self._watch_task = None
+            return
+        try:
+            async for changes in awatch(
+                *roots, stop_event=stop_event, rust_timeout=500
+            ):
+                for _, changed in changes:
+                    if skill_dir := self._skill_dir_for(Path(changed)):
+                        self._changed_dirs.add(skill_dir)
+                    else:
+                        # A root itself changed
+                        self._needs_full_scan = True
+        except Exception:
+            if stop_event.is_set():
+                return
+            # Fall back to re-discovering on every request
+            logger.exception("Skills watcher stopped")
+            self._watch_task = None
+
+    def _skill_dir_for(self, path: Path) -> Path | None:
+        """Return the skill directory (a root's direct child) containing path."""
+        for root in self._roots:
+            if path.is_relative_to(root) and path != root:
+                return root / path.relative_to(root).parts[0]
+        return None
+
     # Override list methods to support reload
     async def _list_resources(self) -> Sequence[Resource]:
         await self._ensure_discovered()
@@ -14,10 +14,12 @@ from fastmcp.resources.resource import Resource, ResourceResult
 from fastmcp.resources.template import ResourceTemplate
 from fastmcp.server.providers.base import Provider
 from fastmcp.server.providers.skills._common import (
+    SkillFileIndex,
+    SkillIndexCache,
     SkillInfo,
     parse_frontmatter,
-    scan_skill_files,
 )
+from fastmcp.utilities.async_utils import call_sync_fn_in_threadpool
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.versions import VersionSpec
 
@@ -27,6 +29,27 @@ logger = get_logger(__name__)
 mimetypes.add_type("text/markdown", ".md")
 
 
+def _read_skill_file(skill_info: SkillInfo, file_path: str) -> str | bytes:
+    """Read a file from a skill directory, as text or bytes by mime type."""
+    full_path = (skill_info.path / file_path).resolve()
+
+    # Security: ensure path doesn't escape skill directory
+    if not full_path.is_relative_to(skill_info.path):
+        raise ValueError(f"Invalid path: Path {file_path} escapes skill directory")
+
+    if not full_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if not full_path.is_file():
+        raise ValueError(f"Not a file: {file_path}")
+
+    mime_type, _ = mimetypes.guess_type(str(full_path))
+    if mime_type and mime_type.startswith("text/"):
+        return full_path.read_text()
+    else:
+        return full_path.read_bytes()
+
+
 # -----------------------------------------------------------------------------
 # Skill-specific Resource and ResourceTemplate subclasses
 # -----------------------------------------------------------------------------
@@ -41,18 +64,19 @@ class SkillResource(Resource):
     async def read(self) -> str | bytes | ResourceResult:
         """Read the resource content."""
         if self.is_manifest:
-            return self._generate_manifest()
+            return await self._generate_manifest()
         else:
             main_file_path = self.skill_info.path / self.skill_info.main_file
-            return main_file_path.read_text()
+            return await call_sync_fn_in_threadpool(main_file_path.read_text)
 
-    def _generate_manifest(self) -> str:
+    async def _generate_manifest(self) -> str:
         """Generate JSON manifest for the skill."""
+        files = self.skill_info.index.files
         manifest = {
             "skill": self.skill_info.name,
             "files": [
                 {"path": f.path, "size": f.size, "hash": f.hash}
-                for f in self.skill_info.files
+                for f in await call_sync_fn_in_threadpool(files)
             ],
         }
         return json.dumps(manifest, indent=2)
@@ -65,29 +89,9 @@ class SkillFileTemplate(ResourceTemplate):
 
     async def read(self, arguments: dict[str, Any]) -> str | bytes | ResourceResult:
         """Read a file from the skill directory."""
-        file_path = arguments.get("path", "")
-        full_path = self.skill_info.path / file_path
-
-        # Security: ensure path doesn't escape skill directory
-        try:
-            full_path = full_path.resolve()
-            if not full_path.is_relative_to(self.skill_info.path):
-                raise ValueError(f"Path {file_path} escapes skill directory")
-        except ValueError as e:
-            raise ValueError(f"Invalid path: {e}") from e
-
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        if not full_path.is_file():
-            raise ValueError(f"Not a file: {file_path}")
-
-        # Determine if binary or text based on mime type
-        mime_type, _ = mimetypes.guess_type(str(full_path))
-        if mime_type and mime_type.startswith("text/"):
-            return full_path.read_text()
-        else:
-            return full_path.read_bytes()
+        return await call_sync_fn_in_threadpool(
+            _read_skill_file, self.skill_info, arguments.get("path", "")
+        )
 
     async def _read(  # type: ignore[override]
         self,
@@ -137,21 +141,9 @@ class SkillFileResource(Resource):
 
     async def read(self) -> str | bytes | ResourceResult:
         """Read the file content."""
-        full_path = self.skill_info.path / self.file_path
-
-        # Security check
-        full_path = full_path.resolve()
-        if not full_path.is_relative_to(self.skill_info.path):
-            raise ValueError(f"Path {self.file_path} escapes skill directory")
-
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {self.file_path}")
-
-        mime_type, _ = mimetypes.guess_type(str(full_path))
-        if mime_type and mime_type.startswith("text/"):
-            return full_path.read_text()
-        else:
-            return full_path.read_bytes()
+        return await call_sync_fn_in_threadpool(
+            _read_skill_file, self.skill_info, self.file_path
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -165,6 +157,11 @@ class SkillProvider(Provider):
     Each skill folder must contain a main file (default: SKILL.md) and may
     contain additional supporting files.
 
+    Only the main file is read at init. The skill's other files are listed
+    and hashed the first time they are needed (reading the manifest, or
+    listing resources in "resources" mode), and files are read off the
+    event loop.
+
     Exposes:
     - A Resource for the main file (skill://{name}/SKILL.md)
     - A Resource for the synthetic manifest (skill://{name}/_manifest)
@@ -179,6 +176,9 @@ class SkillProvider(Provider):
               Clients discover files by reading the manifest first.
             - "resources": Each file exposed as individual Resource in list_resources().
               Full enumeration upfront.
+        cache_path: JSON file in which to persist file hashes, so a restart
+            only rehashes files whose size or mtime changed. Defaults to
+            None (hashes are kept in memory only).
 
     Example:
         ```python
@@ -198,11 +198,13 @@ class SkillProvider(Provider):
         skill_path: str | Path,
         main_file_name: str = "SKILL.md",
         supporting_files: Literal["template", "resources"] = "template",
+        cache_path: str | Path | None = None,
     ) -> None:
         super().__init__()
         self._skill_path = Path(skill_path).resolve()
         self._main_file_name = main_file_name
         self._supporting_files = supporting_files
+        self._index_cache = SkillIndexCache(Path(cache_path) if cache_path else None)
         self._skill_info: SkillInfo | None = None
 
         # Load at init to catch errors early
@@ -236,16 +238,13 @@ class SkillProvider(Provider):
                     description = line.lstrip("#").strip()[:200]
                     break
 
-        # Scan all files in the skill directory
-        files = scan_skill_files(self._skill_path)
-
         self._skill_info = SkillInfo(
             name=self._skill_path.name,
             description=description or f"Skill: {self._skill_path.name}",
             path=self._skill_path,
             main_file=self._main_file_name,
-            files=files,
             frontmatter=frontmatter,
+            index=SkillFileIndex(self._skill_path, self._index_cache),
         )
 
         logger.debug(f"SkillProvider loaded skill: {self._skill_info.name}")
@@ -292,7 +291,8 @@ class SkillProvider(Provider):
 
         # If supporting_files="resources", add all supporting files as resources
         if self._supporting_files == "resources":
-            for file_info in skill.files:
+            files = await call_sync_fn_in_threadpool(skill.index.files)
+            for file_info in files:
                 # Skip main file and manifest (already added)
                 if file_info.path == self._main_file_name:
                     continue
@@ -350,17 +350,16 @@ class SkillProvider(Provider):
             )
         elif self._supporting_files == "resources":
             # Check if it's a known supporting file
-            for file_info in skill.files:
-                if file_info.path == file_path:
-                    mime_type, _ = mimetypes.guess_type(file_path)
-                    return SkillFileResource(
-                        uri=AnyUrl(uri),
-                        name=f"{skill_name}/{file_path}",
-                        description=f"File from {skill_name} skill",
-                        mime_type=mime_type or "application/octet-stream",
-                        skill_info=skill,
-                        file_path=file_path,
-                    )
+            if await call_sync_fn_in_threadpool(skill.index.get, file_path):
+                mime_type, _ = mimetypes.guess_type(file_path)
+                return SkillFileResource(
+                    uri=AnyUrl(uri),
+                    name=f"{skill_name}/{file_path}",
+                    description=f"File from {skill_name} skill",
+                    mime_type=mime_type or "application/octet-stream",
+                    skill_info=skill,
+                    file_path=file_path,
+                )
 
         return None
 
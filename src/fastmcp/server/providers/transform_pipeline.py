@@ -0,0 +1,178 @@
+"""Compiled transform pipelines for providers.
+
+Every listing and lookup on a provider passes through its transforms. Rather
+than awaiting each transform in turn (and building a fresh `call_next` chain
+for every lookup), providers compile their transforms once per component type
+into a TransformPipeline. Consecutive transforms that describe themselves as
+synchronous steps (see `Transform.compile`) are fused into a single stage;
+other transforms keep their async list and get methods.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.server.transforms import ComponentKind, Transform, TransformSteps
+from fastmcp.utilities.versions import VersionSpec
+
+if TYPE_CHECKING:
+    from fastmcp.server.providers.base import Provider
+
+# Public list and get method names for each component type
+TRANSFORM_METHODS: dict[ComponentKind, tuple[str, str]] = {
+    "tool": ("list_tools", "get_tool"),
+    "resource": ("list_resources", "get_resource"),
+    "template": ("list_resource_templates", "get_resource_template"),
+    "prompt": ("list_prompts", "get_prompt"),
+}
+
+GetNext = Callable[..., Awaitable[Any]]
+
+# Every pipeline gets a distinct generation, so a rebuilt pipeline (after its
+# transforms changed) never reports the generation of the one it replaced
+_generations = itertools.count(1)
+
+
+def compile_transform(
+    transform: Transform, kind: ComponentKind
+) -> TransformSteps | None:
+    """Return a transform's steps for `kind`, or None to keep it async.
+
+    Steps inherited from a built-in transform don't describe a subclass that
+    overrides its list or get methods, so such subclasses are not compiled.
+    """
+    steps = transform.compile(kind)
+    if steps is None:
+        return None
+    mro = type(transform).__mro__
+
+    def owner(attr: str) -> int:
+        return next(i for i, cls in enumerate(mro) if attr in cls.__dict__)
+
+    compiled_by = owner("compile")
+    if any(owner(method) < compiled_by for method in TRANSFORM_METHODS[kind]):
+        return None
+    return steps
+
+
+class _FusedStage:
+    """Consecutive compiled transforms, applied without intermediate awaits."""
+
+    def __init__(self, steps: Sequence[TransformSteps]) -> None:
+        # Innermost first, matching the order transforms were added
+        self._steps = tuple(steps)
+        self._outermost_first = tuple(reversed(self._steps))
+        self._component_steps = tuple(
+            s.component for s in self._steps if s.component is not None
+        )
+
+    def map_components(self, components: Sequence[Any]) -> list[Any]:
+        result = []
+        for component in components:
+            for step in self._component_steps:
+                component = step(component)
+                if component is None:
+                    break
+            else:
+                result.append(component)
+        return result
+
+    async def get(
+        self, name: str, call_next: GetNext, *, version: VersionSpec | None = None
+    ) -> Any:
+        # Lookups pass through transforms outermost first; each result step
+        # sees the name its own transform was asked for
+        requested: list[str] = []
+        for steps in self._outermost_first:
+            requested.append(name)
+            if steps.request is not None:
+                mapped = steps.request(name, version)
+                if mapped is None:
+                    return None
+                name, version = mapped
+
+        component = await call_next(name, version=version)
+        for steps, requested_name in zip(self._steps, reversed(requested), strict=True):
+            if component is None:
+                return None
+            if steps.result is not None:
+                component = steps.result(requested_name, component)
+            elif steps.component is not None:
+                component = steps.component(component)
+        return component
+
+
+class TransformPipeline:
+    """A provider's transforms for one component type, compiled once.
+
+    Args:
+        source: The provider whose `_list_*` and `_get_*` methods supply
+            components.
+        transforms: Transforms to apply, innermost first.
+        kind: The component type.
+
+    Attributes:
+        generation: A number unique to this pipeline, used in the provider's
+            catalog generation (see `Provider._catalog_generation`).
+    """
+
+    def __init__(
+        self,
+        source: Provider,
+        transforms: Sequence[Transform],
+        kind: ComponentKind,
+    ) -> None:
+        self.source = source
+        self.transforms = tuple(transforms)
+        self.generation = next(_generations)
+        list_method, get_method = TRANSFORM_METHODS[kind]
+        self._list_method = list_method
+        self._list_base = getattr(source, f"_{list_method}")
+
+        stages: list[Transform | _FusedStage] = []
+        pending: list[TransformSteps] = []
+        for transform in self.transforms:
+            steps = compile_transform(transform, kind)
+            if steps is None:
+                if pending:
+                    stages.append(_FusedStage(pending))
+                    pending = []
+                stages.append(transform)
+            elif not steps.is_empty:
+                pending.append(steps)
+        if pending:
+            stages.append(_FusedStage(pending))
+        self._stages = tuple(stages)
+
+        get_base = getattr(source, f"_{get_method}")
+
+        def base(name: str, version: VersionSpec | None = None) -> Awaitable[Any]:
+            return get_base(name, version)
+
+        chain: GetNext = base
+        for stage in self._stages:
+            if isinstance(stage, _FusedStage):
+                chain = partial(stage.get, call_next=chain)
+            else:
+                chain = partial(getattr(stage, get_method), call_next=chain)
+        self._get = chain
+
+    @property
+    def fused(self) -> bool:
+        """Whether every transform was compiled (no async transform stages)."""
+        return all(isinstance(stage, _FusedStage) for stage in self._stages)
+
+    async def list(self) -> Sequence[Any]:
+        components = await self._list_base()
+        for stage in self._stages:
+            if isinstance(stage, _FusedStage):
+                components = stage.map_components(components)
+            else:
+                components = await getattr(stage, self._list_method)(components)
+        return components
+
+    async def get(self, name: str, version: VersionSpec | None = None) -> Any:
+        return await self._get(name, version=version)
@@ -11,13 +11,14 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 from fastmcp.server.providers.base import Provider
+from fastmcp.server.providers.transform_pipeline import TRANSFORM_METHODS
 from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
     from fastmcp.prompts.prompt import Prompt
     from fastmcp.resources.resource import Resource
     from fastmcp.resources.template import ResourceTemplate
-    from fastmcp.server.transforms import Transform
+    from fastmcp.server.transforms import ComponentKind, Transform
     from fastmcp.tools.tool import Tool
     from fastmcp.utilities.components import FastMCPComponent
 
@@ -49,6 +50,24 @@ class _WrappedProvider(Provider):
     def __repr__(self) -> str:
         return f"_WrappedProvider({self._inner!r}, transforms={self._transforms!r})"
 
+    def _transform_stack(
+        self, kind: ComponentKind
+    ) -> tuple[Provider, Sequence[Transform]]:
+        """Fold the inner provider's transforms into this provider's pipeline.
+
+        Stacked wrappers then run as one pipeline over the innermost
+        provider, instead of one pipeline per layer. Inner providers that
+        override the public list or get methods are kept as the source.
+        """
+        inner_type = type(self._inner)
+        if all(
+            getattr(inner_type, method) is getattr(Provider, method)
+            for method in TRANSFORM_METHODS[kind]
+        ):
+            source, inner_transforms = self._inner._transform_stack(kind)
+            return source, [*inner_transforms, *self.transforms]
+        return self, self.transforms
+
     # -------------------------------------------------------------------------
     # Delegate to inner provider's public methods (which apply inner's transforms)
     # -------------------------------------------------------------------------
@@ -1,10 +1,11 @@
 """Sampling module for FastMCP servers."""
 
 from fastmcp.server.sampling.run import SampleStep, SamplingResult
-from fastmcp.server.sampling.sampling_tool import SamplingTool
+from fastmcp.server.sampling.sampling_tool import SamplingTool, SamplingToolset
 
 __all__ = [
     "SampleStep",
     "SamplingResult",
     "SamplingTool",
+    "SamplingToolset",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import inspect
 import json
-from collections.abc import Callable, Sequence
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Generic, Literal, cast
 
@@ -31,9 +31,12 @@ from typing_extensions import TypeVar
 
 from fastmcp import settings
 from fastmcp.exceptions import ToolError
-from fastmcp.server.sampling.sampling_tool import SamplingTool
-from fastmcp.tools.function_tool import FunctionTool
-from fastmcp.tools.tool_transform import TransformedTool
+from fastmcp.server.sampling.sampling_tool import (
+    SamplingTool,
+    SamplingToolLike,
+    SamplingToolset,
+    to_sampling_tool,
+)
 from fastmcp.utilities.async_utils import gather
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
@@ -369,14 +372,14 @@ def prepare_messages(
 
 
 def prepare_tools(
-    tools: Sequence[SamplingTool | FunctionTool | TransformedTool | Callable[..., Any]]
-    | None,
+    tools: Sequence[SamplingToolLike] | None,
 ) -> list[SamplingTool] | None:
     """Convert tools to SamplingTool objects.
 
     Accepts SamplingTool instances, FunctionTool instances, TransformedTool instances,
     or plain callable functions. FunctionTool and TransformedTool are converted using
-    from_callable_tool(), while plain functions use from_function().
+    from_callable_tool(), while plain functions use from_function(). Use a
+    SamplingToolset to convert tools once across repeated calls.
 
     Args:
         tools: Sequence of tools to prepare. Can be SamplingTool, FunctionTool,
@@ -388,19 +391,7 @@ def prepare_tools(
     if tools is None:
         return None
 
-    sampling_tools: list[SamplingTool] = []
-    for t in tools:
-        if isinstance(t, SamplingTool):
-            sampling_tools.append(t)
-        elif isinstance(t, (FunctionTool, TransformedTool)):
-            sampling_tools.append(SamplingTool.from_callable_tool(t))
-        elif callable(t):
-            sampling_tools.append(SamplingTool.from_function(t))
-        else:
-            raise TypeError(
-                f"Expected SamplingTool, FunctionTool, TransformedTool, or callable, got {type(t)}"
-            )
-
+    sampling_tools = [to_sampling_tool(t) for t in tools]
     return sampling_tools if sampling_tools else None
 
 
@@ -460,8 +451,7 @@ async def sample_step_impl(
     temperature: float | None = None,
     max_tokens: int | None = None,
     model_preferences: ModelPreferences | str | list[str] | None = None,
-    tools: Sequence[SamplingTool | FunctionTool | TransformedTool | Callable[..., Any]]
-    | None = None,
+    tools: SamplingToolset | Sequence[SamplingToolLike] | None = None,
     tool_choice: ToolChoiceOption | str | None = None,
     auto_execute_tools: bool = True,
     mask_error_details: bool | None = None,
@@ -475,17 +465,12 @@ async def sample_step_impl(
     # Convert messages to SamplingMessage objects
     current_messages = prepare_messages(messages)
 
-    # Convert tools to SamplingTools
-    sampling_tools = prepare_tools(tools)
-    sdk_tools: list[SDKTool] | None = (
-        [t._to_sdk_tool() for t in sampling_tools] if sampling_tools else None
-    )
-    tool_map: dict[str, SamplingTool] = (
-        {t.name: t for t in sampling_tools} if sampling_tools else {}
-    )
+    # Convert tools to SamplingTools (a no-op when given a SamplingToolset)
+    toolset = SamplingToolset.from_tools(tools)
+    sdk_tools: list[SDKTool] | None = toolset.sdk_tools
 
     # Determine whether to use fallback handler or client
-    use_fallback = determine_handler_mode(context, bool(sampling_tools))
+    use_fallback = determine_handler_mode(context, bool(toolset))
 
     # Build tool choice
     effective_tool_choice: ToolChoice | None = None
@@ -553,7 +538,7 @@ async def sample_step_impl(
         )
         tool_results: list[ToolResultContent] = await execute_tools(
             step_tool_calls,
-            tool_map,
+            toolset.tool_map,
             mask_error_details=effective_mask,
             tool_concurrency=tool_concurrency,
         )
@@ -577,8 +562,7 @@ async def sample_impl(
     temperature: float | None = None,
     max_tokens: int | None = None,
     model_preferences: ModelPreferences | str | list[str] | None = None,
-    tools: Sequence[SamplingTool | FunctionTool | TransformedTool | Callable[..., Any]]
-    | None = None,
+    tools: SamplingToolset | Sequence[SamplingToolLike] | None = None,
     result_type: type[ResultT] | None = None,
     mask_error_details: bool | None = None,
     tool_concurrency: int | None = None,
@@ -592,15 +576,13 @@ async def sample_impl(
     # Safety limit to prevent infinite loops
     max_iterations = 100
 
-    # Convert tools to SamplingTools
-    sampling_tools = prepare_tools(tools)
+    # Convert tools once; every iteration reuses the same toolset
+    toolset = SamplingToolset.from_tools(tools)
 
     # Handle structured output with result_type
     tool_choice: str | None = None
     if result_type is not None and result_type is not str:
-        final_response_tool = create_final_response_tool(result_type)
-        sampling_tools = list(sampling_tools) if sampling_tools else []
-        sampling_tools.append(final_response_tool)
+        toolset = toolset.with_tools(create_final_response_tool(result_type))
 
         # Always require tool calls when result_type is set - the LLM must
         # eventually call final_response (text responses are not accepted)
@@ -617,7 +599,7 @@ async def sample_impl(
             temperature=temperature,
             max_tokens=max_tokens,
             model_preferences=model_preferences,
-            tools=sampling_tools,
+            tools=toolset,
             tool_choice=tool_choice,
             mask_error_details=mask_error_details,
             tool_concurrency=tool_concurrency,
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, TypeAlias
 
 from mcp.types import TextContent
 from mcp.types import Tool as SDKTool
@@ -181,3 +181,104 @@ class SamplingTool(FastMCPBaseModel):
             parameters=tool.parameters,
             fn=fn,
         )
+
+
+SamplingToolLike: TypeAlias = (
+    SamplingTool | FunctionTool | TransformedTool | Callable[..., Any]
+)
+
+
+def to_sampling_tool(tool: SamplingToolLike) -> SamplingTool:
+    """Convert a tool or callable to a SamplingTool.
+
+    FunctionTool and TransformedTool are converted using from_callable_tool(),
+    while plain functions use from_function().
+
+    Raises:
+        TypeError: If the object is not a supported tool type or callable.
+    """
+    if isinstance(tool, SamplingTool):
+        return tool
+    if isinstance(tool, (FunctionTool, TransformedTool)):
+        return SamplingTool.from_callable_tool(tool)
+    if callable(tool):
+        return SamplingTool.from_function(tool)
+    raise TypeError(
+        f"Expected SamplingTool, FunctionTool, TransformedTool, or callable, got {type(tool)}"
+    )
+
+
+class SamplingToolset:
+    """A fixed set of tools prepared once for repeated sampling calls.
+
+    Converting tools to SamplingTools and building their SDK payloads means
+    generating JSON schemas, which adds up when a sampling loop sends the same
+    tools on every turn. A toolset does that work once; pass it to
+    ctx.sample() or ctx.sample_step() in place of a list of tools:
+
+        toolset = SamplingToolset([search, fetch_url])
+
+        while True:
+            step = await ctx.sample_step(messages, tools=toolset)
+            ...
+    """
+
+    def __init__(self, tools: Sequence[SamplingToolLike] = ()):
+        # Conversions keyed by the identity of their source, which each entry
+        # holds so the id can't be reused while the toolset is alive
+        self._converted: dict[int, tuple[SamplingToolLike, SamplingTool]] = {}
+        self._tools: tuple[SamplingTool, ...] = tuple(self._convert(t) for t in tools)
+        self._tool_map: dict[str, SamplingTool] = {t.name: t for t in self._tools}
+        self._sdk_tools: tuple[SDKTool, ...] = tuple(
+            t._to_sdk_tool() for t in self._tools
+        )
+
+    @classmethod
+    def from_tools(
+        cls, tools: SamplingToolset | Sequence[SamplingToolLike] | None
+    ) -> SamplingToolset:
+        """Return `tools` if it is already a toolset, otherwise build one."""
+        if isinstance(tools, SamplingToolset):
+            return tools
+        return cls(tools or ())
+
+    def with_tools(self, *tools: SamplingToolLike) -> SamplingToolset:
+        """Return a new toolset with additional tools, reusing converted ones."""
+        toolset = SamplingToolset()
+        toolset._converted = dict(self._converted)
+        added = tuple(toolset._convert(t) for t in tools)
+        toolset._tools = self._tools + added
+        toolset._tool_map = self._tool_map | {t.name: t for t in added}
+        toolset._sdk_tools = self._sdk_tools + tuple(t._to_sdk_tool() for t in added)
+        return toolset
+
+    def _convert(self, tool: SamplingToolLike) -> SamplingTool:
+        entry = self._converted.get(id(tool))
+        if entry is not None and entry[0] is tool:
+            return entry[1]
+        converted = to_sampling_tool(tool)
+        self._converted[id(tool)] = (tool, converted)
+        return converted
+
+    @property
+    def tools(self) -> tuple[SamplingTool, ...]:
+        return self._tools
+
+    @property
+    def tool_map(self) -> dict[str, SamplingTool]:
+        """Mapping from tool name to SamplingTool."""
+        return self._tool_map
+
+    @property
+    def sdk_tools(self) -> list[SDKTool] | None:
+        """The tools as mcp.types.Tool payloads, or None if the set is empty."""
+        return list(self._sdk_tools) if self._sdk_tools else None
+
+    def __iter__(self) -> Iterator[SamplingTool]:
+        return iter(self._tools)
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __bool__(self) -> bool:
+        return bool(self._tools)
@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import re
 import secrets
+import time
 import warnings
 from collections.abc import (
     AsyncIterator,
     Awaitable,
     Callable,
+    Hashable,
     Sequence,
 )
 from contextlib import (
     AbstractAsyncContextManager,
+    AbstractContextManager,
     asynccontextmanager,
+    nullcontext,
 )
 from dataclasses import replace
 from functools import partial
@@ -62,25 +67,38 @@ from fastmcp.server.apps import (
     resolve_ui_mime_type,
 )
 from fastmcp.server.auth import AuthCheck, AuthContext, AuthProvider, run_auth_checks
+from fastmcp.server.coalescing import RequestCoalescer, coalescing_key
 from fastmcp.server.dependencies import get_access_token
 from fastmcp.server.lifespan import Lifespan
 from fastmcp.server.low_level import LowLevelServer
+from fastmcp.server.metrics import (
+    MetricFamily,
+    MetricsCollector,
+    RequestObservation,
+    ServerMetrics,
+)
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.server.mixins import LifespanMixin, MCPOperationsMixin, TransportMixin
+from fastmcp.server.mixins.mcp_operations import CatalogCache
 from fastmcp.server.providers import LocalProvider, Provider
 from fastmcp.server.providers.aggregate import AggregateProvider
 from fastmcp.server.tasks.config import TaskConfig, TaskMeta
 from fastmcp.server.telemetry import server_span
 from fastmcp.server.transforms import (
+    ComponentKind,
     ToolTransform,
     Transform,
 )
-from fastmcp.server.transforms.visibility import apply_session_transforms, is_enabled
+from fastmcp.server.transforms.visibility import (
+    apply_session_transforms,
+    get_session_visibility_key,
+    is_enabled,
+)
 from fastmcp.settings import DuplicateBehavior as DuplicateBehaviorSetting
-from fastmcp.tools.function_tool import FunctionTool
+from fastmcp.tools.function_tool import FunctionTool, ToolExecutor
 from fastmcp.tools.tool import Tool, ToolResult
 from fastmcp.tools.tool_transform import ToolTransformConfig
-from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.components import FastMCPComponent, component_revision
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import FastMCPBaseModel, NotSet, NotSetT
 from fastmcp.utilities.versions import (
@@ -231,7 +249,9 @@ class FastMCP(
         mask_error_details: bool | None = None,
         dereference_schemas: bool = True,
         strict_input_validation: bool | None = None,
+        lazy_components: bool | None = None,
         list_page_size: int | None = None,
+        metrics: bool | ServerMetrics | None = None,
         tasks: bool | None = None,
         session_state_store: AsyncKeyValue | None = None,
         sampling_handler: SamplingHandler | None = None,
@@ -245,6 +265,9 @@ class FastMCP(
 
         self._on_duplicate: DuplicateBehaviorSetting = on_duplicate or "warn"
 
+        # Shares in-flight reads/renders of components with coalesce=True
+        self._coalescer = RequestCoalescer()
+
         # Resolve server default for background task support
         self._support_tasks_by_default: bool = tasks if tasks is not None else False
 
@@ -264,7 +287,7 @@ class FastMCP(
 
         # Create LocalProvider for local components
         self._local_provider: LocalProvider = LocalProvider(
-            on_duplicate=self._on_duplicate
+            on_duplicate=self._on_duplicate, lazy=lazy_components
         )
 
         # Add providers using AggregateProvider's add_provider
@@ -285,6 +308,9 @@ class FastMCP(
             raise ValueError("list_page_size must be a positive integer")
         self._list_page_size: int | None = list_page_size
 
+        # Wire-format list results, reused while the listed components are unchanged
+        self._catalog_cache = CatalogCache()
+
         # Handle Lifespan instances (they're callable) or regular lifespan functions
         if lifespan is not None:
             self._lifespan: LifespanCallable[LifespanResultT] = lifespan
@@ -330,6 +356,17 @@ class FastMCP(
 
             self.middleware.append(DereferenceRefsMiddleware())
 
+        # Request, provider and auth metrics, recorded only when enabled
+        self._metrics: ServerMetrics | None = (
+            ServerMetrics() if metrics is True else metrics or None
+        )
+        if self._metrics is not None:
+            self._metrics.registry.register_collector(self._collect_middleware_metrics)
+            if self._metrics.route is not None:
+                self.custom_route(
+                    self._metrics.route, methods=["GET"], include_in_schema=False
+                )(self._metrics.handle_metrics_request)
+
         # Set up MCP protocol handlers
         self._setup_handlers()
 
@@ -341,6 +378,47 @@ class FastMCP(
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.name!r})"
 
+    @property
+    def metrics(self) -> ServerMetrics | None:
+        """The server's metrics, or None if metrics are disabled."""
+        return self._metrics
+
+    def _observe_request(
+        self, method: str, component_type: str, component: str
+    ) -> AbstractContextManager[RequestObservation]:
+        """Record a request's latency, outcome and payload size, if enabled."""
+        if self._metrics is None:
+            return nullcontext(RequestObservation(component))
+        return self._metrics.observe(self.name, method, component_type, component)
+
+    async def _run_auth_checks(
+        self, checks: AuthCheck | list[AuthCheck], ctx: AuthContext
+    ) -> bool:
+        """Run component auth checks, timing them if metrics are enabled."""
+        if self._metrics is None:
+            return await run_auth_checks(checks, ctx)
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            allowed = await run_auth_checks(checks, ctx)
+            outcome = "success" if allowed else "denied"
+            return allowed
+        except AuthorizationError:
+            outcome = "denied"
+            raise
+        finally:
+            self._metrics.observe_auth(
+                "component", time.perf_counter() - start, outcome
+            )
+
+    def _collect_middleware_metrics(self) -> list[MetricFamily]:
+        """Collect metrics reported by middleware, such as cache hits."""
+        families: list[MetricFamily] = []
+        for mw in self.middleware:
+            if isinstance(mw, MetricsCollector):
+                families.extend(mw.collect_metrics())
+        return families
+
     @property
     def name(self) -> str:
         return self._mcp_server.name
@@ -497,6 +575,32 @@ class FastMCP(
                 stacklevel=2,
             )
 
+    async def _catalog_key(self, kind: ComponentKind) -> Hashable | None:
+        """Identify the catalog a list request for `kind` would build.
+
+        A catalog depends on the providers and transforms (their catalog
+        generation), in-place edits to components (`component_revision()`),
+        the session's visibility rules, and the access token seen by
+        component auth checks. Returns None when the providers can't
+        report a generation, so the catalog is built on every request.
+        """
+        generation = self._catalog_generation(kind)
+        if generation is None:
+            return None
+        from fastmcp.server.context import _current_context
+
+        ctx = _current_context.get()
+        visibility = "" if ctx is None else await get_session_visibility_key(ctx)
+        skip_auth, token = _get_auth_context()
+        return (
+            kind,
+            generation,
+            component_revision(),
+            visibility,
+            skip_auth,
+            token and token.token,
+        )
+
     async def list_tools(self, *, run_middleware: bool = True) -> Sequence[Tool]:
         """List all enabled tools from providers.
 
@@ -518,6 +622,12 @@ class FastMCP(
                     call_next=lambda context: self.list_tools(run_middleware=False),
                 )
 
+            # Reuse the catalog while nothing it depends on has changed
+            key = await self._catalog_key("tool")
+            cached = self._catalog_cache.get(key)
+            if cached is not None:
+                return cached
+
             # Get all tools, apply session transforms, then filter enabled
             tools = list(await super().list_tools())
             tools = await apply_session_transforms(tools)
@@ -529,11 +639,12 @@ class FastMCP(
                 if not skip_auth and tool.auth is not None:
                     ctx = AuthContext(token=token, component=tool)
                     try:
-                        if not await run_auth_checks(tool.auth, ctx):
+                        if not await self._run_auth_checks(tool.auth, ctx):
                             continue
                     except AuthorizationError:
                         continue
                 authorized.append(tool)
+            self._catalog_cache.put(key, authorized)
             return authorized
 
     async def _get_tool(
@@ -560,7 +671,7 @@ class FastMCP(
         if not skip_auth and tool.auth is not None:
             ctx = AuthContext(token=token, component=tool)
             try:
-                if not await run_auth_checks(tool.auth, ctx):
+                if not await self._run_auth_checks(tool.auth, ctx):
                     return None
             except AuthorizationError:
                 return None
@@ -616,6 +727,12 @@ class FastMCP(
                     call_next=lambda context: self.list_resources(run_middleware=False),
                 )
 
+            # Reuse the catalog while nothing it depends on has changed
+            key = await self._catalog_key("resource")
+            cached = self._catalog_cache.get(key)
+            if cached is not None:
+                return cached
+
             # Get all resources, apply session transforms, then filter enabled
             resources = list(await super().list_resources())
             resources = await apply_session_transforms(resources)
@@ -627,11 +744,12 @@ class FastMCP(
                 if not skip_auth and resource.auth is not None:
                     ctx = AuthContext(token=token, component=resource)
                     try:
-                        if not await run_auth_checks(resource.auth, ctx):
+                        if not await self._run_auth_checks(resource.auth, ctx):
                             continue
                     except AuthorizationError:
                         continue
                 authorized.append(resource)
+            self._catalog_cache.put(key, authorized)
             return authorized
 
     async def _get_resource(
@@ -658,7 +776,7 @@ class FastMCP(
         if not skip_auth and resource.auth is not None:
             ctx = AuthContext(token=token, component=resource)
             try:
-                if not await run_auth_checks(resource.auth, ctx):
+                if not await self._run_auth_checks(resource.auth, ctx):
                     return None
             except AuthorizationError:
                 return None
@@ -715,6 +833,12 @@ class FastMCP(
                     ),
                 )
 
+            # Reuse the catalog while nothing it depends on has changed
+            key = await self._catalog_key("template")
+            cached = self._catalog_cache.get(key)
+            if cached is not None:
+                return cached
+
             # Get all templates, apply session transforms, then filter enabled
             templates = list(await super().list_resource_templates())
             templates = await apply_session_transforms(templates)
@@ -726,11 +850,12 @@ class FastMCP(
                 if not skip_auth and template.auth is not None:
                     ctx = AuthContext(token=token, component=template)
                     try:
-                        if not await run_auth_checks(template.auth, ctx):
+                        if not await self._run_auth_checks(template.auth, ctx):
                             continue
                     except AuthorizationError:
                         continue
                 authorized.append(template)
+            self._catalog_cache.put(key, authorized)
             return authorized
 
     async def _get_resource_template(
@@ -757,7 +882,7 @@ class FastMCP(
         if not skip_auth and template.auth is not None:
             ctx = AuthContext(token=token, component=template)
             try:
-                if not await run_auth_checks(template.auth, ctx):
+                if not await self._run_auth_checks(template.auth, ctx):
                     return None
             except AuthorizationError:
                 return None
@@ -810,6 +935,12 @@ class FastMCP(
                     call_next=lambda context: self.list_prompts(run_middleware=False),
                 )
 
+            # Reuse the catalog while nothing it depends on has changed
+            key = await self._catalog_key("prompt")
+            cached = self._catalog_cache.get(key)
+            if cached is not None:
+                return cached
+
             # Get all prompts, apply session transforms, then filter enabled
             prompts = list(await super().list_prompts())
             prompts = await apply_session_transforms(prompts)
@@ -821,11 +952,12 @@ class FastMCP(
                 if not skip_auth and prompt.auth is not None:
                     ctx = AuthContext(token=token, component=prompt)
                     try:
-                        if not await run_auth_checks(prompt.auth, ctx):
+                        if not await self._run_auth_checks(prompt.auth, ctx):
                             continue
                     except AuthorizationError:
                         continue
                 authorized.append(prompt)
+            self._catalog_cache.put(key, authorized)
             return authorized
 
     async def _get_prompt(
@@ -852,7 +984,7 @@ class FastMCP(
         if not skip_auth and prompt.auth is not None:
             ctx = AuthContext(token=token, component=prompt)
             try:
-                if not await run_auth_checks(prompt.auth, ctx):
+                if not await self._run_auth_checks(prompt.auth, ctx):
                     return None
             except AuthorizationError:
                 return None
@@ -966,9 +1098,12 @@ class FastMCP(
 
             # Core logic: find and execute tool (providers queried in parallel)
             # Use get_tool to apply transforms and filter disabled
-            with server_span(
-                f"tools/call {name}", "tools/call", self.name, "tool", name
-            ) as span:
+            with (
+                server_span(
+                    f"tools/call {name}", "tools/call", self.name, "tool", name
+                ) as span,
+                self._observe_request("tools/call", "tool", name) as request,
+            ):
                 tool = await self.get_tool(name, version=version)
                 if tool is None:
                     raise NotFoundError(f"Unknown tool: {name!r}")
@@ -976,7 +1111,9 @@ class FastMCP(
                 if task_meta is not None and task_meta.fn_key is None:
                     task_meta = replace(task_meta, fn_key=tool.key)
                 try:
-                    return await tool._run(arguments or {}, task_meta=task_meta)
+                    return request.record(
+                        await tool._run(arguments or {}, task_meta=task_meta)
+                    )
                 except FastMCPError:
                     logger.exception(f"Error calling tool {name!r}")
                     raise
@@ -1079,14 +1216,17 @@ class FastMCP(
                 )
 
             # Core logic: find and read resource (providers queried in parallel)
-            with server_span(
-                f"resources/read {uri}",
-                "resources/read",
-                self.name,
-                "resource",
-                uri,
-                resource_uri=uri,
-            ) as span:
+            with (
+                server_span(
+                    f"resources/read {uri}",
+                    "resources/read",
+                    self.name,
+                    "resource",
+                    uri,
+                    resource_uri=uri,
+                ) as span,
+                self._observe_request("resources/read", "resource", uri) as request,
+            ):
                 # Try concrete resources first (transforms + auth via _get_resource)
                 resource = await self.get_resource(uri, version=version)
                 if resource is not None:
@@ -1094,7 +1234,13 @@ class FastMCP(
                     if task_meta is not None and task_meta.fn_key is None:
                         task_meta = replace(task_meta, fn_key=resource.key)
                     try:
-                        return await resource._read(task_meta=task_meta)
+                        if resource.coalesce and task_meta is None:
+                            return request.record(
+                                await self._coalescer.run(
+                                    coalescing_key(resource.key, uri), resource._read
+                                )
+                            )
+                        return request.record(await resource._read(task_meta=task_meta))
                     except (FastMCPError, McpError):
                         logger.exception(f"Error reading resource {uri!r}")
                         raise
@@ -1128,12 +1274,23 @@ class FastMCP(
                         f"Unknown resource: {uri!r} version {version!r}"
                     )
                 span.set_attributes(template.get_span_attributes())
+                # Label by template so each expanded URI isn't its own series
+                request.component = template.uri_template
                 params = template.matches(uri)
                 assert params is not None
                 if task_meta is not None and task_meta.fn_key is None:
                     task_meta = replace(task_meta, fn_key=template.key)
                 try:
-                    return await template._read(uri, params, task_meta=task_meta)
+                    if template.coalesce and task_meta is None:
+                        return request.record(
+                            await self._coalescer.run(
+                                coalescing_key(template.key, uri),
+                                lambda: template._read(uri, params),
+                            )
+                        )
+                    return request.record(
+                        await template._read(uri, params, task_meta=task_meta)
+                    )
                 except (FastMCPError, McpError):
                     logger.exception(f"Error reading resource {uri!r}")
                     raise
@@ -1232,9 +1389,12 @@ class FastMCP(
 
             # Core logic: find and render prompt (providers queried in parallel)
             # Use get_prompt to apply transforms and filter disabled
-            with server_span(
-                f"prompts/get {name}", "prompts/get", self.name, "prompt", name
-            ) as span:
+            with (
+                server_span(
+                    f"prompts/get {name}", "prompts/get", self.name, "prompt", name
+                ) as span,
+                self._observe_request("prompts/get", "prompt", name) as request,
+            ):
                 prompt = await self.get_prompt(name, version=version)
                 if prompt is None:
                     raise NotFoundError(f"Unknown prompt: {name!r}")
@@ -1242,7 +1402,19 @@ class FastMCP(
                 if task_meta is not None and task_meta.fn_key is None:
                     task_meta = replace(task_meta, fn_key=prompt.key)
                 try:
-                    return await prompt._render(arguments, task_meta=task_meta)
+                    if prompt.coalesce and task_meta is None:
+                        return request.record(
+                            await self._coalescer.run(
+                                coalescing_key(
+                                    prompt.key,
+                                    json.dumps(arguments, sort_keys=True, default=str),
+                                ),
+                                lambda: prompt._render(arguments),
+                            )
+                        )
+                    return request.record(
+                        await prompt._render(arguments, task_meta=task_meta)
+                    )
                 except (FastMCPError, McpError):
                     logger.exception(f"Error rendering prompt {name!r}")
                     raise
@@ -1313,6 +1485,8 @@ class FastMCP(
         app: AppConfig | dict[str, Any] | bool | None = None,
         task: bool | TaskConfig | None = None,
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> FunctionTool: ...
 
@@ -1334,6 +1508,8 @@ class FastMCP(
         app: AppConfig | dict[str, Any] | bool | None = None,
         task: bool | TaskConfig | None = None,
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> Callable[[AnyFunction], FunctionTool]: ...
 
@@ -1354,6 +1530,8 @@ class FastMCP(
         app: AppConfig | dict[str, Any] | bool | None = None,
         task: bool | TaskConfig | None = None,
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> (
         Callable[[AnyFunction], FunctionTool]
@@ -1383,6 +1561,14 @@ class FastMCP(
             exclude_args: Optional list of argument names to exclude from the tool schema.
                 Deprecated: Use `Depends()` for dependency injection instead.
             meta: Optional meta information about the tool
+            structured_only: If True, results with structured content are sent
+                without the duplicate JSON text block. Clients that only read
+                text content will not see these results.
+            executor: Where a sync tool function runs. "thread" (default) uses
+                the thread pool; "process" runs it in a worker process so
+                CPU-bound work does not hold the GIL. Process tools must be
+                module-level sync functions with picklable arguments and
+                results, and cannot use Context or dependency injection.
 
         Examples:
             Register a tool with a custom name:
@@ -1431,6 +1617,8 @@ class FastMCP(
             meta=meta,
             task=task if task is not None else self._support_tasks_by_default,
             timeout=timeout,
+            structured_only=structured_only,
+            executor=executor,
             auth=auth,
         )
 
@@ -1476,6 +1664,7 @@ class FastMCP(
         app: AppConfig | dict[str, Any] | bool | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> Callable[[AnyFunction], Resource | ResourceTemplate | AnyFunction]:
         """Decorator to register a function as a resource.
 
@@ -1575,6 +1764,7 @@ class FastMCP(
             meta=meta,
             task=task if task is not None else self._support_tasks_by_default,
             auth=auth,
+            coalesce=coalesce,
         )
 
         def decorator(fn: AnyFunction) -> Resource | ResourceTemplate | AnyFunction:
@@ -1607,6 +1797,7 @@ class FastMCP(
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> FunctionPrompt: ...
 
     @overload
@@ -1623,6 +1814,7 @@ class FastMCP(
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> Callable[[AnyFunction], FunctionPrompt]: ...
 
     def prompt(
@@ -1638,6 +1830,7 @@ class FastMCP(
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         auth: AuthCheck | list[AuthCheck] | None = None,
+        coalesce: bool = False,
     ) -> (
         Callable[[AnyFunction], FunctionPrompt]
         | FunctionPrompt
@@ -1723,6 +1916,7 @@ class FastMCP(
             meta=meta,
             task=task if task is not None else self._support_tasks_by_default,
             auth=auth,
+            coalesce=coalesce,
         )
 
     def mount(
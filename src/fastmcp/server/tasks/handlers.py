@@ -8,7 +8,7 @@ from __future__ import annotations
 import uuid
 from contextlib import suppress
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import mcp.types
 from mcp.shared.exceptions import McpError
@@ -17,6 +17,7 @@ from mcp.types import INTERNAL_ERROR, ErrorData
 from fastmcp.server.dependencies import _current_docket, get_access_token, get_context
 from fastmcp.server.tasks.config import TaskMeta
 from fastmcp.server.tasks.keys import build_task_key
+from fastmcp.server.tasks.metadata import TaskMetadata, store_task_metadata
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -44,7 +45,8 @@ async def submit_to_docket(
     methods (_run, _read, _render) when task metadata is present and mode allows.
 
     Queues the component's method to Docket, stores raw return values,
-    and converts to MCP types on retrieval.
+    and converts to MCP types on retrieval. The task's metadata is written in
+    one pipelined Redis transaction.
 
     Args:
         task_type: Component type for task key construction
@@ -90,30 +92,21 @@ async def submit_to_docket(
         ttl_ms = int(docket.execution_ttl.total_seconds() * 1000)
     ttl_seconds = int(ttl_ms / 1000) + TASK_MAPPING_TTL_BUFFER_SECONDS
 
-    # Store task metadata in Redis for protocol handlers
-    task_meta_key = docket.key(f"fastmcp:task:{session_id}:{server_task_id}")
-    created_at_key = docket.key(
-        f"fastmcp:task:{session_id}:{server_task_id}:created_at"
-    )
-    poll_interval_key = docket.key(
-        f"fastmcp:task:{session_id}:{server_task_id}:poll_interval"
-    )
     poll_interval_ms = int(component.task_config.poll_interval.total_seconds() * 1000)
 
     # Snapshot the current access token (if any) for background task access (#3095)
     access_token = get_access_token()
-    access_token_key = docket.key(
-        f"fastmcp:task:{session_id}:{server_task_id}:access_token"
-    )
 
-    async with docket.redis() as redis:
-        await redis.set(task_meta_key, task_key, ex=ttl_seconds)
-        await redis.set(created_at_key, created_at.isoformat(), ex=ttl_seconds)
-        await redis.set(poll_interval_key, str(poll_interval_ms), ex=ttl_seconds)
-        if access_token is not None:
-            await redis.set(
-                access_token_key, access_token.model_dump_json(), ex=ttl_seconds
-            )
+    # Store task metadata in Redis for protocol handlers
+    metadata = TaskMetadata(
+        task_key=task_key,
+        created_at=created_at.isoformat(),
+        poll_interval_ms=poll_interval_ms,
+        access_token=(
+            access_token.model_dump_json() if access_token is not None else None
+        ),
+    )
+    await store_task_metadata(docket, session_id, server_task_id, metadata, ttl_seconds)
 
     # Register session for Context access in background workers (SEP-1686)
     # This enables elicitation/sampling from background tasks via weakref
@@ -153,11 +146,19 @@ async def submit_to_docket(
     # Use component.add_to_docket() which handles calling conventions
     # `fn_key` is the function lookup key (e.g., "child_multiply")
     # `task_key` is the task result key (e.g., "fastmcp:task:{session}:{task_id}:tool:child_multiply")
-    # Resources don't take arguments; tools/prompts/templates always pass arguments (even if None/empty)
+    # Resources don't take arguments; prompts take them as given (even if None),
+    # and tools/templates always receive a dict
     if task_type == "resource":
-        await component.add_to_docket(docket, fn_key=key, task_key=task_key)  # type: ignore[call-arg]
+        resource = cast("Resource", component)
+        await resource.add_to_docket(docket, fn_key=key, task_key=task_key)
+    elif task_type == "prompt":
+        prompt = cast("Prompt", component)
+        await prompt.add_to_docket(docket, arguments, fn_key=key, task_key=task_key)
     else:
-        await component.add_to_docket(docket, arguments, fn_key=key, task_key=task_key)  # type: ignore[call-arg]
+        runnable = cast("Tool | ResourceTemplate", component)
+        await runnable.add_to_docket(
+            docket, arguments or {}, fn_key=key, task_key=task_key
+        )
 
     # Spawn subscription task to send status notifications (SEP-1686 optional feature)
     from fastmcp.server.tasks.subscriptions import subscribe_to_task_updates
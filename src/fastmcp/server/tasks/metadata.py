@@ -0,0 +1,187 @@
+"""Redis storage for SEP-1686 task metadata.
+
+Each background task has one Redis hash holding everything the protocol
+handlers need to answer tasks/get, tasks/result, and tasks/cancel, plus the
+access token snapshot restored in Docket workers:
+
+    `fastmcp:task:{session_id}:{task_id}:meta`
+
+Each session also has a sorted set of its task IDs scored by creation time,
+which backs paginated tasks/list:
+
+    `fastmcp:task:{session_id}:index`
+
+A task's metadata is written in a single pipelined transaction (one
+round-trip), and reads are a single HGETALL per task, pipelined when reading
+several.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, cast
+
+from fastmcp.server.tasks.config import DEFAULT_POLL_INTERVAL_MS
+
+if TYPE_CHECKING:
+    from docket import Docket
+
+TASK_METADATA_KEY = "fastmcp:task:{session_id}:{task_id}:meta"
+TASK_INDEX_KEY = "fastmcp:task:{session_id}:index"
+
+# Sets a key's TTL unless it already expires later (including a key that was
+# just created, whose TTL is -1). EXPIRE's NX/GT options do the same but need
+# Redis 7, and Docket itself only needs Lua scripting.
+_EXTEND_TTL_SCRIPT = """
+if redis.call('TTL', KEYS[1]) < tonumber(ARGV[1]) then
+    return redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return 0
+"""
+
+
+def task_metadata_key(docket: Docket, session_id: str, task_id: str) -> str:
+    """Return the Redis key of a task's metadata hash."""
+    return docket.key(TASK_METADATA_KEY.format(session_id=session_id, task_id=task_id))
+
+
+def task_index_key(docket: Docket, session_id: str) -> str:
+    """Return the Redis key of a session's task index."""
+    return docket.key(TASK_INDEX_KEY.format(session_id=session_id))
+
+
+@dataclass(frozen=True)
+class TaskMetadata:
+    """Server-side metadata stored for a background task."""
+
+    # Full Docket task key (see fastmcp.server.tasks.keys)
+    task_key: str
+    # ISO 8601 creation timestamp
+    created_at: str | None = None
+    poll_interval_ms: int = DEFAULT_POLL_INTERVAL_MS
+    # JSON-serialized AccessToken snapshot, if the request was authenticated
+    access_token: str | None = None
+
+    def to_mapping(self) -> dict[str, str]:
+        mapping = {
+            "task_key": self.task_key,
+            "poll_interval": str(self.poll_interval_ms),
+        }
+        if self.created_at is not None:
+            mapping["created_at"] = self.created_at
+        if self.access_token is not None:
+            mapping["access_token"] = self.access_token
+        return mapping
+
+    @classmethod
+    def from_mapping(cls, mapping: dict[bytes, bytes]) -> TaskMetadata | None:
+        """Parse a raw HGETALL result. Returns None if the task is unknown."""
+        fields = {k.decode("utf-8"): v.decode("utf-8") for k, v in mapping.items()}
+        task_key = fields.get("task_key")
+        if not task_key:
+            return None
+        try:
+            poll_interval_ms = int(fields["poll_interval"])
+        except (KeyError, ValueError):
+            poll_interval_ms = DEFAULT_POLL_INTERVAL_MS
+        return cls(
+            task_key=task_key,
+            created_at=fields.get("created_at"),
+            poll_interval_ms=poll_interval_ms,
+            access_token=fields.get("access_token"),
+        )
+
+    def created_timestamp(self) -> float:
+        """Creation time as a POSIX timestamp, used as the task index score."""
+        if self.created_at:
+            try:
+                return datetime.fromisoformat(self.created_at).timestamp()
+            except ValueError:
+                pass
+        return datetime.now(timezone.utc).timestamp()
+
+
+async def store_task_metadata(
+    docket: Docket,
+    session_id: str,
+    task_id: str,
+    metadata: TaskMetadata,
+    ttl_seconds: int,
+) -> None:
+    """Store a task's metadata in a single pipelined transaction.
+
+    The task is also added to the session's task index. The index lives as
+    long as the longest-lived task submitted to it; entries whose metadata
+    has already expired are pruned when the index is read.
+
+    Args:
+        docket: Docket instance
+        session_id: Session that owns the task
+        task_id: Server-generated task ID
+        metadata: Metadata to store
+        ttl_seconds: How long to keep the metadata
+    """
+    index_key = task_index_key(docket, session_id)
+    key = task_metadata_key(docket, session_id, task_id)
+    async with docket.redis() as redis, redis.pipeline() as pipe:
+        pipe.hset(key, mapping=metadata.to_mapping())
+        pipe.expire(key, ttl_seconds)
+        pipe.zadd(index_key, {task_id: metadata.created_timestamp()})
+        pipe.eval(_EXTEND_TTL_SCRIPT, 1, index_key, ttl_seconds)
+        await pipe.execute()
+
+
+async def load_task_metadata(
+    docket: Docket, session_id: str, task_id: str
+) -> TaskMetadata | None:
+    """Fetch a task's metadata in one round-trip. Returns None if not found."""
+    async with docket.redis() as redis:
+        mapping = await cast(
+            Any, redis.hgetall(task_metadata_key(docket, session_id, task_id))
+        )
+    return TaskMetadata.from_mapping(mapping)
+
+
+async def load_many_task_metadata(
+    docket: Docket, session_id: str, task_ids: Sequence[str]
+) -> list[TaskMetadata | None]:
+    """Fetch metadata for several tasks in one pipelined round-trip.
+
+    Returns one entry per task ID, in order, with None for unknown tasks.
+    """
+    if not task_ids:
+        return []
+    async with docket.redis() as redis, redis.pipeline() as pipe:
+        for task_id in task_ids:
+            pipe.hgetall(task_metadata_key(docket, session_id, task_id))
+        mappings = await pipe.execute()
+    return [TaskMetadata.from_mapping(mapping) for mapping in mappings]
+
+
+async def list_task_ids(
+    docket: Docket, session_id: str, offset: int, limit: int | None
+) -> tuple[list[str], int]:
+    """Read a page of a session's task index, oldest first.
+
+    Returns:
+        Tuple of (task IDs in the page, total number of indexed tasks)
+    """
+    index_key = task_index_key(docket, session_id)
+    end = -1 if limit is None else offset + limit - 1
+    async with docket.redis() as redis, redis.pipeline() as pipe:
+        pipe.zrange(index_key, offset, end)
+        pipe.zcard(index_key)
+        members, total = await pipe.execute()
+    return [member.decode("utf-8") for member in members], total
+
+
+async def remove_from_task_index(
+    docket: Docket, session_id: str, task_ids: Sequence[str]
+) -> None:
+    """Drop task IDs from a session's task index."""
+    if not task_ids:
+        return
+    async with docket.redis() as redis:
+        await redis.zrem(task_index_key(docket, session_id), *task_ids)
@@ -8,6 +8,8 @@ This module requires fastmcp[tasks] (pydocket). It is only imported when docket
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -28,14 +30,27 @@ from fastmcp.exceptions import NotFoundError
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import ResourceTemplate
-from fastmcp.server.tasks.config import DEFAULT_POLL_INTERVAL_MS, DEFAULT_TTL_MS
+from fastmcp.server.tasks.config import DEFAULT_TTL_MS
 from fastmcp.server.tasks.keys import parse_task_key
+from fastmcp.server.tasks.metadata import (
+    TaskMetadata,
+    list_task_ids,
+    load_many_task_metadata,
+    load_task_metadata,
+    remove_from_task_index,
+)
 from fastmcp.tools.tool import Tool
+from fastmcp.utilities.async_utils import gather
+from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.pagination import CursorState
 from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
+    from docket import Docket
+
     from fastmcp.server.server import FastMCP
 
+logger = get_logger(__name__)
 
 # Map Docket execution states to MCP task status strings
 # Per SEP-1686 final spec (line 381): tasks MUST begin in "working" status
@@ -68,6 +83,170 @@ def _parse_key_version(key_suffix: str) -> tuple[str, str | None]:
     return name_or_uri, version if version else None
 
 
+@dataclass(frozen=True)
+class ExecutionSnapshot:
+    """Lifecycle fields read from Docket for one task, without loading the task."""
+
+    state: ExecutionState
+    # Error text recorded by the worker (FAILED only)
+    error: str | None = None
+    # Latest progress message reported by the task
+    progress_message: str | None = None
+
+
+def _execution_state_keys(docket: Docket, task_key: str) -> tuple[str, str]:
+    """Return the Redis keys `Execution.sync()` reads: (runs hash, progress hash).
+
+    This is the only place that depends on Docket's Redis layout. Raises
+    AttributeError if the installed Docket doesn't expose it.
+    """
+    return docket.runs_key(task_key), docket.key(f"progress:{task_key}")
+
+
+async def _sync_execution_snapshot(
+    docket: Docket, task_key: str
+) -> ExecutionSnapshot | None:
+    """Read one execution's state through Docket's public API."""
+    execution = await docket.get_execution(task_key)
+    if execution is None:
+        return None
+    await execution.sync()
+    return ExecutionSnapshot(
+        state=execution.state,
+        error=execution.error,
+        progress_message=execution.progress.message,
+    )
+
+
+async def read_execution_snapshots(
+    docket: Docket, task_keys: Sequence[str]
+) -> list[ExecutionSnapshot | None]:
+    """Read the state of many Docket executions in one pipelined round-trip.
+
+    This reads the same runs and progress hashes as `Execution.sync()`, but
+    without first loading (and unpickling) each execution, so polling a large
+    number of tasks costs one round-trip instead of two per task.
+
+    If the hashes can't be read or parsed (for example after a Docket upgrade
+    changed them), and for executions whose hash is missing, the state is
+    read with `docket.get_execution()` and `Execution.sync()` instead.
+
+    Returns one snapshot per task key, in order, with None for executions
+    that no longer exist.
+    """
+    if not task_keys:
+        return []
+    try:
+        snapshots = await _read_execution_hashes(docket, task_keys)
+    except (AttributeError, KeyError, ValueError) as error:
+        logger.debug("Falling back to Execution.sync() for task state: %s", error)
+        snapshots = [None] * len(task_keys)
+    missing = [i for i, snapshot in enumerate(snapshots) if snapshot is None]
+    if missing:
+        synced = await gather(
+            *(_sync_execution_snapshot(docket, task_keys[i]) for i in missing)
+        )
+        for i, snapshot in zip(missing, synced, strict=True):
+            snapshots[i] = snapshot
+    return snapshots
+
+
+async def _read_execution_hashes(
+    docket: Docket, task_keys: Sequence[str]
+) -> list[ExecutionSnapshot | None]:
+    async with docket.redis() as redis, redis.pipeline() as pipe:
+        for task_key in task_keys:
+            runs_key, progress_key = _execution_state_keys(docket, task_key)
+            pipe.hgetall(runs_key)
+            pipe.hgetall(progress_key)
+        replies = await pipe.execute()
+
+    snapshots: list[ExecutionSnapshot | None] = []
+    for runs, progress in zip(replies[::2], replies[1::2], strict=True):
+        if not runs:
+            snapshots.append(None)
+            continue
+        state_value = runs.get(b"state")
+        error = runs.get(b"error")
+        message = progress.get(b"message") if progress else None
+        snapshots.append(
+            ExecutionSnapshot(
+                state=ExecutionState(state_value.decode())
+                if state_value
+                else ExecutionState.SCHEDULED,
+                error=error.decode() if error else None,
+                progress_message=message.decode() if message else None,
+            )
+        )
+    return snapshots
+
+
+def _parse_created_at(created_at: str | None) -> datetime:
+    """Parse a stored ISO timestamp, falling back to now.
+
+    createdAt is required per spec, but can be None from Redis.
+    """
+    if created_at:
+        try:
+            return datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            pass
+    return datetime.now(timezone.utc)
+
+
+def _build_task(
+    task_id: str,
+    metadata: TaskMetadata,
+    snapshot: ExecutionSnapshot,
+    status_message: str | None = None,
+) -> mcp.types.Task:
+    """Build the spec Task object for a task from its metadata and state."""
+    mcp_state: Literal[
+        "working", "input_required", "completed", "failed", "cancelled"
+    ] = DOCKET_TO_MCP_STATE.get(snapshot.state, "failed")  # type: ignore[assignment]
+
+    if status_message is None:
+        if snapshot.state == ExecutionState.FAILED:
+            if snapshot.error:
+                status_message = f"Task failed: {snapshot.error}"
+        elif snapshot.progress_message:
+            # Extract progress message from Docket if available (spec line 403)
+            status_message = snapshot.progress_message
+
+    # Use default ttl since we don't track per-task values
+    return mcp.types.Task(
+        taskId=task_id,
+        status=mcp_state,
+        createdAt=_parse_created_at(metadata.created_at),
+        lastUpdatedAt=datetime.now(timezone.utc),
+        ttl=DEFAULT_TTL_MS,
+        pollInterval=metadata.poll_interval_ms,
+        statusMessage=status_message,
+    )
+
+
+async def get_task_statuses(
+    docket: Docket, session_id: str, task_ids: Sequence[str]
+) -> list[mcp.types.Task | None]:
+    """Get the status of many tasks in two pipelined round-trips.
+
+    Equivalent to a tasks/get per task, except that failed tasks report the
+    error text recorded by the worker rather than the re-raised exception.
+
+    Returns one Task per task ID, in order, with None for tasks that are
+    unknown to this session or whose execution has expired.
+    """
+    metadata = await load_many_task_metadata(docket, session_id, task_ids)
+    known = [(i, m) for i, m in enumerate(metadata) if m is not None]
+    snapshots = await read_execution_snapshots(docket, [m.task_key for _, m in known])
+
+    statuses: list[mcp.types.Task | None] = [None] * len(task_ids)
+    for (i, task_metadata), snapshot in zip(known, snapshots, strict=True):
+        if snapshot is not None:
+            statuses[i] = _build_task(task_ids[i], task_metadata, snapshot)
+    return statuses
+
+
 async def _lookup_task_execution(
     docket: Any,
     session_id: str,
@@ -89,26 +268,13 @@ async def _lookup_task_execution(
     Raises:
         McpError: If task not found or execution not found
     """
-    task_meta_key = docket.key(f"fastmcp:task:{session_id}:{client_task_id}")
-    created_at_key = docket.key(
-        f"fastmcp:task:{session_id}:{client_task_id}:created_at"
-    )
-    poll_interval_key = docket.key(
-        f"fastmcp:task:{session_id}:{client_task_id}:poll_interval"
-    )
-
-    # Fetch metadata (single round-trip with mget)
-    async with docket.redis() as redis:
-        task_key_bytes, created_at_bytes, poll_interval_bytes = await redis.mget(
-            task_meta_key, created_at_key, poll_interval_key
-        )
-
-    # Decode and validate task_key
-    task_key = task_key_bytes.decode("utf-8") if task_key_bytes else None
-    if not task_key:
+    # Fetch metadata (single round-trip)
+    metadata = await load_task_metadata(docket, session_id, client_task_id)
+    if metadata is None:
         raise McpError(
             ErrorData(code=INVALID_PARAMS, message=f"Task {client_task_id} not found")
         )
+    task_key = metadata.task_key
 
     # Get execution
     execution = await docket.get_execution(task_key)
@@ -120,18 +286,7 @@ async def _lookup_task_execution(
             )
         )
 
-    # Parse metadata with defaults
-    created_at = created_at_bytes.decode("utf-8") if created_at_bytes else None
-    try:
-        poll_interval_ms = (
-            int(poll_interval_bytes.decode("utf-8"))
-            if poll_interval_bytes
-            else DEFAULT_POLL_INTERVAL_MS
-        )
-    except (ValueError, UnicodeDecodeError):
-        poll_interval_ms = DEFAULT_POLL_INTERVAL_MS
-
-    return execution, created_at, poll_interval_ms
+    return execution, metadata.created_at, metadata.poll_interval_ms
 
 
 async def tasks_get_handler(server: FastMCP, params: dict[str, Any]) -> GetTaskResult:
@@ -166,57 +321,37 @@ async def tasks_get_handler(server: FastMCP, params: dict[str, Any]) -> GetTaskR
                 )
             )
 
-        # Look up task execution and metadata
-        execution, created_at, poll_interval_ms = await _lookup_task_execution(
-            docket, session_id, client_task_id
-        )
-
-        # Sync state from Redis
-        await execution.sync()
-
-        # Map Docket state to MCP state
-        state_map = DOCKET_TO_MCP_STATE
-        mcp_state: Literal[
-            "working", "input_required", "completed", "failed", "cancelled"
-        ] = state_map.get(execution.state, "failed")  # type: ignore[assignment]
+        # Fetch metadata, then execution state (one round-trip each)
+        metadata = await load_task_metadata(docket, session_id, client_task_id)
+        if metadata is None:
+            raise McpError(
+                ErrorData(
+                    code=INVALID_PARAMS, message=f"Task {client_task_id} not found"
+                )
+            )
+        [snapshot] = await read_execution_snapshots(docket, [metadata.task_key])
+        if snapshot is None:
+            raise McpError(
+                ErrorData(
+                    code=INVALID_PARAMS,
+                    message=f"Task {client_task_id} execution not found",
+                )
+            )
 
-        # Build response (use default ttl since we don't track per-task values)
-        # createdAt is REQUIRED per SEP-1686 final spec (line 430)
         # Per spec lines 447-448: SHOULD NOT include related-task metadata in tasks/get
-        error_message = None
         status_message = None
+        if snapshot.state == ExecutionState.FAILED:
+            # Report the stored exception itself, which needs the full execution
+            execution = await docket.get_execution(metadata.task_key)
+            if execution is not None:
+                await execution.sync()
+                try:
+                    await execution.get_result(timeout=timedelta(seconds=0))
+                except Exception as error:
+                    status_message = f"Task failed: {error}"
 
-        if execution.state == ExecutionState.FAILED:
-            try:
-                await execution.get_result(timeout=timedelta(seconds=0))
-            except Exception as error:
-                error_message = str(error)
-                status_message = f"Task failed: {error_message}"
-        elif execution.progress and execution.progress.message:
-            # Extract progress message from Docket if available (spec line 403)
-            status_message = execution.progress.message
-
-        # createdAt is required per spec, but can be None from Redis
-        # Parse ISO string to datetime, or use current time as fallback
-        if created_at:
-            try:
-                created_at_dt = datetime.fromisoformat(
-                    created_at.replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
-                created_at_dt = datetime.now(timezone.utc)
-        else:
-            created_at_dt = datetime.now(timezone.utc)
-
-        return GetTaskResult(
-            taskId=client_task_id,
-            status=mcp_state,
-            createdAt=created_at_dt,
-            lastUpdatedAt=datetime.now(timezone.utc),
-            ttl=DEFAULT_TTL_MS,
-            pollInterval=poll_interval_ms,
-            statusMessage=status_message,
-        )
+        task = _build_task(client_task_id, metadata, snapshot, status_message)
+        return GetTaskResult(**task.model_dump())
 
 
 async def tasks_result_handler(server: FastMCP, params: dict[str, Any]) -> Any:
@@ -254,11 +389,8 @@ async def tasks_result_handler(server: FastMCP, params: dict[str, Any]) -> Any:
             )
 
         # Look up full task key from Redis
-        task_meta_key = docket.key(f"fastmcp:task:{session_id}:{client_task_id}")
-        async with docket.redis() as redis:
-            task_key_bytes = await redis.get(task_meta_key)
-
-        task_key = None if task_key_bytes is None else task_key_bytes.decode("utf-8")
+        metadata = await load_task_metadata(docket, session_id, client_task_id)
+        task_key = metadata.task_key if metadata is not None else None
 
         if task_key is None:
             raise McpError(
@@ -400,17 +532,58 @@ async def tasks_list_handler(
 ) -> ListTasksResult:
     """Handle MCP 'tasks/list' request (SEP-1686).
 
-    Note: With client-side tracking, this returns minimal info.
+    Lists the current session's tasks, oldest first, from the session's task
+    index. Pages hold `list_page_size` tasks when the server sets it, like the
+    other list methods; otherwise all tasks are returned.
 
     Args:
         server: FastMCP server instance
-        params: Request params (cursor, limit)
+        params: Request params (cursor)
 
     Returns:
         ListTasksResult: Response with tasks list and pagination
     """
-    # Return empty list - client tracks tasks locally
-    return ListTasksResult(tasks=[], nextCursor=None)
+    async with fastmcp.server.context.Context(fastmcp=server) as ctx:
+        docket = server._docket
+        if docket is None:
+            raise McpError(
+                ErrorData(
+                    code=INTERNAL_ERROR,
+                    message="Background tasks require Docket",
+                )
+            )
+        session_id = ctx.session_id
+
+        offset = 0
+        if cursor := params.get("cursor"):
+            try:
+                offset = CursorState.decode(cursor).offset
+            except ValueError as e:
+                raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e))) from e
+
+        task_ids, total = await list_task_ids(
+            docket, session_id, offset, server._list_page_size
+        )
+        statuses = await get_task_statuses(docket, session_id, task_ids)
+
+        # Drop tasks whose metadata or execution has expired from the index
+        expired = [
+            task_id
+            for task_id, status in zip(task_ids, statuses, strict=True)
+            if status is None
+        ]
+        await remove_from_task_index(docket, session_id, expired)
+
+        # Pruned entries were all in this page, so the next page starts earlier
+        end = offset + len(task_ids)
+        next_cursor = None
+        if end < total:
+            next_cursor = CursorState(offset=end - len(expired)).encode()
+
+        return ListTasksResult(
+            tasks=[status for status in statuses if status is not None],
+            nextCursor=next_cursor,
+        )
 
 
 async def tasks_cancel_handler(
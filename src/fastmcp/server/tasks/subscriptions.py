@@ -16,6 +16,7 @@ from docket.execution import ExecutionState
 from mcp.types import TaskStatusNotification, TaskStatusNotificationParams
 
 from fastmcp.server.tasks.keys import parse_task_key
+from fastmcp.server.tasks.metadata import load_task_metadata
 from fastmcp.server.tasks.requests import DOCKET_TO_MCP_STATE
 from fastmcp.utilities.logging import get_logger
 
@@ -109,13 +110,10 @@ async def _send_status_notification(
     key_parts = parse_task_key(task_key)
     session_id = key_parts["session_id"]
 
-    created_at_key = docket.key(f"fastmcp:task:{session_id}:{task_id}:created_at")
-    async with docket.redis() as redis:
-        created_at_bytes = await redis.get(created_at_key)
-
+    metadata = await load_task_metadata(docket, session_id, task_id)
     created_at = (
-        created_at_bytes.decode("utf-8")
-        if created_at_bytes
+        metadata.created_at
+        if metadata is not None and metadata.created_at
         else datetime.now(timezone.utc).isoformat()
     )
 
@@ -183,13 +181,10 @@ async def _send_progress_notification(
     key_parts = parse_task_key(task_key)
     session_id = key_parts["session_id"]
 
-    created_at_key = docket.key(f"fastmcp:task:{session_id}:{task_id}:created_at")
-    async with docket.redis() as redis:
-        created_at_bytes = await redis.get(created_at_key)
-
+    metadata = await load_task_metadata(docket, session_id, task_id)
     created_at = (
-        created_at_bytes.decode("utf-8")
-        if created_at_bytes
+        metadata.created_at
+        if metadata is not None and metadata.created_at
         else datetime.now(timezone.utc).isoformat()
     )
 
@@ -20,8 +20,9 @@ Example:
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Sequence
-from typing import TYPE_CHECKING, Protocol
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 from fastmcp.utilities.versions import VersionSpec
 
@@ -65,6 +66,40 @@ class GetPromptNext(Protocol):
     ) -> Awaitable[Prompt | None]: ...
 
 
+ComponentKind = Literal["tool", "resource", "template", "prompt"]
+
+
+@dataclass(frozen=True)
+class TransformSteps:
+    """Synchronous form of a transform for one component type.
+
+    Transforms that only rename, filter, or mark components can describe
+    themselves with these steps (see `Transform.compile`). Providers fuse
+    consecutive compiled transforms into a single step, so lookups and
+    listings run them without awaiting each transform in turn. Every step
+    is optional; a TransformSteps with no steps leaves components unchanged.
+
+    Attributes:
+        request: Maps the requested name or URI and version spec to the
+            ones to look up downstream, or returns None if nothing this
+            transform produces can match.
+        component: Maps a component on its way out. Returning None drops it.
+        result: Maps the component found by a lookup, given the name or URI
+            that was requested. Defaults to `component`.
+    """
+
+    request: (
+        Callable[[str, VersionSpec | None], tuple[str, VersionSpec | None] | None]
+        | None
+    ) = None
+    component: Callable[[Any], Any | None] | None = None
+    result: Callable[[str, Any], Any | None] | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.request is None and self.component is None and self.result is None
+
+
 class Transform:
     """Base class for component transformations.
 
@@ -88,6 +123,23 @@ class Transform:
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
+    def compile(self, kind: ComponentKind) -> TransformSteps | None:
+        """Describe this transform as synchronous steps, if it can be.
+
+        Override in transforms that only rename, filter, or mark components.
+        The steps must behave exactly like this transform's list and get
+        methods for `kind`. Returning None (the default) keeps the transform
+        on the async path. Subclasses that override the list or get methods
+        of a compiled transform are not compiled.
+
+        Args:
+            kind: The component type to compile for.
+
+        Returns:
+            The transform's steps, or None.
+        """
+        return None
+
     # -------------------------------------------------------------------------
     # Tools
     # -------------------------------------------------------------------------
@@ -228,6 +280,7 @@ from fastmcp.server.transforms.tool_transform import ToolTransform  # noqa: E402
 from fastmcp.server.transforms.version_filter import VersionFilter  # noqa: E402
 
 __all__ = [
+    "ComponentKind",
     "GetPromptNext",
     "GetResourceNext",
     "GetResourceTemplateNext",
@@ -237,6 +290,7 @@ __all__ = [
     "ResourcesAsTools",
     "ToolTransform",
     "Transform",
+    "TransformSteps",
     "VersionFilter",
     "VersionSpec",
     "Visibility",
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, TypeVar
 
 from fastmcp.server.transforms import (
+    ComponentKind,
     GetPromptNext,
     GetResourceNext,
     GetResourceTemplateNext,
     GetToolNext,
     Transform,
+    TransformSteps,
 )
+from fastmcp.utilities.components import CopyCache
 from fastmcp.utilities.versions import VersionSpec
 
 if TYPE_CHECKING:
@@ -24,6 +27,9 @@ if TYPE_CHECKING:
 # Pattern for matching URIs: protocol://path
 _URI_PATTERN = re.compile(r"^([^:]+://)(.*?)$")
 
+C = TypeVar("C", bound="Tool | Prompt")
+T = TypeVar("T", bound="Tool | Prompt | Resource | ResourceTemplate")
+
 
 class Namespace(Transform):
     """Prefixes component names with a namespace.
@@ -49,6 +55,7 @@ class Namespace(Transform):
         """
         self._prefix = prefix
         self._name_prefix = f"{prefix}_"
+        self._copies = CopyCache()
 
     def __repr__(self) -> str:
         return f"Namespace({self._prefix!r})"
@@ -90,15 +97,52 @@ class Namespace(Transform):
             return None
         return None
 
+    # -------------------------------------------------------------------------
+    # Component copies
+    # -------------------------------------------------------------------------
+
+    def _rename(self, component: C) -> C:
+        return component.model_copy(
+            update={"name": self._transform_name(component.name)}
+        )
+
+    def _move_resource(self, resource: Resource) -> Resource:
+        return resource.model_copy(
+            update={"uri": self._transform_uri(str(resource.uri))}
+        )
+
+    def _move_template(self, template: ResourceTemplate) -> ResourceTemplate:
+        return template.model_copy(
+            update={"uri_template": self._transform_uri(template.uri_template)}
+        )
+
+    def compile(self, kind: ComponentKind) -> TransformSteps:
+        """Namespacing is a pure rename for every component type."""
+        if kind in ("tool", "prompt"):
+            return self._compile_rename(self._reverse_name, self._rename)
+        if kind == "resource":
+            return self._compile_rename(self._reverse_uri, self._move_resource)
+        return self._compile_rename(self._reverse_uri, self._move_template)
+
+    def _compile_rename(
+        self, reverse: Callable[[str], str | None], apply: Callable[[T], T]
+    ) -> TransformSteps:
+        def request(
+            name: str, version: VersionSpec | None
+        ) -> tuple[str, VersionSpec | None] | None:
+            original = reverse(name)
+            return None if original is None else (original, version)
+
+        copies = self._copies
+        return TransformSteps(request=request, component=lambda c: copies.get(c, apply))
+
     # -------------------------------------------------------------------------
     # Tools
     # -------------------------------------------------------------------------
 
     async def list_tools(self, tools: Sequence[Tool]) -> Sequence[Tool]:
         """Prefix tool names with namespace."""
-        return [
-            t.model_copy(update={"name": self._transform_name(t.name)}) for t in tools
-        ]
+        return [self._copies.get(t, self._rename) for t in tools]
 
     async def get_tool(
         self, name: str, call_next: GetToolNext, *, version: VersionSpec | None = None
@@ -109,7 +153,7 @@ class Namespace(Transform):
             return None
         tool = await call_next(original, version=version)
         if tool:
-            return tool.model_copy(update={"name": name})
+            return self._copies.get(tool, self._rename)
         return None
 
     # -------------------------------------------------------------------------
@@ -118,10 +162,7 @@ class Namespace(Transform):
 
     async def list_resources(self, resources: Sequence[Resource]) -> Sequence[Resource]:
         """Add namespace path segment to resource URIs."""
-        return [
-            r.model_copy(update={"uri": self._transform_uri(str(r.uri))})
-            for r in resources
-        ]
+        return [self._copies.get(r, self._move_resource) for r in resources]
 
     async def get_resource(
         self,
@@ -136,7 +177,7 @@ class Namespace(Transform):
             return None
         resource = await call_next(original, version=version)
         if resource:
-            return resource.model_copy(update={"uri": uri})
+            return self._copies.get(resource, self._move_resource)
         return None
 
     # -------------------------------------------------------------------------
@@ -147,10 +188,7 @@ class Namespace(Transform):
         self, templates: Sequence[ResourceTemplate]
     ) -> Sequence[ResourceTemplate]:
         """Add namespace path segment to template URIs."""
-        return [
-            t.model_copy(update={"uri_template": self._transform_uri(t.uri_template)})
-            for t in templates
-        ]
+        return [self._copies.get(t, self._move_template) for t in templates]
 
     async def get_resource_template(
         self,
@@ -165,9 +203,7 @@ class Namespace(Transform):
             return None
         template = await call_next(original, version=version)
         if template:
-            return template.model_copy(
-                update={"uri_template": self._transform_uri(template.uri_template)}
-            )
+            return self._copies.get(template, self._move_template)
         return None
 
     # -------------------------------------------------------------------------
@@ -176,9 +212,7 @@ class Namespace(Transform):
 
     async def list_prompts(self, prompts: Sequence[Prompt]) -> Sequence[Prompt]:
         """Prefix prompt names with namespace."""
-        return [
-            p.model_copy(update={"name": self._transform_name(p.name)}) for p in prompts
-        ]
+        return [self._copies.get(p, self._rename) for p in prompts]
 
     async def get_prompt(
         self, name: str, call_next: GetPromptNext, *, version: VersionSpec | None = None
@@ -189,5 +223,5 @@ class Namespace(Transform):
             return None
         prompt = await call_next(original, version=version)
         if prompt:
-            return prompt.model_copy(update={"name": name})
+            return self._copies.get(prompt, self._rename)
         return None
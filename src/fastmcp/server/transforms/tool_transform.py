@@ -5,7 +5,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-from fastmcp.server.transforms import GetToolNext, Transform
+from fastmcp.server.transforms import (
+    ComponentKind,
+    GetToolNext,
+    Transform,
+    TransformSteps,
+)
 from fastmcp.tools.tool_transform import ToolTransformConfig
 from fastmcp.utilities.versions import VersionSpec
 
@@ -61,16 +66,41 @@ class ToolTransform(Transform):
             return f"ToolTransform({names!r})"
         return f"ToolTransform({names[:3]!r}... +{len(names) - 3} more)"
 
+    def compile(self, kind: ComponentKind) -> TransformSteps:
+        """Tool transforms rename and rewrite individual tools."""
+        if kind != "tool":
+            return TransformSteps()
+        return TransformSteps(
+            request=lambda name, version: (
+                self._name_reverse.get(name, name),
+                version,
+            ),
+            component=self._apply,
+            result=self._apply_requested,
+        )
+
+    def _apply(self, tool: Tool) -> Tool:
+        config = self._transforms.get(tool.name)
+        return config.apply(tool) if config is not None else tool
+
+    def _apply_requested(self, name: str, tool: Tool) -> Tool | None:
+        """Transform a looked-up tool, if it is the one `name` refers to."""
+        original_name = self._name_reverse.get(name, name)
+
+        # Apply transform if applicable
+        if original_name in self._transforms:
+            transformed = self._transforms[original_name].apply(tool)
+            # Only return if requested name matches transformed name
+            if transformed.name == name:
+                return transformed
+            return None
+
+        # No transform, return as-is only if name matches
+        return tool if tool.name == name else None
+
     async def list_tools(self, tools: Sequence[Tool]) -> Sequence[Tool]:
         """Apply transforms to matching tools."""
-        result: list[Tool] = []
-        for tool in tools:
-            if tool.name in self._transforms:
-                transformed = self._transforms[tool.name].apply(tool)
-                result.append(transformed)
-            else:
-                result.append(tool)
-        return result
+        return [self._apply(tool) for tool in tools]
 
     async def get_tool(
         self, name: str, call_next: GetToolNext, *, version: VersionSpec | None = None
@@ -83,14 +113,4 @@ class ToolTransform(Transform):
         tool = await call_next(original_name, version=version)
         if tool is None:
             return None
-
-        # Apply transform if applicable
-        if original_name in self._transforms:
-            transformed = self._transforms[original_name].apply(tool)
-            # Only return if requested name matches transformed name
-            if transformed.name == name:
-                return transformed
-            return None
-
-        # No transform, return as-is only if name matches
-        return tool if tool.name == name else None
+        return self._apply_requested(name, tool)
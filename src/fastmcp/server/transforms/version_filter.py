@@ -6,11 +6,13 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from fastmcp.server.transforms import (
+    ComponentKind,
     GetPromptNext,
     GetResourceNext,
     GetResourceTemplateNext,
     GetToolNext,
     Transform,
+    TransformSteps,
 )
 from fastmcp.utilities.versions import VersionSpec
 
@@ -65,6 +67,15 @@ class VersionFilter(Transform):
             parts.append(f"version_lt={self.version_lt!r}")
         return f"VersionFilter({', '.join(parts)})"
 
+    def compile(self, kind: ComponentKind) -> TransformSteps:
+        """Version filtering narrows lookups and filters listings."""
+        spec = self._spec
+        return TransformSteps(
+            request=lambda name, version: (name, spec.intersect(version)),
+            component=lambda c: c if spec.matches(c.version) else None,
+            result=lambda name, c: c,
+        )
+
     # -------------------------------------------------------------------------
     # Tools
     # -------------------------------------------------------------------------
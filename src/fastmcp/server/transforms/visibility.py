@@ -7,6 +7,7 @@ Final filtering happens at the Provider level.
 
 from __future__ import annotations
 
+import json
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
@@ -15,11 +16,13 @@ import mcp.types
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import ResourceTemplate
 from fastmcp.server.transforms import (
+    ComponentKind,
     GetPromptNext,
     GetResourceNext,
     GetResourceTemplateNext,
     GetToolNext,
     Transform,
+    TransformSteps,
 )
 from fastmcp.utilities.versions import VersionSpec
 
@@ -137,9 +140,8 @@ class Visibility(Transform):
 
         # Check component type if specified
         if self.components is not None:
-            component_type = component.key.split(":")[
-                0
-            ]  # e.g., "tool" from "tool:foo@"
+            # e.g., "tool" from "tool:foo@"
+            component_type = component.KEY_PREFIX or component.key.split(":")[0]
             if component_type not in self.components:
                 return False
 
@@ -189,6 +191,10 @@ class Visibility(Transform):
             new_meta = {**component.meta, _FASTMCP_KEY: new_fastmcp}
         return component.model_copy(update={"meta": new_meta})
 
+    def compile(self, kind: ComponentKind) -> TransformSteps:
+        """Visibility only marks components."""
+        return TransformSteps(component=self._mark_component)
+
     # -------------------------------------------------------------------------
     # Transform methods (mark components, don't filter)
     # -------------------------------------------------------------------------
@@ -369,6 +375,21 @@ async def get_session_transforms(context: Context) -> list[Visibility]:
     return create_visibility_transforms(rules)
 
 
+async def get_session_visibility_key(context: Context) -> str:
+    """Return a string that identifies the session's visibility rules.
+
+    Sessions with the same rules get the same key, and the key changes
+    whenever the session's rules do. Empty when there are no rules.
+    """
+    try:
+        _ = context.session_id
+    except RuntimeError:
+        return ""
+
+    rules = await get_visibility_rules(context)
+    return json.dumps(rules, sort_keys=True, default=repr) if rules else ""
+
+
 async def enable_components(
     context: Context,
     *,
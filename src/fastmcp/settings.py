@@ -267,6 +267,73 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    process_pool_max_workers: Annotated[
+        int | None,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Maximum number of worker processes used by tools registered with
+                executor="process". Defaults to the number of CPUs.
+                """
+            ),
+        ),
+    ] = None
+
+    type_adapter_cache_size: Annotated[
+        int | None,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Number of pydantic TypeAdapters kept for validating tool,
+                resource, and prompt arguments. Servers with more components
+                than this rebuild adapters on every call; raise it, or set it
+                to None for an unbounded cache. Read when the first adapter is
+                cached; use `fastmcp.utilities.types.configure_typeadapter_cache`
+                to resize it afterwards.
+                """
+            ),
+        ),
+    ] = 5000
+
+    schema_cache: Annotated[
+        bool,
+        Field(
+            description=inspect.cleandoc(
+                """
+                If True, JSON schemas generated for function tools are stored
+                on disk, keyed by the function's qualified name, a hash of its
+                source, and the pydantic version, so later starts skip schema
+                generation for unchanged functions.
+                """
+            ),
+        ),
+    ] = False
+
+    schema_cache_dir: Annotated[
+        Path | None,
+        Field(
+            description=inspect.cleandoc(
+                """
+                Directory for the on-disk schema cache. Defaults to a
+                `schema-cache` directory under `home`.
+                """
+            ),
+        ),
+    ] = None
+
+    lazy_components: Annotated[
+        bool,
+        Field(
+            description=inspect.cleandoc(
+                """
+                If True, components registered with decorators are built (and
+                their schemas generated) the first time they are listed or
+                requested rather than at decoration time.
+                """
+            ),
+        ),
+    ] = False
+
     server_dependencies: list[str] = Field(
         default_factory=list,
         description="List of dependencies to install in the server environment",
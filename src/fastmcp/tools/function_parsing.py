@@ -18,6 +18,7 @@ from fastmcp.server.dependencies import (
 from fastmcp.tools.tool import ToolResult
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.schema_cache import get_schema_cache, schema_cache_key
 from fastmcp.utilities.types import (
     Audio,
     File,
@@ -58,6 +59,96 @@ def _is_object_schema(schema: dict[str, Any]) -> bool:
     return "$ref" in schema and "$defs" in schema
 
 
+def _generate_input_schema(
+    fn: Callable[..., Any], exclude_args: list[str] | None
+) -> dict[str, Any]:
+    """Generate the compressed input schema for a function's arguments."""
+    # Handle injected parameters (Context, Docket dependencies)
+    wrapper_fn = without_injected_parameters(fn)
+
+    # Also handle exclude_args with non-serializable types (issue #2431)
+    # This must happen before Pydantic tries to serialize the parameters
+    if exclude_args:
+        wrapper_fn = create_function_without_params(wrapper_fn, list(exclude_args))
+
+    input_type_adapter = get_cached_typeadapter(wrapper_fn)
+    input_schema = input_type_adapter.json_schema()
+
+    # Compress and handle exclude_args
+    prune_params = list(exclude_args) if exclude_args else None
+    return compress_schema(input_schema, prune_params=prune_params, prune_titles=True)
+
+
+def _generate_output_schema(
+    fn: Callable[..., Any], wrap_non_object_output_schema: bool
+) -> dict[str, Any] | None:
+    """Generate the compressed output schema for a function's return type."""
+    output_schema = None
+    # Get the return annotation from the signature
+    sig = inspect.signature(fn)
+    output_type = sig.return_annotation
+
+    # If the annotation is a string (from __future__ annotations), resolve it
+    if isinstance(output_type, str):
+        try:
+            # Use get_type_hints to resolve the return type
+            # include_extras=True preserves Annotated metadata
+            type_hints = get_type_hints(fn, include_extras=True)
+            output_type = type_hints.get("return", output_type)
+        except Exception as e:
+            # If resolution fails, keep the string annotation
+            logger.debug("Failed to resolve type hint for return annotation: %s", e)
+
+    if output_type not in (inspect._empty, None, Any, ...):
+        # there are a variety of types that we don't want to attempt to
+        # serialize because they are either used by FastMCP internally,
+        # or are MCP content types that explicitly don't form structured
+        # content. By replacing them with an explicitly unserializable type,
+        # we ensure that no output schema is automatically generated.
+        clean_output_type = replace_type(
+            output_type,
+            dict.fromkeys(
+                (
+                    Image,
+                    Audio,
+                    File,
+                    ToolResult,
+                    mcp.types.TextContent,
+                    mcp.types.ImageContent,
+                    mcp.types.AudioContent,
+                    mcp.types.ResourceLink,
+                    mcp.types.EmbeddedResource,
+                ),
+                _UnserializableType,
+            ),
+        )
+
+        try:
+            type_adapter = get_cached_typeadapter(clean_output_type)
+            base_schema = type_adapter.json_schema(mode="serialization")
+
+            # Generate schema for wrapped type if it's non-object
+            # because MCP requires that output schemas are objects
+            # Check if schema is an object type, resolving $ref references
+            # (self-referencing types use $ref at root level)
+            if wrap_non_object_output_schema and not _is_object_schema(base_schema):
+                # Use the wrapped result schema directly
+                wrapped_type = _WrappedResult[clean_output_type]
+                wrapped_adapter = get_cached_typeadapter(wrapped_type)
+                output_schema = wrapped_adapter.json_schema(mode="serialization")
+                output_schema["x-fastmcp-wrap-result"] = True
+            else:
+                output_schema = base_schema
+
+            output_schema = compress_schema(output_schema, prune_titles=True)
+
+        except PydanticSchemaGenerationError as e:
+            if "_UnserializableType" not in str(e):
+                logger.debug(f"Unable to generate schema for type {output_type!r}")
+
+    return output_schema or None
+
+
 @dataclass
 class ParsedFunction:
     fn: Callable[..., Any]
@@ -109,88 +200,27 @@ class ParsedFunction:
         if isinstance(fn, staticmethod):
             fn = fn.__func__
 
+        # Reuse schemas from the on-disk cache when the function is unchanged
+        schema_cache = get_schema_cache()
+        cache_key = None
+        cached = None
+        if schema_cache is not None:
+            cache_key = schema_cache_key(
+                fn, exclude_args, wrap_non_object_output_schema
+            )
+            if cache_key is not None:
+                cached = schema_cache.get(cache_key)
+
         # Transform Context type annotations to Depends() for unified DI
         fn = transform_context_annotations(fn)
 
-        # Handle injected parameters (Context, Docket dependencies)
-        wrapper_fn = without_injected_parameters(fn)
-
-        # Also handle exclude_args with non-serializable types (issue #2431)
-        # This must happen before Pydantic tries to serialize the parameters
-        if exclude_args:
-            wrapper_fn = create_function_without_params(wrapper_fn, list(exclude_args))
-
-        input_type_adapter = get_cached_typeadapter(wrapper_fn)
-        input_schema = input_type_adapter.json_schema()
-
-        # Compress and handle exclude_args
-        prune_params = list(exclude_args) if exclude_args else None
-        input_schema = compress_schema(
-            input_schema, prune_params=prune_params, prune_titles=True
-        )
-
-        output_schema = None
-        # Get the return annotation from the signature
-        sig = inspect.signature(fn)
-        output_type = sig.return_annotation
-
-        # If the annotation is a string (from __future__ annotations), resolve it
-        if isinstance(output_type, str):
-            try:
-                # Use get_type_hints to resolve the return type
-                # include_extras=True preserves Annotated metadata
-                type_hints = get_type_hints(fn, include_extras=True)
-                output_type = type_hints.get("return", output_type)
-            except Exception as e:
-                # If resolution fails, keep the string annotation
-                logger.debug("Failed to resolve type hint for return annotation: %s", e)
-
-        if output_type not in (inspect._empty, None, Any, ...):
-            # there are a variety of types that we don't want to attempt to
-            # serialize because they are either used by FastMCP internally,
-            # or are MCP content types that explicitly don't form structured
-            # content. By replacing them with an explicitly unserializable type,
-            # we ensure that no output schema is automatically generated.
-            clean_output_type = replace_type(
-                output_type,
-                dict.fromkeys(
-                    (
-                        Image,
-                        Audio,
-                        File,
-                        ToolResult,
-                        mcp.types.TextContent,
-                        mcp.types.ImageContent,
-                        mcp.types.AudioContent,
-                        mcp.types.ResourceLink,
-                        mcp.types.EmbeddedResource,
-                    ),
-                    _UnserializableType,
-                ),
-            )
-
-            try:
-                type_adapter = get_cached_typeadapter(clean_output_type)
-                base_schema = type_adapter.json_schema(mode="serialization")
-
-                # Generate schema for wrapped type if it's non-object
-                # because MCP requires that output schemas are objects
-                # Check if schema is an object type, resolving $ref references
-                # (self-referencing types use $ref at root level)
-                if wrap_non_object_output_schema and not _is_object_schema(base_schema):
-                    # Use the wrapped result schema directly
-                    wrapped_type = _WrappedResult[clean_output_type]
-                    wrapped_adapter = get_cached_typeadapter(wrapped_type)
-                    output_schema = wrapped_adapter.json_schema(mode="serialization")
-                    output_schema["x-fastmcp-wrap-result"] = True
-                else:
-                    output_schema = base_schema
-
-                output_schema = compress_schema(output_schema, prune_titles=True)
-
-            except PydanticSchemaGenerationError as e:
-                if "_UnserializableType" not in str(e):
-                    logger.debug(f"Unable to generate schema for type {output_type!r}")
+        if cached is not None:
+            input_schema, output_schema = cached
+        else:
+            input_schema = _generate_input_schema(fn, exclude_args)
+            output_schema = _generate_output_schema(fn, wrap_non_object_output_schema)
+            if schema_cache is not None and cache_key is not None:
+                schema_cache.set(cache_key, input_schema, output_schema)
 
         return cls(
             fn=fn,
@@ -6,12 +6,15 @@ import inspect
 import warnings
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
+    Annotated,
     Any,
     Literal,
     Protocol,
     TypeVar,
+    get_type_hints,
     overload,
     runtime_checkable,
 )
@@ -20,12 +23,16 @@ import anyio
 import mcp.types
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, Icon, ToolAnnotations, ToolExecution
+from pydantic import Field, TypeAdapter
 from pydantic.json_schema import SkipJsonSchema
 
 import fastmcp
 from fastmcp.decorators import resolve_task_config
 from fastmcp.server.auth.authorization import AuthCheck
-from fastmcp.server.dependencies import without_injected_parameters
+from fastmcp.server.dependencies import (
+    get_dependency_parameters,
+    without_injected_parameters,
+)
 from fastmcp.server.tasks.config import TaskConfig
 from fastmcp.tools.function_parsing import ParsedFunction, _is_object_schema
 from fastmcp.tools.tool import (
@@ -33,11 +40,15 @@ from fastmcp.tools.tool import (
     ToolResult,
     ToolResultSerializerType,
 )
-from fastmcp.utilities.async_utils import call_sync_fn_in_threadpool
+from fastmcp.utilities.async_utils import (
+    call_sync_fn_in_process_pool,
+    call_sync_fn_in_threadpool,
+)
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import (
     NotSet,
     NotSetT,
+    find_kwarg_by_type,
     get_cached_typeadapter,
 )
 
@@ -49,6 +60,51 @@ if TYPE_CHECKING:
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+ToolExecutor = Literal["thread", "process"]
+
+
+@lru_cache(maxsize=1000)
+def _get_arguments_adapter(
+    fn: Callable[..., Any],
+) -> TypeAdapter[tuple[tuple[Any, ...], dict[str, Any]]]:
+    """Build a TypeAdapter that validates arguments for `fn` without calling it.
+
+    Validating through `get_cached_typeadapter(fn)` invokes the function as a
+    side effect. Process execution needs the validated arguments themselves so
+    they can be pickled and sent to a worker.
+    """
+
+    def capture(*args: Any, **kwargs: Any) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return args, kwargs
+
+    try:
+        hints = get_type_hints(fn, include_extras=True)
+    except Exception:
+        hints = dict(getattr(fn, "__annotations__", {}))
+    hints.pop("return", None)
+
+    capture.__signature__ = inspect.signature(fn).replace(  # type: ignore[attr-defined]
+        return_annotation=inspect.Signature.empty
+    )
+    capture.__annotations__ = hints
+    return get_cached_typeadapter(capture)
+
+
+def _validate_process_executor(fn: Callable[..., Any], name: str) -> None:
+    """Reject functions that cannot run in a worker process."""
+    from fastmcp.server.context import Context
+
+    if inspect.iscoroutinefunction(fn):
+        raise ValueError(
+            f"Tool '{name}' uses executor='process', which requires a sync function."
+        )
+    if find_kwarg_by_type(fn, Context) or get_dependency_parameters(fn):
+        raise ValueError(
+            f"Tool '{name}' uses executor='process', which does not support "
+            "Context or dependency-injected parameters. Use the default thread "
+            "executor, or pass the values you need as regular arguments."
+        )
+
 
 @runtime_checkable
 class DecoratedTool(Protocol):
@@ -78,12 +134,21 @@ class ToolMeta:
     exclude_args: list[str] | None = None
     serializer: Any | None = None
     timeout: float | None = None
+    structured_only: bool = False
+    executor: ToolExecutor = "thread"
     auth: AuthCheck | list[AuthCheck] | None = None
     enabled: bool = True
 
 
 class FunctionTool(Tool):
     fn: SkipJsonSchema[Callable[..., Any]]
+    executor: Annotated[
+        ToolExecutor,
+        Field(
+            description="Where sync functions run: a worker thread or a worker process",
+            exclude=True,
+        ),
+    ] = "thread"
 
     def to_mcp_tool(
         self,
@@ -123,6 +188,8 @@ class FunctionTool(Tool):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> FunctionTool:
         """Create a FunctionTool from a function.
@@ -155,6 +222,8 @@ class FunctionTool(Tool):
             )
             or output_schema is not NotSet
             or exclude_args is not None
+            or structured_only
+            or executor != "thread"
         )
 
         if metadata is not None and individual_params_provided:
@@ -179,6 +248,8 @@ class FunctionTool(Tool):
                 exclude_args=exclude_args,
                 serializer=serializer,
                 timeout=timeout,
+                structured_only=structured_only,
+                executor=executor,
                 auth=auth,
             )
 
@@ -215,6 +286,9 @@ class FunctionTool(Tool):
             task_config = task_value
         task_config.validate_function(fn, func_name)
 
+        if metadata.executor == "process":
+            _validate_process_executor(parsed_fn.fn, func_name)
+
         # Handle output_schema
         if isinstance(metadata.output_schema, NotSetT):
             final_output_schema = parsed_fn.output_schema
@@ -243,29 +317,18 @@ class FunctionTool(Tool):
             meta=metadata.meta,
             task_config=task_config,
             timeout=metadata.timeout,
+            structured_only=metadata.structured_only,
+            executor=metadata.executor,
             auth=metadata.auth,
         )
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Run the tool with arguments."""
-        wrapper_fn = without_injected_parameters(self.fn)
-        type_adapter = get_cached_typeadapter(wrapper_fn)
-
         # Apply timeout if configured
         if self.timeout is not None:
             try:
                 with anyio.fail_after(self.timeout):
-                    # Thread pool execution for sync functions, direct await for async
-                    if inspect.iscoroutinefunction(wrapper_fn):
-                        result = await type_adapter.validate_python(arguments)
-                    else:
-                        # Sync function: run in threadpool to avoid blocking
-                        result = await call_sync_fn_in_threadpool(
-                            type_adapter.validate_python, arguments
-                        )
-                        # Handle sync wrappers that return awaitables
-                        if inspect.isawaitable(result):
-                            result = await result
+                    result = await self._call_fn(arguments)
             except TimeoutError:
                 logger.warning(
                     f"Tool '{self.name}' timed out after {self.timeout}s. "
@@ -279,18 +342,33 @@ class FunctionTool(Tool):
                     )
                 ) from None
         else:
-            # No timeout: use existing execution path
-            if inspect.iscoroutinefunction(wrapper_fn):
-                result = await type_adapter.validate_python(arguments)
-            else:
-                result = await call_sync_fn_in_threadpool(
-                    type_adapter.validate_python, arguments
-                )
-                if inspect.isawaitable(result):
-                    result = await result
+            result = await self._call_fn(arguments)
 
         return self.convert_result(result)
 
+    async def _call_fn(self, arguments: dict[str, Any]) -> Any:
+        """Validate arguments and call the function on the configured executor."""
+        if self.executor == "process":
+            # Validate in this process, then ship plain arguments to a worker
+            args, kwargs = _get_arguments_adapter(self.fn).validate_python(arguments)
+            return await call_sync_fn_in_process_pool(self.fn, *args, **kwargs)
+
+        wrapper_fn = without_injected_parameters(self.fn)
+        type_adapter = get_cached_typeadapter(wrapper_fn)
+
+        # Thread pool execution for sync functions, direct await for async
+        if inspect.iscoroutinefunction(wrapper_fn):
+            return await type_adapter.validate_python(arguments)
+
+        # Sync function: run in threadpool to avoid blocking
+        result = await call_sync_fn_in_threadpool(
+            type_adapter.validate_python, arguments
+        )
+        # Handle sync wrappers that return awaitables
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
     def register_with_docket(self, docket: Docket) -> None:
         """Register this tool with docket for background execution.
 
@@ -345,6 +423,8 @@ def tool(
     exclude_args: list[str] | None = None,
     serializer: Any | None = None,
     timeout: float | None = None,
+    structured_only: bool = False,
+    executor: ToolExecutor = "thread",
     auth: AuthCheck | list[AuthCheck] | None = None,
 ) -> Callable[[F], F]: ...
 @overload
@@ -364,6 +444,8 @@ def tool(
     exclude_args: list[str] | None = None,
     serializer: Any | None = None,
     timeout: float | None = None,
+    structured_only: bool = False,
+    executor: ToolExecutor = "thread",
     auth: AuthCheck | list[AuthCheck] | None = None,
 ) -> Callable[[F], F]: ...
 
@@ -384,6 +466,8 @@ def tool(
     exclude_args: list[str] | None = None,
     serializer: Any | None = None,
     timeout: float | None = None,
+    structured_only: bool = False,
+    executor: ToolExecutor = "thread",
     auth: AuthCheck | list[AuthCheck] | None = None,
 ) -> Any:
     """Standalone decorator to mark a function as an MCP tool.
@@ -416,6 +500,8 @@ def tool(
             exclude_args=exclude_args,
             serializer=serializer,
             timeout=timeout,
+            structured_only=structured_only,
+            executor=executor,
             auth=auth,
         )
         return FunctionTool.from_function(fn, metadata=tool_meta)
@@ -435,6 +521,8 @@ def tool(
             exclude_args=exclude_args,
             serializer=serializer,
             timeout=timeout,
+            structured_only=structured_only,
+            executor=executor,
             auth=auth,
         )
         target = fn.__func__ if hasattr(fn, "__func__") else fn
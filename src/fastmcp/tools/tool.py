@@ -42,7 +42,7 @@ if TYPE_CHECKING:
     from docket import Docket
     from docket.execution import Execution
 
-    from fastmcp.tools.function_tool import FunctionTool
+    from fastmcp.tools.function_tool import FunctionTool, ToolExecutor
     from fastmcp.tools.tool_transform import ArgTransform, TransformedTool
 
 # Re-export from function_tool module
@@ -153,6 +153,13 @@ class Tool(FastMCPComponent):
             description="Execution timeout in seconds. If None, no timeout is applied."
         ),
     ] = None
+    structured_only: Annotated[
+        bool,
+        Field(
+            description="If True, results with structured content are returned without a duplicate JSON text block.",
+            exclude=True,
+        ),
+    ] = False
 
     @model_validator(mode="after")
     def _validate_tool_name(self) -> Tool:
@@ -204,6 +211,8 @@ class Tool(FastMCPComponent):
         meta: dict[str, Any] | None = None,
         task: bool | TaskConfig | None = None,
         timeout: float | None = None,
+        structured_only: bool = False,
+        executor: ToolExecutor = "thread",
         auth: AuthCheck | list[AuthCheck] | None = None,
     ) -> FunctionTool:
         """Create a Tool from a function."""
@@ -224,6 +233,8 @@ class Tool(FastMCPComponent):
             meta=meta,
             task=task,
             timeout=timeout,
+            structured_only=structured_only,
+            executor=executor,
             auth=auth,
         )
 
@@ -244,21 +255,81 @@ class Tool(FastMCPComponent):
 
         Handles ToolResult passthrough and converts raw values using the tool's
         attributes (serializer, output_schema) for proper conversion.
+
+        Plain values are encoded to JSON exactly once: the text content is the
+        decoded encoding, and structured content (when needed) is parsed back
+        from the same bytes rather than built by a second serialization pass.
         """
         if isinstance(raw_value, ToolResult):
             return raw_value
 
+        if (
+            self.serializer is not None
+            or raw_value is None
+            or isinstance(raw_value, str)
+            or _contains_content(raw_value)
+        ):
+            return self._convert_result_legacy(raw_value)
+
+        if self.structured_only:
+            structured_only = self._convert_structured_only(raw_value)
+            if structured_only is not None:
+                return structured_only
+
+        try:
+            encoded = pydantic_core.to_json(raw_value)
+        except pydantic_core.PydanticSerializationError:
+            # Not JSON-serializable without the str() fallback, so there is no
+            # valid structured representation; emit text content only
+            return ToolResult(content=_convert_to_content(raw_value))
+
+        content: list[ContentBlock] = [TextContent(type="text", text=encoded.decode())]
+
+        if self.output_schema is None:
+            # No schema - only use structured_content for JSON objects
+            if not encoded.startswith(b"{"):
+                return _prevalidated_tool_result(content)
+            return _prevalidated_tool_result(content, pydantic_core.from_json(encoded))
+
+        structured = pydantic_core.from_json(encoded)
+        # Has output_schema - wrap if x-fastmcp-wrap-result is set
+        if self.output_schema.get("x-fastmcp-wrap-result"):
+            structured = {"result": structured}
+        elif not isinstance(structured, dict):
+            # Let ToolResult raise its standard error for non-object results
+            return ToolResult(content=content, structured_content=structured)
+        return _prevalidated_tool_result(content, structured)
+
+    def _convert_structured_only(self, raw_value: Any) -> ToolResult | None:
+        """Build a result that carries only structured content.
+
+        Returns None when the value has no structured representation, in which
+        case the caller falls back to emitting text content.
+        """
+        try:
+            structured = pydantic_core.to_jsonable_python(raw_value)
+        except pydantic_core.PydanticSerializationError:
+            return None
+        if self.output_schema is not None and self.output_schema.get(
+            "x-fastmcp-wrap-result"
+        ):
+            structured = {"result": structured}
+        if not isinstance(structured, dict):
+            return None
+        return _prevalidated_tool_result([], structured)
+
+    def _convert_result_legacy(self, raw_value: Any) -> ToolResult:
+        """Convert values that produce content directly.
+
+        Used for strings, content blocks, media helpers, and tools with a
+        custom (deprecated) serializer, where the text content is not derived
+        from the JSON encoding of the value.
+        """
         content = _convert_to_content(raw_value, serializer=self.serializer)
 
         # Skip structured content for ContentBlock types only if no output_schema
         # (if output_schema exists, MCP SDK requires structured_content)
-        if self.output_schema is None and (
-            isinstance(raw_value, ContentBlock | Audio | Image | File)
-            or (
-                isinstance(raw_value, list | tuple)
-                and any(isinstance(item, ContentBlock) for item in raw_value)
-            )
-        ):
+        if self.output_schema is None and _contains_content_blocks(raw_value):
             return ToolResult(content=content)
 
         try:
@@ -399,6 +470,38 @@ class Tool(FastMCPComponent):
         }
 
 
+def _contains_content_blocks(value: Any) -> bool:
+    """Whether a raw result is (or contains) content rather than plain data."""
+    if isinstance(value, ContentBlock | Audio | Image | File):
+        return True
+    return isinstance(value, list | tuple) and any(
+        isinstance(item, ContentBlock) for item in value
+    )
+
+
+def _contains_content(value: Any) -> bool:
+    """Whether a raw result has any item that converts to its own content block."""
+    if isinstance(value, ContentBlock | Audio | Image | File):
+        return True
+    return isinstance(value, list | tuple) and any(
+        isinstance(item, ContentBlock | Audio | Image | File) for item in value
+    )
+
+
+def _prevalidated_tool_result(
+    content: list[ContentBlock], structured_content: dict[str, Any] | None = None
+) -> ToolResult:
+    """Build a ToolResult from already-converted parts.
+
+    `ToolResult.__init__` normalizes its inputs with `to_jsonable_python`,
+    which would walk a large structured payload a second time. Callers must
+    only pass content blocks and JSON-compatible structured content.
+    """
+    return ToolResult.model_construct(
+        content=content, structured_content=structured_content, meta=None
+    )
+
+
 def _serialize_with_fallback(
     result: Any, serializer: ToolResultSerializerType | None = None
 ) -> str:
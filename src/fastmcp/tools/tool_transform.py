@@ -232,6 +232,174 @@ class ArgTransformConfig(FastMCPBaseModel):
         return ArgTransform(**self.model_dump(exclude_unset=True))  # pyright: ignore[reportAny]
 
 
+@dataclass(frozen=True)
+class _DefaultsStep:
+    """Argument values added by a forwarding plan.
+
+    Hidden arguments are always set (`override=True`); schema defaults only
+    fill in arguments the caller left out.
+    """
+
+    values: dict[str, Any]
+    factories: dict[str, Callable[[], Any]]
+    override: bool
+
+    def apply(self, args: dict[str, Any]) -> None:
+        if self.override:
+            args.update(self.values)
+            for name, factory in self.factories.items():
+                args[name] = factory()
+        else:
+            for name, value in self.values.items():
+                args.setdefault(name, value)
+            for name, factory in self.factories.items():
+                if name not in args:
+                    args[name] = factory()
+
+    def renamed(self, renames: dict[str, str]) -> _DefaultsStep:
+        return _DefaultsStep(
+            values={renames[name]: value for name, value in self.values.items()},
+            factories={renames[name]: f for name, f in self.factories.items()},
+            override=self.override,
+        )
+
+
+@dataclass(frozen=True)
+class _RequiredStep:
+    """Checks arguments a fused parent tool requires.
+
+    Maps argument names to the names reported when they are missing.
+    """
+
+    names: dict[str, str]
+
+    def apply(self, args: dict[str, Any]) -> None:
+        missing = [shown for name, shown in self.names.items() if name not in args]
+        if missing:
+            raise TypeError(
+                f"Missing required argument(s): {', '.join(sorted(missing))}"
+            )
+
+    def renamed(self, renames: dict[str, str]) -> _RequiredStep:
+        return _RequiredStep(
+            names={renames[name]: shown for name, shown in self.names.items()}
+        )
+
+
+@dataclass(frozen=True)
+class _ForwardingPlan:
+    """How a transformed tool's arguments map onto the tool it calls.
+
+    Built once when the transformed tool is created. When the parent is
+    itself a pure transformation (a TransformedTool without a custom
+    function), its plan is fused into this one and `target` is the first
+    tool down the chain that does real work, so forwarding builds a single
+    argument dict regardless of how many transforms are stacked.
+    """
+
+    valid: frozenset[str]
+    required: frozenset[str]
+    # Transformed argument name -> target argument name
+    renames: dict[str, str]
+    steps: tuple[_DefaultsStep | _RequiredStep, ...]
+    target: Tool
+    # Whether a fused parent's output schema disables structured content
+    strip_structured_content: bool = False
+
+    def map_arguments(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        unknown_args = kwargs.keys() - self.valid
+        if unknown_args:
+            raise TypeError(
+                f"Got unexpected keyword argument(s): {', '.join(sorted(unknown_args))}"
+            )
+
+        missing_args = self.required - kwargs.keys()
+        if missing_args:
+            raise TypeError(
+                f"Missing required argument(s): {', '.join(sorted(missing_args))}"
+            )
+
+        renames = self.renames
+        args = {renames[name]: value for name, value in kwargs.items()}
+        for step in self.steps:
+            step.apply(args)
+        return args
+
+    async def forward(self, kwargs: dict[str, Any]) -> ToolResult:
+        result = await self.target.run(self.map_arguments(kwargs))
+        if self.strip_structured_content:
+            return ToolResult(content=result.content, structured_content=None)
+        return result
+
+    def fuse(self, parent: Tool) -> _ForwardingPlan:
+        """Fold a pure-transformation parent into this plan, if possible."""
+        if not (
+            isinstance(parent, TransformedTool)
+            and type(parent).run is TransformedTool.run
+            and parent.fn is parent.forwarding_fn
+        ):
+            return self
+        parent_plan = parent._forwarding_plan
+        if parent_plan is None:
+            return self
+        parent_renames = parent_plan.renames
+        if not all(name in parent_renames for name in self.renames.values()):
+            return self
+
+        run_defaults = parent._run_defaults
+        return _ForwardingPlan(
+            valid=self.valid,
+            required=self.required,
+            renames={
+                name: parent_renames[old_name]
+                for name, old_name in self.renames.items()
+            },
+            steps=(
+                *(step.renamed(parent_renames) for step in self.steps),
+                run_defaults.renamed(parent_renames),
+                _RequiredStep(
+                    names={parent_renames[name]: name for name in parent_plan.required}
+                ),
+                *parent_plan.steps,
+            ),
+            target=parent_plan.target,
+            strip_structured_content=(
+                parent._strips_structured_content
+                or parent_plan.strip_structured_content
+            ),
+        )
+
+
+def _build_run_defaults(
+    parameters: dict[str, Any], transform_args: dict[str, ArgTransform]
+) -> _DefaultsStep:
+    """Collect the schema defaults a transformed tool fills in on each run.
+
+    Defaults that come from an ArgTransform's default_factory are called on
+    every run instead of using the value cached in the schema.
+    """
+    factories: dict[str, Callable[[], Any]] = {}
+    for orig_name, transform in transform_args.items():
+        if transform.default_factory is not NotSet and callable(
+            transform.default_factory
+        ):
+            transform_name = (
+                transform.name if transform.name is not NotSet else orig_name
+            )
+            factories.setdefault(transform_name, transform.default_factory)
+
+    values: dict[str, Any] = {}
+    run_factories: dict[str, Callable[[], Any]] = {}
+    for param_name, param_schema in parameters.get("properties", {}).items():
+        if "default" not in param_schema:
+            continue
+        if param_name in factories:
+            run_factories[param_name] = factories[param_name]
+        else:
+            values[param_name] = param_schema["default"]
+    return _DefaultsStep(values=values, factories=run_factories, override=False)
+
+
 class TransformedTool(Tool):
     """A tool that is transformed from another tool.
 
@@ -261,6 +429,31 @@ class TransformedTool(Tool):
     ]  # Always present, handles arg transformation
     transform_args: dict[str, ArgTransform]
 
+    @property
+    def _forwarding_plan(self) -> _ForwardingPlan | None:
+        """The argument mapping behind forwarding_fn, if it was built here."""
+        return getattr(self.forwarding_fn, "plan", None)
+
+    @property
+    def _run_defaults(self) -> _DefaultsStep:
+        """Schema defaults filled in on each run, cached like `key`."""
+        derived = self._derived_values()
+        defaults = derived.get("run_defaults")
+        if defaults is None:
+            defaults = derived["run_defaults"] = _build_run_defaults(
+                self.parameters, self.transform_args
+            )
+        return defaults
+
+    @property
+    def _strips_structured_content(self) -> bool:
+        """Whether an explicit non-object output schema disables structured content."""
+        return (
+            self.output_schema is not None
+            and self.output_schema.get("type") != "object"
+            and not self.output_schema.get("x-fastmcp-wrap-result")
+        )
+
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Run the tool with context set for forward() functions.
 
@@ -278,33 +471,7 @@ class TransformedTool(Tool):
         # Fill in missing arguments with schema defaults to ensure
         # ArgTransform defaults take precedence over function defaults
         arguments = arguments.copy()
-        properties = self.parameters.get("properties", {})
-
-        for param_name, param_schema in properties.items():
-            if param_name not in arguments and "default" in param_schema:
-                # Check if this parameter has a default_factory from transform_args
-                # We need to call the factory for each run, not use the cached schema value
-                has_factory_default = False
-                if self.transform_args:
-                    # Find the original parameter name that maps to this param_name
-                    for orig_name, transform in self.transform_args.items():
-                        transform_name = (
-                            transform.name
-                            if transform.name is not NotSet
-                            else orig_name
-                        )
-                        if (
-                            transform_name == param_name
-                            and transform.default_factory is not NotSet
-                        ):
-                            # Type check to ensure default_factory is callable
-                            if callable(transform.default_factory):
-                                arguments[param_name] = transform.default_factory()
-                                has_factory_default = True
-                                break
-
-                if not has_factory_default:
-                    arguments[param_name] = param_schema["default"]
+        self._run_defaults.apply(arguments)
 
         token = _current_tool.set(self)
         try:
@@ -312,27 +479,15 @@ class TransformedTool(Tool):
 
             # If transform function returns ToolResult, respect our output_schema setting
             if isinstance(result, ToolResult):
-                if self.output_schema is None:
-                    # Check if this is from a custom function that returns ToolResult
-
-                    return_annotation = inspect.signature(self.fn).return_annotation
-                    if return_annotation is ToolResult:
-                        # Custom function returns ToolResult - preserve its content
-                        return result
-                    else:
-                        # Forwarded call with no explicit schema - preserve parent's structured content
-                        # The parent tool may have generated structured content via its own fallback logic
-                        return result
-                elif self.output_schema.get(
-                    "type"
-                ) != "object" and not self.output_schema.get("x-fastmcp-wrap-result"):
+                if self._strips_structured_content:
                     # Non-object explicit schemas disable structured content
                     return ToolResult(
                         content=result.content,
                         structured_content=None,
                     )
-                else:
-                    return result
+                # Otherwise preserve the result, including any structured
+                # content the parent generated via its own fallback logic
+                return result
 
             # Otherwise convert to content and create ToolResult with proper structured content
 
@@ -638,7 +793,9 @@ class TransformedTool(Tool):
         new_props = {}
         new_required = set()
         new_to_old = {}
-        hidden_defaults = {}  # Track hidden parameters with constant values
+        # Hidden parameters with constant values or factories
+        hidden_values: dict[str, Any] = {}
+        hidden_factories: dict[str, Callable[[], Any]] = {}
 
         for old_name, old_schema in parent_props.items():
             # Check if parameter is in transform_args
@@ -661,9 +818,12 @@ class TransformedTool(Tool):
                         f"and no default or default_factory provided in ArgTransform. Either provide a default "
                         f"or default_factory in ArgTransform or don't hide required parameters."
                     )
-                if has_user_default:
-                    # Store info for later factory calling or direct value
-                    hidden_defaults[old_name] = transform
+                if transform.default is not NotSet:
+                    hidden_values[old_name] = transform.default
+                elif transform.default_factory is not NotSet and callable(
+                    transform.default_factory
+                ):
+                    hidden_factories[old_name] = transform.default_factory
                 # Skip adding to schema (not exposed to clients)
                 continue
 
@@ -692,42 +852,30 @@ class TransformedTool(Tool):
             schema["$defs"] = parent_defs
             schema = compress_schema(schema)
 
-        # Create forwarding function that closes over everything it needs
-        async def _forward(**kwargs: Any):
-            # Validate arguments
-            valid_args = set(new_props.keys())
-            provided_args = set(kwargs.keys())
-            unknown_args = provided_args - valid_args
-
-            if unknown_args:
-                raise TypeError(
-                    f"Got unexpected keyword argument(s): {', '.join(sorted(unknown_args))}"
-                )
-
-            # Check required arguments
-            missing_args = new_required - provided_args
-            if missing_args:
-                raise TypeError(
-                    f"Missing required argument(s): {', '.join(sorted(missing_args))}"
+        # Compile the argument mapping once, folding in the parent's own
+        # mapping when the parent is a pure transformation
+        plan = _ForwardingPlan(
+            valid=frozenset(new_props),
+            required=frozenset(new_required),
+            renames=new_to_old,
+            steps=(
+                (
+                    _DefaultsStep(
+                        values=hidden_values,
+                        factories=hidden_factories,
+                        override=True,
+                    ),
                 )
+                if hidden_values or hidden_factories
+                else ()
+            ),
+            target=parent_tool,
+        ).fuse(parent_tool)
 
-            # Map arguments to parent names
-            parent_args = {}
-            for new_name, value in kwargs.items():
-                old_name = new_to_old.get(new_name, new_name)
-                parent_args[old_name] = value
-
-            # Add hidden defaults (constant values for hidden parameters)
-            for old_name, transform in hidden_defaults.items():
-                if transform.default is not NotSet:
-                    parent_args[old_name] = transform.default
-                elif transform.default_factory is not NotSet:
-                    # Type check to ensure default_factory is callable
-                    if callable(transform.default_factory):
-                        parent_args[old_name] = transform.default_factory()
-
-            return await parent_tool.run(parent_args)
+        async def _forward(**kwargs: Any):
+            return await plan.forward(kwargs)
 
+        _forward.plan = plan  # type: ignore[attr-defined]
         return schema, _forward
 
     @staticmethod
@@ -1,14 +1,21 @@
 """Async utilities for FastMCP."""
 
 import functools
+import os
 from collections.abc import Awaitable, Callable
 from typing import Any, Literal, TypeVar, overload
 
 import anyio
+import anyio.to_process
+from anyio.lowlevel import RunVar
 from anyio.to_thread import run_sync as run_sync_in_threadpool
 
+import fastmcp
+
 T = TypeVar("T")
 
+_process_limiter: RunVar[anyio.CapacityLimiter] = RunVar("_process_limiter")
+
 
 async def call_sync_fn_in_threadpool(
     fn: Callable[..., Any], *args: Any, **kwargs: Any
@@ -21,6 +28,57 @@ async def call_sync_fn_in_threadpool(
     return await run_sync_in_threadpool(functools.partial(fn, *args, **kwargs))
 
 
+def get_process_limiter() -> anyio.CapacityLimiter:
+    """Return the limiter that bounds the worker process pool for this event loop.
+
+    The pool size comes from `settings.process_pool_max_workers`, falling back
+    to the number of CPUs.
+    """
+    try:
+        return _process_limiter.get()
+    except LookupError:
+        max_workers = fastmcp.settings.process_pool_max_workers or os.cpu_count() or 1
+        limiter = anyio.CapacityLimiter(max_workers)
+        _process_limiter.set(limiter)
+        return limiter
+
+
+async def call_sync_fn_in_process_pool(
+    fn: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Call a sync function in a worker process to avoid holding the GIL.
+
+    The function and its arguments are pickled, so `fn` must be importable
+    by reference (e.g. a module-level function) and the arguments and return
+    value must be picklable. Cancelling the call (including via a timeout)
+    terminates the worker process running it.
+    """
+    return await anyio.to_process.run_sync(
+        functools.partial(fn, *args, **kwargs),
+        cancellable=True,
+        limiter=get_process_limiter(),
+    )
+
+
+def _noop() -> None:
+    return None
+
+
+async def warm_process_pool(workers: int | None = None) -> None:
+    """Start worker processes ahead of the first process-pool call.
+
+    Args:
+        workers: Number of workers to start. Defaults to the pool size.
+    """
+    limiter = get_process_limiter()
+    count = workers if workers is not None else int(limiter.total_tokens)
+    async with anyio.create_task_group() as tg:
+        for _ in range(count):
+            tg.start_soon(
+                functools.partial(anyio.to_process.run_sync, _noop, limiter=limiter)
+            )
+
+
 @overload
 async def gather(
     *awaitables: Awaitable[T],
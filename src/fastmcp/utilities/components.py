@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import hashlib
+import json
+import weakref
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, TypedDict, cast
 
 from mcp.types import Icon
-from pydantic import BeforeValidator, Field
+from pydantic import BeforeValidator, Field, PrivateAttr
 from typing_extensions import Self, TypeVar
 
 from fastmcp.server.tasks.config import TaskConfig
 from fastmcp.utilities.types import FastMCPBaseModel
+from fastmcp.utilities.versions import VersionKey, parse_version_key
 
 if TYPE_CHECKING:
     from docket import Docket
@@ -58,6 +62,85 @@ def _coerce_version(v: str | int | None) -> str | None:
     return version
 
 
+C = TypeVar("C")
+D = TypeVar("D")
+
+# Stands in for a copy that is the original object
+_UNCHANGED = object()
+
+
+# Advanced on every public field write to any component
+_revision = 0
+
+
+def component_revision() -> int:
+    """Return a counter that advances whenever any component field is assigned.
+
+    Caches built from components include it in their key so that in-place
+    edits such as `tool.description = "..."` are picked up.
+    """
+    return _revision
+
+
+class CopyCache:
+    """Reuses the copy derived from a component while the original is alive.
+
+    Transforms and providers that rebuild components on every list call use
+    this to return the same derived object for the same original, which keeps
+    component identity stable so the server can reuse its wire-format catalog.
+    `make_copy` may return the original unchanged. Entries are dropped when
+    the original is garbage collected, and rebuilt after any component field
+    is assigned (see `component_revision`).
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref[Any], Any, int]] = {}
+
+    def get(self, original: C, make_copy: Callable[[C], D]) -> D:
+        """Return the cached copy of `original`, creating it with `make_copy` on a miss."""
+        key = id(original)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is original and entry[2] == _revision:
+            return cast("D", original) if entry[1] is _UNCHANGED else entry[1]
+        copy = make_copy(original)
+        # Holding the original itself would keep it alive forever
+        cached = _UNCHANGED if copy is original else copy
+        self._entries[key] = (
+            weakref.ref(original, self._discard(key)),
+            cached,
+            _revision,
+        )
+        return copy
+
+    def _discard(self, key: int) -> Callable[[weakref.ref[Any]], None]:
+        cache = weakref.ref(self)
+
+        def callback(ref: weakref.ref[Any]) -> None:
+            if (live := cache()) is None:
+                return
+            entry = live._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del live._entries[key]
+
+        return callback
+
+
+def _canonicalize(value: Any) -> Any:
+    """Normalize a model dump so equal content always serializes identically."""
+    if isinstance(value, dict):
+        return {str(_canonicalize(k)): _canonicalize(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonicalize(v) for v in value]
+    if isinstance(value, set | frozenset):
+        return sorted((_canonicalize(v) for v in value), key=repr)
+    # True == 1 == 1.0 in Python, but each has its own JSON form
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
 class FastMCPComponent(FastMCPBaseModel):
     """Base class for FastMCP tools, prompts, resources, and resource templates."""
 
@@ -108,6 +191,34 @@ class FastMCPComponent(FastMCPBaseModel):
         Field(description="Background task execution configuration (SEP-1686)."),
     ] = Field(default_factory=lambda: TaskConfig(mode="forbidden"))
 
+    # Derived values (key, version key, content hash) computed on first use.
+    # Public field assignment and model_copy() start a fresh dict; in-place
+    # mutation of nested values (e.g. `component.tags.add(...)`) is not
+    # detected, so reassign the field instead.
+    _derived: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _revision
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._reset_derived()
+            _revision += 1
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copy = super().model_copy(update=update, deep=deep)
+        copy._reset_derived()
+        return copy
+
+    def _derived_values(self) -> dict[str, Any]:
+        """Return the `_derived` dict, bypassing pydantic's attribute lookup."""
+        return cast("dict[str, Any]", self.__pydantic_private__)["_derived"]
+
+    def _reset_derived(self) -> None:
+        # Copies may share the old dict, so replace it rather than clear it
+        cast("dict[str, Any]", self.__pydantic_private__)["_derived"] = {}
+
     @classmethod
     def make_key(cls, identifier: str) -> str:
         """Construct the lookup key for this component type.
@@ -132,12 +243,59 @@ class FastMCPComponent(FastMCPBaseModel):
         The @ suffix is ALWAYS present to enable unambiguous parsing of keys
         (URIs may contain @ characters, so we always include the delimiter).
 
+        Computed once by `_compute_key()` and cached until a field changes.
+        """
+        derived = self._derived_values()
+        key = derived.get("key")
+        if key is None:
+            key = derived["key"] = self._compute_key()
+        return key
+
+    def _compute_key(self) -> str:
+        """Build the lookup key.
+
         Subclasses should override this to use their specific identifier.
         Base implementation uses name.
         """
         base_key = self.make_key(self.name)
         return f"{base_key}@{self.version or ''}"
 
+    @property
+    def version_key(self) -> VersionKey:
+        """The parsed, sortable form of `version`, cached like `key`."""
+        derived = self._derived_values()
+        version_key = derived.get("version_key")
+        if version_key is None:
+            version_key = derived["version_key"] = parse_version_key(self.version)
+        return version_key
+
+    @property
+    def content_hash(self) -> str:
+        """A digest of the component's full content, cached like `key`.
+
+        Components with equal content have equal hashes, as long as all of
+        their values have a JSON form. Other values (such as functions)
+        contribute their repr, which equal values need not share.
+        """
+        derived = self._derived_values()
+        digest = derived.get("content_hash")
+        if digest is None:
+            exact = True
+
+            def fallback(value: Any) -> str:
+                nonlocal exact
+                exact = False
+                return repr(value)
+
+            payload = json.dumps(
+                _canonicalize(self.model_dump()), sort_keys=True, default=fallback
+            )
+            digest = derived["content_hash"] = hashlib.blake2b(
+                payload.encode(), digest_size=16
+            ).hexdigest()
+            derived["content_hash_exact"] = exact
+        return digest
+
     def get_meta(self) -> dict[str, Any]:
         """Get the meta information about the component.
 
@@ -171,6 +329,17 @@ class FastMCPComponent(FastMCPBaseModel):
             return False
         if not isinstance(other, type(self)):
             return False
+        if self is other:
+            return True
+        # Differing hashes prove inequality only when both were computed from
+        # JSON values alone; reprs of equal values can differ and reprs of
+        # distinct values can match, so anything else is confirmed
+        if (
+            self.content_hash != other.content_hash
+            and self._derived_values()["content_hash_exact"]
+            and other._derived_values()["content_hash_exact"]
+        ):
+            return False
         return self.model_dump() == other.model_dump()
 
     def __repr__(self) -> str:
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Any
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 
+import jsonschema
 from jsonref import JsonRefError, replace_refs
 
+from fastmcp.utilities.types import identity_cache
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
 
 def dereference_refs(schema: dict[str, Any]) -> dict[str, Any]:
     """Resolve all $ref references in a JSON schema by inlining definitions.
@@ -402,3 +409,34 @@ def compress_schema(
     )
 
     return schema
+
+
+@identity_cache(maxsize=4096)
+def get_schema_validator(schema: Mapping[str, Any]) -> Validator:
+    """Return a compiled validator for a JSON schema.
+
+    Checking a schema against its metaschema and building a validator costs
+    far more than validating a typical instance, so validators are built once
+    per schema object and reused.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def validate_json_schema(instance: Any, schema: Mapping[str, Any]) -> None:
+    """Validate an instance against a JSON schema using a cached validator.
+
+    Behaves like `jsonschema.validate`, raising the same best-matching error.
+
+    Raises:
+        jsonschema.ValidationError: If the instance is invalid
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    validator = get_schema_validator(schema)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
@@ -0,0 +1,133 @@
+"""On-disk cache of the JSON schemas generated for function tools.
+
+Generating a tool's input and output schemas builds pydantic TypeAdapters and
+walks the resulting core schemas, which dominates startup for servers with
+many tools. With `settings.schema_cache` enabled, each function's schemas are
+stored in a small JSON file whose name is derived from the function's
+qualified name, a hash of its source, and the pydantic and FastMCP versions,
+so a warm restart reads them back instead of regenerating them.
+
+Only the function's own source is hashed. If its annotations refer to types
+defined elsewhere (for example a pydantic model in another module), changes to
+those types are not detected until the function itself changes; delete the
+cache directory to force regeneration.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+import fastmcp
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+CachedSchemas = tuple[dict[str, Any], dict[str, Any] | None]
+
+
+def schema_cache_key(fn: Callable[..., Any], *options: object) -> str | None:
+    """Return the cache key for a function's schemas.
+
+    Args:
+        fn: The function whose schemas are cached
+        *options: Anything else that affects the generated schemas
+
+    Returns:
+        A hex digest, or None if the function's source is unavailable (for
+        example, functions defined in a REPL or created dynamically) or its
+        annotations, defaults or options have no stable repr (for example, a
+        default object whose repr includes its memory address).
+    """
+    try:
+        source = inspect.getsource(fn)
+    except (OSError, TypeError):
+        return None
+    # Functions built by a factory share their source but not the annotations
+    # and defaults they close over
+    values = [
+        repr(getattr(fn, "__annotations__", None)),
+        repr(getattr(fn, "__defaults__", None)),
+        repr(getattr(fn, "__kwdefaults__", None)),
+        *(repr(option) for option in options),
+    ]
+    # A repr with a memory address differs on every run, so the entry would
+    # never be hit again
+    if any(" at 0x" in value for value in values):
+        return None
+    qualname = getattr(fn, "__qualname__", None) or getattr(fn, "__name__", "")
+    parts = [
+        str(SchemaCache.VERSION),
+        fastmcp.__version__,
+        pydantic.VERSION,
+        f"{getattr(fn, '__module__', '')}:{qualname}",
+        hashlib.sha256(source.encode()).hexdigest(),
+        *values,
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class SchemaCache:
+    """A directory of cached schemas, one file per function.
+
+    Entries are immutable: any change to a function produces a new key, so
+    stale entries are never read and can be deleted at any time.
+    """
+
+    VERSION = 1
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CachedSchemas | None:
+        """Return the cached (input schema, output schema), if present."""
+        try:
+            data = json.loads(self._path(key).read_bytes())
+            return data["input_schema"], data["output_schema"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable schema cache entry {key}: {e}")
+            return None
+
+    def set(
+        self,
+        key: str,
+        input_schema: dict[str, Any],
+        output_schema: dict[str, Any] | None,
+    ) -> None:
+        """Store a function's schemas. Write failures are logged and ignored."""
+        path = self._path(key)
+        try:
+            data = json.dumps(
+                {"input_schema": input_schema, "output_schema": output_schema}
+            )
+        except (TypeError, ValueError) as e:
+            # Schemas with non-JSON values (e.g. defaults of custom types)
+            logger.debug(f"Not caching schemas for {key}: {e}")
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(data)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write schema cache entry {path}: {e}")
+
+
+def get_schema_cache() -> SchemaCache | None:
+    """Return the schema cache configured in settings, or None if disabled."""
+    settings = fastmcp.settings
+    if not settings.schema_cache:
+        return None
+    return SchemaCache(settings.schema_cache_dir or settings.home / "schema-cache")
@@ -4,8 +4,10 @@ import base64
 import inspect
 import mimetypes
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
-from functools import lru_cache
+from functools import lru_cache, wraps
 from pathlib import Path
 from types import EllipsisType, UnionType
 from typing import (
@@ -41,14 +43,80 @@ class FastMCPBaseModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-@lru_cache(maxsize=5000)
-def get_cached_typeadapter(cls: T) -> TypeAdapter[T]:
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def identity_cache(
+    maxsize: int = 1024,
+) -> Callable[[Callable[[K], V]], Callable[[K], V]]:
+    """Cache a one-argument function by the identity of its argument.
+
+    Like `functools.lru_cache`, but for unhashable arguments such as JSON
+    schema dicts that are built once and then reused. Each entry keeps its
+    argument alive, so an id can't be reused while cached. Mutating an
+    argument in place does not invalidate its entry.
+    """
+
+    def decorator(fn: Callable[[K], V]) -> Callable[[K], V]:
+        cache: OrderedDict[int, tuple[K, V]] = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(arg: K) -> V:
+            key = id(arg)
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] is arg:
+                    cache.move_to_end(key)
+                    return entry[1]
+            value = fn(arg)
+            with lock:
+                cache[key] = (arg, value)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+_typeadapter_cache: Callable[[Any], TypeAdapter[Any]] | None = None
+
+
+def get_cached_typeadapter(cls: Any) -> TypeAdapter[Any]:
     """
     TypeAdapters are heavy objects, and in an application context we'd typically
     create them once in a global scope and reuse them as often as possible.
     However, this isn't feasible for user-generated functions. Instead, we use a
     cache to minimize the cost of creating them as much as possible.
+
+    The cache holds `settings.type_adapter_cache_size` adapters. Servers with
+    more tools than that should raise it so adapters aren't rebuilt on every
+    call.
+    """
+    cache = _typeadapter_cache
+    if cache is None:
+        import fastmcp
+
+        configure_typeadapter_cache(fastmcp.settings.type_adapter_cache_size)
+        cache = _typeadapter_cache
+        assert cache is not None
+    return cache(cls)
+
+
+def configure_typeadapter_cache(maxsize: int | None) -> None:
+    """Resize the cache used by `get_cached_typeadapter`.
+
+    Cached adapters are discarded. Pass None for an unbounded cache.
     """
+    global _typeadapter_cache
+    _typeadapter_cache = lru_cache(maxsize=maxsize)(_create_typeadapter)
+
+
+def _create_typeadapter(cls: T) -> TypeAdapter[T]:
     # For functions, process annotations to handle forward references and convert
     # Annotated[Type, "string"] to Annotated[Type, Field(description="string")]
     if inspect.isfunction(cls) or inspect.ismethod(cls):
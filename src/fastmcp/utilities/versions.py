@@ -213,7 +213,7 @@ def version_sort_key(component: FastMCPComponent) -> VersionKey:
         highest = max(tools, key=version_sort_key)  # Returns tool_v2
         ```
     """
-    return parse_version_key(component.version)
+    return component.version_key
 
 
 def compare_versions(a: str | None, b: str | None) -> int:
@@ -0,0 +1,62 @@
+"""Tests for the fastmcp diagnose CLI."""
+
+import pytest
+
+from fastmcp.cli.diagnose import (
+    diagnose_app,
+    import_command,
+    measure_import,
+    parse_importtime,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        40 |        160 | marshal
+/path/to/module.py:1: DeprecationWarning: something
+import time:       300 |        300 |     fastmcp.utilities
+import time:       900 |       1200 |   fastmcp.server
+import time:      5000 |       6200 | fastmcp
+"""
+
+
+class TestParseImporttime:
+    def test_parses_records(self):
+        timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert [t.module for t in timings] == [
+            "_io",
+            "marshal",
+            "fastmcp.utilities",
+            "fastmcp.server",
+            "fastmcp",
+        ]
+        assert timings[-1].self_us == 5000
+        assert timings[-1].cumulative_us == 6200
+
+    def test_records_depth(self):
+        timings = {t.module: t for t in parse_importtime(IMPORTTIME_OUTPUT)}
+
+        assert timings["fastmcp"].depth == 0
+        assert timings["fastmcp.server"].depth == 1
+        assert timings["fastmcp.utilities"].depth == 2
+
+
+class TestImportCommand:
+    def test_command_parsing(self):
+        command, bound, _ = diagnose_app.parse_args(["import", "--top", "5"])
+        assert command is import_command
+        assert bound.arguments["top"] == 5
+
+    @pytest.mark.timeout(30)
+    def test_measure_import(self):
+        timings = measure_import("fastmcp.utilities")
+
+        assert any(t.module == "fastmcp.utilities" for t in timings)
+
+    @pytest.mark.timeout(30)
+    def test_missing_module_exits(self):
+        with pytest.raises(SystemExit) as exc_info:
+            import_command("fastmcp_does_not_exist")
+
+        assert exc_info.value.code == 1
@@ -0,0 +1,118 @@
+"""
+Tests for the client-wide TaskWatcher that backs Task.wait() polling.
+
+Uses a stand-in client so poll traffic can be counted without the server
+sending notifications/tasks/status.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from mcp import McpError
+from mcp.types import ErrorData, GetTaskResult, ListTasksResult, Task
+
+from fastmcp.client.tasks import TaskWatcher, ToolTask
+
+
+def _status(task_id: str, status: str, poll_interval: int = 10) -> GetTaskResult:
+    now = datetime.now(timezone.utc)
+    return GetTaskResult(
+        taskId=task_id,
+        status=status,  # type: ignore[arg-type]
+        createdAt=now,
+        lastUpdatedAt=now,
+        ttl=None,
+        pollInterval=poll_interval,
+    )
+
+
+class FakeClient:
+    """Answers tasks/get and tasks/list from a status table."""
+
+    def __init__(self, *, supports_list: bool = True):
+        self.session = object()
+        self.statuses: dict[str, str] = {}
+        self.supports_list = supports_list
+        self.get_calls = 0
+        self.list_calls = 0
+        self._task_watcher = TaskWatcher(self)  # type: ignore[arg-type]
+
+    async def get_task_status(self, task_id: str) -> GetTaskResult:
+        self.get_calls += 1
+        return _status(task_id, self.statuses[task_id])
+
+    async def _list_tasks_page(self, cursor: str | None = None) -> ListTasksResult:
+        self.list_calls += 1
+        if not self.supports_list:
+            return ListTasksResult(tasks=[])
+        tasks = [
+            Task.model_validate(_status(task_id, status).model_dump())
+            for task_id, status in self.statuses.items()
+        ]
+        return ListTasksResult(tasks=tasks)
+
+    def make_task(self, task_id: str, status: str = "working") -> ToolTask:
+        self.statuses[task_id] = status
+        task = ToolTask(self, task_id, tool_name="tool")  # type: ignore[arg-type]
+        # Seed the server's suggested interval, as a first poll would
+        task._status_cache = _status(task_id, status)
+        return task
+
+
+async def _complete_after(client: FakeClient, delay: float) -> None:
+    await asyncio.sleep(delay)
+    for task_id in client.statuses:
+        client.statuses[task_id] = "completed"
+
+
+async def test_many_waiters_share_one_loop_and_batch_polls():
+    client = FakeClient()
+    tasks = [client.make_task(f"task-{i}") for i in range(20)]
+
+    completer = asyncio.create_task(_complete_after(client, 0.1))
+    results = await asyncio.gather(*(task.wait(timeout=5) for task in tasks))
+    await completer
+
+    assert all(result.status == "completed" for result in results)
+    # Polling each task every 10ms for 0.1s would take ~200 requests
+    assert client.list_calls > 0
+    assert client.list_calls + client.get_calls < 40
+    assert client._task_watcher._entries == {}
+
+
+async def test_falls_back_to_get_when_list_is_empty():
+    client = FakeClient(supports_list=False)
+    tasks = [client.make_task(f"task-{i}") for i in range(3)]
+
+    completer = asyncio.create_task(_complete_after(client, 0.05))
+    await asyncio.gather(*(task.wait(timeout=5) for task in tasks))
+    await completer
+
+    assert client.list_calls == 1
+    assert client.get_calls >= 3
+    assert client._task_watcher._bulk_supported is False
+
+
+async def test_unchanged_status_backs_off():
+    client = FakeClient()
+    task = client.make_task("task-1")
+
+    with pytest.raises(TimeoutError):
+        await task.wait(timeout=0.5)
+
+    # A fixed 10ms interval would poll ~50 times in 0.5s
+    assert 0 < client.get_calls < 15
+
+
+async def test_poll_error_raises_from_wait():
+    client = FakeClient()
+    task = client.make_task("task-1")
+
+    async def fail(task_id: str) -> GetTaskResult:
+        raise McpError(ErrorData(code=-32602, message="Task task-1 not found"))
+
+    client.get_task_status = fail  # type: ignore[method-assign]
+
+    with pytest.raises(McpError, match="not found"):
+        await task.wait(timeout=2)
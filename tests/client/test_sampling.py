@@ -1392,6 +1392,71 @@ class TestSampleStep:
         assert result.data == "Done"
         assert call_count == 2
 
+    async def test_sample_step_reuses_toolset(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a SamplingToolset is converted once across loop iterations."""
+        from mcp.types import CreateMessageResultWithTools, ToolUseContent
+
+        from fastmcp.server.sampling import SamplingToolset
+
+        sdk_conversions = 0
+        to_sdk_tool = SamplingTool._to_sdk_tool
+
+        def counting_to_sdk_tool(self: SamplingTool):
+            nonlocal sdk_conversions
+            sdk_conversions += 1
+            return to_sdk_tool(self)
+
+        monkeypatch.setattr(SamplingTool, "_to_sdk_tool", counting_to_sdk_tool)
+
+        def my_tool(x: int) -> str:
+            """A test tool."""
+            return f"result:{x}"
+
+        def sampling_handler(
+            messages: list[SamplingMessage], params: SamplingParams, ctx: RequestContext
+        ) -> CreateMessageResultWithTools:
+            assert params.tools is not None
+            assert [t.name for t in params.tools] == ["my_tool"]
+            if len(messages) < 7:
+                return CreateMessageResultWithTools(
+                    role="assistant",
+                    content=[
+                        ToolUseContent(
+                            type="tool_use",
+                            id=f"call_{len(messages)}",
+                            name="my_tool",
+                            input={"x": len(messages)},
+                        )
+                    ],
+                    model="test-model",
+                    stopReason="toolUse",
+                )
+            return CreateMessageResultWithTools(
+                role="assistant",
+                content=[TextContent(type="text", text="Done")],
+                model="test-model",
+                stopReason="endTurn",
+            )
+
+        mcp = FastMCP(sampling_handler=sampling_handler)
+
+        @mcp.tool
+        async def test_step(context: Context) -> str:
+            toolset = SamplingToolset([my_tool])
+            messages: str | list[SamplingMessage] = "Run tool"
+
+            while True:
+                step = await context.sample_step(messages=messages, tools=toolset)
+                if not step.is_tool_use:
+                    return step.text or ""
+                messages = step.history
+
+        async with Client(mcp) as client:
+            result = await client.call_tool("test_step", {})
+
+        assert result.data == "Done"
+        assert sdk_conversions == 1
+
     async def test_sample_step_execute_tools_false(self):
         """Test sample_step with execute_tools=False doesn't execute tools."""
         from mcp.types import CreateMessageResultWithTools, ToolUseContent
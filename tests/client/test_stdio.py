@@ -2,13 +2,19 @@ import asyncio
 import gc
 import inspect
 import os
+import sys
+import time
 import weakref
 
 import psutil
 import pytest
 
 from fastmcp import Client, FastMCP
-from fastmcp.client.transports import PythonStdioTransport, StdioTransport
+from fastmcp.client.transports import (
+    PooledStdioTransport,
+    PythonStdioTransport,
+    StdioTransport,
+)
 
 
 def running_under_debugger():
@@ -255,6 +261,129 @@ class TestKeepAlive:
                 pass
 
 
+class TestPooledStdioTransport:
+    @pytest.fixture
+    def stdio_script(self, tmp_path):
+        script = inspect.cleandoc('''
+            import os
+            import time
+            from fastmcp import FastMCP
+
+            mcp = FastMCP()
+
+            @mcp.tool
+            def pid() -> int:
+                """Gets PID of server"""
+                return os.getpid()
+
+            @mcp.tool
+            def slow_pid() -> int:
+                """Gets PID of server after blocking for a moment"""
+                time.sleep(0.5)
+                return os.getpid()
+
+            @mcp.tool
+            def crash() -> None:
+                """Exits the server process"""
+                os._exit(1)
+
+            if __name__ == "__main__":
+                mcp.run()
+            ''')
+        script_file = tmp_path / "stdio.py"
+        script_file.write_text(script)
+        return script_file
+
+    def make_transport(self, stdio_script, **kwargs) -> PooledStdioTransport:
+        kwargs.setdefault("stateless", True)
+        return PooledStdioTransport(
+            command=sys.executable, args=[str(stdio_script)], **kwargs
+        )
+
+    def test_multiple_workers_require_stateless(self, stdio_script):
+        with pytest.raises(ValueError, match="stateless=True"):
+            PooledStdioTransport(
+                command=sys.executable, args=[str(stdio_script)], workers=2
+            )
+
+    def test_single_worker_does_not_require_stateless(self, stdio_script):
+        transport = PooledStdioTransport(
+            command=sys.executable, args=[str(stdio_script)], workers=1
+        )
+        assert transport.workers == 1
+
+    async def test_idle_worker_is_reused(self, stdio_script):
+        transport = self.make_transport(stdio_script, workers=3)
+        try:
+            pids = set()
+            for _ in range(3):
+                async with Client(transport) as client:
+                    pids.add((await client.call_tool("pid")).data)
+            assert len(pids) == 1
+            assert transport.outstanding == [0, 0, 0]
+        finally:
+            await transport.close()
+
+    @pytest.mark.timeout(15)
+    async def test_concurrent_sessions_spread_across_workers(self, stdio_script):
+        transport = self.make_transport(stdio_script, workers=2)
+        client = Client(transport)
+
+        async def call() -> int:
+            async with client.new() as session_client:
+                return (await session_client.call_tool("slow_pid")).data
+
+        try:
+            pids = await asyncio.gather(call(), call())
+            assert len(set(pids)) == 2
+        finally:
+            await transport.close()
+
+    @pytest.mark.timeout(15)
+    async def test_prespawn_starts_all_workers(self, stdio_script):
+        transport = self.make_transport(stdio_script, workers=2)
+        try:
+            await transport.start()
+            assert all(worker.running for worker in transport._workers)
+        finally:
+            await transport.close()
+        assert not any(worker.running for worker in transport._workers)
+
+    @pytest.mark.timeout(15)
+    async def test_crashed_worker_is_restarted(self, stdio_script):
+        transport = self.make_transport(stdio_script, workers=1)
+        try:
+            async with Client(transport) as client:
+                pid1 = (await client.call_tool("pid")).data
+                with pytest.raises(Exception):
+                    await client.call_tool("crash")
+
+            async with Client(transport) as client:
+                pid2 = (await client.call_tool("pid")).data
+
+            assert pid1 != pid2
+            assert transport._workers[0].failures == 0
+        finally:
+            await transport.close()
+
+    async def test_failed_restarts_back_off(self):
+        transport = PooledStdioTransport(
+            command="nonexistent_command", args=[], workers=1, restart_backoff=10
+        )
+        client = Client(transport)
+
+        with pytest.raises(RuntimeError, match="Client failed to connect"):
+            async with client:
+                pass
+        with pytest.raises(RuntimeError, match="Client failed to connect"):
+            async with client:
+                pass
+
+        worker = transport._workers[0]
+        assert worker.failures == 2
+        assert worker.retry_at > time.monotonic() + 5
+
+
 class TestLogFile:
     @pytest.fixture
     def stdio_script_with_stderr(self, tmp_path):
@@ -1,11 +1,16 @@
 """Tests for FileSystemProvider."""
 
+import asyncio
 import time
 from pathlib import Path
+from typing import Any
+
+import anyio
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.server.providers import FileSystemProvider
+from fastmcp.server.transforms import ComponentKind
 
 
 class TestFileSystemProvider:
@@ -419,3 +424,328 @@ def charge(amount: float) -> str:
             assert len(tools_list) == 2
             names = {t.name for t in tools_list}
             assert names == {"greet", "charge"}
+
+
+class TestFileSystemProviderIncrementalReload:
+    """Tests for fingerprint-based incremental reload."""
+
+    async def test_unchanged_files_are_not_reimported(self, tmp_path: Path):
+        (tmp_path / "a.py").write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def tool_a() -> str:
+    return "a"
+"""
+        )
+        (tmp_path / "b.py").write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def tool_b() -> str:
+    return "b"
+"""
+        )
+
+        provider = FileSystemProvider(tmp_path, reload=True)
+        original_a = provider._components["tool:tool_a@"]
+        original_b = provider._components["tool:tool_b@"]
+
+        time.sleep(0.01)
+        (tmp_path / "b.py").write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def tool_b() -> str:
+    '''Changed.'''
+    return "b"
+"""
+        )
+        await provider._ensure_loaded()
+
+        assert provider._components["tool:tool_a@"] is original_a
+        assert provider._components["tool:tool_b@"] is not original_b
+        assert provider._components["tool:tool_b@"].description == "Changed."
+
+    async def test_touched_file_is_not_reimported(self, tmp_path: Path):
+        tool_file = tmp_path / "a.py"
+        tool_file.write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def tool_a() -> str:
+    return "a"
+"""
+        )
+
+        provider = FileSystemProvider(tmp_path, reload=True)
+        original = provider._components["tool:tool_a@"]
+
+        time.sleep(0.01)
+        tool_file.touch()
+        await provider._ensure_loaded()
+
+        assert provider._components["tool:tool_a@"] is original
+
+    async def test_removed_file_unregisters_components(self, tmp_path: Path):
+        tool_file = tmp_path / "a.py"
+        tool_file.write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def tool_a() -> str:
+    return "a"
+"""
+        )
+
+        provider = FileSystemProvider(tmp_path, reload=True)
+        assert len(provider._components) == 1
+
+        tool_file.unlink()
+        await provider._ensure_loaded()
+
+        assert provider._components == {}
+
+    async def test_renamed_component_replaces_old_one(self, tmp_path: Path):
+        tool_file = tmp_path / "a.py"
+        tool_file.write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def old_name() -> str:
+    return "a"
+"""
+        )
+
+        provider = FileSystemProvider(tmp_path, reload=True)
+
+        time.sleep(0.01)
+        tool_file.write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def new_name() -> str:
+    return "a"
+"""
+        )
+        await provider._ensure_loaded()
+
+        assert list(provider._components) == ["tool:new_name@"]
+
+    async def test_reload_interval_skips_scans(self, tmp_path: Path):
+        provider = FileSystemProvider(tmp_path, reload=True, reload_interval=60)
+
+        (tmp_path / "a.py").write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def tool_a() -> str:
+    return "a"
+"""
+        )
+        await provider._ensure_loaded()
+
+        assert provider._components == {}
+
+    async def test_requests_during_a_scan_reuse_it(self, tmp_path: Path):
+        provider = FileSystemProvider(tmp_path, reload=True)
+        await provider._ensure_loaded()
+
+        scans = 0
+        refresh = provider._refresh
+
+        def slow_refresh(*args: Any) -> set[ComponentKind]:
+            nonlocal scans
+            scans += 1
+            affected = refresh(*args)
+            time.sleep(0.05)
+            return affected
+
+        provider._refresh = slow_refresh  # type: ignore[method-assign]
+        scan = asyncio.create_task(provider._ensure_loaded())
+        await asyncio.sleep(0.02)
+        await asyncio.gather(scan, *(provider._ensure_loaded() for _ in range(4)))
+
+        assert scans == 1
+
+    async def test_list_changed_sent_only_when_components_change(self, tmp_path: Path):
+        import mcp.types
+
+        from fastmcp.client.messages import MessageHandler
+
+        tool_file = tmp_path / "a.py"
+        tool_file.write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def tool_a() -> str:
+    return "a"
+"""
+        )
+
+        class RecordingHandler(MessageHandler):
+            def __init__(self):
+                self.count = 0
+
+            async def on_tool_list_changed(
+                self, message: mcp.types.ToolListChangedNotification
+            ) -> None:
+                self.count += 1
+
+        handler = RecordingHandler()
+        mcp_server = FastMCP(
+            "TestServer", providers=[FileSystemProvider(tmp_path, reload=True)]
+        )
+
+        async with Client(mcp_server, message_handler=handler) as client:
+            await client.list_tools()
+            assert handler.count == 0
+
+            time.sleep(0.01)
+            tool_file.write_text(
+                """\
+from fastmcp.tools import tool
+
+@tool
+def tool_b() -> str:
+    return "b"
+"""
+            )
+            tools = await client.list_tools()
+            assert [t.name for t in tools] == ["tool_b"]
+            await client.ping()
+            assert handler.count == 1
+
+
+class TestFileSystemProviderWatch:
+    async def test_watch_picks_up_changes(self, tmp_path: Path):
+        provider = FileSystemProvider(tmp_path, watch=True)
+        mcp_server = FastMCP("TestServer", providers=[provider])
+
+        async with Client(mcp_server) as client:
+            assert await client.list_tools() == []
+
+            (tmp_path / "a.py").write_text(
+                """\
+from fastmcp.tools import tool
+
+@tool
+def tool_a() -> str:
+    return "a"
+"""
+            )
+            for _ in range(40):
+                await anyio.sleep(0.1)
+                if await client.list_tools():
+                    break
+
+            tools = await client.list_tools()
+            assert [t.name for t in tools] == ["tool_a"]
+
+
+class TestFileSystemProviderLazy:
+    """Tests for cache-backed lazy imports."""
+
+    def _write_files(self, root: Path) -> None:
+        (root / "lazy_tools.py").write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def lazy_add(a: int, b: int) -> int:
+    return a + b
+"""
+        )
+        (root / "lazy_prompts.py").write_text(
+            """\
+from fastmcp.prompts import prompt
+
+@prompt
+def lazy_prompt() -> str:
+    return "hi"
+"""
+        )
+
+    def test_records_import_times(self, tmp_path: Path):
+        self._write_files(tmp_path)
+        provider = FileSystemProvider(tmp_path)
+        assert set(provider.import_times) == {
+            tmp_path / "lazy_tools.py",
+            tmp_path / "lazy_prompts.py",
+        }
+
+    async def test_unchanged_files_are_deferred(self, tmp_path: Path):
+        root = tmp_path / "mcp"
+        root.mkdir()
+        cache_path = tmp_path / "cache.json"
+        self._write_files(root)
+
+        FileSystemProvider(root, lazy=True, cache_path=cache_path)
+        assert cache_path.exists()
+
+        provider = FileSystemProvider(root, lazy=True, cache_path=cache_path)
+        assert provider._components == {}
+        assert provider.import_times == {}
+
+        tool = await provider._get_tool("lazy_add")
+        assert tool is not None
+        assert set(provider.import_times) == {root / "lazy_tools.py"}
+
+        prompts = await provider._list_prompts()
+        assert [p.name for p in prompts] == ["lazy_prompt"]
+        assert len(provider.import_times) == 2
+
+    async def test_changed_file_is_imported_at_init(self, tmp_path: Path):
+        root = tmp_path / "mcp"
+        root.mkdir()
+        cache_path = tmp_path / "cache.json"
+        self._write_files(root)
+        FileSystemProvider(root, lazy=True, cache_path=cache_path)
+
+        (root / "lazy_tools.py").write_text(
+            """\
+from fastmcp.tools import tool
+
+@tool
+def lazy_sub(a: int, b: int) -> int:
+    return a - b
+"""
+        )
+        provider = FileSystemProvider(root, lazy=True, cache_path=cache_path)
+        assert list(provider._components) == ["tool:lazy_sub@"]
+        assert set(provider.import_times) == {root / "lazy_tools.py"}
+
+    async def test_deferred_tool_callable_through_server(self, tmp_path: Path):
+        root = tmp_path / "mcp"
+        root.mkdir()
+        cache_path = tmp_path / "cache.json"
+        self._write_files(root)
+        FileSystemProvider(root, lazy=True, cache_path=cache_path)
+
+        provider = FileSystemProvider(root, lazy=True, cache_path=cache_path)
+        mcp_server = FastMCP("TestServer", providers=[provider])
+
+        async with Client(mcp_server) as client:
+            result = await client.call_tool("lazy_add", {"a": 1, "b": 2})
+            assert result.data == 3
+
+        assert root / "lazy_prompts.py" not in provider.import_times
+
+    def test_unreadable_cache_is_ignored(self, tmp_path: Path):
+        root = tmp_path / "mcp"
+        root.mkdir()
+        cache_path = tmp_path / "cache.json"
+        cache_path.write_text("not json")
+        self._write_files(root)
+
+        provider = FileSystemProvider(root, lazy=True, cache_path=cache_path)
+        assert len(provider._components) == 2
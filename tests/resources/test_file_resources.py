@@ -6,7 +6,7 @@ import pytest
 from pydantic import FileUrl
 
 from fastmcp.exceptions import ResourceError
-from fastmcp.resources import FileResource
+from fastmcp.resources import DirectoryResource, FileResource
 from fastmcp.resources.resource import ResourceResult
 
 
@@ -119,3 +119,117 @@ class TestFileResource:
                 await resource.read()
         finally:
             temp_file.chmod(0o644)  # Restore permissions
+
+    async def test_unchanged_file_reuses_content(self, temp_file: Path):
+        """Test that repeated reads of an unchanged file share its encoding."""
+        resource = FileResource(
+            uri=FileUrl(temp_file.as_uri()),
+            name="test",
+            path=temp_file,
+            is_binary=True,
+        )
+        first = await resource.read()
+        second = await resource.read()
+        assert second.contents[0] is not first.contents[0]
+        assert second.contents[0].content is first.contents[0].content
+
+        blob = first.contents[0].to_mcp_resource_contents(temp_file.as_uri())
+        again = second.contents[0].to_mcp_resource_contents(temp_file.as_uri())
+        assert again.blob is blob.blob  # type: ignore[union-attr]
+
+    async def test_cached_content_is_not_shared(self, temp_file: Path):
+        """Test that mutating a read result doesn't change later reads."""
+        resource = FileResource(
+            uri=FileUrl(temp_file.as_uri()),
+            name="test",
+            path=temp_file,
+        )
+        first = await resource.read()
+        original = first.contents[0].content
+        first.contents[0].content = "mutated"
+        second = await resource.read()
+        assert second.contents[0].content == original
+
+    async def test_changed_file_is_reread(self, temp_file: Path):
+        """Test that a modified file is read again."""
+        resource = FileResource(
+            uri=FileUrl(temp_file.as_uri()),
+            name="test",
+            path=temp_file,
+        )
+        await resource.read()
+        temp_file.write_text("new content, longer")
+        result = await resource.read()
+        assert result.contents[0].content == "new content, longer"
+
+    async def test_max_size(self, temp_file: Path):
+        """Test that files larger than max_size are rejected."""
+        resource = FileResource(
+            uri=FileUrl(temp_file.as_uri()),
+            name="test",
+            path=temp_file,
+            max_size=4,
+        )
+        with pytest.raises(ResourceError, match="exceeds the limit of 4 bytes"):
+            await resource.read()
+
+    async def test_large_files_are_not_cached(self, temp_file: Path):
+        """Test that files above max_cache_size are read each time."""
+        resource = FileResource(
+            uri=FileUrl(temp_file.as_uri()),
+            name="test",
+            path=temp_file,
+            max_cache_size=4,
+        )
+        first = await resource.read()
+        second = await resource.read()
+        assert second.contents[0] is not first.contents[0]
+
+
+class TestDirectoryResource:
+    """Test DirectoryResource functionality."""
+
+    async def test_list_files(self, tmp_path: Path):
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.txt").write_text("b")
+
+        resource = DirectoryResource(
+            uri=FileUrl(tmp_path.as_uri()), name="dir", path=tmp_path
+        )
+        assert await resource.list_files() == [tmp_path / "a.txt"]
+
+        recursive = DirectoryResource(
+            uri=FileUrl(tmp_path.as_uri()),
+            name="dir",
+            path=tmp_path,
+            recursive=True,
+        )
+        assert sorted(await recursive.list_files()) == [
+            tmp_path / "a.txt",
+            tmp_path / "sub" / "b.txt",
+        ]
+
+    async def test_listing_updates_when_directory_changes(self, tmp_path: Path):
+        (tmp_path / "sub").mkdir()
+        resource = DirectoryResource(
+            uri=FileUrl(tmp_path.as_uri()),
+            name="dir",
+            path=tmp_path,
+            recursive=True,
+        )
+        assert await resource.list_files() == []
+
+        new_file = tmp_path / "sub" / "new.txt"
+        new_file.write_text("new")
+        # Force a visible mtime change on filesystems with coarse timestamps
+        stat = (tmp_path / "sub").stat()
+        os.utime(tmp_path / "sub", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert await resource.list_files() == [new_file]
+
+    async def test_missing_directory(self, tmp_path: Path):
+        resource = DirectoryResource(
+            uri=FileUrl(tmp_path.as_uri()), name="dir", path=tmp_path / "missing"
+        )
+        with pytest.raises(ResourceError, match="Error reading directory"):
+            await resource.read()
@@ -0,0 +1,106 @@
+import httpx
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ResourceError
+from fastmcp.resources import HttpResource
+from fastmcp.resources import types as resource_types
+
+
+class Upstream:
+    """Serves a JSON body, counting requests and answering conditional GETs."""
+
+    def __init__(self, headers: dict[str, str] | None = None):
+        self.body = '{"value": 1}'
+        self.headers = headers or {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = self.headers.get("ETag")
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, text=self.body, headers=self.headers)
+
+
+@pytest.fixture
+def upstream(monkeypatch: pytest.MonkeyPatch):
+    server = Upstream()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    monkeypatch.setattr(resource_types, "_get_http_client", lambda: client)
+    resource_types._http_cache.clear()
+    yield server
+    resource_types._http_cache.clear()
+
+
+def make_resource(**kwargs) -> HttpResource:
+    return HttpResource(
+        uri="http://example.com/data",  # type: ignore[arg-type]
+        name="data",
+        url="http://example.com/data",
+        **kwargs,
+    )
+
+
+async def test_read(upstream: Upstream):
+    result = await make_resource().read()
+    assert result.contents[0].content == '{"value": 1}'
+    assert result.contents[0].mime_type == "application/json"
+
+
+async def test_uncacheable_response_is_refetched(upstream: Upstream):
+    resource = make_resource()
+    await resource.read()
+    await resource.read()
+    assert len(upstream.requests) == 2
+
+
+async def test_fresh_response_is_not_refetched(upstream: Upstream):
+    upstream.headers = {"Cache-Control": "max-age=60"}
+    resource = make_resource()
+    await resource.read()
+    result = await resource.read()
+    assert result.contents[0].content == '{"value": 1}'
+    assert len(upstream.requests) == 1
+
+
+async def test_stale_response_is_revalidated(upstream: Upstream):
+    upstream.headers = {"ETag": '"v1"', "Cache-Control": "no-cache"}
+    resource = make_resource()
+    await resource.read()
+    upstream.body = "changed without a new ETag"
+    result = await resource.read()
+
+    assert result.contents[0].content == '{"value": 1}'
+    assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_no_store_is_not_cached(upstream: Upstream):
+    upstream.headers = {"ETag": '"v1"', "Cache-Control": "no-store"}
+    resource = make_resource()
+    await resource.read()
+    await resource.read()
+    assert "If-None-Match" not in upstream.requests[1].headers
+
+
+async def test_max_size(upstream: Upstream):
+    with pytest.raises(ResourceError, match="exceeds the limit of 4 bytes"):
+        await make_resource(max_size=4).read()
+
+
+async def test_http_error(upstream: Upstream, monkeypatch: pytest.MonkeyPatch):
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(500))
+    )
+    monkeypatch.setattr(resource_types, "_get_http_client", lambda: client)
+    with pytest.raises(httpx.HTTPStatusError):
+        await make_resource().read()
+
+
+async def test_server_shutdown_closes_client():
+    server = FastMCP()
+    async with server._lifespan_manager():
+        client = resource_types._get_http_client()
+        assert resource_types._get_http_client() is client
+    assert client.is_closed
+    assert resource_types._get_http_client() is not client
@@ -882,6 +882,41 @@ class TestQueryParameterTypeCoercion:
         assert result["threshold"] == 0.95
         assert result["type"] == "float"
 
+    async def test_complex_type_coercion(self):
+        """Test coercion of optional and JSON-encoded query parameters."""
+
+        def search(
+            index: str, limit: int | None = None, ids: list[int] | None = None
+        ) -> dict:
+            return {"limit": limit, "ids": ids}
+
+        template = ResourceTemplate.from_function(
+            fn=search,
+            uri_template="search://{index}{?limit,ids}",
+            name="test",
+        )
+
+        result = await template.read(
+            arguments={"index": "docs", "limit": "10", "ids": "[1, 2]"}
+        )
+        assert result == {"limit": 10, "ids": [1, 2]}
+
+    async def test_sync_function_runs_in_threadpool(self):
+        """Test that sync template functions don't run on the event loop thread."""
+        import threading
+
+        def get_thread(name: str) -> str:
+            return str(threading.get_ident())
+
+        template = ResourceTemplate.from_function(
+            fn=get_thread,
+            uri_template="thread://{name}",
+            name="test",
+        )
+
+        result = await template.read(arguments={"name": "x"})
+        assert result != str(threading.get_ident())
+
 
 class TestQueryParameterValidation:
     """Test validation rules for query parameters."""
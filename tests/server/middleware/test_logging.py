@@ -2,6 +2,7 @@
 
 import datetime
 import logging
+import threading
 from collections.abc import Generator
 from typing import Any, Literal, TypeVar
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,6 +19,8 @@ from fastmcp.resources.template import ResourceTemplate
 from fastmcp.server.middleware.logging import (
     LoggingMiddleware,
     StructuredLoggingMiddleware,
+    default_serializer,
+    truncated_serializer,
 )
 from fastmcp.server.middleware.middleware import CallNext, MiddlewareContext
 
@@ -398,6 +401,131 @@ class TestLoggingMiddleware:
         )
 
 
+class TestTruncatedSerializer:
+    """Test serializing only as much payload as will be logged."""
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            mcp.types.CallToolRequest(
+                method="tools/call",
+                params=mcp.types.CallToolRequestParams(
+                    name="test_method",
+                    arguments={"nested": {"items": [1, 2.5, None, True]}, "s": "é"},
+                ),
+            ),
+            mcp.types.ReadResourceRequestParams(uri=AnyUrl("test://example/1")),
+            ResourceTemplate(
+                name="tmpl",
+                uri_template="tmpl://{id}",
+                parameters={"id": {"type": "string"}},
+            ),
+            {"a": (1, 2), 3: "int key", "b": FIXED_DATE, "café": "é"},
+        ],
+    )
+    def test_matches_default_serializer(self, payload: Any):
+        expected = default_serializer(payload)
+
+        assert truncated_serializer(payload, len(expected)) == expected
+        for max_length in (1, 10, len(expected) // 2, len(expected) - 1):
+            assert (
+                truncated_serializer(payload, max_length)
+                == expected[:max_length] + "..."
+            )
+
+    def test_stops_encoding_at_bound(self):
+        encoded: list[str] = []
+
+        class Tracked:
+            def __init__(self, name: str):
+                self.name = name
+
+            def __str__(self) -> str:
+                encoded.append(self.name)
+                return self.name
+
+        payload = {
+            "first": Tracked("first"),
+            "rest": [Tracked(str(i)) for i in range(100)],
+        }
+
+        assert truncated_serializer(payload, 12) == '{"first":"fi...'
+        assert encoded == ["first"]
+
+
+class TestBackgroundLogging:
+    """Test writing log lines from the background worker."""
+
+    async def test_logs_same_lines_as_inline(
+        self, mock_context: MiddlewareContext[Any], caplog: pytest.LogCaptureFixture
+    ):
+        middleware = LoggingMiddleware(include_payloads=True, background=True)
+
+        with caplog.at_level(logging.INFO):
+            await middleware.on_message(mock_context, AsyncMock(return_value="ok"))
+            assert middleware.flush(timeout=5)
+
+        assert get_log_lines(caplog) == snapshot(
+            [
+                'event=request_start method=test_method source=client payload={"method":"tools/call","params":{"task":null,"_meta":null,"name":"test_method","arguments":{"param":"value"}}} payload_type=CallToolRequest',
+                "event=request_success method=test_method source=client duration_ms=0.02",
+            ]
+        )
+        assert middleware.dropped_log_events == 0
+
+    async def test_payload_is_captured_before_the_request_continues(
+        self, mock_context: MiddlewareContext[Any], caplog: pytest.LogCaptureFixture
+    ):
+        middleware = LoggingMiddleware(include_payloads=True, background=True)
+
+        async def mutate(context: MiddlewareContext[Any]) -> str:
+            context.message.params.arguments["param"] = "changed"
+            return "ok"
+
+        with caplog.at_level(logging.INFO):
+            await middleware.on_message(mock_context, mutate)
+            assert middleware.flush(timeout=5)
+
+        start = get_log_lines(caplog)[0]
+        assert '"param":"value"' in start
+        assert "changed" not in start
+
+    async def test_drops_events_when_queue_is_full(
+        self, mock_context: MiddlewareContext[Any]
+    ):
+        release = threading.Event()
+        lines: list[str] = []
+
+        class BlockingHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                release.wait(5)
+                lines.append(record.getMessage())
+
+        logger = logging.getLogger("test_background_logging")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = BlockingHandler()
+        logger.addHandler(handler)
+        try:
+            middleware = LoggingMiddleware(
+                logger=logger, background=True, max_queue_size=2
+            )
+            call_next = AsyncMock(return_value="ok")
+            for _ in range(5):
+                await middleware.on_message(mock_context, call_next)
+
+            # The worker holds one event and the queue holds two more
+            assert middleware.dropped_log_events >= 7
+            assert call_next.await_count == 5
+
+            release.set()
+            assert middleware.flush(timeout=5)
+        finally:
+            logger.removeHandler(handler)
+
+        assert any("dropped" in line for line in lines)
+
+
 @pytest.fixture
 def logging_server():
     """Create a FastMCP server specifically for logging middleware tests."""
@@ -515,7 +643,7 @@ class TestLoggingMiddlewareIntegration:
 
         # Should have processing and failure logs
         assert log_text.splitlines()[-1] == snapshot(
-            "ERROR    fastmcp.middleware.logging:logging.py:122 event=request_error method=tools/call source=client duration_ms=0.02 error=Error calling tool 'operation_with_error': Operation failed intentionally"
+            "ERROR    fastmcp.middleware.logging:logging.py:286 event=request_error method=tools/call source=client duration_ms=0.02 error=Error calling tool 'operation_with_error': Operation failed intentionally"
         )
 
     async def test_logging_middleware_with_payloads(
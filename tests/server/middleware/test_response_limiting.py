@@ -1,10 +1,16 @@
 """Tests for ResponseLimitingMiddleware."""
 
+import pydantic_core
 import pytest
 from mcp.types import ImageContent, TextContent
 
 from fastmcp import Client, FastMCP
-from fastmcp.server.middleware.response_limiting import ResponseLimitingMiddleware
+from fastmcp.prompts import Message, PromptResult
+from fastmcp.resources import ResourceContent, ResourceResult
+from fastmcp.server.middleware.response_limiting import (
+    ResponseLimitingMiddleware,
+    estimate_size,
+)
 from fastmcp.tools.tool import ToolResult
 
 
@@ -153,3 +159,169 @@ class TestResponseLimitingMiddleware:
         content = result.content[0]
         assert isinstance(content, TextContent)
         content.text.encode("utf-8")
+
+    async def test_multiple_text_blocks_keep_order(self, mcp_server: FastMCP):
+        """Test that earlier blocks are kept whole before later ones are cut."""
+        mcp_server.add_middleware(ResponseLimitingMiddleware(max_size=300))
+
+        @mcp_server.tool()
+        def multi_block() -> ToolResult:
+            return ToolResult(
+                content=[
+                    TextContent(type="text", text="First: " + "a" * 100),
+                    TextContent(type="text", text="Second: " + "b" * 500),
+                    TextContent(type="text", text="Third: " + "c" * 500),
+                ]
+            )
+
+        async with Client(mcp_server) as client:
+            result = await client.call_tool("multi_block", {})
+            text = result.content[0].text
+            assert text.startswith("First: " + "a" * 100 + "\n\nSecond: b")
+            assert "Third" not in text
+            assert len(text.encode("utf-8")) < 300
+
+    async def test_resource_over_limit_is_truncated(self, mcp_server: FastMCP):
+        """Test that resource contents are kept up to the limit."""
+        mcp_server.add_middleware(
+            ResponseLimitingMiddleware(max_size=500, resources="all")
+        )
+
+        @mcp_server.resource("data://large")
+        def large_resource() -> ResourceResult:
+            return ResourceResult(
+                [
+                    ResourceContent("small", mime_type="text/markdown"),
+                    ResourceContent("x" * 10_000, mime_type="text/markdown"),
+                    ResourceContent("never sent"),
+                ]
+            )
+
+        @mcp_server.resource("data://small")
+        def small_resource() -> str:
+            return "hello"
+
+        async with Client(mcp_server) as client:
+            contents = await client.read_resource("data://large")
+            assert [c.mimeType for c in contents] == ["text/markdown"] * 2
+            assert contents[0].text == "small"
+            assert contents[1].text.endswith("[Response truncated due to size limit]")
+            assert len(contents[1].text.encode("utf-8")) < 500
+
+            contents = await client.read_resource("data://small")
+            assert contents[0].text == "hello"
+
+    async def test_resource_filtering(self, mcp_server: FastMCP):
+        """Test that resource filtering only applies to specified URIs."""
+        mcp_server.add_middleware(
+            ResponseLimitingMiddleware(max_size=100, resources=["data://limited"])
+        )
+
+        @mcp_server.resource("data://limited")
+        def limited() -> str:
+            return "x" * 10_000
+
+        @mcp_server.resource("data://unlimited")
+        def unlimited() -> str:
+            return "y" * 10_000
+
+        async with Client(mcp_server) as client:
+            contents = await client.read_resource("data://limited")
+            assert "[Response truncated" in contents[0].text
+
+            contents = await client.read_resource("data://unlimited")
+            assert contents[0].text == "y" * 10_000
+
+    async def test_resources_and_prompts_not_limited_by_default(
+        self, mcp_server: FastMCP
+    ):
+        """Test that only tools are limited unless resources/prompts opt in."""
+        mcp_server.add_middleware(ResponseLimitingMiddleware(max_size=100))
+
+        @mcp_server.resource("data://large")
+        def large_resource() -> str:
+            return "x" * 10_000
+
+        @mcp_server.prompt
+        def large_prompt() -> str:
+            return "y" * 10_000
+
+        async with Client(mcp_server) as client:
+            contents = await client.read_resource("data://large")
+            assert contents[0].text == "x" * 10_000
+            result = await client.get_prompt("large_prompt")
+            assert result.messages[0].content.text == "y" * 10_000
+
+    async def test_dropped_binary_resource_is_logged(
+        self, mcp_server: FastMCP, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that binary contents over the limit are dropped with a warning."""
+        mcp_server.add_middleware(
+            ResponseLimitingMiddleware(max_size=500, resources="all")
+        )
+
+        @mcp_server.resource("data://image")
+        def image() -> ResourceResult:
+            return ResourceResult(
+                [ResourceContent(b"\x00" * 10_000, mime_type="image/png")]
+            )
+
+        async with Client(mcp_server) as client:
+            contents = await client.read_resource("data://image")
+        assert [c.text for c in contents] == ["[Response truncated due to size limit]"]
+        assert "dropping 10000 bytes of image/png content" in caplog.text
+
+    async def test_prompt_over_limit_is_truncated(self, mcp_server: FastMCP):
+        """Test that prompt messages are kept up to the limit."""
+        mcp_server.add_middleware(
+            ResponseLimitingMiddleware(max_size=500, prompts="all")
+        )
+
+        @mcp_server.prompt
+        def large_prompt() -> PromptResult:
+            return PromptResult(
+                [
+                    Message("Summarize this:"),
+                    Message("x" * 10_000, role="assistant"),
+                    Message("never sent"),
+                ]
+            )
+
+        async with Client(mcp_server) as client:
+            result = await client.get_prompt("large_prompt")
+            assert [m.role for m in result.messages] == ["user", "assistant"]
+            assert result.messages[0].content.text == "Summarize this:"
+            text = result.messages[1].content.text
+            assert text.endswith("[Response truncated due to size limit]")
+            assert len(text.encode("utf-8")) < 500
+
+    def test_estimate_size_close_to_encoded_size(self):
+        """Test that the estimate tracks the JSON encoding."""
+        result = ToolResult(
+            content=[TextContent(type="text", text="héllo " * 50)],
+            structured_content={"items": list(range(20)), "ok": True},
+        )
+        encoded = len(pydantic_core.to_json(result))
+        assert abs(estimate_size(result) - encoded) < encoded * 0.2
+
+    def test_estimate_size_counts_escapes_near_budget(self):
+        """Test that escaped characters count once they could exceed the budget."""
+        text = '"\n' * 100
+        encoded = len(pydantic_core.to_json(text))
+        assert encoded > 300
+        assert estimate_size(text, budget=300) == encoded
+        assert estimate_size({"k": text}, budget=300) > 300
+
+    def test_estimate_size_stops_at_budget(self):
+        """Test that the walk stops once the budget is exceeded."""
+        visited = 0
+
+        class Counted:
+            def __str__(self) -> str:
+                nonlocal visited
+                visited += 1
+                return "x" * 100
+
+        value = [Counted() for _ in range(1_000)]
+        assert estimate_size(value, budget=500) > 500
+        assert visited < 10
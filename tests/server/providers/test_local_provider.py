@@ -832,3 +832,169 @@ class TestLocalProviderStandaloneUsage:
         async with Client(server) as client:
             result = await client.call_tool("duplicate_tool", {})
             assert result.data == "from server"
+
+
+class TestLocalProviderLazy:
+    """Tests for deferred component construction with lazy=True."""
+
+    def test_decorated_tools_are_not_built(self):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @provider.prompt
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        assert provider._components == {}
+        assert set(provider._deferred) == {"tool:add@", "prompt:greet@"}
+
+    async def test_list_builds_deferred_components(self):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        tools = await provider.list_tools()
+        assert [t.name for t in tools] == ["add"]
+        assert tools[0].parameters["required"] == ["a", "b"]
+        assert provider._deferred == {}
+
+    async def test_get_builds_only_requested_component(self):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool
+        def first() -> str:
+            return "first"
+
+        @provider.tool
+        def second() -> str:
+            return "second"
+
+        tool = await provider.get_tool("second")
+        assert tool is not None
+        assert set(provider._deferred) == {"tool:first@"}
+
+    def test_duplicate_raises_at_decoration(self):
+        provider = LocalProvider(on_duplicate="error", lazy=True)
+
+        @provider.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        with pytest.raises(ValueError, match="already exists"):
+
+            @provider.tool(name="add")
+            def other() -> int:
+                return 0
+
+    def test_version_mixing_raises_at_decoration(self):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool(version="1")
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        with pytest.raises(ValueError, match="Either version all components"):
+
+            @provider.tool(name="add")
+            def add_unversioned(a: int, b: int) -> int:
+                return a + b
+
+    async def test_remove_deferred_tool(self):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        provider.remove_tool("add")
+        assert await provider.list_tools() == []
+
+    async def test_disabled_deferred_tool_is_hidden(self):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool(enabled=False)
+        def hidden() -> str:
+            return "hidden"
+
+        @provider.tool
+        def visible() -> str:
+            return "visible"
+
+        server = FastMCP("Test", providers=[provider])
+        async with Client(server) as client:
+            tools = await client.list_tools()
+            assert [t.name for t in tools] == ["visible"]
+
+    async def test_get_tasks_builds_task_tools(self):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool(task=True)
+        async def background(x: int) -> int:
+            return x
+
+        @provider.tool
+        def foreground(x: int) -> int:
+            return x
+
+        tasks = await provider.get_tasks()
+        assert [t.name for t in tasks] == ["background"]
+        assert set(provider._deferred) == {"tool:foreground@"}
+
+    async def test_call_deferred_tool_through_server(self):
+        server = FastMCP("Test", lazy_components=True)
+
+        @server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        async with Client(server) as client:
+            result = await client.call_tool("add", {"a": 1, "b": 2})
+            assert result.data == 3
+
+    def test_invalid_signature_raises_at_decoration(self):
+        provider = LocalProvider(lazy=True)
+
+        with pytest.raises(ValueError, match=r"\*args are not supported as tools"):
+
+            @provider.tool
+            def spread(*args: int) -> int:
+                return sum(args)
+
+        with pytest.raises(ValueError, match="does not exist in function"):
+
+            @provider.tool(exclude_args=["missing"])
+            def add(a: int, b: int) -> int:
+                return a + b
+
+        with pytest.raises(
+            ValueError, match=r"\*\*kwargs are not supported as prompts"
+        ):
+
+            @provider.prompt
+            def greet(**kwargs: str) -> str:
+                return "hi"
+
+    async def test_failed_build_is_skipped(self, caplog):
+        provider = LocalProvider(lazy=True)
+
+        @provider.tool
+        def good() -> str:
+            return "good"
+
+        @provider.tool
+        def bad() -> str:
+            return "bad"
+
+        def fail() -> Tool:
+            raise RuntimeError("cannot build")
+
+        provider._deferred["tool:bad@"].build = fail
+
+        tools = await provider.list_tools()
+        assert [t.name for t in tools] == ["good"]
+        assert "Failed to build deferred component 'tool:bad@'" in caplog.text
@@ -3,6 +3,7 @@
 import json
 from pathlib import Path
 
+import anyio
 import pytest
 from mcp.types import TextResourceContents
 from pydantic import AnyUrl
@@ -13,6 +14,7 @@ from fastmcp.server.providers.skills import (
     SkillProvider,
     SkillsDirectoryProvider,
     SkillsProvider,
+    _common,
 )
 from fastmcp.server.providers.skills._common import parse_frontmatter
 
@@ -414,6 +416,135 @@ description: A new skill
         assert templates == []
 
 
+def skill_providers(provider: SkillsDirectoryProvider) -> list[SkillProvider]:
+    providers = [p for p in provider.providers if isinstance(p, SkillProvider)]
+    assert len(providers) == len(provider.providers)
+    return providers
+
+
+class TestSkillIndexing:
+    """Tests for lazy file indexing, hash caching, and incremental reloads."""
+
+    @pytest.fixture
+    def skills_dir(self, tmp_path: Path) -> Path:
+        skills_root = tmp_path / "skills"
+        skills_root.mkdir()
+        for name in ("alpha", "beta"):
+            skill = skills_root / name
+            skill.mkdir()
+            (skill / "SKILL.md").write_text(f"# {name.title()}\n\nContent.")
+            (skill / "data.bin").write_bytes(b"\x00" * 64)
+        return skills_root
+
+    @pytest.fixture
+    def hash_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        calls: list[Path] = []
+        original = _common.compute_file_hash
+
+        def counting_hash(path: Path) -> str:
+            calls.append(path)
+            return original(path)
+
+        monkeypatch.setattr(_common, "compute_file_hash", counting_hash)
+        return calls
+
+    async def test_files_are_not_hashed_at_init(
+        self, skills_dir: Path, hash_calls: list[Path]
+    ):
+        provider = SkillsDirectoryProvider(roots=skills_dir)
+        resources = await provider.list_resources()
+        assert len(resources) == 4
+        assert hash_calls == []
+
+        alpha = next(
+            p for p in skill_providers(provider) if p.skill_info.name == "alpha"
+        )
+        assert {f.path for f in alpha.skill_info.files} == {"SKILL.md", "data.bin"}
+        assert len(hash_calls) == 2
+
+    async def test_unchanged_files_are_not_rehashed(
+        self, skills_dir: Path, hash_calls: list[Path]
+    ):
+        provider = SkillProvider(skill_path=skills_dir / "alpha")
+        provider.skill_info.files
+        assert len(hash_calls) == 2
+
+        provider.skill_info.index.invalidate()
+        (skills_dir / "alpha" / "extra.txt").write_text("extra")
+        paths = {f.path for f in provider.skill_info.files}
+        assert paths == {"SKILL.md", "data.bin", "extra.txt"}
+        assert hash_calls[2:] == [skills_dir / "alpha" / "extra.txt"]
+
+    async def test_cache_path_persists_hashes(
+        self, skills_dir: Path, tmp_path: Path, hash_calls: list[Path]
+    ):
+        cache_path = tmp_path / "skill-index.json"
+        first = SkillProvider(skill_path=skills_dir / "alpha", cache_path=cache_path)
+        expected = first.skill_info.files
+        assert cache_path.exists()
+        assert len(hash_calls) == 2
+
+        second = SkillProvider(skill_path=skills_dir / "alpha", cache_path=cache_path)
+        assert second.skill_info.files == expected
+        assert len(hash_calls) == 2
+
+    async def test_reload_keeps_unchanged_skills(
+        self, skills_dir: Path, hash_calls: list[Path]
+    ):
+        provider = SkillsDirectoryProvider(roots=skills_dir, reload=True)
+        await provider.list_resources()
+        before = {p.skill_info.name: p for p in skill_providers(provider)}
+        for p in skill_providers(provider):
+            p.skill_info.files
+
+        (skills_dir / "beta" / "SKILL.md").write_text(
+            "---\ndescription: Updated\n---\n\n# Beta"
+        )
+        resources = await provider.list_resources()
+
+        after = {p.skill_info.name: p for p in skill_providers(provider)}
+        assert after["alpha"] is before["alpha"]
+        assert after["beta"] is not before["beta"]
+        assert "Updated" in {r.description for r in resources}
+
+        # Rescanning after the reload only hashes the edited main file
+        hashed = len(hash_calls)
+        for p in skill_providers(provider):
+            p.skill_info.files
+        assert hash_calls[hashed:] == [skills_dir / "beta" / "SKILL.md"]
+
+    async def test_manifest_reflects_changes_in_reload_mode(self, skills_dir: Path):
+        mcp = FastMCP("Test")
+        mcp.add_provider(SkillsDirectoryProvider(roots=skills_dir, reload=True))
+
+        async with Client(mcp) as client:
+            result = await client.read_resource(AnyUrl("skill://alpha/_manifest"))
+            assert len(json.loads(result[0].text)["files"]) == 2
+
+            (skills_dir / "alpha" / "notes.md").write_text("# Notes")
+            result = await client.read_resource(AnyUrl("skill://alpha/_manifest"))
+            paths = {f["path"] for f in json.loads(result[0].text)["files"]}
+            assert paths == {"SKILL.md", "data.bin", "notes.md"}
+
+    async def test_watch_picks_up_changes(self, skills_dir: Path):
+        provider = SkillsDirectoryProvider(roots=skills_dir, watch=True)
+        mcp = FastMCP("Test", providers=[provider])
+
+        async with Client(mcp) as client:
+            assert len(await client.list_resources()) == 4
+
+            gamma = skills_dir / "gamma"
+            gamma.mkdir()
+            (gamma / "SKILL.md").write_text("# Gamma")
+            for _ in range(40):
+                await anyio.sleep(0.1)
+                if len(await client.list_resources()) == 6:
+                    break
+
+            names = {r.name for r in await client.list_resources()}
+            assert "gamma/SKILL.md" in names
+
+
 class TestMultiDirectoryProvider:
     """Tests for multi-directory support in SkillsDirectoryProvider."""
 
@@ -5,7 +5,13 @@ import pytest
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.server.providers import FastMCPProvider
-from fastmcp.server.transforms import Namespace, ToolTransform
+from fastmcp.server.transforms import (
+    Namespace,
+    ToolTransform,
+    Transform,
+    VersionFilter,
+    is_enabled,
+)
 from fastmcp.tools.tool_transform import ToolTransformConfig
 
 
@@ -297,3 +303,125 @@ class TestNoTransformation:
 
         assert len(transformed_tools) == 1
         assert transformed_tools[0].name == "my_tool"
+
+
+class TestCompiledTransformPipeline:
+    """Test that providers compile their transforms into one pipeline."""
+
+    def _provider(self) -> FastMCPProvider:
+        server = FastMCP("Test")
+
+        @server.tool(version="1.0")
+        def my_tool() -> str:
+            return "v1"
+
+        @server.tool(name="my_tool", version="2.0")
+        def my_tool_v2() -> str:
+            return "v2"
+
+        @server.tool
+        def other() -> str:
+            return "other"
+
+        return FastMCPProvider(server)
+
+    async def test_builtin_transforms_are_fused(self):
+        """Namespace, ToolTransform, VersionFilter and Visibility fuse."""
+        provider = self._provider()
+        provider.add_transform(Namespace("ns"))
+        provider.add_transform(
+            ToolTransform({"ns_my_tool": ToolTransformConfig(name="short")})
+        )
+        provider.add_transform(VersionFilter(version_lt="2.0"))
+        provider.disable(names={"ns_other"})
+
+        assert provider._transform_pipeline("tool").fused
+
+        tools = await provider.list_tools()
+        assert {(t.name, t.version) for t in tools} == {
+            ("short", "1.0"),
+            ("ns_other", None),
+        }
+
+        tool = await provider.get_tool("short")
+        assert tool is not None
+        assert tool.version == "1.0"
+        assert await provider.get_tool("ns_my_tool") is None
+        assert await provider.get_tool("my_tool") is None
+
+        disabled = await provider.get_tool("ns_other")
+        assert disabled is not None
+        assert not is_enabled(disabled)
+
+    async def test_add_transform_rebuilds_pipeline(self):
+        """Adding a transform invalidates the cached pipeline."""
+        provider = self._provider()
+        provider.add_transform(Namespace("inner"))
+        assert await provider.get_tool("inner_other") is not None
+        pipeline = provider._transform_pipeline("tool")
+        assert provider._transform_pipeline("tool") is pipeline
+
+        provider.add_transform(Namespace("outer"))
+        assert provider._transform_pipeline("tool") is not pipeline
+        assert await provider.get_tool("inner_other") is None
+        assert await provider.get_tool("outer_inner_other") is not None
+
+    async def test_custom_transform_keeps_async_stage(self):
+        """Transforms that don't compile still run, between fused stages."""
+
+        class Upper(Transform):
+            async def list_tools(self, tools):
+                return [t.model_copy(update={"name": t.name.upper()}) for t in tools]
+
+            async def get_tool(self, name, call_next, *, version=None):
+                tool = await call_next(name.lower(), version=version)
+                if tool is None:
+                    return None
+                return tool.model_copy(update={"name": name})
+
+        provider = self._provider()
+        provider.add_transform(Namespace("ns"))
+        provider.add_transform(Upper())
+        provider.add_transform(Namespace("outer"))
+
+        assert not provider._transform_pipeline("tool").fused
+        names = {t.name for t in await provider.list_tools()}
+        assert names == {"outer_NS_MY_TOOL", "outer_NS_OTHER"}
+        tool = await provider.get_tool("outer_NS_OTHER")
+        assert tool is not None
+        assert tool.name == "outer_NS_OTHER"
+
+    async def test_subclass_overriding_get_is_not_compiled(self):
+        """Subclasses that change a compiled transform's behavior stay async."""
+
+        class HideOther(Namespace):
+            async def get_tool(self, name, call_next, *, version=None):
+                if name.endswith("other"):
+                    return None
+                return await super().get_tool(name, call_next, version=version)
+
+        provider = self._provider()
+        provider.add_transform(HideOther("ns"))
+
+        assert not provider._transform_pipeline("tool").fused
+        assert await provider.get_tool("ns_other") is None
+        assert await provider.get_tool("ns_my_tool") is not None
+
+    async def test_wrapped_providers_share_one_pipeline(self):
+        """wrap_transform layers fold into the innermost provider's pipeline."""
+        provider = self._provider()
+        provider.add_transform(Namespace("a"))
+        wrapped = provider.wrap_transform(Namespace("b")).wrap_transform(Namespace("c"))
+
+        pipeline = wrapped._transform_pipeline("tool")
+        assert pipeline.source is provider
+        assert pipeline.fused
+        assert len(pipeline.transforms) == 3
+
+        tool = await wrapped.get_tool("c_b_a_other")
+        assert tool is not None
+        assert tool.name == "c_b_a_other"
+        assert {t.name for t in await wrapped.list_tools()} == {
+            "c_b_a_my_tool",
+            "c_b_a_other",
+        }
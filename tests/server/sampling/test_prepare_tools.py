@@ -3,7 +3,7 @@
 import pytest
 
 from fastmcp.server.sampling.run import prepare_tools
-from fastmcp.server.sampling.sampling_tool import SamplingTool
+from fastmcp.server.sampling.sampling_tool import SamplingTool, SamplingToolset
 from fastmcp.tools.function_tool import FunctionTool
 from fastmcp.tools.tool_transform import ArgTransform, TransformedTool
 
@@ -109,3 +109,65 @@ class TestPrepareTools:
         """Test that empty list returns None."""
         result = prepare_tools([])
         assert result is None
+
+
+class TestSamplingToolset:
+    """Tests for SamplingToolset."""
+
+    def test_toolset_precomputes_tools(self):
+        def search(query: str) -> str:
+            """Search the web."""
+            return f"Results: {query}"
+
+        toolset = SamplingToolset([search])
+
+        assert len(toolset) == 1
+        assert toolset.tool_map["search"] is toolset.tools[0]
+        assert toolset.sdk_tools is not None
+        assert toolset.sdk_tools[0].name == "search"
+        assert toolset.sdk_tools[0].inputSchema == toolset.tools[0].parameters
+
+    def test_empty_toolset(self):
+        toolset = SamplingToolset()
+
+        assert not toolset
+        assert toolset.sdk_tools is None
+        assert toolset.tool_map == {}
+
+    def test_from_tools_returns_existing_toolset(self):
+        def search(query: str) -> str:
+            return query
+
+        toolset = SamplingToolset([search])
+
+        assert SamplingToolset.from_tools(toolset) is toolset
+        assert SamplingToolset.from_tools([search]).tools == toolset.tools
+        assert not SamplingToolset.from_tools(None)
+
+    def test_toolset_reuses_its_own_conversions(self):
+        def search(query: str) -> str:
+            return query
+
+        function_tool = FunctionTool.from_function(search)
+        toolset = SamplingToolset([search, function_tool])
+        extended = toolset.with_tools(search)
+
+        assert extended.tools[2] is toolset.tools[0]
+        assert SamplingToolset([search]).tools[0] is not toolset.tools[0]
+
+    def test_with_tools_extends_without_mutating(self):
+        def search(query: str) -> str:
+            return query
+
+        def fetch(url: str) -> str:
+            return url
+
+        toolset = SamplingToolset([search])
+        extended = toolset.with_tools(fetch)
+
+        assert [t.name for t in toolset] == ["search"]
+        assert [t.name for t in extended] == ["search", "fetch"]
+        assert extended.tools[0] is toolset.tools[0]
+        assert set(extended.tool_map) == {"search", "fetch"}
+        assert extended.sdk_tools is not None
+        assert [t.name for t in extended.sdk_tools] == ["search", "fetch"]
@@ -145,6 +145,61 @@ async def test_tasks_list_endpoint_session_isolation(endpoint_server):
         assert all(tid in task_ids for tid in returned_ids)
 
 
+async def test_tasks_list_returns_server_side_status(endpoint_server):
+    """tasks/list is served from the server's task index, with status."""
+    async with Client(endpoint_server) as client:
+        ok = await client.call_tool("quick_tool", {"value": 1}, task=True)
+        bad = await client.call_tool("error_tool", task=True)
+        await ok.wait(timeout=2.0)
+        await bad.wait(state="failed", timeout=2.0)
+
+        # Bypass client-side tracking to check what the server returns
+        client._submitted_task_ids.clear()
+        response = await client.list_tasks()
+
+        statuses = {t["taskId"]: t for t in response["tasks"]}
+        assert list(statuses) == [ok.task_id, bad.task_id]
+        assert statuses[ok.task_id]["status"] == "completed"
+        assert statuses[bad.task_id]["status"] == "failed"
+        assert "Task failed!" in statuses[bad.task_id]["statusMessage"]
+
+
+async def test_tasks_list_paginates():
+    """tasks/list pages through tasks in submission order."""
+    mcp = FastMCP("paginated-tasks", list_page_size=2)
+
+    @mcp.tool(task=True)
+    async def quick_tool(value: int) -> int:
+        return value * 2
+
+    async with Client(mcp) as client:
+        tasks = [
+            await client.call_tool("quick_tool", {"value": i}, task=True)
+            for i in range(5)
+        ]
+
+        seen: list[str] = []
+        cursor = None
+        pages = 0
+        while True:
+            response = await client.list_tasks(cursor=cursor)
+            assert len(response["tasks"]) <= 2
+            seen.extend(t["taskId"] for t in response["tasks"])
+            pages += 1
+            cursor = response["nextCursor"]
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert seen == [t.task_id for t in tasks]
+
+
+async def test_tasks_list_invalid_cursor(endpoint_server):
+    async with Client(endpoint_server) as client:
+        with pytest.raises(McpError, match="Invalid cursor"):
+            await client.list_tasks(cursor="not-a-cursor")
+
+
 async def test_get_status_nonexistent_task_raises_error(endpoint_server):
     """Getting status for nonexistent task raises MCP error (per SEP-1686 SDK behavior)."""
     async with Client(endpoint_server) as client:
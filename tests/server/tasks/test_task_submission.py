@@ -0,0 +1,119 @@
+"""Tests for task metadata storage and batched status reads."""
+
+import anyio
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.server.dependencies import get_context
+from fastmcp.server.tasks import requests
+from fastmcp.server.tasks.metadata import (
+    TaskMetadata,
+    load_task_metadata,
+    store_task_metadata,
+    task_index_key,
+)
+from fastmcp.server.tasks.requests import get_task_statuses
+
+
+async def test_metadata_stored_as_single_hash():
+    mcp = FastMCP("metadata-test")
+
+    @mcp.tool(task=True)
+    async def slow() -> str:
+        return "done"
+
+    @mcp.tool
+    async def metadata(task_id: str) -> dict[str, str | int | None]:
+        ctx = get_context()
+        docket = ctx.fastmcp._docket
+        assert docket is not None
+        metadata = await load_task_metadata(docket, ctx.session_id, task_id)
+        assert metadata is not None
+        return {
+            "task_key": metadata.task_key,
+            "created_at": metadata.created_at,
+            "poll_interval_ms": metadata.poll_interval_ms,
+        }
+
+    async with Client(mcp) as client:
+        task = await client.call_tool("slow", {}, task=True)
+        result = await client.call_tool("metadata", {"task_id": task.task_id})
+        assert ":tool:" in result.data["task_key"]
+        assert result.data["created_at"] is not None
+        assert result.data["poll_interval_ms"] == 5000
+
+
+async def test_get_task_statuses():
+    mcp = FastMCP("status-test")
+
+    @mcp.tool(task=True)
+    async def double(value: int) -> int:
+        return value * 2
+
+    @mcp.tool
+    async def statuses(task_ids: list[str]) -> list[str | None]:
+        ctx = get_context()
+        docket = ctx.fastmcp._docket
+        assert docket is not None
+        tasks = await get_task_statuses(docket, ctx.session_id, task_ids)
+        return [task.status if task is not None else None for task in tasks]
+
+    async with Client(mcp) as client:
+        task_ids = [
+            (await client.call_tool("double", {"value": i}, task=True)).task_id
+            for i in range(3)
+        ]
+        with anyio.fail_after(5):
+            while True:
+                result = await client.call_tool(
+                    "statuses", {"task_ids": [*task_ids, "unknown"]}
+                )
+                if result.data[:3] == ["completed"] * 3:
+                    break
+                assert all(s in ("working", "completed") for s in result.data[:3])
+                await anyio.sleep(0.01)
+        assert result.data[3] is None
+
+
+async def test_task_index_ttl_never_shrinks():
+    mcp = FastMCP("index-ttl-test")
+
+    @mcp.tool(task=True)
+    async def background() -> None:
+        pass
+
+    @mcp.tool
+    async def index_ttl() -> int:
+        ctx = get_context()
+        docket = ctx.fastmcp._docket
+        assert docket is not None
+        metadata = TaskMetadata(task_key="key")
+        await store_task_metadata(docket, ctx.session_id, "long", metadata, 1000)
+        await store_task_metadata(docket, ctx.session_id, "short", metadata, 10)
+        async with docket.redis() as redis:
+            return await redis.ttl(task_index_key(docket, ctx.session_id))
+
+    async with Client(mcp) as client:
+        result = await client.call_tool("index_ttl", {})
+        assert result.data > 10
+
+
+async def test_task_state_falls_back_to_execution_sync(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    def unavailable(docket, task_key):
+        raise AttributeError("runs_key")
+
+    monkeypatch.setattr(requests, "_execution_state_keys", unavailable)
+    mcp = FastMCP("fallback-test")
+
+    @mcp.tool(task=True)
+    async def double(value: int) -> int:
+        return value * 2
+
+    async with Client(mcp) as client:
+        task = await client.call_tool("double", {"value": 2}, task=True)
+        with anyio.fail_after(5):
+            while (await client.get_task_status(task.task_id)).status != "completed":
+                await anyio.sleep(0.01)
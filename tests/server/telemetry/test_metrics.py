@@ -0,0 +1,244 @@
+"""Tests for server metrics."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+
+import pytest
+from starlette.testclient import TestClient
+
+from fastmcp import FastMCP
+from fastmcp.client import Client
+from fastmcp.exceptions import NotFoundError, ToolError
+from fastmcp.server.auth import AuthContext
+from fastmcp.server.metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    Counter,
+    Histogram,
+    MetricFamily,
+    MetricsExporter,
+    ServerMetrics,
+    generate_openmetrics,
+)
+from fastmcp.server.middleware.caching import ResponseCachingMiddleware
+
+
+def samples(metrics: ServerMetrics, name: str) -> dict[tuple, float]:
+    """Return a family's samples keyed by (sample name, sorted labels)."""
+    return {
+        (s.name, tuple(sorted(s.labels.items()))): s.value
+        for family in metrics.collect()
+        if family.name == name
+        for s in family.samples
+    }
+
+
+class TestMetricPrimitives:
+    def test_counter_sums_across_threads(self):
+        counter = Counter("hits", "Hits.", ("path",))
+
+        def work():
+            for _ in range(1000):
+                counter.inc("/a")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        counter.inc("/b", amount=2)
+
+        assert counter.value("/a") == 4000
+        assert counter.value("/b") == 2
+        assert counter.value("/c") == 0
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+
+        family = histogram.collect()
+        values = {(s.name, s.labels.get("le")): s.value for s in family.samples}
+        assert values[("latency_bucket", "0.1")] == 2
+        assert values[("latency_bucket", "1.0")] == 3
+        assert values[("latency_bucket", "+Inf")] == 4
+        assert values[("latency_count", None)] == 4
+        assert values[("latency_sum", None)] == pytest.approx(5.65)
+
+    def test_openmetrics_format(self):
+        counter = Counter("requests", "Requests.", ("method",))
+        counter.inc('say "hi"')
+
+        text = generate_openmetrics([counter.collect()])
+        assert text == (
+            "# HELP requests Requests.\n"
+            "# TYPE requests counter\n"
+            'requests_total{method="say \\"hi\\""} 1.0\n'
+            "# EOF\n"
+        )
+
+
+class TestServerMetrics:
+    async def test_disabled_by_default(self):
+        mcp = FastMCP("test-server")
+        assert mcp.metrics is None
+
+    async def test_tool_call_records_latency_and_payload(self):
+        mcp = FastMCP("test-server", metrics=True)
+
+        @mcp.tool
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        await mcp.call_tool("greet", {"name": "World"})
+
+        metrics = mcp.metrics
+        assert metrics is not None
+        labels = ("test-server", "tools/call", "tool", "greet")
+        assert metrics.requests.value(*labels, "success") == 1
+        assert metrics.request_duration.count(*labels) == 1
+        assert metrics.payload_bytes.count(*labels) == 1
+        payload = samples(metrics, "fastmcp_response_payload_bytes")
+        size_key = (
+            "fastmcp_response_payload_bytes_sum",
+            (
+                ("component", "greet"),
+                ("component_type", "tool"),
+                ("method", "tools/call"),
+                ("server", "test-server"),
+            ),
+        )
+        assert payload[size_key] == len("Hello, World!")
+
+    async def test_errors_are_counted(self):
+        mcp = FastMCP("test-server", metrics=True)
+
+        @mcp.tool
+        def failing() -> str:
+            raise ValueError("boom")
+
+        with pytest.raises(ToolError):
+            await mcp.call_tool("failing", {})
+
+        metrics = mcp.metrics
+        assert metrics is not None
+        labels = ("test-server", "tools/call", "tool", "failing")
+        assert metrics.requests.value(*labels, "error") == 1
+        assert metrics.payload_bytes.count(*labels) == 0
+
+    async def test_unknown_components_share_one_series(self):
+        mcp = FastMCP("test-server", metrics=True)
+
+        for name in ("missing_a", "missing_b"):
+            with pytest.raises(NotFoundError):
+                await mcp.call_tool(name, {})
+
+        metrics = mcp.metrics
+        assert metrics is not None
+        labels = ("test-server", "tools/call", "tool", "")
+        assert metrics.requests.value(*labels, "error") == 2
+
+    async def test_templates_are_labeled_by_uri_template(self):
+        mcp = FastMCP("test-server", metrics=True)
+
+        @mcp.resource("data://users/{user_id}")
+        def user(user_id: str) -> str:
+            return user_id
+
+        await mcp.read_resource("data://users/1")
+        await mcp.read_resource("data://users/2")
+
+        metrics = mcp.metrics
+        assert metrics is not None
+        template = "data://users/{user_id}"
+        labels = ("test-server", "resources/read", "resource", template)
+        assert metrics.requests.value(*labels, "success") == 2
+
+    async def test_provider_fan_out_is_timed(self):
+        mcp = FastMCP("test-server", metrics=True)
+
+        @mcp.tool
+        def greet() -> str:
+            return "hi"
+
+        await mcp.call_tool("greet", {})
+
+        metrics = mcp.metrics
+        assert metrics is not None
+        durations = samples(metrics, "fastmcp_provider_duration_seconds")
+        counts = {
+            dict(labels)["operation"]: value
+            for (name, labels), value in durations.items()
+            if name == "fastmcp_provider_duration_seconds_count"
+        }
+        assert counts["get_tool"] == 1
+
+    async def test_component_auth_checks_are_timed(self):
+        def deny(ctx: AuthContext) -> bool:
+            return False
+
+        mcp = FastMCP("test-server", metrics=True)
+
+        @mcp.tool(auth=deny)
+        def secret() -> str:
+            return "secret"
+
+        async with Client(mcp) as client:
+            await client.list_tools()
+
+        metrics = mcp.metrics
+        assert metrics is not None
+        assert metrics.auth_duration.count("component", "denied") >= 1
+
+    async def test_cache_lookups_are_collected(self):
+        mcp = FastMCP("test-server", metrics=True)
+        mcp.add_middleware(ResponseCachingMiddleware())
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        async with Client(mcp) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        metrics = mcp.metrics
+        assert metrics is not None
+        lookups = samples(metrics, "fastmcp_cache_lookups")
+        hit = (("method", "tools/call"), ("result", "hit"))
+        miss = (("method", "tools/call"), ("result", "miss"))
+        assert lookups["fastmcp_cache_lookups_total", hit] == 1
+        assert lookups["fastmcp_cache_lookups_total", miss] == 1
+
+    def test_metrics_route(self):
+        mcp = FastMCP("test-server", metrics=ServerMetrics(route="/metrics"))
+
+        with TestClient(mcp.http_app()) as client:
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == OPENMETRICS_CONTENT_TYPE
+        assert "# TYPE fastmcp_request_duration_seconds histogram" in response.text
+        assert response.text.endswith("# EOF\n")
+
+    async def test_exporters_run_at_shutdown(self):
+        exported: list[Sequence[MetricFamily]] = []
+
+        class RecordingExporter(MetricsExporter):
+            async def export(self, families: Sequence[MetricFamily]) -> None:
+                exported.append(families)
+
+        metrics = ServerMetrics(exporters=[RecordingExporter()], export_interval=3600)
+        mcp = FastMCP("test-server", metrics=metrics)
+
+        @mcp.tool
+        def greet() -> str:
+            return "hi"
+
+        async with Client(mcp) as client:
+            await client.call_tool("greet", {})
+
+        assert len(exported) == 1
+        names = {family.name for family in exported[0]}
+        assert "fastmcp_requests" in names
@@ -0,0 +1,221 @@
+"""Tests for the wire-format catalog cache used by list handlers."""
+
+import gc
+
+import mcp.types
+from pydantic import BaseModel
+
+from fastmcp import Client, Context, FastMCP
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.transforms import Namespace
+from fastmcp.tools import Tool
+
+
+def _list_request() -> mcp.types.ListToolsRequest:
+    return mcp.types.ListToolsRequest(method="tools/list")
+
+
+class TestCatalogCache:
+    async def test_unchanged_catalog_is_reused(self):
+        mcp_server = FastMCP("test")
+
+        @mcp_server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        first = await mcp_server._list_tools_mcp(_list_request())
+        second = await mcp_server._list_tools_mcp(_list_request())
+        assert second.tools[0] is first.tools[0]
+
+    async def test_added_tool_is_listed(self):
+        mcp_server = FastMCP("test")
+
+        @mcp_server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        async with Client(mcp_server) as client:
+            assert [t.name for t in await client.list_tools()] == ["add"]
+
+            @mcp_server.tool
+            def subtract(a: int, b: int) -> int:
+                return a - b
+
+            tools = await client.list_tools()
+            assert sorted(t.name for t in tools) == ["add", "subtract"]
+
+    async def test_disabled_tool_is_not_listed(self):
+        mcp_server = FastMCP("test")
+
+        @mcp_server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @mcp_server.tool
+        def subtract(a: int, b: int) -> int:
+            return a - b
+
+        async with Client(mcp_server) as client:
+            assert len(await client.list_tools()) == 2
+            mcp_server.disable(names={"subtract"})
+            assert [t.name for t in await client.list_tools()] == ["add"]
+
+    async def test_edited_tool_is_relisted(self):
+        mcp_server = FastMCP("test")
+        tool = mcp_server.add_tool(Tool.from_function(lambda: 1, name="one"))
+
+        await mcp_server._list_tools_mcp(_list_request())
+        tool.description = "changed"
+        result = await mcp_server._list_tools_mcp(_list_request())
+        assert result.tools[0].description == "changed"
+
+    async def test_edited_mounted_tool_is_relisted(self):
+        child = FastMCP("child")
+        tool = child.add_tool(Tool.from_function(lambda: 1, name="one"))
+        parent = FastMCP("parent")
+        parent.mount(child, namespace="child")
+
+        await parent._list_tools_mcp(_list_request())
+        tool.description = "changed"
+        result = await parent._list_tools_mcp(_list_request())
+        assert result.tools[0].description == "changed"
+
+    async def test_versions_are_injected(self):
+        mcp_server = FastMCP("test")
+
+        @mcp_server.tool(version="1.0")
+        def calc() -> int:
+            return 1
+
+        @mcp_server.tool(name="calc", version="2.0")
+        def calc_v2() -> int:
+            return 2
+
+        for _ in range(2):
+            result = await mcp_server._list_tools_mcp(_list_request())
+            assert len(result.tools) == 1
+            assert result.tools[0].meta is not None
+            assert result.tools[0].meta["fastmcp"]["versions"] == ["2.0", "1.0"]
+
+    async def test_mounted_catalog_is_reused(self):
+        child = FastMCP("child")
+
+        @child.tool
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        parent = FastMCP("parent")
+        parent.mount(child, namespace="child")
+
+        first = await parent._list_tools_mcp(_list_request())
+        second = await parent._list_tools_mcp(_list_request())
+        assert [t.name for t in first.tools] == ["child_greet"]
+        assert second.tools[0] is first.tools[0]
+
+    async def test_mounted_list_middleware_runs_every_time(self):
+        child = FastMCP("child")
+
+        @child.tool
+        def secret() -> str:
+            return "secret"
+
+        hidden = False
+
+        class HideWhenAsked(Middleware):
+            async def on_list_tools(self, context, call_next):
+                tools = await call_next(context)
+                return [] if hidden else tools
+
+        child.add_middleware(HideWhenAsked())
+        parent = FastMCP("parent")
+        parent.mount(child, namespace="c")
+
+        result = await parent._list_tools_mcp(_list_request())
+        assert [t.name for t in result.tools] == ["c_secret"]
+        hidden = True
+        result = await parent._list_tools_mcp(_list_request())
+        assert result.tools == []
+
+    async def test_reused_catalog_skips_providers(self):
+        mcp_server = FastMCP("test")
+
+        @mcp_server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        calls = 0
+        list_tools = mcp_server._local_provider._list_tools
+
+        async def counting_list_tools():
+            nonlocal calls
+            calls += 1
+            return await list_tools()
+
+        mcp_server._local_provider._list_tools = counting_list_tools  # type: ignore[method-assign]
+
+        await mcp_server._list_tools_mcp(_list_request())
+        await mcp_server._list_tools_mcp(_list_request())
+        assert calls == 1
+
+        mcp_server.disable(names={"add"})
+        result = await mcp_server._list_tools_mcp(_list_request())
+        assert result.tools == []
+        assert calls == 2
+
+    async def test_dereferenced_catalog_is_reused(self):
+        mcp_server = FastMCP("test")
+
+        class Point(BaseModel):
+            x: int
+            y: int
+
+        @mcp_server.tool
+        def move(point: Point) -> Point:
+            return point
+
+        first = await mcp_server._list_tools_mcp(_list_request())
+        second = await mcp_server._list_tools_mcp(_list_request())
+        assert "$defs" not in first.tools[0].inputSchema
+        assert second.tools[0] is first.tools[0]
+
+    async def test_session_visibility_gets_its_own_catalog(self):
+        mcp_server = FastMCP("test")
+
+        @mcp_server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @mcp_server.tool
+        async def hide_add(ctx: Context) -> str:
+            await ctx.disable_components(names={"add"})
+            return "hidden"
+
+        async with Client(mcp_server) as hiding, Client(mcp_server) as other:
+            await hiding.call_tool("hide_add", {})
+            assert [t.name for t in await hiding.list_tools()] == ["hide_add"]
+            assert sorted(t.name for t in await other.list_tools()) == [
+                "add",
+                "hide_add",
+            ]
+            assert [t.name for t in await hiding.list_tools()] == ["hide_add"]
+
+
+class TestNamespaceCopies:
+    async def test_copies_are_reused(self):
+        tool = Tool.from_function(lambda: 1, name="one")
+        namespace = Namespace("ns")
+
+        [first] = await namespace.list_tools([tool])
+        [second] = await namespace.list_tools([tool])
+        assert first.name == "ns_one"
+        assert second is first
+
+    async def test_copy_dropped_with_original(self):
+        tool = Tool.from_function(lambda: 1, name="one")
+        namespace = Namespace("ns")
+
+        await namespace.list_tools([tool])
+        assert len(namespace._copies._entries) == 1
+        del tool
+        gc.collect()
+        assert namespace._copies._entries == {}
@@ -0,0 +1,204 @@
+import asyncio
+
+import pytest
+
+from fastmcp import Context, FastMCP
+from fastmcp.server.coalescing import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    async def test_concurrent_calls_share_execution(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        results = await asyncio.gather(*(coalescer.run("k", work) for _ in range(10)))
+        assert results == [1] * 10
+        assert calls == 1
+        assert len(coalescer) == 0
+
+    async def test_sequential_calls_are_not_cached(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await coalescer.run("k", work) == 1
+        assert await coalescer.run("k", work) == 2
+
+    async def test_different_keys_run_separately(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(coalescer.run("a", work), coalescer.run("b", work))
+        assert calls == 2
+
+    async def test_errors_reach_every_caller(self):
+        coalescer = RequestCoalescer()
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            coalescer.run("k", fail), coalescer.run("k", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(coalescer) == 0
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        coalescer = RequestCoalescer()
+
+        async def work() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(coalescer.run("k", work))
+        second = asyncio.create_task(coalescer.run("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_execution_cancelled_when_all_callers_leave(self):
+        coalescer = RequestCoalescer()
+        finished = False
+
+        async def work() -> None:
+            nonlocal finished
+            await asyncio.sleep(0.05)
+            finished = True
+
+        caller = asyncio.create_task(coalescer.run("k", work))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0.08)
+
+        assert not finished
+        assert len(coalescer) == 0
+
+
+class TestServerCoalescing:
+    async def test_resource(self):
+        mcp = FastMCP()
+        calls = 0
+
+        @mcp.resource("data://dashboard", coalesce=True)
+        async def dashboard() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "data"
+
+        results = await asyncio.gather(
+            *(mcp.read_resource("data://dashboard") for _ in range(5))
+        )
+        assert all(r.contents[0].content == "data" for r in results)
+        assert calls == 1
+
+    async def test_template_coalesces_per_uri(self):
+        mcp = FastMCP()
+        calls: list[str] = []
+
+        @mcp.resource("data://{name}", coalesce=True)
+        async def item(name: str) -> str:
+            calls.append(name)
+            await asyncio.sleep(0.05)
+            return name
+
+        await asyncio.gather(
+            mcp.read_resource("data://a"),
+            mcp.read_resource("data://a"),
+            mcp.read_resource("data://b"),
+        )
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_prompt_coalesces_per_arguments(self):
+        mcp = FastMCP()
+        calls: list[str] = []
+
+        @mcp.prompt(coalesce=True)
+        async def greet(name: str) -> str:
+            calls.append(name)
+            await asyncio.sleep(0.05)
+            return f"Hello, {name}!"
+
+        await asyncio.gather(
+            mcp.render_prompt("greet", {"name": "a"}),
+            mcp.render_prompt("greet", {"name": "a"}),
+            mcp.render_prompt("greet", {"name": "b"}),
+        )
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_not_coalesced_by_default(self):
+        mcp = FastMCP()
+        calls = 0
+
+        @mcp.resource("data://dashboard")
+        async def dashboard() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "data"
+
+        await asyncio.gather(*(mcp.read_resource("data://dashboard") for _ in range(3)))
+        assert calls == 3
+
+
+class TestInjectedParameters:
+    def test_resource_with_context_is_rejected(self):
+        mcp = FastMCP()
+        with pytest.raises(ValueError, match="coalesce=True is not supported"):
+
+            @mcp.resource("data://session", coalesce=True)
+            async def session(ctx: Context) -> str:
+                return ctx.session_id
+
+    def test_template_with_context_is_rejected(self):
+        mcp = FastMCP()
+        with pytest.raises(ValueError, match="coalesce=True is not supported"):
+
+            @mcp.resource("data://{name}", coalesce=True)
+            async def item(name: str, ctx: Context) -> str:
+                return ctx.session_id
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_prompt_with_context_is_rejected(self, lazy: bool):
+        mcp = FastMCP(lazy_components=lazy)
+        with pytest.raises(ValueError, match="coalesce=True is not supported"):
+
+            @mcp.prompt(coalesce=True)
+            async def greet(name: str, ctx: Context) -> str:
+                return ctx.session_id
+
+
+def test_key_includes_access_token(monkeypatch: pytest.MonkeyPatch):
+    from fastmcp.server import coalescing
+    from fastmcp.server.auth import AccessToken
+
+    def token(value: str) -> AccessToken:
+        return AccessToken(token=value, client_id="client", scopes=[])
+
+    monkeypatch.setattr(coalescing, "get_access_token", lambda: token("alice"))
+    alice = coalescing.coalescing_key("resource:data://x@", "data://x")
+    monkeypatch.setattr(coalescing, "get_access_token", lambda: token("bob"))
+    bob = coalescing.coalescing_key("resource:data://x@", "data://x")
+    monkeypatch.setattr(coalescing, "get_access_token", lambda: None)
+    anonymous = coalescing.coalescing_key("resource:data://x@", "data://x")
+
+    assert len({alice, bob, anonymous}) == 3
@@ -0,0 +1,88 @@
+"""Performance regression tests for component identity on hot paths.
+
+Registry lookups, version selection, and visibility/namespace transforms all
+hit `key`, `version_key`, and equality for every component on every request.
+These tests are canaries rather than strict benchmarks: the bounds are loose
+enough for CI, but recomputing identity on every access blows through them.
+"""
+
+import time
+
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.server.transforms import Namespace
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.versions import version_sort_key
+
+NUM_TOOLS = 1000
+
+
+def _make_server() -> FastMCP:
+    mcp = FastMCP("perf")
+    for i in range(NUM_TOOLS):
+        for version in ("1.0", "2.0"):
+            mcp.add_tool(
+                Tool(
+                    name=f"tool_{i}",
+                    version=version,
+                    tags={"perf", f"group_{i % 10}"},
+                    parameters={"type": "object", "properties": {}},
+                )
+            )
+    mcp.add_transform(Namespace("ns"))
+    mcp.disable(tags={"group_0"})
+    return mcp
+
+
+class TestComponentIdentityPerformance:
+    @pytest.mark.timeout(30)
+    async def test_list_and_get_through_transforms(self):
+        mcp = _make_server()
+        await mcp.list_tools()
+
+        start = time.perf_counter()
+        for _ in range(10):
+            tools = await mcp.list_tools(run_middleware=False)
+        list_elapsed = time.perf_counter() - start
+        print(f"10 list_tools calls took {list_elapsed:.3f}s")
+
+        # Both versions of every tool outside the disabled group
+        assert len(tools) == 2 * (NUM_TOOLS - NUM_TOOLS // 10)
+
+        start = time.perf_counter()
+        for i in range(200):
+            tool = await mcp.get_tool(f"ns_tool_{i}")
+            if i % 10 == 0:
+                assert tool is None
+            else:
+                assert tool is not None and tool.version == "2.0"
+        get_elapsed = time.perf_counter() - start
+        print(f"200 get_tool calls took {get_elapsed:.3f}s")
+
+        assert list_elapsed < 10.0
+        assert get_elapsed < 10.0
+
+    @pytest.mark.timeout(30)
+    def test_key_version_and_equality(self):
+        tools = [
+            Tool(name=f"tool_{i}", version=str(i % 5), parameters={})
+            for i in range(NUM_TOOLS)
+        ]
+        copies = [tool.model_copy() for tool in tools]
+
+        start = time.perf_counter()
+        for _ in range(100):
+            keys = {tool.key for tool in tools}
+            max(tools, key=version_sort_key)
+        identity_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(10):
+            assert tools == copies
+        equality_elapsed = time.perf_counter() - start
+        print(f"identity: {identity_elapsed:.3f}s, equality: {equality_elapsed:.3f}s")
+
+        assert len(keys) == NUM_TOOLS
+        assert identity_elapsed < 5.0
+        assert equality_elapsed < 5.0
@@ -9,7 +9,14 @@ strict_input_validation=False, the default).
 import json
 
 import pytest
-from mcp.types import TextContent
+from mcp.server.lowlevel import Server
+from mcp.types import (
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    TextContent,
+    Tool,
+)
 from pydantic import BaseModel
 
 from fastmcp import Client, FastMCP
@@ -243,6 +250,43 @@ class TestValidationErrorMessages:
                 or "type" in error_msg.lower()
             )
 
+    async def test_strict_error_matches_sdk(self):
+        """Strict validation returns the same result as the MCP SDK handler."""
+        mcp = FastMCP("TestServer", strict_input_validation=True)
+
+        @mcp.tool
+        def process_data(count: int, name: str) -> str:
+            """Process some data."""
+            return f"Processed {count} items for {name}"
+
+        arguments = {"count": "not-a-number", "name": "test"}
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "process_data", arguments, raise_on_error=False
+            )
+
+        tool = await mcp.get_tool("process_data")
+        assert tool is not None
+        sdk = Server("sdk")
+
+        @sdk.list_tools()
+        async def list_tools() -> list[Tool]:
+            return [tool.to_mcp_tool()]
+
+        @sdk.call_tool()
+        async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+            return []
+
+        expected = await sdk.request_handlers[CallToolRequest](
+            CallToolRequest(
+                params=CallToolRequestParams(name="process_data", arguments=arguments)
+            )
+        )
+        assert isinstance(expected.root, CallToolResult)
+        assert expected.root.isError
+        assert result.is_error
+        assert result.content == expected.root.content
+
     async def test_error_message_quality_pydantic(self):
         """Capture error message with Pydantic validation."""
         mcp = FastMCP("TestServer", strict_input_validation=False)
@@ -0,0 +1,73 @@
+"""Performance regression tests for tool schema validation.
+
+Every tools/call validates its arguments against the tool's input schema (with
+`strict_input_validation`) and its structured content against the output schema.
+`jsonschema.validate` re-checks the schema and builds a validator each time;
+compiled validators are reused instead. These are canaries rather than strict
+benchmarks: the bounds are loose enough for CI.
+"""
+
+import time
+
+import jsonschema
+import pytest
+from pydantic import BaseModel
+
+from fastmcp import Client, FastMCP
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.json_schema import validate_json_schema
+
+NUM_CALLS = 200
+
+
+class Item(BaseModel):
+    name: str
+    quantity: int
+    tags: list[str] = []
+
+
+def order(items: list[Item], owner: str, limit: int = 10, note: str | None = None):
+    return {"count": len(items), "owner": owner}
+
+
+ARGUMENTS = {
+    "items": [{"name": f"item-{i}", "quantity": i, "tags": ["a"]} for i in range(5)],
+    "owner": "me",
+}
+
+
+class TestValidationPerformance:
+    @pytest.mark.timeout(30)
+    def test_compiled_validation_is_faster_per_call(self):
+        schema = Tool.from_function(order).parameters
+
+        start = time.perf_counter()
+        for _ in range(NUM_CALLS):
+            jsonschema.validate(ARGUMENTS, schema)
+        uncached = (time.perf_counter() - start) / NUM_CALLS
+
+        start = time.perf_counter()
+        for _ in range(NUM_CALLS):
+            validate_json_schema(ARGUMENTS, schema)
+        cached = (time.perf_counter() - start) / NUM_CALLS
+
+        print(
+            f"per-call validation: jsonschema.validate {uncached * 1e6:.0f}us, "
+            f"compiled {cached * 1e6:.0f}us"
+        )
+        assert cached < uncached
+
+    @pytest.mark.timeout(30)
+    async def test_strict_tool_calls(self):
+        mcp = FastMCP("perf", strict_input_validation=True)
+        mcp.tool(order)
+
+        async with Client(mcp) as client:
+            start = time.perf_counter()
+            for _ in range(NUM_CALLS):
+                result = await client.call_tool("order", ARGUMENTS)
+                assert result.data == {"count": 5, "owner": "me"}
+            elapsed = time.perf_counter() - start
+        print(f"{NUM_CALLS} strict tool calls took {elapsed:.3f}s")
+
+        assert elapsed < 10.0
@@ -0,0 +1,87 @@
+"""Regression tests for the cost of `import fastmcp`.
+
+Optional subsystems (auth providers, OpenAPI, skills, the CLI) are imported
+on first use. These tests fail if one of them is pulled back into the
+top-level import, or if the import as a whole grows past its budget.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from fastmcp.cli.diagnose import measure_import
+
+# `import fastmcp` is measured against importing the MCP SDK's own high-level
+# server (`mcp.server.fastmcp`), which loads pydantic, starlette and uvicorn
+# too. Comparing against a baseline measured on the same machine keeps the test
+# meaningful on slow or heavily loaded runners, where absolute times vary.
+# fastmcp currently takes about twice as long as the baseline.
+REFERENCE_MODULE = "mcp.server.fastmcp"
+IMPORT_TIME_RATIO_BUDGET = 3.0
+
+# uvicorn, starlette and the SDK's HTTP transports can't be listed here: any
+# `mcp.server` import runs the SDK's `mcp.server.fastmcp`, which imports them.
+# fastmcp.server.http also stays eager because dependencies.py needs its
+# request context variable.
+LAZY_MODULES = [
+    "fastmcp.cli",
+    "fastmcp.server.auth.oauth_proxy",
+    "fastmcp.server.auth.oidc_proxy",
+    "fastmcp.server.auth.providers.jwt",
+    "fastmcp.server.providers.openapi",
+    "fastmcp.server.providers.proxy",
+    "fastmcp.server.providers.skills",
+    "authlib",
+    "openapi_pydantic",
+]
+
+
+@pytest.mark.timeout(30)
+def test_optional_modules_not_imported():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, fastmcp; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(result.stdout.splitlines())
+
+    assert [module for module in LAZY_MODULES if module in loaded] == []
+
+
+def _import_time_us(module: str) -> int:
+    """Total time of all top-level imports when importing `module` afresh."""
+    return sum(t.cumulative_us for t in measure_import(module) if t.depth == 0)
+
+
+# Six fresh interpreters can take a while on a loaded machine; the timeout only
+# guards against hangs, the ratio is what is tested.
+@pytest.mark.timeout(180)
+def test_import_time_budget():
+    """Canary for large regressions rather than a strict performance test.
+
+    Both imports are measured in alternation and the best of three runs of
+    each is compared, so that one slow run on a busy machine does not fail the
+    test.
+    """
+    fastmcp_times, reference_times = [], []
+    for _ in range(3):
+        fastmcp_times.append(_import_time_us("fastmcp"))
+        reference_times.append(_import_time_us(REFERENCE_MODULE))
+    ratio = min(fastmcp_times) / min(reference_times)
+    assert ratio < IMPORT_TIME_RATIO_BUDGET
+
+
+@pytest.mark.timeout(30)
+def test_lazy_exports_resolve():
+    from fastmcp.server import auth, providers
+
+    for name in auth.__all__:
+        assert getattr(auth, name) is not None
+    for name in providers.__all__:
+        assert getattr(providers, name) is not None
@@ -5,6 +5,7 @@ import logging
 import os
 import sys
 import tempfile
+import time
 from collections.abc import AsyncGenerator
 from datetime import timedelta
 from pathlib import Path
@@ -457,6 +458,136 @@ async def test_multi_client_force_close(tmp_path: Path):
         assert not process
 
 
+@pytest.mark.timeout(30)
+async def test_multi_client_reuses_composite_across_connections(tmp_path: Path):
+    server_script = inspect.cleandoc("""
+        from fastmcp import FastMCP
+        import os
+
+        mcp = FastMCP()
+
+        @mcp.tool
+        def pid() -> int:
+            return os.getpid()
+
+        if __name__ == '__main__':
+            mcp.run()
+        """)
+
+    script_path = tmp_path / "test.py"
+    script_path.write_text(server_script)
+
+    config = {
+        "mcpServers": {
+            "test_1": {"command": "python", "args": [str(script_path)]},
+            "test_2": {"command": "python", "args": [str(script_path)]},
+        }
+    }
+    transport = MCPConfigTransport(config)
+    client = Client(transport)
+
+    try:
+        async with client:
+            composite = transport._composite
+            pid_1 = (await client.call_tool("test_1_pid")).data
+
+        async with client:
+            assert transport._composite is composite
+            assert (await client.call_tool("test_1_pid")).data == pid_1
+
+        assert set(transport.connect_times) == {"test_1", "test_2"}
+    finally:
+        await client.close()
+    assert transport._composite is None
+
+
+@pytest.mark.timeout(30)
+async def test_multi_client_slow_backend_connects_lazily(tmp_path: Path):
+    server_script = inspect.cleandoc("""
+        import sys
+        import time
+        from fastmcp import FastMCP
+
+        if sys.argv[1] == "slow":
+            time.sleep(3)
+
+        mcp = FastMCP()
+
+        @mcp.tool
+        def name() -> str:
+            return sys.argv[1]
+
+        if __name__ == '__main__':
+            mcp.run()
+        """)
+
+    script_path = tmp_path / "test.py"
+    script_path.write_text(server_script)
+
+    config = {
+        "mcpServers": {
+            "fast": {"command": "python", "args": [str(script_path), "fast"]},
+            "slow": {
+                "command": "python",
+                "args": [str(script_path), "slow"],
+                "startup_timeout": 0.1,
+            },
+        }
+    }
+    client = Client(MCPConfigTransport(config))
+
+    async with client:
+        tools = await client.list_tools()
+        assert [tool.name for tool in tools] == ["fast_name"]
+
+        # Calling a tool on the slow backend waits for it to connect
+        result = await client.call_tool("slow_name")
+        assert result.data == "slow"
+
+        tools = await client.list_tools()
+        assert {tool.name for tool in tools} == {"fast_name", "slow_name"}
+
+
+async def test_multi_client_failed_backend_retries_with_backoff():
+    config = {
+        "mcpServers": {
+            "a": {"url": "http://127.0.0.1:9/mcp"},
+            "b": {"url": "http://127.0.0.1:9/mcp"},
+        }
+    }
+    transport = MCPConfigTransport(config)
+    client = Client(transport)
+
+    async with client:
+        backend = transport._backends["a"]
+        assert backend.failures == 1
+        assert await client.list_tools() == []
+        await asyncio.sleep(0.1)
+        # The first retry is immediate, later ones back off
+        assert backend.failures == 2
+        assert backend.retry_at > time.monotonic()
+        assert await client.list_tools() == []
+        await asyncio.sleep(0.1)
+        assert backend.failures == 2
+
+
+async def test_multi_client_waits_for_slow_backend_once():
+    # `sleep` never answers the initialize request
+    config = {
+        "mcpServers": {
+            "a": {"command": "sleep", "args": ["10"], "startup_timeout": 0.1},
+            "b": {"command": "sleep", "args": ["10"], "startup_timeout": 0.1},
+        }
+    }
+    transport = MCPConfigTransport(config)
+
+    async with Client(transport):
+        assert transport._backends["a"].connecting
+        with patch.object(transport, "_wait_for_backend") as wait_for_backend:
+            await transport._start_backends()
+        wait_for_backend.assert_not_called()
+
+
 async def test_remote_config_default_no_auth():
     config = {
         "mcpServers": {
@@ -899,7 +1030,8 @@ async def test_multi_server_timeout_propagation():
         }
     )
 
-    transport = MCPConfigTransport(config)
+    # `echo` never completes a handshake, so don't wait for the backends
+    transport = MCPConfigTransport(config, startup_timeout=0)
     timeout = timedelta(seconds=42)
 
     # Patch _create_proxy to verify timeout is passed correctly
@@ -0,0 +1,86 @@
+"""Tests for running sync tools in a worker process."""
+
+import os
+import time
+
+import pytest
+
+from fastmcp import Context, FastMCP
+from fastmcp.dependencies import Depends
+from fastmcp.exceptions import ToolError
+from fastmcp.tools import Tool
+
+
+def get_pid(scale: int, label: str = "x") -> dict[str, int | str]:
+    return {"pid": os.getpid(), "value": scale * 2, "label": label}
+
+
+def sleep_for(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+class TestProcessExecutor:
+    async def test_runs_in_worker_process(self):
+        mcp = FastMCP()
+        mcp.tool(get_pid, executor="process")
+
+        result = await mcp.call_tool("get_pid", {"scale": 3})
+
+        assert result.structured_content is not None
+        assert result.structured_content["pid"] != os.getpid()
+        assert result.structured_content["value"] == 6
+        assert result.structured_content["label"] == "x"
+
+    async def test_arguments_are_validated_before_dispatch(self):
+        mcp = FastMCP()
+        mcp.tool(get_pid, executor="process")
+
+        result = await mcp.call_tool("get_pid", {"scale": "4", "label": "y"})
+
+        assert result.structured_content is not None
+        assert result.structured_content["value"] == 8
+        assert result.structured_content["label"] == "y"
+
+    async def test_timeout_cancels_worker(self):
+        mcp = FastMCP()
+        mcp.tool(sleep_for, executor="process", timeout=0.5)
+
+        with pytest.raises(ToolError, match="timed out"):
+            await mcp.call_tool("sleep_for", {"seconds": 30})
+
+    def test_rejects_async_functions(self):
+        mcp = FastMCP()
+
+        async def async_tool() -> str:
+            return "hi"
+
+        with pytest.raises(ValueError, match="requires a sync function"):
+            mcp.tool(async_tool, executor="process")
+
+    def test_rejects_context(self):
+        mcp = FastMCP()
+
+        def context_tool(ctx: Context) -> str:
+            return "hi"
+
+        with pytest.raises(ValueError, match="does not support Context"):
+            mcp.tool(context_tool, executor="process")
+
+    def test_rejects_dependencies(self):
+        mcp = FastMCP()
+
+        def get_value() -> int:
+            return 1
+
+        def dependency_tool(value: int = Depends(get_value)) -> int:
+            return value
+
+        with pytest.raises(ValueError, match="does not support Context"):
+            mcp.tool(dependency_tool, executor="process")
+
+    def test_executor_not_in_schema(self):
+        tool = Tool.from_function(get_pid, executor="process")
+
+        assert tool.executor == "process"
+        assert "executor" not in tool.model_dump()
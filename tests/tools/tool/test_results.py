@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Any
 
 import pytest
+from mcp.types import TextContent
 
 from fastmcp.tools.tool import Tool, ToolResult
 
@@ -182,3 +183,108 @@ class TestSerializationAlias:
                 component_data = result.structured_content
             assert component_data["componentId"] == "test123"
             assert "id" not in component_data
+
+
+class TestConvertResultEncoding:
+    """Tests for the single-pass encoding used by Tool.convert_result."""
+
+    def test_text_matches_structured_content(self):
+        from datetime import date
+
+        def get_data() -> dict[str, Any]:
+            return {"when": date(2024, 1, 2), "items": (1, 2), "ok": True}
+
+        tool = Tool.from_function(get_data)
+        result = tool.convert_result(get_data())
+
+        assert result.structured_content == {
+            "when": "2024-01-02",
+            "items": [1, 2],
+            "ok": True,
+        }
+        content = result.content[0]
+        assert isinstance(content, TextContent)
+        assert content.text == '{"when":"2024-01-02","items":[1,2],"ok":true}'
+
+    def test_list_without_schema_has_no_structured_content(self):
+        tool = Tool.from_function(lambda: [1, 2, 3], name="nums", output_schema=None)
+        result = tool.convert_result([1, 2, 3])
+
+        assert result.structured_content is None
+        content = result.content[0]
+        assert isinstance(content, TextContent)
+        assert content.text == "[1,2,3]"
+
+    def test_unserializable_value_falls_back_to_text(self):
+        class Opaque:
+            def __str__(self) -> str:
+                return "opaque"
+
+        tool = Tool.from_function(lambda: None, name="opaque", output_schema=None)
+        result = tool.convert_result({"value": Opaque()})
+
+        assert result.structured_content is None
+        content = result.content[0]
+        assert isinstance(content, TextContent)
+        assert content.text == '{"value":"opaque"}'
+
+    def test_wrapped_result(self):
+        def get_numbers() -> list[int]:
+            return [1, 2]
+
+        tool = Tool.from_function(get_numbers)
+        result = tool.convert_result([1, 2])
+
+        assert result.structured_content == {"result": [1, 2]}
+        content = result.content[0]
+        assert isinstance(content, TextContent)
+        assert content.text == "[1,2]"
+
+
+class TestStructuredOnly:
+    def test_structured_only_omits_text_content(self):
+        def get_data() -> dict[str, int]:
+            return {"a": 1}
+
+        tool = Tool.from_function(get_data, structured_only=True)
+        result = tool.convert_result({"a": 1})
+
+        assert result.content == []
+        assert result.structured_content == {"a": 1}
+
+    def test_structured_only_wraps_result(self):
+        def get_numbers() -> list[int]:
+            return [1, 2]
+
+        tool = Tool.from_function(get_numbers, structured_only=True)
+        result = tool.convert_result([1, 2])
+
+        assert result.content == []
+        assert result.structured_content == {"result": [1, 2]}
+
+    def test_structured_only_without_structured_content_keeps_text(self):
+        tool = Tool.from_function(
+            lambda: [1, 2], name="nums", output_schema=None, structured_only=True
+        )
+        result = tool.convert_result([1, 2])
+
+        assert result.structured_content is None
+        content = result.content[0]
+        assert isinstance(content, TextContent)
+        assert content.text == "[1,2]"
+
+    async def test_structured_only_over_the_wire(self):
+        from fastmcp import Client, FastMCP
+
+        mcp = FastMCP()
+
+        @mcp.tool(structured_only=True)
+        def get_data() -> dict[str, int]:
+            return {"a": 1}
+
+        async with Client(mcp) as client:
+            result = await client.call_tool("get_data", {})
+
+        assert result.content == []
+        assert result.structured_content == {"a": 1}
+        assert result.data == {"a": 1}
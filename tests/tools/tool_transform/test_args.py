@@ -13,6 +13,7 @@ from fastmcp.client.client import Client
 from fastmcp.exceptions import ToolError
 from fastmcp.tools import Tool, forward, forward_raw
 from fastmcp.tools.function_tool import FunctionTool
+from fastmcp.tools.tool import ToolResult
 from fastmcp.tools.tool_transform import (
     ArgTransform,
 )
@@ -59,6 +60,75 @@ async def test_tool_transform_chaining(add_tool):
     assert result.content[0].text == "custom 8"
 
 
+async def test_chained_pure_transforms_call_base_tool_directly(add_tool):
+    """Stacked transforms without custom functions forward in a single step."""
+    calls = []
+
+    def next_y() -> int:
+        calls.append(1)
+        return len(calls)
+
+    tool1 = Tool.from_tool(
+        add_tool,
+        transform_args={
+            "old_x": ArgTransform(name="x"),
+            "old_y": ArgTransform(hide=True, default_factory=next_y),
+        },
+    )
+    tool2 = Tool.from_tool(tool1, transform_args={"x": ArgTransform(name="a")})
+    tool3 = Tool.from_tool(tool2, transform_args={"a": ArgTransform(default=100)})
+
+    assert tool3._forwarding_plan is not None
+    assert tool3._forwarding_plan.target is add_tool
+    assert tool3._forwarding_plan.renames == {"a": "old_x"}
+
+    result = await tool3.run(arguments={})
+    assert result.structured_content == {"result": 101}
+    result = await tool3.run(arguments={"a": 5})
+    assert result.structured_content == {"result": 7}
+
+
+async def test_chained_transforms_check_parent_required_args(add_tool):
+    tool1 = Tool.from_tool(add_tool, transform_args={"old_x": ArgTransform(name="x")})
+
+    async def skip_x(**kwargs) -> ToolResult:
+        return await forward()
+
+    tool2 = Tool.from_tool(
+        tool1, transform_fn=skip_x, transform_args={"x": ArgTransform(default=1)}
+    )
+
+    with pytest.raises(TypeError, match="Missing required argument\\(s\\): x"):
+        await tool2.run(arguments={})
+
+
+async def test_chained_transforms_do_not_fuse_custom_functions(add_tool):
+    async def double_x(x: int, old_y: int = 10) -> ToolResult:
+        return await forward(x=x * 2, old_y=old_y)
+
+    tool1 = Tool.from_tool(
+        add_tool,
+        transform_fn=double_x,
+        transform_args={"old_x": ArgTransform(name="x")},
+    )
+    tool2 = Tool.from_tool(tool1, transform_args={"x": ArgTransform(name="a")})
+
+    assert tool2._forwarding_plan is not None
+    assert tool2._forwarding_plan.target is tool1
+    result = await tool2.run(arguments={"a": 1})
+    assert result.structured_content == {"result": 12}
+
+
+async def test_chained_transforms_keep_parent_output_schema_setting(add_tool):
+    tool1 = Tool.from_tool(add_tool, output_schema={"type": "integer"})
+    tool2 = Tool.from_tool(tool1, output_schema={"type": "object"})
+
+    result = await tool2.run(arguments={"old_x": 1})
+    assert isinstance(result.content[0], TextContent)
+    assert result.content[0].text == "11"
+    assert result.structured_content is None
+
+
 class MyModel(BaseModel):
     x: int
     y: str
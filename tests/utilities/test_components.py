@@ -3,7 +3,7 @@
 import warnings
 
 import pytest
-from pydantic import ValidationError
+from pydantic import AnyUrl, ValidationError
 
 from fastmcp.prompts.prompt import Prompt
 from fastmcp.resources.resource import Resource
@@ -251,6 +251,103 @@ class TestKeyPrefix:
             assert WithPrefix.make_key("test") == "custom:test"
 
 
+class TestDerivedIdentity:
+    """Tests for cached key, version key, and content hash."""
+
+    def test_key_is_cached(self):
+        tool = Tool(name="greet", parameters={})
+        assert tool.key is tool.key
+
+    def test_key_invalidated_on_assignment(self):
+        tool = Tool(name="greet", parameters={})
+        assert tool.key == "tool:greet@"
+        tool.name = "hello"
+        assert tool.key == "tool:hello@"
+        tool.version = "2"
+        assert tool.key == "tool:hello@2"
+
+    def test_resource_key_invalidated_on_uri_assignment(self):
+        resource = Resource(uri=AnyUrl("data://app/a"), name="a")
+        assert resource.key == "resource:data://app/a@"
+        resource.uri = AnyUrl("data://app/b")
+        assert resource.key == "resource:data://app/b@"
+
+    def test_model_copy_update_recomputes_key(self):
+        tool = Tool(name="greet", parameters={})
+        assert tool.key == "tool:greet@"
+        renamed = tool.model_copy(update={"name": "ns_greet"})
+        assert renamed.key == "tool:ns_greet@"
+        assert tool.key == "tool:greet@"
+
+    def test_copy_does_not_share_invalidation(self):
+        tool = Tool(name="greet", parameters={})
+        copy = tool.model_copy()
+        assert copy.key == tool.key
+        copy.name = "other"
+        assert copy.key == "tool:other@"
+        assert tool.key == "tool:greet@"
+
+    def test_version_key_tracks_version(self):
+        tool = Tool(name="greet", version="1.0", parameters={})
+        assert (
+            tool.version_key == Tool(name="x", version="1.0", parameters={}).version_key
+        )
+        tool.version = "2.0"
+        assert (
+            tool.version_key > Tool(name="x", version="1.0", parameters={}).version_key
+        )
+
+    def test_content_hash_matches_for_equal_content(self):
+        a = Tool(name="greet", tags={"a", "b", "c"}, parameters={"type": "object"})
+        b = Tool(name="greet", tags={"c", "b", "a"}, parameters={"type": "object"})
+        assert a.content_hash == b.content_hash
+        assert a == b
+
+    def test_content_hash_changes_on_assignment(self):
+        tool = Tool(name="greet", parameters={})
+        original = tool.content_hash
+        tool.description = "Now with a description"
+        assert tool.content_hash != original
+
+    def test_equality_uses_content(self):
+        a = Tool(name="greet", parameters={})
+        b = Tool(name="greet", description="different", parameters={})
+        assert a != b
+        assert a != Prompt(name="greet")
+
+    def test_equality_confirms_matching_hashes(self):
+        class Opaque:
+            def __repr__(self) -> str:
+                return "Opaque()"
+
+        a = FastMCPComponent(name="c", meta={"value": Opaque()})
+        b = FastMCPComponent(name="c", meta={"value": Opaque()})
+        assert a.content_hash == b.content_hash
+        assert a != b
+
+    def test_equal_numbers_with_different_types_are_equal(self):
+        a = FastMCPComponent(name="c", meta={"value": 1, "flag": True})
+        b = FastMCPComponent(name="c", meta={"value": 1.0, "flag": 1})
+        assert a.content_hash == b.content_hash
+        assert a == b
+
+    def test_equality_confirms_differing_repr_hashes(self):
+        class Equal:
+            def __init__(self, label: str):
+                self.label = label
+
+            def __eq__(self, other: object) -> bool:
+                return isinstance(other, Equal)
+
+            def __repr__(self) -> str:
+                return f"Equal({self.label!r})"
+
+        a = FastMCPComponent(name="c", meta={"value": Equal("a")})
+        b = FastMCPComponent(name="c", meta={"value": Equal("b")})
+        assert a.content_hash != b.content_hash
+        assert a == b
+
+
 class TestComponentEnableDisable:
     """Tests for the enable/disable methods raising NotImplementedError."""
 
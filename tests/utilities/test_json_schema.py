@@ -1,8 +1,13 @@
+import jsonschema
+import pytest
+
 from fastmcp.utilities.json_schema import (
     _prune_param,
     compress_schema,
     dereference_refs,
+    get_schema_validator,
     resolve_root_ref,
+    validate_json_schema,
 )
 
 
@@ -628,3 +633,42 @@ class TestResolveRootRef:
 
         # Should return original schema unchanged
         assert result is schema
+
+
+class TestValidateJsonSchema:
+    """Tests for compiled, cached schema validation."""
+
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "count": {"type": "integer", "minimum": 0},
+        },
+        "required": ["name"],
+    }
+
+    def test_valid_instance(self):
+        validate_json_schema({"name": "a", "count": 1}, self.SCHEMA)
+
+    @pytest.mark.parametrize(
+        "instance",
+        [{"count": 1}, {"name": 1}, {"name": "a", "count": -1}, "not an object"],
+    )
+    def test_errors_match_jsonschema_validate(self, instance):
+        with pytest.raises(jsonschema.ValidationError) as expected:
+            jsonschema.validate(instance, self.SCHEMA)
+        with pytest.raises(jsonschema.ValidationError) as actual:
+            validate_json_schema(instance, self.SCHEMA)
+
+        assert actual.value.message == expected.value.message
+
+    def test_validator_is_reused_per_schema_object(self):
+        assert get_schema_validator(self.SCHEMA) is get_schema_validator(self.SCHEMA)
+        # An equal but distinct dict gets its own validator
+        assert get_schema_validator(dict(self.SCHEMA)) is not get_schema_validator(
+            self.SCHEMA
+        )
+
+    def test_invalid_schema_raises_schema_error(self):
+        with pytest.raises(jsonschema.SchemaError):
+            validate_json_schema({}, {"type": "not-a-type"})
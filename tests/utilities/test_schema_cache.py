@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import pytest
+
+from fastmcp.tools.function_parsing import ParsedFunction
+from fastmcp.utilities.schema_cache import (
+    SchemaCache,
+    get_schema_cache,
+    schema_cache_key,
+)
+from fastmcp.utilities.tests import temporary_settings
+
+
+def add(a: int, b: int = 1) -> int:
+    return a + b
+
+
+def make_tool(default: int):
+    def tool(x: int = default) -> int:
+        return x
+
+    return tool
+
+
+class TestSchemaCacheKey:
+    def test_stable(self):
+        assert schema_cache_key(add) == schema_cache_key(add)
+
+    def test_options_change_key(self):
+        assert schema_cache_key(add, ["a"]) != schema_cache_key(add, None)
+
+    def test_closures_with_different_defaults_differ(self):
+        assert schema_cache_key(make_tool(1)) != schema_cache_key(make_tool(2))
+
+    def test_unstable_default_repr(self):
+        sentinel = object()
+
+        def tool(x: object = sentinel) -> object:
+            return x
+
+        assert schema_cache_key(tool) is None
+
+    def test_unavailable_source(self):
+        fn = eval("lambda x: x")
+        assert schema_cache_key(fn) is None
+
+
+class TestSchemaCache:
+    def test_roundtrip(self, tmp_path: Path):
+        cache = SchemaCache(tmp_path)
+        assert cache.get("abc") is None
+        cache.set("abc", {"type": "object"}, None)
+        assert cache.get("abc") == ({"type": "object"}, None)
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path: Path):
+        cache = SchemaCache(tmp_path)
+        cache.set("abc", {"type": "object"}, None)
+        (tmp_path / "ab" / "abc.json").write_text("not json")
+        assert cache.get("abc") is None
+
+    def test_disabled_by_default(self):
+        assert get_schema_cache() is None
+
+
+class TestParsedFunctionSchemaCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path: Path):
+        with temporary_settings(schema_cache=True, schema_cache_dir=tmp_path):
+            yield tmp_path
+
+    def test_hit_skips_generation(self, cache_dir: Path, monkeypatch):
+        parsed = ParsedFunction.from_function(add)
+        assert list(cache_dir.glob("*/*.json"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("schema regenerated")
+
+        monkeypatch.setattr(
+            "fastmcp.tools.function_parsing._generate_input_schema", fail
+        )
+        cached = ParsedFunction.from_function(add)
+        assert cached.input_schema == parsed.input_schema
+        assert cached.output_schema == parsed.output_schema
+
+    def test_exclude_args_not_shared(self, cache_dir: Path):
+        full = ParsedFunction.from_function(add)
+        excluded = ParsedFunction.from_function(add, exclude_args=["b"])
+        assert "b" in full.input_schema["properties"]
+        assert "b" not in excluded.input_schema["properties"]
@@ -10,8 +10,10 @@ from fastmcp.utilities.types import (
     Audio,
     File,
     Image,
+    configure_typeadapter_cache,
     create_function_without_params,
     get_cached_typeadapter,
+    identity_cache,
     is_class_member_of_type,
     issubclass_safe,
     replace_type,
@@ -671,3 +673,68 @@ class TestAnnotationStringDescriptions:
 
         # Should keep the Field description
         assert schema["properties"]["name"]["description"] == "Field desc"
+
+
+class TestIdentityCache:
+    def test_caches_by_identity(self):
+        calls: list[dict] = []
+
+        @identity_cache(maxsize=2)
+        def size(schema: dict) -> int:
+            calls.append(schema)
+            return len(schema)
+
+        first = {"a": 1}
+        equal = {"a": 1}
+
+        assert size(first) == 1
+        assert size(first) == 1
+        assert size(equal) == 1
+        assert calls == [first, equal]
+        assert calls[0] is first and calls[1] is equal
+
+    def test_evicts_least_recently_used(self):
+        calls = 0
+
+        @identity_cache(maxsize=2)
+        def ident(value: list) -> list:
+            nonlocal calls
+            calls += 1
+            return value
+
+        a, b, c = [1], [2], [3]
+        ident(a)
+        ident(b)
+        ident(a)
+        ident(c)  # evicts b
+        assert calls == 3
+        ident(a)
+        assert calls == 3
+        ident(b)
+        assert calls == 4
+
+
+class TestTypeAdapterCache:
+    @pytest.fixture(autouse=True)
+    def restore_cache(self):
+        yield
+        configure_typeadapter_cache(5000)
+
+    def test_reuses_adapters(self):
+        def fn(x: int) -> int:
+            return x
+
+        assert get_cached_typeadapter(fn) is get_cached_typeadapter(fn)
+
+    def test_configure_sets_size(self):
+        configure_typeadapter_cache(1)
+
+        def first(x: int) -> int:
+            return x
+
+        def second(x: str) -> str:
+            return x
+
+        adapter = get_cached_typeadapter(first)
+        get_cached_typeadapter(second)  # evicts first
+        assert get_cached_typeadapter(first) is not adapter